@@ -55,6 +55,7 @@ from google.cloud.aiplatform.jobs import (
     HyperparameterTuningJob,
     ModelDeploymentMonitoringJob,
 )
+from google.cloud.aiplatform.job_watcher import JobWatcher
 from google.cloud.aiplatform.pipeline_jobs import PipelineJob
 from google.cloud.aiplatform.tensorboard import (
     Tensorboard,
@@ -77,6 +78,7 @@ from google.cloud.aiplatform.training_jobs import (
 )
 
 from google.cloud.aiplatform import helpers
+from google.cloud.aiplatform import aio
 
 """
 Usage:
@@ -117,6 +119,7 @@ Context = metadata.context.Context
 
 
 __all__ = (
+    "aio",
     "end_run",
     "explain",
     "gapic",
@@ -162,6 +165,7 @@ __all__ = (
     "MatchingEngineIndexEndpoint",
     "ImageDataset",
     "HyperparameterTuningJob",
+    "JobWatcher",
     "Model",
     "ModelRegistry",
     "ModelEvaluation",
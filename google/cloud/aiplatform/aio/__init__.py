@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""The asyncio flavor of the core Vertex AI resource classes.
+
+Usage:
+from google.cloud import aiplatform
+
+endpoint = await aiplatform.aio.Endpoint.get("456")
+prediction = await endpoint.predict(instances=[...])
+"""
+
+from google.cloud.aiplatform.aio.featurestore import EntityType, Featurestore
+from google.cloud.aiplatform.aio.jobs import BatchPredictionJob
+from google.cloud.aiplatform.aio.models import Endpoint, Model
+from google.cloud.aiplatform.aio.pipeline_jobs import PipelineJob
+
+__all__ = (
+    "BatchPredictionJob",
+    "Endpoint",
+    "EntityType",
+    "Featurestore",
+    "Model",
+    "PipelineJob",
+)
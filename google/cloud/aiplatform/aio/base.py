@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+import proto
+
+from google.auth import credentials as auth_credentials
+from google.protobuf import json_format
+
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import utils
+
+_LOGGER = base.Logger(__name__)
+
+# Poll intervals of `wait`, in seconds. The interval is multiplied every time
+# the state of the resource did not change, and reset when it changed.
+_WAIT_MIN_POLL_INTERVAL = 5
+_WAIT_MAX_POLL_INTERVAL = 60 * 5
+_WAIT_POLL_INTERVAL_MULTIPLIER = 2
+
+# GAPIC async clients by event loop. grpc.aio channels can only be used on the
+# event loop they are created on, so every event loop gets its own clients.
+_async_clients: Dict[asyncio.AbstractEventLoop, Dict[Tuple, Any]] = {}
+_async_clients_lock = threading.Lock()
+
+AsyncResourceNounType = TypeVar("AsyncResourceNounType", bound="AsyncResourceNoun")
+
+
+def _get_async_client(
+    client_class: Type[utils.VertexAiServiceClientWithOverride],
+    credentials: Optional[auth_credentials.Credentials] = None,
+    location: Optional[str] = None,
+    prediction_client: bool = False,
+) -> utils.VertexAiServiceClientWithOverride:
+    """Returns a GAPIC async client shared on the running event loop.
+
+    Args:
+        client_class (utils.VertexAiServiceClientWithOverride):
+            Required. The override of a GAPIC async client.
+        credentials (auth_credentials.Credentials):
+            Optional. Custom credentials of the client. If not set, credentials
+            set in aiplatform.init will be used.
+        location (str):
+            Optional. Location of the client. If not set, location set in
+            aiplatform.init will be used.
+        prediction_client (bool):
+            Optional. Whether the client uses the prediction endpoint.
+
+    Returns:
+        The client of the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    key = (
+        client_class,
+        credentials or initializer.global_config.credentials,
+        location or initializer.global_config.location,
+        prediction_client,
+    )
+    with _async_clients_lock:
+        # Release the clients of event loops that have been closed, e.g. by
+        # asyncio.run. Their channels cannot be used anymore.
+        for closed_loop in [
+            other_loop for other_loop in _async_clients if other_loop.is_closed()
+        ]:
+            del _async_clients[closed_loop]
+
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = initializer.global_config.create_client(
+                client_class=client_class,
+                credentials=key[1],
+                location_override=key[2],
+                prediction_client=prediction_client,
+            )
+            clients[key] = client
+    return client
+
+
+class AsyncResourceNoun:
+    """Base class of the asyncio flavor of Vertex AI resource classes.
+
+    The resource is sent and received with the GAPIC async clients, so that
+    awaiting a request does not block a thread. The resource name format, the
+    GAPIC methods and the list filters are the ones of the synchronous resource
+    class.
+
+    Subclasses require two class attributes:
+
+    _resource_class (base.VertexAiResourceNounWithFutureManager): The synchronous
+    resource class, e.g. aiplatform.Endpoint for aiplatform.aio.Endpoint.
+    _client_class (utils.VertexAiServiceClientWithOverride): The override of the
+    GAPIC async client of the resource.
+    """
+
+    _resource_class: Type[base.VertexAiResourceNounWithFutureManager]
+    _client_class: Type[utils.VertexAiServiceClientWithOverride]
+
+    # Overrides the resource ID validator of the synchronous resource class, for
+    # the classes setting it on their instances.
+    _resource_id_validator: Optional[Callable[[str], None]] = None
+
+    def __init__(
+        self,
+        gca_resource: proto.Message,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ):
+        """Wraps a GAPIC resource. Use `get`, `list` or `create` to retrieve
+        resources.
+
+        Args:
+            gca_resource (proto.Message):
+                Required. The GAPIC representation of the resource.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to interact with the
+                resource. Overrides credentials set in aiplatform.init.
+        """
+        resource_name_parts = utils.extract_project_and_location_from_parent(
+            gca_resource.name
+        )
+        self.project = resource_name_parts.get("project")
+        self.location = resource_name_parts.get("location")
+        self.credentials = credentials or initializer.global_config.credentials
+        self._gca_resource = gca_resource
+
+    @property
+    def api_client(self) -> utils.VertexAiServiceClientWithOverride:
+        """The GAPIC async client of the resource on the running event loop."""
+        return _get_async_client(
+            client_class=self._client_class,
+            credentials=self.credentials,
+            location=self.location,
+        )
+
+    @property
+    def gca_resource(self) -> proto.Message:
+        """The underlying resource proto representation."""
+        return self._gca_resource
+
+    @property
+    def resource_name(self) -> str:
+        """Full qualified resource name."""
+        return self._gca_resource.name
+
+    @property
+    def name(self) -> str:
+        """Name of this resource."""
+        return self.resource_name.split("/")[-1]
+
+    @property
+    def display_name(self) -> str:
+        """Display name of this resource."""
+        return self._gca_resource.display_name
+
+    @property
+    def create_time(self):
+        """Time this resource was created."""
+        return self._gca_resource.create_time
+
+    @property
+    def update_time(self):
+        """Time this resource was last updated."""
+        return self._gca_resource.update_time
+
+    @property
+    def labels(self) -> Dict[str, str]:
+        """User-defined labels containing metadata about this resource."""
+        return dict(self._gca_resource.labels)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the resource proto as a dictionary."""
+        return json_format.MessageToDict(self._gca_resource._pb)
+
+    def to_sync(self) -> base.VertexAiResourceNounWithFutureManager:
+        """Returns the synchronous resource object of this resource.
+
+        No request is sent: the synchronous object wraps the same resource proto.
+        """
+        return self._resource_class._construct_sdk_resource_from_gapic(
+            self._gca_resource,
+            project=self.project,
+            location=self.location,
+            credentials=self.credentials,
+        )
+
+    def __repr__(self) -> str:
+        return f"{object.__repr__(self)} \nresource name: {self.resource_name}"
+
+    @classmethod
+    async def _get(
+        cls: Type[AsyncResourceNounType],
+        resource_name: str,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent_resource_name_fields: Optional[Dict[str, str]] = None,
+    ) -> AsyncResourceNounType:
+        """Retrieves a resource.
+
+        Args:
+            resource_name (str):
+                Required. A fully-qualified resource name or ID.
+            project (str):
+                Optional. Project to retrieve the resource from. If not set,
+                project set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve the resource from. If not set,
+                location set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve the resource.
+                Overrides credentials set in aiplatform.init.
+            parent_resource_name_fields (Dict[str,str]):
+                Optional. Mapping of parent resource name key to values. These
+                will be used to compose the resource name if only resource ID is given.
+                Should not include project and location.
+
+        Returns:
+            The retrieved resource.
+        """
+        resource_class = cls._resource_class
+        resource_name = utils.full_resource_name(
+            resource_name=resource_name,
+            resource_noun=resource_class._resource_noun,
+            parse_resource_name_method=resource_class._parse_resource_name,
+            format_resource_name_method=resource_class._format_resource_name,
+            project=project,
+            location=location,
+            parent_resource_name_fields=parent_resource_name_fields,
+            resource_id_validator=(
+                cls._resource_id_validator or resource_class._resource_id_validator
+            ),
+        )
+        api_client = _get_async_client(
+            client_class=cls._client_class,
+            credentials=credentials,
+            location=utils.extract_project_and_location_from_parent(resource_name).get(
+                "location"
+            ),
+        )
+        gca_resource = await getattr(api_client, resource_class._getter_method)(
+            name=resource_name
+        )
+        return cls(gca_resource, credentials=credentials)
+
+    @classmethod
+    async def get(
+        cls: Type[AsyncResourceNounType],
+        resource_name: str,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> AsyncResourceNounType:
+        """Retrieves a resource.
+
+        Example Usage:
+
+            endpoint = await aiplatform.aio.Endpoint.get("456")
+
+        Args:
+            resource_name (str):
+                Required. A fully-qualified resource name or ID.
+                Example: "projects/123/locations/us-central1/endpoints/456" or
+                "456" when project and location are initialized or passed.
+            project (str):
+                Optional. Project to retrieve the resource from. If not set,
+                project set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve the resource from. If not set,
+                location set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve the resource.
+                Overrides credentials set in aiplatform.init.
+
+        Returns:
+            The retrieved resource.
+        """
+        return await cls._get(
+            resource_name=resource_name,
+            project=project,
+            location=location,
+            credentials=credentials,
+        )
+
+    @classmethod
+    async def _list(
+        cls: Type[AsyncResourceNounType],
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+    ) -> List[AsyncResourceNounType]:
+        """Lists all resources of this class. See `list` for the arguments."""
+        resource_class = cls._resource_class
+        if parent:
+            parent_resources = utils.extract_project_and_location_from_parent(parent)
+            if parent_resources:
+                project, location = (
+                    parent_resources["project"],
+                    parent_resources["location"],
+                )
+
+        list_request = {
+            "parent": parent
+            or initializer.global_config.common_location_path(
+                project=project, location=location
+            ),
+        }
+        if filter:
+            list_request["filter"] = filter
+        if order_by and not resource_class._list_order_by_locally:
+            list_request["order_by"] = order_by
+
+        api_client = _get_async_client(
+            client_class=cls._client_class,
+            credentials=credentials,
+            location=location,
+        )
+        pager = await getattr(api_client, resource_class._list_method)(
+            request=list_request
+        )
+        resources = [
+            cls(gapic_resource, credentials=credentials)
+            async for gapic_resource in pager
+            if resource_class._list_cls_filter(gapic_resource)
+        ]
+
+        if order_by and resource_class._list_order_by_locally:
+            desc = "desc" in order_by
+            fields = [
+                field.strip() for field in order_by.replace("desc", "").split(",")
+            ]
+            resources.sort(
+                key=lambda resource: tuple(
+                    getattr(resource, field) for field in fields
+                ),
+                reverse=desc,
+            )
+        return resources
+
+    @classmethod
+    async def list(
+        cls: Type[AsyncResourceNounType],
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> List[AsyncResourceNounType]:
+        """Lists all resources of this class.
+
+        Example Usage:
+
+            endpoints = await aiplatform.aio.Endpoint.list(
+                filter='labels.my_key="my_value"',
+                order_by="display_name",
+            )
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+
+        Returns:
+            List of the resources.
+        """
+        return await cls._list(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+        )
+
+    async def refresh(self: AsyncResourceNounType) -> AsyncResourceNounType:
+        """Retrieves the latest representation of this resource.
+
+        Returns:
+            This resource.
+        """
+        self._gca_resource = await getattr(
+            self.api_client, self._resource_class._getter_method
+        )(name=self.resource_name)
+        return self
+
+    async def delete(self) -> None:
+        """Deletes this resource. WARNING: This deletion is permanent."""
+        await self._delete()
+
+    async def _delete(self, **kwargs) -> None:
+        """Deletes this resource and waits for the deletion to complete.
+
+        Args:
+            **kwargs:
+                Optional. Additional arguments of the GAPIC delete method.
+        """
+        _LOGGER.log_action_start_against_resource("Deleting", "", self)
+        lro = await getattr(self.api_client, self._resource_class._delete_method)(
+            name=self.resource_name, **kwargs
+        )
+        _LOGGER.log_action_started_against_resource_with_lro(
+            "Delete", "", self.__class__, lro
+        )
+        await lro.result()
+        _LOGGER.log_action_completed_against_resource("deleted.", "", self)
+
+
+class AsyncStatefulResourceNoun(AsyncResourceNoun):
+    """Base class of the asyncio flavor of jobs, which run until they reach a
+    done state.
+
+    Subclasses require two class attributes in addition to those of
+    AsyncResourceNoun:
+
+    _cancel_method (str): The name of the GAPIC method cancelling the job.
+    _error_states (Tuple): The done states in which the job failed.
+    """
+
+    _cancel_method: str
+    _error_states: Tuple = ()
+
+    @property
+    def state(self):
+        """The state of the job when it was last retrieved.
+
+        Unlike the state of the synchronous resource classes, no request is sent;
+        call `refresh` or `wait` to retrieve the latest state.
+        """
+        return self._gca_resource.state
+
+    @property
+    def error(self):
+        """Detailed error info for this job. Only populated when the job
+        failed or was cancelled."""
+        return self._gca_resource.error
+
+    def done(self) -> bool:
+        """Whether the job had reached a done state when it was last retrieved."""
+        return self.state in self._resource_class._valid_done_states
+
+    async def wait(self) -> None:
+        """Waits for the job to complete without blocking the event loop.
+
+        The job is polled with exponential backoff while its state does not
+        change.
+
+        Raises:
+            RuntimeError: If the job failed or was cancelled.
+        """
+        poll_interval = _WAIT_MIN_POLL_INTERVAL
+        previous_state = None
+        while True:
+            await self.refresh()
+            if self.state != previous_state:
+                _LOGGER.info(
+                    "%s %s current state:\n%s"
+                    % (self.__class__.__name__, self.resource_name, self.state)
+                )
+                previous_state = self.state
+                poll_interval = _WAIT_MIN_POLL_INTERVAL
+            else:
+                poll_interval = min(
+                    poll_interval * _WAIT_POLL_INTERVAL_MULTIPLIER,
+                    _WAIT_MAX_POLL_INTERVAL,
+                )
+
+            if self.done():
+                break
+            await asyncio.sleep(poll_interval)
+
+        # Error is only populated when the job failed or was cancelled.
+        if self.state in self._error_states:
+            raise RuntimeError("Job failed with:\n%s" % self.error)
+        _LOGGER.log_action_completed_against_resource("run", "completed", self)
+
+    async def cancel(self) -> None:
+        """Cancels this job. Success of cancellation is not guaranteed; use
+        `wait` to wait for the job to reach a done state."""
+        _LOGGER.log_action_start_against_resource("Cancelling", "", self)
+        await getattr(self.api_client, self._cancel_method)(name=self.resource_name)
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from google.auth import credentials as auth_credentials
+
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import featurestore
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.aio import base as aio_base
+from google.cloud.aiplatform.compat.types import (
+    entity_type as gca_entity_type,
+    featurestore as gca_featurestore,
+)
+
+_LOGGER = base.Logger(__name__)
+
+
+class Featurestore(aio_base.AsyncResourceNoun):
+    """The asyncio flavor of aiplatform.Featurestore."""
+
+    _resource_class = featurestore.Featurestore
+    _client_class = utils.FeaturestoreAsyncClientWithOverride
+
+    @classmethod
+    async def create(
+        cls,
+        featurestore_id: str,
+        online_store_fixed_node_count: Optional[int] = None,
+        labels: Optional[Dict[str, str]] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        encryption_spec_key_name: Optional[str] = None,
+        create_request_timeout: Optional[float] = None,
+    ) -> "Featurestore":
+        """Creates a Featurestore resource and waits for the creation to complete.
+
+        Example Usage:
+
+            my_featurestore = await aiplatform.aio.Featurestore.create(
+                featurestore_id='my_featurestore_id',
+            )
+
+        See `aiplatform.Featurestore.create` for the arguments.
+
+        Returns:
+            Featurestore - Featurestore resource object
+        """
+        gapic_featurestore = gca_featurestore.Featurestore(
+            online_serving_config=gca_featurestore.Featurestore.OnlineServingConfig(
+                fixed_node_count=online_store_fixed_node_count
+            )
+        )
+
+        if labels:
+            utils.validate_labels(labels)
+            gapic_featurestore.labels = labels
+
+        if encryption_spec_key_name:
+            gapic_featurestore.encryption_spec = (
+                initializer.global_config.get_encryption_spec(
+                    encryption_spec_key_name=encryption_spec_key_name
+                )
+            )
+
+        api_client = aio_base._get_async_client(
+            client_class=cls._client_class,
+            credentials=credentials,
+            location=location,
+        )
+
+        created_featurestore_lro = await api_client.create_featurestore(
+            parent=initializer.global_config.common_location_path(
+                project=project, location=location
+            ),
+            featurestore=gapic_featurestore,
+            featurestore_id=featurestore_id,
+            metadata=request_metadata,
+            timeout=create_request_timeout,
+        )
+
+        _LOGGER.log_create_with_lro(cls, created_featurestore_lro)
+
+        created_featurestore = await created_featurestore_lro.result()
+
+        _LOGGER.log_create_complete_with_getter(
+            cls, created_featurestore, "featurestore"
+        )
+
+        return cls(created_featurestore, credentials=credentials)
+
+    async def delete(self, force: bool = False) -> None:
+        """Deletes this Featurestore resource. WARNING: This deletion is permanent.
+
+        Args:
+            force (bool):
+                If set to true, any EntityTypes and
+                Features for this Featurestore will also
+                be deleted. (Otherwise, the request will
+                only work if the Featurestore has no
+                EntityTypes.)
+        """
+        await self._delete(force=force)
+
+
+class EntityType(aio_base.AsyncResourceNoun):
+    """The asyncio flavor of aiplatform.EntityType."""
+
+    _resource_class = featurestore.EntityType
+    _client_class = utils.FeaturestoreAsyncClientWithOverride
+
+    @property
+    def featurestore_name(self) -> str:
+        """Full qualified resource name of the managed featurestore in which this EntityType is."""
+        entity_type_name_components = self._resource_class._parse_resource_name(
+            self.resource_name
+        )
+        return featurestore.Featurestore._format_resource_name(
+            project=entity_type_name_components["project"],
+            location=entity_type_name_components["location"],
+            featurestore=entity_type_name_components["featurestore"],
+        )
+
+    @classmethod
+    async def get(
+        cls,
+        entity_type_name: str,
+        featurestore_id: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> "EntityType":
+        """Retrieves an existing managed entityType given an entityType resource name or an entity_type ID.
+
+        Example Usage:
+
+            my_entity_type = await aiplatform.aio.EntityType.get(
+                entity_type_name='my_entity_type_id',
+                featurestore_id='my_featurestore_id',
+            )
+
+        See `aiplatform.EntityType` for the arguments.
+
+        Returns:
+            EntityType - The retrieved entityType.
+        """
+        return await cls._get(
+            resource_name=entity_type_name,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent_resource_name_fields={
+                featurestore.Featurestore._resource_noun: featurestore_id
+            }
+            if featurestore_id
+            else featurestore_id,
+        )
+
+    @classmethod
+    async def list(
+        cls,
+        featurestore_name: str,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+    ) -> List["EntityType"]:
+        """Lists existing managed entityType resources in a featurestore, given a featurestore resource name or a featurestore ID.
+
+        See `aiplatform.EntityType.list` for the arguments.
+
+        Returns:
+            List[EntityType] - A list of managed entityType resource objects
+        """
+        return await cls._list(
+            filter=filter,
+            order_by=order_by,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=utils.full_resource_name(
+                resource_name=featurestore_name,
+                resource_noun=featurestore.Featurestore._resource_noun,
+                parse_resource_name_method=featurestore.Featurestore._parse_resource_name,
+                format_resource_name_method=featurestore.Featurestore._format_resource_name,
+                project=project,
+                location=location,
+                resource_id_validator=featurestore.Featurestore._resource_id_validator,
+            ),
+        )
+
+    @classmethod
+    async def create(
+        cls,
+        entity_type_id: str,
+        featurestore_name: str,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        create_request_timeout: Optional[float] = None,
+    ) -> "EntityType":
+        """Creates an EntityType resource in a Featurestore and waits for the
+        creation to complete.
+
+        Example Usage:
+
+            my_entity_type = await aiplatform.aio.EntityType.create(
+                entity_type_id='my_entity_type_id',
+                featurestore_name='my_featurestore_id',
+            )
+
+        See `aiplatform.EntityType.create` for the arguments.
+
+        Returns:
+            EntityType - entity_type resource object
+        """
+        featurestore_name = utils.full_resource_name(
+            resource_name=featurestore_name,
+            resource_noun=featurestore.Featurestore._resource_noun,
+            parse_resource_name_method=featurestore.Featurestore._parse_resource_name,
+            format_resource_name_method=featurestore.Featurestore._format_resource_name,
+            project=project,
+            location=location,
+            resource_id_validator=featurestore.Featurestore._resource_id_validator,
+        )
+
+        featurestore_name_components = featurestore.Featurestore._parse_resource_name(
+            featurestore_name
+        )
+
+        gapic_entity_type = gca_entity_type.EntityType()
+
+        if labels:
+            utils.validate_labels(labels)
+            gapic_entity_type.labels = labels
+
+        if description:
+            gapic_entity_type.description = description
+
+        api_client = aio_base._get_async_client(
+            client_class=cls._client_class,
+            credentials=credentials,
+            location=featurestore_name_components["location"],
+        )
+
+        created_entity_type_lro = await api_client.create_entity_type(
+            parent=featurestore_name,
+            entity_type=gapic_entity_type,
+            entity_type_id=entity_type_id,
+            metadata=request_metadata,
+            timeout=create_request_timeout,
+        )
+
+        _LOGGER.log_create_with_lro(cls, created_entity_type_lro)
+
+        created_entity_type = await created_entity_type_lro.result()
+
+        _LOGGER.log_create_complete_with_getter(cls, created_entity_type, "entity_type")
+
+        return cls(created_entity_type, credentials=credentials)
+
+    async def delete(self, force: bool = False) -> None:
+        """Deletes this EntityType resource. WARNING: This deletion is permanent.
+
+        Args:
+            force (bool):
+                If set to true, any Features for this
+                EntityType will also be deleted.
+                (Otherwise, the request will only work if
+                the EntityType has no Features.)
+        """
+        await self._delete(force=force)
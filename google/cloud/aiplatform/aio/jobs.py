@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Dict, Optional, Sequence, Union
+
+from google.auth import credentials as auth_credentials
+
+from google.cloud import aiplatform
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import jobs
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.aio import base as aio_base
+from google.cloud.aiplatform.aio import models as aio_models
+
+_LOGGER = base.Logger(__name__)
+
+
+class BatchPredictionJob(aio_base.AsyncStatefulResourceNoun):
+    """The asyncio flavor of aiplatform.BatchPredictionJob.
+
+    Example usage:
+
+        batch_prediction_jobs = await asyncio.gather(
+            *[
+                aiplatform.aio.BatchPredictionJob.create(
+                    job_display_name=f"job-{i}",
+                    model_name=model_name,
+                    gcs_source=gcs_source,
+                    gcs_destination_prefix=gcs_destination_prefix,
+                )
+                for i, gcs_source in enumerate(gcs_sources)
+            ]
+        )
+        await asyncio.gather(*[job.wait() for job in batch_prediction_jobs])
+    """
+
+    _resource_class = jobs.BatchPredictionJob
+    _client_class = utils.JobAsyncClientWithOverride
+    _cancel_method = jobs.BatchPredictionJob._cancel_method
+    _error_states = jobs._JOB_ERROR_STATES
+
+    @classmethod
+    async def create(
+        cls,
+        job_display_name: str,
+        model_name: Union[str, "aiplatform.Model", aio_models.Model],
+        instances_format: str = "jsonl",
+        predictions_format: str = "jsonl",
+        gcs_source: Optional[Union[str, Sequence[str]]] = None,
+        bigquery_source: Optional[str] = None,
+        gcs_destination_prefix: Optional[str] = None,
+        bigquery_destination_prefix: Optional[str] = None,
+        model_parameters: Optional[Dict] = None,
+        machine_type: Optional[str] = None,
+        accelerator_type: Optional[str] = None,
+        accelerator_count: Optional[int] = None,
+        starting_replica_count: Optional[int] = None,
+        max_replica_count: Optional[int] = None,
+        generate_explanation: Optional[bool] = False,
+        explanation_metadata: Optional["aiplatform.explain.ExplanationMetadata"] = None,
+        explanation_parameters: Optional[
+            "aiplatform.explain.ExplanationParameters"
+        ] = None,
+        labels: Optional[Dict[str, str]] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        encryption_spec_key_name: Optional[str] = None,
+        create_request_timeout: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        service_account: Optional[str] = None,
+    ) -> "BatchPredictionJob":
+        """Creates a batch prediction job.
+
+        Unlike `aiplatform.BatchPredictionJob.create`, this method returns once
+        the job is created; await `wait` to wait for the job to complete. Model
+        monitoring is not supported.
+
+        See `aiplatform.BatchPredictionJob.create` for the arguments. `model_name`
+        may also be an `aiplatform.aio.Model`.
+
+        Returns:
+            (aiplatform.aio.BatchPredictionJob):
+                The created batch prediction job.
+
+        Raises:
+            ValueError:
+                If no or multiple source or destinations are provided. Also, if
+                provided instances_format or predictions_format are not supported
+                by Vertex AI.
+        """
+        (
+            model_name,
+            gapic_batch_prediction_job,
+        ) = cls._resource_class._build_gca_batch_prediction_job(
+            job_display_name=job_display_name,
+            model_name=model_name
+            if isinstance(model_name, str)
+            else model_name.versioned_resource_name,
+            instances_format=instances_format,
+            predictions_format=predictions_format,
+            gcs_source=gcs_source,
+            bigquery_source=bigquery_source,
+            gcs_destination_prefix=gcs_destination_prefix,
+            bigquery_destination_prefix=bigquery_destination_prefix,
+            model_parameters=model_parameters,
+            machine_type=machine_type,
+            accelerator_type=accelerator_type,
+            accelerator_count=accelerator_count,
+            starting_replica_count=starting_replica_count,
+            max_replica_count=max_replica_count,
+            generate_explanation=generate_explanation,
+            explanation_metadata=explanation_metadata,
+            explanation_parameters=explanation_parameters,
+            labels=labels,
+            project=project,
+            location=location,
+            encryption_spec_key_name=encryption_spec_key_name,
+            batch_size=batch_size,
+            service_account=service_account,
+        )
+        gapic_batch_prediction_job.model = model_name
+
+        project = project or initializer.global_config.project
+        location = location or initializer.global_config.location
+        api_client = aio_base._get_async_client(
+            client_class=cls._client_class,
+            credentials=credentials,
+            location=location,
+        )
+
+        _LOGGER.log_create_with_lro(cls)
+
+        gapic_batch_prediction_job = await api_client.create_batch_prediction_job(
+            parent=initializer.global_config.common_location_path(
+                project=project, location=location
+            ),
+            batch_prediction_job=gapic_batch_prediction_job,
+            timeout=create_request_timeout,
+        )
+
+        _LOGGER.log_create_complete_with_getter(cls, gapic_batch_prediction_job, "bpj")
+
+        return cls(gapic_batch_prediction_job, credentials=credentials)
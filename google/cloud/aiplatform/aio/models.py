@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from google.auth import credentials as auth_credentials
+
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import models
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.aio import base as aio_base
+from google.cloud.aiplatform.compat.types import endpoint as gca_endpoint_compat
+
+_LOGGER = base.Logger(__name__)
+
+
+class Endpoint(aio_base.AsyncResourceNoun):
+    """The asyncio flavor of aiplatform.Endpoint.
+
+    Example usage:
+
+        endpoint = await aiplatform.aio.Endpoint.get("456")
+        predictions = await asyncio.gather(
+            *[endpoint.predict(instances=[instance]) for instance in instances]
+        )
+    """
+
+    _resource_class = models.Endpoint
+    _client_class = utils.EndpointAsyncClientWithOverride
+
+    @classmethod
+    async def create(
+        cls,
+        display_name: Optional[str] = None,
+        description: Optional[str] = None,
+        labels: Optional[Dict[str, str]] = None,
+        metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        encryption_spec_key_name: Optional[str] = None,
+        create_request_timeout: Optional[float] = None,
+        endpoint_id: Optional[str] = None,
+    ) -> "Endpoint":
+        """Creates a new endpoint and waits for the creation to complete.
+
+        Args:
+            display_name (str):
+                Optional. The user-defined name of the Endpoint.
+                The name can be up to 128 characters long and can be consist
+                of any UTF-8 characters.
+            description (str):
+                Optional. The description of the Endpoint.
+            labels (Dict[str, str]):
+                Optional. The labels with user-defined metadata to
+                organize your Endpoints. See `aiplatform.Endpoint.create` for
+                details.
+            metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as
+                metadata.
+            project (str):
+                Optional. Project to create the endpoint in. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to create the endpoint in. If not set,
+                location set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to create the endpoint.
+                Overrides credentials set in aiplatform.init.
+            encryption_spec_key_name (str):
+                Optional. The Cloud KMS resource identifier of the customer
+                managed encryption key used to protect the endpoint.
+                Overrides encryption_spec_key_name set in aiplatform.init.
+            create_request_timeout (float):
+                Optional. The timeout for the create request in seconds.
+            endpoint_id (str):
+                Optional. The ID to use for endpoint, which will become
+                the final component of the endpoint resource name. If
+                not provided, Vertex AI will generate a value for this
+                ID.
+
+        Returns:
+            endpoint (aiplatform.aio.Endpoint):
+                Created endpoint.
+        """
+        if not display_name:
+            display_name = cls._resource_class._generate_display_name()
+
+        utils.validate_display_name(display_name)
+        if labels:
+            utils.validate_labels(labels)
+
+        project = project or initializer.global_config.project
+        location = location or initializer.global_config.location
+
+        gapic_endpoint = gca_endpoint_compat.Endpoint(
+            display_name=display_name,
+            description=description,
+            labels=labels,
+            encryption_spec=initializer.global_config.get_encryption_spec(
+                encryption_spec_key_name=encryption_spec_key_name
+            ),
+        )
+
+        api_client = aio_base._get_async_client(
+            client_class=cls._client_class,
+            credentials=credentials,
+            location=location,
+        )
+        operation_future = await api_client.create_endpoint(
+            parent=initializer.global_config.common_location_path(
+                project=project, location=location
+            ),
+            endpoint=gapic_endpoint,
+            endpoint_id=endpoint_id,
+            metadata=metadata,
+            timeout=create_request_timeout,
+        )
+
+        _LOGGER.log_create_with_lro(cls, operation_future)
+
+        created_endpoint = await operation_future.result()
+
+        _LOGGER.log_create_complete_with_getter(cls, created_endpoint, "endpoint")
+
+        return cls(created_endpoint, credentials=credentials)
+
+    @property
+    def deployed_models(self) -> List[gca_endpoint_compat.DeployedModel]:
+        """The models deployed to this endpoint when it was last retrieved."""
+        return list(self._gca_resource.deployed_models)
+
+    async def predict(
+        self,
+        instances: List,
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        return_format: str = models._PREDICTIONS_FORMAT_JSON,
+    ) -> models.Prediction:
+        """Makes a prediction against this Endpoint.
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. See `aiplatform.Endpoint.predict` for details.
+            parameters (Dict):
+                The parameters that govern the prediction. See
+                `aiplatform.Endpoint.predict` for details.
+            timeout (float): Optional. The timeout for this request in seconds.
+            return_format (str):
+                Optional. The format of the returned predictions, "json" or
+                "numpy". See `aiplatform.Endpoint.predict` for details.
+
+        Returns:
+            prediction (aiplatform.Prediction):
+                Prediction with returned predictions and Model ID.
+        """
+        self._resource_class._validate_return_format(return_format)
+        prediction_client = aio_base._get_async_client(
+            client_class=utils.PredictionAsyncClientWithOverride,
+            credentials=self.credentials,
+            location=self.location,
+            prediction_client=True,
+        )
+        prediction_response = await prediction_client.predict(
+            endpoint=self.resource_name,
+            instances=instances,
+            parameters=parameters,
+            timeout=timeout,
+        )
+
+        return models.Prediction(
+            predictions=self._resource_class._get_predictions(
+                prediction_response.predictions.pb, return_format=return_format
+            ),
+            deployed_model_id=prediction_response.deployed_model_id,
+            model_version_id=prediction_response.model_version_id,
+            model_resource_name=prediction_response.model,
+        )
+
+
+class Model(aio_base.AsyncResourceNoun):
+    """The asyncio flavor of aiplatform.Model.
+
+    Example usage:
+
+        model = await aiplatform.aio.Model.get("456@2")
+    """
+
+    _resource_class = models.Model
+    _client_class = utils.ModelAsyncClientWithOverride
+    _resource_id_validator = staticmethod(
+        base.VertexAiResourceNoun._revisioned_resource_id_validator
+    )
+
+    @property
+    def version_id(self) -> str:
+        """The version ID of the model."""
+        return self._gca_resource.version_id
+
+    @property
+    def versioned_resource_name(self) -> str:
+        """The fully-qualified resource name, including the version ID. For example,
+        projects/{project}/locations/{location}/models/{model_id}@{version_id}
+        """
+        return models.ModelRegistry._get_versioned_name(
+            self.resource_name,
+            self.version_id,
+        )
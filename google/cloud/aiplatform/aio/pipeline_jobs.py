@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Optional
+
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import pipeline_jobs
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.aio import base as aio_base
+
+_LOGGER = base.Logger(__name__)
+
+
+class PipelineJob(aio_base.AsyncStatefulResourceNoun):
+    """The asyncio flavor of aiplatform.PipelineJob.
+
+    Example usage:
+
+        pipeline_job = await aiplatform.aio.PipelineJob.create(
+            aiplatform.PipelineJob(
+                display_name="my-pipeline",
+                template_path="pipeline.json",
+                parameter_values={"learning_rate": 0.1},
+            )
+        )
+        await pipeline_job.wait()
+    """
+
+    _resource_class = pipeline_jobs.PipelineJob
+    _client_class = utils.PipelineJobAsyncClientWithOverride
+    _cancel_method = "cancel_pipeline_job"
+    _error_states = pipeline_jobs._PIPELINE_ERROR_STATES
+
+    @classmethod
+    async def create(
+        cls,
+        pipeline_job: pipeline_jobs.PipelineJob,
+        service_account: Optional[str] = None,
+        network: Optional[str] = None,
+        create_request_timeout: Optional[float] = None,
+    ) -> "PipelineJob":
+        """Submits a configured PipelineJob.
+
+        The pipeline is configured by constructing an `aiplatform.PipelineJob`,
+        which does not send any request to Vertex AI. Unlike
+        `aiplatform.PipelineJob.submit`, the bucket of the output artifacts
+        directory is not created when it does not exist, and experiments are
+        not supported.
+
+        Args:
+            pipeline_job (aiplatform.PipelineJob):
+                Required. The configured, not yet submitted, pipeline job.
+            service_account (str):
+                Optional. Specifies the service account for workload run-as account.
+                Users submitting jobs must have act-as permission on this run-as account.
+            network (str):
+                Optional. The full name of the Compute Engine network to which the job
+                should be peered. For example, projects/12345/global/networks/myVPC.
+                If left unspecified, the network set in aiplatform.init will be used.
+                Otherwise, the job is not peered with any network.
+            create_request_timeout (float):
+                Optional. The timeout for the create request in seconds.
+
+        Returns:
+            (aiplatform.aio.PipelineJob):
+                The submitted pipeline job.
+        """
+        gapic_pipeline_job = pipeline_job._gca_resource
+        network = network or initializer.global_config.network
+
+        if service_account:
+            gapic_pipeline_job.service_account = service_account
+
+        if network:
+            gapic_pipeline_job.network = network
+
+        api_client = aio_base._get_async_client(
+            client_class=cls._client_class,
+            credentials=pipeline_job.credentials,
+            location=pipeline_job.location,
+        )
+
+        _LOGGER.log_create_with_lro(cls)
+
+        gapic_pipeline_job = await api_client.create_pipeline_job(
+            parent=pipeline_job._parent,
+            pipeline_job=gapic_pipeline_job,
+            pipeline_job_id=pipeline_job.job_id,
+            timeout=create_request_timeout,
+        )
+
+        _LOGGER.log_create_complete_with_getter(cls, gapic_pipeline_job, "pipeline_job")
+
+        return cls(gapic_pipeline_job, credentials=pipeline_job.credentials)
@@ -19,8 +19,11 @@ import abc
 from concurrent import futures
 import datetime
 import functools
+import heapq
 import inspect
+import itertools
 import logging
+import queue
 import re
 import sys
 import threading
@@ -31,6 +34,7 @@ from typing import (
     Dict,
     List,
     Iterable,
+    Iterator,
     Optional,
     Sequence,
     Tuple,
@@ -56,6 +60,61 @@ from google.protobuf import json_format
 # This is the default retry callback to be used with get methods.
 _DEFAULT_RETRY = retry.Retry()
 
+# Maximum number of listed resources fetched ahead of the consumer by iter_list.
+_LIST_PREFETCH_MAX_ITEMS = 1000
+
+
+def _iter_prefetched(items: Iterable[Any], max_prefetched: int) -> Iterator[Any]:
+    """Iterates over items while a background thread fetches the next ones.
+
+    Used to fetch the next page of a GAPIC pager while the current page is
+    consumed. The background thread stops once the returned iterator is closed
+    or garbage collected.
+
+    Args:
+        items (Iterable[Any]):
+            Required. The items to iterate over, e.g. a GAPIC pager.
+        max_prefetched (int):
+            Required. The maximum number of items fetched ahead of the consumer.
+
+    Yields:
+        The items, in order.
+    """
+    done = object()
+    buffer = queue.Queue(maxsize=max_prefetched)
+    stopped = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _fetch():
+        try:
+            for item in items:
+                if not _put((item, None)):
+                    return
+        except Exception as exc:
+            _put((done, exc))
+            return
+        _put((done, None))
+
+    threading.Thread(target=_fetch, daemon=True).start()
+    try:
+        while True:
+            item, exc = buffer.get()
+            if exc is not None:
+                raise exc
+            if item is done:
+                return
+            yield item
+    finally:
+        stopped.set()
+
 
 class Logger:
     """Logging wrapper class with high level helper methods."""
@@ -1035,6 +1094,23 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         sdk_resource._gca_resource = gapic_resource
         return sdk_resource
 
+    # Whether the list API of the resource does not support `order_by`, so that
+    # listed resources are ordered client-side by iter_list.
+    _list_order_by_locally = False
+
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: proto.Message) -> bool:
+        """Returns whether a listed GAPIC resource is represented by this class.
+
+        Args:
+            gapic_resource (proto.Message):
+                Required. A GAPIC resource returned by the list API.
+
+        Returns:
+            True if the resource should be listed by this class.
+        """
+        return True
+
     # TODO(b/144545165): Improve documentation for list filtering once available
     # TODO(b/184910159): Expose `page_size` field in list method
     @classmethod
@@ -1053,6 +1129,45 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         takes a `cls_filter` arg to filter to a particular SDK resource
         subclass.
 
+        See `_iter_list` for the arguments.
+
+        Returns:
+            List[VertexAiResourceNoun] - A list of SDK resource objects
+        """
+        return list(
+            cls._iter_list(
+                cls_filter=cls_filter,
+                filter=filter,
+                order_by=order_by,
+                read_mask=read_mask,
+                project=project,
+                location=location,
+                credentials=credentials,
+                parent=parent,
+            )
+        )
+
+    @classmethod
+    def _iter_list(
+        cls,
+        cls_filter: Callable[[proto.Message], bool] = lambda _: True,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        read_mask: Optional[field_mask.FieldMask] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[VertexAiResourceNoun]:
+        """Private method to lazily list all instances of this Vertex AI
+        Resource, takes a `cls_filter` arg to filter to a particular SDK resource
+        subclass.
+
+        The list request is sent when the iteration starts. The following pages
+        are requested as the iteration proceeds.
+
         Args:
             cls_filter (Callable[[proto.Message], bool]):
                 A function that takes one argument, a GAPIC resource, and returns
@@ -1085,9 +1200,15 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
                 credentials set in aiplatform.init.
             parent (str):
                 Optional. The parent resource name if any to retrieve resource list from.
-
-        Returns:
-            List[VertexAiResourceNoun] - A list of SDK resource objects
+            page_size (int):
+                Optional. The number of resources requested per page. If not set,
+                the service default is used.
+            prefetch (bool):
+                Optional. Whether to request the next page in a background thread
+                while the current page is consumed.
+
+        Yields:
+            VertexAiResourceNoun - The SDK resource objects
         """
         if parent:
             parent_resources = utils.extract_project_and_location_from_parent(parent)
@@ -1123,15 +1244,25 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         if order_by:
             list_request["order_by"] = order_by
 
+        if page_size:
+            list_request["page_size"] = page_size
+
         resource_list = resource_list_method(request=list_request) or []
 
-        return [
-            cls._construct_sdk_resource_from_gapic(
-                gapic_resource, project=project, location=location, credentials=creds
+        if prefetch:
+            resource_list = _iter_prefetched(
+                resource_list,
+                max_prefetched=page_size or _LIST_PREFETCH_MAX_ITEMS,
             )
-            for gapic_resource in resource_list
-            if cls_filter(gapic_resource)
-        ]
+
+        for gapic_resource in resource_list:
+            if cls_filter(gapic_resource):
+                yield cls._construct_sdk_resource_from_gapic(
+                    gapic_resource,
+                    project=project,
+                    location=location,
+                    credentials=creds,
+                )
 
     @classmethod
     def _list_with_local_order(
@@ -1183,8 +1314,51 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
         Returns:
             List[VertexAiResourceNoun] - A list of SDK resource objects
         """
+        return list(
+            cls._iter_list_with_local_order(
+                cls_filter=cls_filter,
+                filter=filter,
+                order_by=order_by,
+                read_mask=read_mask,
+                project=project,
+                location=location,
+                credentials=credentials,
+            )
+        )
 
-        li = cls._list(
+    @classmethod
+    def _iter_list_with_local_order(
+        cls,
+        cls_filter: Callable[[proto.Message], bool] = lambda _: True,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        read_mask: Optional[field_mask.FieldMask] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+        max_results: Optional[int] = None,
+    ) -> Iterator[VertexAiResourceNoun]:
+        """Private method to lazily list instances of this Vertex AI Resource
+        with client-side sorting.
+
+        Without `order_by`, resources are yielded as their pages are received.
+        With `order_by`, all resources have to be listed before the first one is
+        yielded; if `max_results` is set only the first `max_results` resources
+        are kept, in a bounded heap.
+
+        See `_iter_list` for the other arguments.
+
+        Args:
+            max_results (int):
+                Optional. The maximum number of resources to yield.
+
+        Yields:
+            VertexAiResourceNoun - The SDK resource objects
+        """
+        resources = cls._iter_list(
             cls_filter=cls_filter,
             filter=filter,
             order_by=None,  # This method will handle the ordering locally
@@ -1192,19 +1366,28 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             project=project,
             location=location,
             credentials=credentials,
+            parent=parent,
+            page_size=page_size,
+            prefetch=prefetch,
         )
 
-        if order_by:
-            desc = "desc" in order_by
-            order_by = order_by.replace("desc", "")
-            order_by = order_by.split(",")
+        if not order_by:
+            yield from itertools.islice(resources, max_results)
+            return
 
-            li.sort(
-                key=lambda x: tuple(getattr(x, field.strip()) for field in order_by),
-                reverse=desc,
-            )
+        desc = "desc" in order_by
+        order_by = order_by.replace("desc", "")
+        order_by = order_by.split(",")
 
-        return li
+        def _key(resource: VertexAiResourceNoun) -> Tuple:
+            return tuple(getattr(resource, field.strip()) for field in order_by)
+
+        if max_results is None:
+            yield from sorted(resources, key=_key, reverse=desc)
+        elif desc:
+            yield from heapq.nlargest(max_results, resources, key=_key)
+        else:
+            yield from heapq.nsmallest(max_results, resources, key=_key)
 
     @classmethod
     def list(
@@ -1259,6 +1442,88 @@ class VertexAiResourceNounWithFutureManager(VertexAiResourceNoun, FutureManager)
             parent=parent,
         )
 
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,
+        order_by: Optional[str] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        parent: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[VertexAiResourceNoun]:
+        """Lazily list instances of this Vertex AI Resource.
+
+        Unlike `list`, resources are yielded page by page as soon as they are
+        received, while the next page is requested in the background. Breaking
+        out of the iteration stops the listing. Resources of list APIs without
+        server-side ordering are all listed before the first one is yielded if
+        `order_by` is set.
+
+        Example Usage:
+
+        for model in aiplatform.Model.iter_list(filter='labels.team="fraud"'):
+            if model.display_name == "my_model":
+                break
+
+        Args:
+            filter (str):
+                Optional. An expression for filtering the results of the request.
+                For field names both snake_case and camelCase are supported.
+            order_by (str):
+                Optional. A comma-separated list of fields to order by, sorted in
+                ascending order. Use "desc" after a field name for descending.
+                Supported fields: `display_name`, `create_time`, `update_time`
+            project (str):
+                Optional. Project to retrieve list from. If not set, project
+                set in aiplatform.init will be used.
+            location (str):
+                Optional. Location to retrieve list from. If not set, location
+                set in aiplatform.init will be used.
+            credentials (auth_credentials.Credentials):
+                Optional. Custom credentials to use to retrieve list. Overrides
+                credentials set in aiplatform.init.
+            parent (str):
+                Optional. The parent resource name if any to retrieve list from.
+            page_size (int):
+                Optional. The number of resources requested per page.
+            max_results (int):
+                Optional. The maximum number of resources to yield.
+
+        Returns:
+            Iterator[VertexAiResourceNoun] - An iterator of SDK resource objects
+        """
+        if cls._list_order_by_locally:
+            return cls._iter_list_with_local_order(
+                cls_filter=cls._list_cls_filter,
+                filter=filter,
+                order_by=order_by,
+                project=project,
+                location=location,
+                credentials=credentials,
+                parent=parent,
+                page_size=page_size,
+                prefetch=True,
+                max_results=max_results,
+            )
+
+        return itertools.islice(
+            cls._iter_list(
+                cls_filter=cls._list_cls_filter,
+                filter=filter,
+                order_by=order_by,
+                project=project,
+                location=location,
+                credentials=credentials,
+                parent=parent,
+                page_size=page_size,
+                prefetch=True,
+            ),
+            max_results,
+        )
+
     @optional_sync()
     def delete(self, sync: bool = True) -> None:
         """Deletes this Vertex AI resource. WARNING: This deletion is
@@ -29,16 +29,30 @@ if DEFAULT_VERSION == V1BETA1:
     services.deployment_resource_pool_service_client = (
         services.deployment_resource_pool_service_client_v1beta1
     )
+    services.endpoint_service_async_client = (
+        services.endpoint_service_async_client_v1beta1
+    )
     services.endpoint_service_client = services.endpoint_service_client_v1beta1
     services.featurestore_online_serving_service_client = (
         services.featurestore_online_serving_service_client_v1beta1
     )
+    services.featurestore_service_async_client = (
+        services.featurestore_service_async_client_v1beta1
+    )
     services.featurestore_service_client = services.featurestore_service_client_v1beta1
+    services.job_service_async_client = services.job_service_async_client_v1beta1
     services.job_service_client = services.job_service_client_v1beta1
+    services.model_service_async_client = services.model_service_async_client_v1beta1
     services.model_service_client = services.model_service_client_v1beta1
     services.model_garden_service_client = services.model_garden_service_client_v1beta1
+    services.pipeline_service_async_client = (
+        services.pipeline_service_async_client_v1beta1
+    )
     services.pipeline_service_client = services.pipeline_service_client_v1beta1
     services.prediction_service_client = services.prediction_service_client_v1beta1
+    services.prediction_service_async_client = (
+        services.prediction_service_async_client_v1beta1
+    )
     services.schedule_service_client = services.schedule_service_client_v1beta1
     services.specialist_pool_service_client = (
         services.specialist_pool_service_client_v1beta1
@@ -134,16 +148,26 @@ if DEFAULT_VERSION == V1BETA1:
 if DEFAULT_VERSION == V1:
 
     services.dataset_service_client = services.dataset_service_client_v1
+    services.endpoint_service_async_client = services.endpoint_service_async_client_v1
     services.endpoint_service_client = services.endpoint_service_client_v1
     services.featurestore_online_serving_service_client = (
         services.featurestore_online_serving_service_client_v1
     )
+    services.featurestore_service_async_client = (
+        services.featurestore_service_async_client_v1
+    )
     services.featurestore_service_client = services.featurestore_service_client_v1
+    services.job_service_async_client = services.job_service_async_client_v1
     services.job_service_client = services.job_service_client_v1
     services.model_garden_service_client = services.model_garden_service_client_v1
+    services.model_service_async_client = services.model_service_async_client_v1
     services.model_service_client = services.model_service_client_v1
+    services.pipeline_service_async_client = services.pipeline_service_async_client_v1
     services.pipeline_service_client = services.pipeline_service_client_v1
     services.prediction_service_client = services.prediction_service_client_v1
+    services.prediction_service_async_client = (
+        services.prediction_service_async_client_v1
+    )
     services.specialist_pool_service_client = services.specialist_pool_service_client_v1
     services.tensorboard_service_client = services.tensorboard_service_client_v1
     services.index_service_client = services.index_service_client_v1
@@ -21,12 +21,18 @@ from google.cloud.aiplatform_v1beta1.services.dataset_service import (
 from google.cloud.aiplatform_v1beta1.services.deployment_resource_pool_service import (
     client as deployment_resource_pool_service_client_v1beta1,
 )
+from google.cloud.aiplatform_v1beta1.services.endpoint_service import (
+    async_client as endpoint_service_async_client_v1beta1,
+)
 from google.cloud.aiplatform_v1beta1.services.endpoint_service import (
     client as endpoint_service_client_v1beta1,
 )
 from google.cloud.aiplatform_v1beta1.services.featurestore_online_serving_service import (
     client as featurestore_online_serving_service_client_v1beta1,
 )
+from google.cloud.aiplatform_v1beta1.services.featurestore_service import (
+    async_client as featurestore_service_async_client_v1beta1,
+)
 from google.cloud.aiplatform_v1beta1.services.featurestore_service import (
     client as featurestore_service_client_v1beta1,
 )
@@ -36,6 +42,9 @@ from google.cloud.aiplatform_v1beta1.services.index_service import (
 from google.cloud.aiplatform_v1beta1.services.index_endpoint_service import (
     client as index_endpoint_service_client_v1beta1,
 )
+from google.cloud.aiplatform_v1beta1.services.job_service import (
+    async_client as job_service_async_client_v1beta1,
+)
 from google.cloud.aiplatform_v1beta1.services.job_service import (
     client as job_service_client_v1beta1,
 )
@@ -48,12 +57,21 @@ from google.cloud.aiplatform_v1beta1.services.metadata_service import (
 from google.cloud.aiplatform_v1beta1.services.model_garden_service import (
     client as model_garden_service_client_v1beta1,
 )
+from google.cloud.aiplatform_v1beta1.services.model_service import (
+    async_client as model_service_async_client_v1beta1,
+)
 from google.cloud.aiplatform_v1beta1.services.model_service import (
     client as model_service_client_v1beta1,
 )
+from google.cloud.aiplatform_v1beta1.services.pipeline_service import (
+    async_client as pipeline_service_async_client_v1beta1,
+)
 from google.cloud.aiplatform_v1beta1.services.pipeline_service import (
     client as pipeline_service_client_v1beta1,
 )
+from google.cloud.aiplatform_v1beta1.services.prediction_service import (
+    async_client as prediction_service_async_client_v1beta1,
+)
 from google.cloud.aiplatform_v1beta1.services.prediction_service import (
     client as prediction_service_client_v1beta1,
 )
@@ -73,12 +91,18 @@ from google.cloud.aiplatform_v1beta1.services.vizier_service import (
 from google.cloud.aiplatform_v1.services.dataset_service import (
     client as dataset_service_client_v1,
 )
+from google.cloud.aiplatform_v1.services.endpoint_service import (
+    async_client as endpoint_service_async_client_v1,
+)
 from google.cloud.aiplatform_v1.services.endpoint_service import (
     client as endpoint_service_client_v1,
 )
 from google.cloud.aiplatform_v1.services.featurestore_online_serving_service import (
     client as featurestore_online_serving_service_client_v1,
 )
+from google.cloud.aiplatform_v1.services.featurestore_service import (
+    async_client as featurestore_service_async_client_v1,
+)
 from google.cloud.aiplatform_v1.services.featurestore_service import (
     client as featurestore_service_client_v1,
 )
@@ -88,6 +112,9 @@ from google.cloud.aiplatform_v1.services.index_service import (
 from google.cloud.aiplatform_v1.services.index_endpoint_service import (
     client as index_endpoint_service_client_v1,
 )
+from google.cloud.aiplatform_v1.services.job_service import (
+    async_client as job_service_async_client_v1,
+)
 from google.cloud.aiplatform_v1.services.job_service import (
     client as job_service_client_v1,
 )
@@ -97,12 +124,21 @@ from google.cloud.aiplatform_v1.services.metadata_service import (
 from google.cloud.aiplatform_v1.services.model_garden_service import (
     client as model_garden_service_client_v1,
 )
+from google.cloud.aiplatform_v1.services.model_service import (
+    async_client as model_service_async_client_v1,
+)
 from google.cloud.aiplatform_v1.services.model_service import (
     client as model_service_client_v1,
 )
+from google.cloud.aiplatform_v1.services.pipeline_service import (
+    async_client as pipeline_service_async_client_v1,
+)
 from google.cloud.aiplatform_v1.services.pipeline_service import (
     client as pipeline_service_client_v1,
 )
+from google.cloud.aiplatform_v1.services.prediction_service import (
+    async_client as prediction_service_async_client_v1,
+)
 from google.cloud.aiplatform_v1.services.prediction_service import (
     client as prediction_service_client_v1,
 )
@@ -119,16 +155,22 @@ from google.cloud.aiplatform_v1.services.vizier_service import (
 __all__ = (
     # v1
     dataset_service_client_v1,
+    endpoint_service_async_client_v1,
     endpoint_service_client_v1,
     featurestore_online_serving_service_client_v1,
+    featurestore_service_async_client_v1,
     featurestore_service_client_v1,
     index_service_client_v1,
     index_endpoint_service_client_v1,
+    job_service_async_client_v1,
     job_service_client_v1,
     metadata_service_client_v1,
     model_garden_service_client_v1,
+    model_service_async_client_v1,
     model_service_client_v1,
+    pipeline_service_async_client_v1,
     pipeline_service_client_v1,
+    prediction_service_async_client_v1,
     prediction_service_client_v1,
     specialist_pool_service_client_v1,
     tensorboard_service_client_v1,
@@ -136,16 +178,22 @@ __all__ = (
     # v1beta1
     dataset_service_client_v1beta1,
     deployment_resource_pool_service_client_v1beta1,
+    endpoint_service_async_client_v1beta1,
     endpoint_service_client_v1beta1,
     featurestore_online_serving_service_client_v1beta1,
+    featurestore_service_async_client_v1beta1,
     featurestore_service_client_v1beta1,
     index_service_client_v1beta1,
     index_endpoint_service_client_v1beta1,
+    job_service_async_client_v1beta1,
     job_service_client_v1beta1,
     match_service_client_v1beta1,
     model_garden_service_client_v1beta1,
+    model_service_async_client_v1beta1,
     model_service_client_v1beta1,
+    pipeline_service_async_client_v1beta1,
     pipeline_service_client_v1beta1,
+    prediction_service_async_client_v1beta1,
     prediction_service_client_v1beta1,
     schedule_service_client_v1beta1,
     specialist_pool_service_client_v1beta1,
@@ -49,6 +49,8 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
 
     _supported_metadata_schema_uris: Tuple[str] = ()
 
+    _list_order_by_locally = True
+
     def __init__(
         self,
         dataset_name: str,
@@ -672,6 +674,11 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
 
         return self
 
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: gca_dataset.Dataset) -> bool:
+        """Returns whether a listed dataset has a metadata schema of this class."""
+        return gapic_resource.metadata_schema_uri in cls._supported_metadata_schema_uris
+
     @classmethod
     def list(
         cls,
@@ -711,14 +718,8 @@ class _Dataset(base.VertexAiResourceNounWithFutureManager):
         Returns:
             List[base.VertexAiResourceNoun] - A list of Dataset resource objects
         """
-
-        dataset_subclass_filter = (
-            lambda gapic_obj: gapic_obj.metadata_schema_uri
-            in cls._supported_metadata_schema_uris
-        )
-
         return cls._list_with_local_order(
-            cls_filter=dataset_subclass_filter,
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
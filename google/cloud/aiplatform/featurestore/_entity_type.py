@@ -15,11 +15,17 @@
 # limitations under the License.
 #
 
+import collections
+from concurrent import futures
 import datetime
+import os
+import tempfile
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 import uuid
 from google.protobuf import timestamp_pb2
 
+from google.api_core import exceptions
+from google.api_core import retry
 from google.auth import credentials as auth_credentials
 from google.protobuf import field_mask_pb2
 
@@ -36,13 +42,86 @@ from google.cloud.aiplatform import featurestore
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import featurestore_utils
+from google.cloud.aiplatform.utils import gcs_utils
 from google.cloud.aiplatform.utils import resource_manager_utils
 
 from google.cloud import bigquery
+from google.cloud import storage
 
 _LOGGER = base.Logger(__name__)
 _ALL_FEATURE_IDS = "*"
 
+# Ways ingest_from_df stages a DataFrame before importing it.
+_DF_STAGING_STRATEGIES = {"auto", "bigquery", "gcs"}
+
+# Approximate in-memory size of the rows of a DataFrame staged as one CSV file.
+_GCS_STAGING_FILE_DF_BYTES = 64 << 20
+
+# Maximum number of CSV files converted and uploaded at the same time.
+_DEFAULT_GCS_STAGING_MAX_WORKERS = 8
+
+# Feature value types that cannot be imported from CSV files.
+_CSV_UNSUPPORTED_FEATURE_VALUE_TYPES = {
+    "BOOL_ARRAY",
+    "DOUBLE_ARRAY",
+    "INT64_ARRAY",
+    "STRING_ARRAY",
+    "BYTES",
+}
+
+# The StreamingReadFeatureValues API accepts up to 100 entity IDs per request.
+_MAX_ENTITY_IDS_PER_READ_REQUEST = 100
+
+# Maximum number of StreamingReadFeatureValues requests in flight at the same time.
+_DEFAULT_MAX_CONCURRENT_READ_REQUESTS = 8
+
+# The WriteFeatureValues API accepts up to 100,000 feature values per request.
+_MAX_FEATURE_VALUES_PER_WRITE_REQUEST = 100000
+
+# FeatureValue fields set directly from the values of a DataFrame column, by the
+# kind of the column's NumPy dtype, or for object columns, by the type of their
+# values inferred by pandas. Values of other columns are converted one by one.
+_FEATURE_VALUE_FIELD_BY_DTYPE_KIND = {
+    "b": "bool_value",
+    "i": "int64_value",
+    "u": "int64_value",
+    "f": "double_value",
+}
+_FEATURE_VALUE_FIELD_BY_INFERRED_TYPE = {
+    "boolean": "bool_value",
+    "string": "string_value",
+    "bytes": "bytes_value",
+    "integer": "int64_value",
+    "floating": "double_value",
+}
+
+# Retries a write request throttled by the online store with exponential backoff.
+_WRITE_FEATURE_VALUES_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(exceptions.ResourceExhausted),
+    initial=1.0,
+    maximum=32.0,
+    multiplier=2.0,
+    deadline=300.0,
+)
+
+
+class FeatureValuesWriteError(RuntimeError):
+    """Raised when some of the requests of a feature values write failed.
+
+    Attributes:
+        errors (List[Tuple[List[str], Exception]]):
+            The entity IDs of the payloads of each failed request, along with
+            the error the request failed with.
+    """
+
+    def __init__(self, errors: List[Tuple[List[str], Exception]]):
+        self.errors = errors
+        failed_payload_count = sum(len(entity_ids) for entity_ids, _ in errors)
+        super().__init__(
+            f"{len(errors)} write feature values request(s) covering "
+            f"{failed_payload_count} payload(s) failed. First error: {errors[0][1]}"
+        )
+
 
 class _EntityType(base.VertexAiResourceNounWithFutureManager):
     """Private managed EntityType resource for Vertex AI."""
@@ -56,6 +135,8 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
     _parse_resource_name_method = "parse_entity_type_path"
     _format_resource_name_method = "entity_type_path"
 
+    _read_cache: Optional[featurestore_utils.FeatureValueCache] = None
+
     @staticmethod
     def _resource_id_validator(resource_id: str):
         """Validates resource ID.
@@ -142,6 +223,62 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         self.wait()
         return self._get_featurestore_name()
 
+    @property
+    def read_cache(self) -> Optional[featurestore_utils.FeatureValueCache]:
+        """The cache of feature values read by `read`, or None if not enabled.
+
+        Its `hits` and `misses` attributes count the (entity ID, feature ID)
+        pairs served from the cache and read from the online store.
+        """
+        return self._read_cache
+
+    def enable_read_cache(
+        self, max_size: int = 10000, ttl: float = 60.0
+    ) -> "_EntityType":
+        """Enables a client-side cache of the feature values read by `read`.
+
+        Feature values read with explicit feature IDs are served from the cache
+        for `ttl` seconds, and only the (entity ID, feature ID) pairs missing
+        from the cache are read from the online store. Feature values written
+        with `write_feature_values` of this EntityType object are removed from
+        the cache; writes by other clients are not seen until the cached values
+        expire.
+
+        Example Usage:
+
+            my_entity_type = aiplatform.EntityType(
+                entity_type_name="my_entity_type_id",
+                featurestore_id="my_featurestore_id",
+            ).enable_read_cache(max_size=100000, ttl=30)
+            my_entity_type.read(entity_ids=["movie_01"], feature_ids=["average_rating"])
+            print(my_entity_type.read_cache.hits, my_entity_type.read_cache.misses)
+
+        Args:
+            max_size (int):
+                Optional. The maximum number of cached (entity ID, feature ID)
+                pairs. Defaults to 10000.
+            ttl (float):
+                Optional. The number of seconds a cached feature value is served
+                for. Defaults to 60.
+
+        Returns:
+            EntityType - This EntityType object.
+        """
+        self._read_cache = featurestore_utils.FeatureValueCache(
+            max_size=max_size, ttl=ttl
+        )
+        return self
+
+    def disable_read_cache(self) -> "_EntityType":
+        """Disables the client-side cache of feature values enabled by
+        `enable_read_cache` and drops the cached values.
+
+        Returns:
+            EntityType - This EntityType object.
+        """
+        self._read_cache = None
+        return self
+
     def get_featurestore(self) -> "featurestore.Featurestore":
         """Retrieves the managed featurestore in which this EntityType is.
 
@@ -1208,6 +1345,9 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         entity_id_field: Optional[str] = None,
         request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
         ingest_request_timeout: Optional[float] = None,
+        staging_strategy: str = "bigquery",
+        staging_gcs_dir: Optional[str] = None,
+        max_upload_workers: Optional[int] = None,
     ) -> "_EntityType":
         """Ingest feature values from DataFrame.
 
@@ -1215,7 +1355,8 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             Calling this method will automatically create and delete a temporary
             bigquery dataset in the same GCP project, which will be used
             as the intermediary storage for ingesting feature values
-            from dataframe to featurestore.
+            from dataframe to featurestore. With the `gcs` staging strategy,
+            temporary CSV files in Cloud Storage are used instead.
 
             The call will return upon ingestion completes, where the
             feature values will be ingested into the entity_type.
@@ -1270,10 +1411,33 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 Optional. Strings which should be sent along with the request as metadata.
             ingest_request_timeout (float):
                 Optional. The timeout for the ingest request in seconds.
+            staging_strategy (str):
+                Optional. How the DataFrame is staged before it is imported, one of:
+                    - `bigquery`, the default: loaded into a temporary BigQuery table.
+                    The whole DataFrame is converted to Arrow at once.
+                    - `gcs`: written as CSV files uploaded to a temporary Cloud
+                    Storage directory. This skips the creation and deletion of a
+                    BigQuery dataset and the BigQuery load job. The DataFrame is
+                    converted and uploaded in chunks, several at a time, so large
+                    DataFrames are streamed. Array and bytes features are not
+                    supported.
+                    - `auto`: `gcs` if the features are supported, `bigquery`
+                    otherwise.
+            staging_gcs_dir (str):
+                Optional. Google Cloud Storage bucket or directory to stage the CSV
+                files in with the `gcs` staging strategy. If not provided, the
+                staging bucket set in aiplatform.init is used, or else a regional
+                staging bucket is created if it does not exist.
+            max_upload_workers (int):
+                Optional. The maximum number of CSV files converted and uploaded at
+                the same time with the `gcs` staging strategy. Defaults to 8.
 
         Returns:
             EntityType - The entityType resource object with feature values imported.
 
+        Raises:
+            ValueError: If staging_strategy is not supported, or is `gcs` and
+                some features are array or bytes features.
         """
         import pandas.api.types as pd_types
 
@@ -1285,6 +1449,47 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 f"{self.ingest_from_df.__name__}"
             )
 
+        if staging_strategy not in _DF_STAGING_STRATEGIES:
+            raise ValueError(
+                f"Only {sorted(_DF_STAGING_STRATEGIES)} are supported "
+                f"staging_strategy, not `{staging_strategy}`."
+            )
+
+        self.wait()
+
+        feature_source_fields = feature_source_fields or {}
+        feature_value_types = {
+            feature_id: self.get_feature(feature_id).to_dict()["valueType"]
+            for feature_id in feature_ids
+        }
+        csv_unsupported_feature_ids = [
+            feature_id
+            for feature_id, feature_value_type in feature_value_types.items()
+            if feature_value_type in _CSV_UNSUPPORTED_FEATURE_VALUE_TYPES
+        ]
+
+        if staging_strategy == "gcs" and csv_unsupported_feature_ids:
+            raise ValueError(
+                f"Features {csv_unsupported_feature_ids} of array or bytes value "
+                f"types cannot be staged in Cloud Storage. Please use the "
+                f"`bigquery` staging strategy."
+            )
+        if staging_strategy == "auto":
+            staging_strategy = "bigquery" if csv_unsupported_feature_ids else "gcs"
+
+        if staging_strategy == "gcs":
+            return self._ingest_from_df_via_gcs(
+                feature_ids=feature_ids,
+                feature_time=feature_time,
+                df_source=df_source,
+                feature_source_fields=feature_source_fields,
+                entity_id_field=entity_id_field,
+                request_metadata=request_metadata,
+                ingest_request_timeout=ingest_request_timeout,
+                staging_gcs_dir=staging_gcs_dir,
+                max_upload_workers=max_upload_workers,
+            )
+
         if any(
             [
                 pd_types.is_datetime64_any_dtype(df_source[column])
@@ -1299,15 +1504,11 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             project=self.project, credentials=self.credentials
         )
 
-        self.wait()
-
-        feature_source_fields = feature_source_fields or {}
         bq_schema = []
         for feature_id in feature_ids:
             feature_field_name = feature_source_fields.get(feature_id, feature_id)
-            feature_value_type = self.get_feature(feature_id).to_dict()["valueType"]
             bq_schema_field = self._get_bq_schema_field(
-                feature_field_name, feature_value_type
+                feature_field_name, feature_value_types[feature_id]
             )
             bq_schema.append(bq_schema_field)
 
@@ -1369,6 +1570,131 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
 
         return entity_type_obj
 
+    def _ingest_from_df_via_gcs(
+        self,
+        feature_ids: List[str],
+        feature_time: Union[str, datetime.datetime],
+        df_source: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        feature_source_fields: Dict[str, str],
+        entity_id_field: Optional[str] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        ingest_request_timeout: Optional[float] = None,
+        staging_gcs_dir: Optional[str] = None,
+        max_upload_workers: Optional[int] = None,
+    ) -> "_EntityType":
+        """Ingests feature values from a DataFrame staged as CSV files in a
+        temporary Cloud Storage directory.
+
+        The DataFrame is split into chunks of about 64 MiB of memory. Each
+        chunk is converted to a CSV file and uploaded on a worker thread, so
+        that only the chunks being uploaded are held in CSV form at a time.
+        The staged files are deleted once the ingestion is done.
+
+        See `ingest_from_df` for the arguments.
+
+        Returns:
+            EntityType - The entityType resource object with feature values imported.
+        """
+        import pyarrow
+        from pyarrow import csv as pyarrow_csv
+        import pandas.api.types as pd_types
+
+        source_columns = [entity_id_field or "entity_id"] + [
+            feature_source_fields.get(feature_id, feature_id)
+            for feature_id in feature_ids
+        ]
+        if isinstance(feature_time, str):
+            source_columns.append(feature_time)
+        # The columns are selected per chunk so that the DataFrame is not copied.
+        source_columns = list(dict.fromkeys(source_columns))
+
+        row_count = len(df_source)
+        df_bytes = sum(
+            df_source[column].memory_usage(index=False, deep=True)
+            for column in source_columns
+        )
+        rows_per_file = max(
+            1, int(row_count * _GCS_STAGING_FILE_DF_BYTES / max(df_bytes, 1))
+        )
+
+        staging_gcs_dir = gcs_utils.get_staging_gcs_dir(
+            staging_gcs_dir=staging_gcs_dir,
+            project=self.project,
+            location=self.location,
+            credentials=self.credentials,
+        )
+        entity_type_id = self._parse_resource_name(self.resource_name)["entity_type"]
+        staging_gcs_subdir = (
+            f"{staging_gcs_dir.rstrip('/')}/vertex_ai_auto_staging/"
+            f"{entity_type_id}-{uuid.uuid4()}"
+        )
+        storage_client = storage.Client(
+            project=self.project, credentials=self.credentials
+        )
+
+        def upload_chunk(start: int) -> str:
+            chunk = df_source.iloc[start : start + rows_per_file][source_columns]
+            if isinstance(feature_time, str) and pd_types.is_datetime64_any_dtype(
+                chunk[feature_time]
+            ):
+                # Feature timestamps are read from CSV files in RFC 3339 format.
+                feature_timestamps = chunk[feature_time]
+                if feature_timestamps.dt.tz is not None:
+                    feature_timestamps = feature_timestamps.dt.tz_convert("UTC")
+                chunk = chunk.assign(
+                    **{
+                        feature_time: feature_timestamps.dt.strftime(
+                            "%Y-%m-%dT%H:%M:%S.%fZ"
+                        )
+                    }
+                )
+            gcs_uri = f"{staging_gcs_subdir}/part-{start // rows_per_file:05d}.csv"
+            with tempfile.TemporaryDirectory() as temp_dir:
+                local_path = os.path.join(temp_dir, "part.csv")
+                pyarrow_csv.write_csv(
+                    pyarrow.Table.from_pandas(chunk, preserve_index=False),
+                    local_path,
+                )
+                storage.Blob.from_string(
+                    uri=gcs_uri, client=storage_client
+                ).upload_from_filename(filename=local_path)
+            return gcs_uri
+
+        _LOGGER.info(f"Staging DataFrame as CSV files in {staging_gcs_subdir}")
+
+        upload_futures = []
+        try:
+            # Chunks are sliced and converted on the workers, so only the chunks
+            # being uploaded are held in CSV form at a time.
+            with futures.ThreadPoolExecutor(
+                max_workers=max_upload_workers or _DEFAULT_GCS_STAGING_MAX_WORKERS
+            ) as executor:
+                upload_futures = [
+                    executor.submit(upload_chunk, start)
+                    for start in range(0, max(row_count, 1), rows_per_file)
+                ]
+            gcs_source_uris = [future.result() for future in upload_futures]
+
+            entity_type_obj = self.ingest_from_gcs(
+                feature_ids=feature_ids,
+                feature_time=feature_time,
+                gcs_source_uris=gcs_source_uris,
+                gcs_source_type="csv",
+                feature_source_fields=feature_source_fields,
+                entity_id_field=entity_id_field,
+                request_metadata=request_metadata,
+                ingest_request_timeout=ingest_request_timeout,
+            )
+
+        finally:
+            for future in upload_futures:
+                if not future.exception():
+                    storage.Blob.from_string(
+                        uri=future.result(), client=storage_client
+                    ).delete()
+
+        return entity_type_obj
+
     @staticmethod
     def _get_bq_schema_field(
         name: str, feature_value_type: str
@@ -1428,10 +1754,14 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
     ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
         """Reads feature values for given feature IDs of given entity IDs in this EntityType.
 
+        If the read cache is enabled with `enable_read_cache`, feature values of
+        explicit feature IDs are served from the cache when they are cached.
+
         Args:
             entity_ids (Union[str, List[str]]):
                 Required. ID for a specific entity, or a list of IDs of entities
-                to read Feature values of. The maximum number of IDs is 100 if a list.
+                to read Feature values of. A list of more than 100 IDs is read
+                with concurrent requests of 100 IDs each.
             feature_ids (Union[str, List[str]]):
                 Required. ID for a specific feature, or a list of IDs of Features in the EntityType
                 for reading feature values. Default to "*", where value of all features will be read.
@@ -1447,6 +1777,14 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         if isinstance(feature_ids, str):
             feature_ids = [feature_ids]
 
+        if self._read_cache is not None and _ALL_FEATURE_IDS not in feature_ids:
+            return self._read_through_cache(
+                entity_ids=[entity_ids] if isinstance(entity_ids, str) else entity_ids,
+                feature_ids=feature_ids,
+                request_metadata=request_metadata,
+                read_request_timeout=read_request_timeout,
+            )
+
         feature_selector = gca_feature_selector.FeatureSelector(
             id_matcher=gca_feature_selector.IdMatcher(ids=feature_ids)
         )
@@ -1469,35 +1807,330 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             header = read_feature_values_response.header
             entity_views = [read_feature_values_response.entity_view]
         elif isinstance(entity_ids, list):
-            streaming_read_feature_values_request = (
-                gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
-                    entity_type=self.resource_name,
-                    entity_ids=entity_ids,
-                    feature_selector=feature_selector,
-                )
-            )
-            streaming_read_feature_values_responses = list(
-                self._featurestore_online_client.streaming_read_feature_values(
-                    request=streaming_read_feature_values_request,
-                    metadata=request_metadata,
-                    timeout=read_request_timeout,
-                )
+            header, entity_views = self._streaming_read_entity_views(
+                entity_ids=entity_ids,
+                feature_selector=feature_selector,
+                request_metadata=request_metadata,
+                read_request_timeout=read_request_timeout,
             )
-            header = streaming_read_feature_values_responses[0].header
-            entity_views = [
-                response.entity_view
-                for response in streaming_read_feature_values_responses[1:]
-            ]
 
         feature_ids = [
             feature_descriptor.id for feature_descriptor in header.feature_descriptors
         ]
 
+        if self._read_cache is not None:
+            self._read_cache.put_many(
+                {
+                    (entity_view.entity_id, feature_id): data
+                    for entity_view in entity_views
+                    for feature_id, data in zip(feature_ids, entity_view.data)
+                }
+            )
+
         return self._construct_dataframe(
             feature_ids=feature_ids,
             entity_views=entity_views,
         )
 
+    def _read_through_cache(
+        self,
+        entity_ids: List[str],
+        feature_ids: List[str],
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+    ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
+        """Reads feature values from the read cache, and reads the (entity ID,
+        feature ID) pairs missing from the cache from the online store.
+
+        Entities missing the same features are read together.
+
+        Args:
+            entity_ids (List[str]):
+                Required. IDs of entities to read Feature values of.
+            feature_ids (List[str]):
+                Required. IDs of Features to read values of.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for each read request in seconds.
+
+        Returns:
+            pd.DataFrame: entities' feature values in DataFrame
+        """
+        values = self._read_cache.get_many(
+            (entity_id, feature_id)
+            for entity_id in dict.fromkeys(entity_ids)
+            for feature_id in feature_ids
+        )
+
+        entity_ids_by_missing_feature_ids = collections.defaultdict(list)
+        for entity_id in dict.fromkeys(entity_ids):
+            missing_feature_ids = tuple(
+                feature_id
+                for feature_id in feature_ids
+                if (entity_id, feature_id) not in values
+            )
+            if missing_feature_ids:
+                entity_ids_by_missing_feature_ids[missing_feature_ids].append(entity_id)
+
+        read_values = {}
+        for (
+            missing_feature_ids,
+            missing_entity_ids,
+        ) in entity_ids_by_missing_feature_ids.items():
+            header, entity_views = self._streaming_read_entity_views(
+                entity_ids=missing_entity_ids,
+                feature_selector=gca_feature_selector.FeatureSelector(
+                    id_matcher=gca_feature_selector.IdMatcher(
+                        ids=list(missing_feature_ids)
+                    )
+                ),
+                request_metadata=request_metadata,
+                read_request_timeout=read_request_timeout,
+            )
+            read_feature_ids = [
+                feature_descriptor.id
+                for feature_descriptor in header.feature_descriptors
+            ]
+            for entity_view in entity_views:
+                for feature_id, data in zip(read_feature_ids, entity_view.data):
+                    read_values[(entity_view.entity_id, feature_id)] = data
+
+        self._read_cache.put_many(read_values)
+        values.update(read_values)
+
+        entity_view_type = (
+            gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView
+        )
+        return self._construct_dataframe(
+            feature_ids=feature_ids,
+            entity_views=[
+                entity_view_type(
+                    entity_id=entity_id,
+                    data=[
+                        values.get((entity_id, feature_id), entity_view_type.Data())
+                        for feature_id in feature_ids
+                    ],
+                )
+                for entity_id in entity_ids
+            ],
+        )
+
+    def read_to_arrow(
+        self,
+        entity_ids: List[str],
+        feature_ids: Union[str, List[str]] = "*",
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_READ_REQUESTS,
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Reads feature values for given feature IDs of given entity IDs in this
+        EntityType into a pyarrow Table.
+
+        The entity IDs are read with concurrent requests of up to 100 IDs each.
+        Feature values are decoded column by column into typed Arrow arrays:
+        each column is typed after the value type of the feature, and values
+        that are not set are null. Use `pyarrow.Table.to_pandas` or
+        `pyarrow.ChunkedArray.to_numpy` to convert the result.
+
+        Example Usage:
+
+            my_entity_type = aiplatform.EntityType(
+                entity_type_name="my_entity_type_id",
+                featurestore_id="my_featurestore_id",
+            )
+            table = my_entity_type.read_to_arrow(
+                entity_ids=candidate_ids,
+                feature_ids=["age", "average_rating"],
+            )
+            average_ratings = table.column("average_rating").to_numpy()
+
+        Args:
+            entity_ids (List[str]):
+                Required. IDs of entities to read Feature values of.
+            feature_ids (Union[str, List[str]]):
+                Required. ID for a specific feature, or a list of IDs of Features in the EntityType
+                for reading feature values. Default to "*", where value of all features will be read.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for each read request in seconds.
+            max_concurrent_requests (int):
+                Optional. The maximum number of read requests in flight at the
+                same time. Defaults to 8.
+
+        Returns:
+            pyarrow.Table: An "entity_id" column followed by a column per
+            feature, with a row per entity in the order of entity_ids.
+
+        Raises:
+            ImportError: If pyarrow is not installed when using this method.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError(
+                f"Pyarrow is not installed. Please install pyarrow to use "
+                f"{self.read_to_arrow.__name__}"
+            )
+
+        self.wait()
+        if isinstance(feature_ids, str):
+            feature_ids = [feature_ids]
+
+        header, entity_views = self._streaming_read_entity_views(
+            entity_ids=entity_ids,
+            feature_selector=gca_feature_selector.FeatureSelector(
+                id_matcher=gca_feature_selector.IdMatcher(ids=feature_ids)
+            ),
+            request_metadata=request_metadata,
+            read_request_timeout=read_request_timeout,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+
+        entity_view_pbs = [
+            gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.pb(
+                entity_view
+            )
+            for entity_view in entity_views
+        ]
+        columns = {
+            "entity_id": pyarrow.array(
+                [entity_view_pb.entity_id for entity_view_pb in entity_view_pbs],
+                type=pyarrow.string(),
+            )
+        }
+        for i, feature_descriptor in enumerate(header.feature_descriptors):
+            columns[feature_descriptor.id] = self._decode_feature_values_to_arrow(
+                [entity_view_pb.data[i] for entity_view_pb in entity_view_pbs]
+            )
+
+        return pyarrow.table(columns)
+
+    @staticmethod
+    def _decode_feature_values_to_arrow(
+        data_pbs: List[
+            "gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data"
+        ],
+    ) -> "pyarrow.Array":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Decodes the values of a feature into an Arrow array.
+
+        The value type of the feature is taken from its first set value.
+
+        Args:
+            data_pbs (List[EntityView.Data]):
+                Required. The raw protobuf data of the feature for each entity.
+
+        Returns:
+            pyarrow.Array: The feature values, null where not set.
+        """
+        import pyarrow
+
+        arrow_types = {
+            "bool_value": pyarrow.bool_(),
+            "double_value": pyarrow.float64(),
+            "int64_value": pyarrow.int64(),
+            "string_value": pyarrow.string(),
+            "bytes_value": pyarrow.binary(),
+            "bool_array_value": pyarrow.list_(pyarrow.bool_()),
+            "double_array_value": pyarrow.list_(pyarrow.float64()),
+            "int64_array_value": pyarrow.list_(pyarrow.int64()),
+            "string_array_value": pyarrow.list_(pyarrow.string()),
+        }
+
+        value_type = next(
+            (
+                data_pb.value.WhichOneof("value")
+                for data_pb in data_pbs
+                if data_pb.HasField("value")
+            ),
+            None,
+        )
+        if value_type is None:
+            return pyarrow.nulls(len(data_pbs))
+
+        if value_type.endswith("_array_value"):
+            values = [
+                list(getattr(data_pb.value, value_type).values)
+                if data_pb.HasField("value")
+                else None
+                for data_pb in data_pbs
+            ]
+        else:
+            values = [
+                getattr(data_pb.value, value_type)
+                if data_pb.HasField("value")
+                else None
+                for data_pb in data_pbs
+            ]
+        return pyarrow.array(values, type=arrow_types.get(value_type))
+
+    def _streaming_read_entity_views(
+        self,
+        entity_ids: List[str],
+        feature_selector: gca_feature_selector.FeatureSelector,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        read_request_timeout: Optional[float] = None,
+        max_concurrent_requests: int = _DEFAULT_MAX_CONCURRENT_READ_REQUESTS,
+    ) -> Tuple[
+        gca_featurestore_online_service.ReadFeatureValuesResponse.Header,
+        List[gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView],
+    ]:
+        """Reads the entity views of entities with streaming requests of up to
+        100 entity IDs each, sent concurrently.
+
+        Args:
+            entity_ids (List[str]):
+                Required. IDs of entities to read Feature values of.
+            feature_selector (gca_feature_selector.FeatureSelector):
+                Required. Selector choosing Features of the EntityType to read.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            read_request_timeout (float):
+                Optional. The timeout for each read request in seconds.
+            max_concurrent_requests (int):
+                Optional. The maximum number of read requests in flight at the
+                same time.
+
+        Returns:
+            Tuple[Header, List[EntityView]] - The header of the first response,
+            and the entity views of all responses in the order of the requests.
+        """
+
+        def read_shard(shard_entity_ids):
+            return list(
+                self._featurestore_online_client.streaming_read_feature_values(
+                    request=gca_featurestore_online_service.StreamingReadFeatureValuesRequest(
+                        entity_type=self.resource_name,
+                        entity_ids=shard_entity_ids,
+                        feature_selector=feature_selector,
+                    ),
+                    metadata=request_metadata,
+                    timeout=read_request_timeout,
+                )
+            )
+
+        shards = [
+            entity_ids[i : i + _MAX_ENTITY_IDS_PER_READ_REQUEST]
+            for i in range(0, len(entity_ids), _MAX_ENTITY_IDS_PER_READ_REQUEST)
+        ] or [entity_ids]
+
+        if len(shards) == 1 or max_concurrent_requests == 1:
+            shard_responses = [read_shard(shard) for shard in shards]
+        else:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(max_concurrent_requests, len(shards))
+            ) as executor:
+                shard_responses = list(executor.map(read_shard, shards))
+
+        header = shard_responses[0][0].header
+        entity_views = [
+            response.entity_view
+            for responses in shard_responses
+            for response in responses[1:]
+        ]
+        return header, entity_views
+
     @staticmethod
     def _construct_dataframe(
         feature_ids: List[str],
@@ -1574,6 +2207,8 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             "pd.DataFrame",  # type: ignore # noqa: F821 - skip check for undefined name 'pd'
         ],
         feature_time: Union[str, datetime.datetime] = None,
+        max_payloads_per_request: Optional[int] = None,
+        max_concurrent_requests: int = 1,
     ) -> "EntityType":  # noqa: F821
         """Streaming ingestion. Write feature values directly to Feature Store.
 
@@ -1677,6 +2312,11 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             instances=payloads
         )
 
+        # writing a large pandas DataFrame with up to 8 requests in flight.
+        my_entity_type.write_feature_values(
+            instances=my_large_df, max_concurrent_requests=8
+        )
+
         # reading back written feature values
         my_entity_type.read(
             entity_ids=["movie_01", "movie_02", "movie_03"]
@@ -1696,18 +2336,40 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 or a pandas Dataframe, where the index column holds the unique entity
                 ID strings and each remaining column represents a feature.  Each row
                 in the pandas Dataframe represents an entity, which has an entity ID
-                and its associated feature values. Currently, a single payload can be
-                written in a single request.
+                and its associated feature values. The payloads are split into
+                requests of up to 100,000 feature values each.
             feature_time Union[str, datetime.datetime]:
                 Optional. Either column name in DataFrame or Dict which contains timestamp value,
                 or datetime to apply to the entire DataFrame or Dict.
                 Timestamp will be applied to generate_timestmap in all FeatureValue.
                 If not provided, curreent timestamp is used. This param is not used
                 when instances is List[WriteFeatureValuesPayload].
+            max_payloads_per_request (int):
+                Optional. The maximum number of payloads written in a single
+                request. If not set, requests are only limited by the number of
+                feature values.
+            max_concurrent_requests (int):
+                Optional. The maximum number of write requests in flight at the
+                same time. Defaults to 1, which writes the requests one after
+                another in order. Payloads of the same entity in different
+                requests may be written in any order when greater than 1.
+                Requests throttled by the online store are retried with
+                exponential backoff.
 
         Returns:
             EntityType - The updated EntityType object.
+
+        Raises:
+            ValueError: If max_payloads_per_request or max_concurrent_requests
+                is not positive.
+            FeatureValuesWriteError: If any of the write requests failed. The
+                remaining requests are still written.
         """
+        if max_payloads_per_request is not None and max_payloads_per_request < 1:
+            raise ValueError("max_payloads_per_request must be positive.")
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be positive.")
+
         if isinstance(instances, Dict):
             payloads = self._generate_payloads(
                 instances=instances, feature_time=feature_time
@@ -1715,9 +2377,8 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
         elif isinstance(instances, List):
             payloads = instances
         else:
-            instances_dict = instances.to_dict(orient="index")
-            payloads = self._generate_payloads(
-                instances=instances_dict, feature_time=feature_time
+            payloads = self._generate_payloads_from_df(
+                df=instances, feature_time=feature_time
             )
 
         _LOGGER.log_action_start_against_resource(
@@ -1726,14 +2387,91 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             self,
         )
 
-        self._featurestore_online_client.write_feature_values(
-            entity_type=self.resource_name, payloads=payloads
+        payload_chunks = self._chunk_payloads(
+            payloads=payloads, max_payloads_per_request=max_payloads_per_request
         )
 
+        def write_chunk(chunk):
+            _WRITE_FEATURE_VALUES_RETRY(
+                self._featurestore_online_client.write_feature_values
+            )(entity_type=self.resource_name, payloads=chunk)
+
+        errors = []
+        if max_concurrent_requests == 1 or len(payload_chunks) <= 1:
+            for chunk in payload_chunks:
+                try:
+                    write_chunk(chunk)
+                except exceptions.GoogleAPIError as e:
+                    errors.append((chunk, e))
+        else:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(max_concurrent_requests, len(payload_chunks))
+            ) as executor:
+                chunk_futures = [
+                    (chunk, executor.submit(write_chunk, chunk))
+                    for chunk in payload_chunks
+                ]
+                for chunk, future in chunk_futures:
+                    try:
+                        future.result()
+                    except exceptions.GoogleAPIError as e:
+                        errors.append((chunk, e))
+
+        if self._read_cache is not None:
+            self._read_cache.invalidate(
+                (payload.entity_id, feature_id)
+                for payload in payloads
+                for feature_id in payload.feature_values
+            )
+
+        if errors:
+            raise FeatureValuesWriteError(
+                [
+                    ([payload.entity_id for payload in chunk], error)
+                    for chunk, error in errors
+                ]
+            )
+
         _LOGGER.log_action_completed_against_resource("feature values", "written", self)
 
         return self
 
+    @staticmethod
+    def _chunk_payloads(
+        payloads: List[gca_featurestore_online_service.WriteFeatureValuesPayload],
+        max_payloads_per_request: Optional[int] = None,
+    ) -> List[List[gca_featurestore_online_service.WriteFeatureValuesPayload]]:
+        """Splits payloads into chunks that fit into a single write request.
+
+        Args:
+            payloads (List[gca_featurestore_online_service.WriteFeatureValuesPayload]):
+                Required. The payloads to split.
+            max_payloads_per_request (int):
+                Optional. The maximum number of payloads in a chunk.
+
+        Returns:
+            List[List[gca_featurestore_online_service.WriteFeatureValuesPayload]] -
+            The chunks of payloads, in order.
+        """
+        chunks = []
+        chunk = []
+        chunk_feature_value_count = 0
+        for payload in payloads:
+            feature_value_count = len(payload.feature_values)
+            if chunk and (
+                chunk_feature_value_count + feature_value_count
+                > _MAX_FEATURE_VALUES_PER_WRITE_REQUEST
+                or len(chunk) == max_payloads_per_request
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_feature_value_count = 0
+            chunk.append(payload)
+            chunk_feature_value_count += feature_value_count
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
     @classmethod
     def _generate_payloads(
         cls,
@@ -1778,6 +2516,18 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
             timestamp_to_all_field = feature_time
 
         for entity_id, features in instances.items():
+            # Create a FeatureValue Metadata with generate_time if
+            # valid feature_time param is provided.
+            timestamp = cls._apply_feature_timestamp(
+                cls, features, timestamp_to_all_field, feature_time
+            )
+            metadata = (
+                gca_featurestore_online_service.FeatureValue.Metadata(
+                    generate_time=timestamp
+                )
+                if timestamp
+                else None
+            )
             feature_values = {}
             for feature_id, value in features.items():
                 if feature_id == feature_time:
@@ -1785,17 +2535,8 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 feature_value = cls._convert_value_to_gapic_feature_value(
                     feature_id=feature_id, value=value
                 )
-                # Create a FeatureValue Metadata with generate_time if
-                # valid feature_time param is provided.
-                timestamp = cls._apply_feature_timestamp(
-                    cls, features, timestamp_to_all_field, feature_time
-                )
-                if timestamp:
-                    feature_value.metadata = (
-                        gca_featurestore_online_service.FeatureValue.Metadata(
-                            generate_time=timestamp
-                        )
-                    )
+                if metadata:
+                    feature_value.metadata = metadata
                 feature_values[feature_id] = feature_value
             payload = gca_featurestore_online_service.WriteFeatureValuesPayload(
                 entity_id=entity_id, feature_values=feature_values
@@ -1804,6 +2545,103 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
 
         return payloads
 
+    @classmethod
+    def _generate_payloads_from_df(
+        cls,
+        df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        feature_time: Union[str, datetime.datetime] = None,
+    ) -> List[gca_featurestore_online_service.WriteFeatureValuesPayload]:
+        """Helper method used to generate GAPIC WriteFeatureValuesPayloads from
+        a pandas DataFrame.
+
+        The DataFrame is read column by column rather than converted to a dict
+        per row. The FeatureValue type of a column is inferred once from its
+        dtype, and the payloads are built as raw protobuf messages.
+
+        Args:
+            df (pd.DataFrame):
+                Required. DataFrame whose index holds the entity IDs and whose
+                columns hold the features.
+            feature_time Union[str, datetime.datetime]:
+                Optional. Either string representing column name which stores
+                feature timestamp, or timestamp to apply to entire DataFrame.
+        Returns:
+            List[gca_featurestore_online_service.WriteFeatureValuesPayload] -
+            A list of WriteFeatureValuesPayload objects ready to be written to the Feature Store.
+        """
+        entity_ids = df.index.tolist()
+
+        if feature_time is not None and cls._is_timestamp(feature_time):
+            timestamps = [feature_time] * len(entity_ids)
+        elif feature_time is not None and feature_time in df.columns:
+            timestamps = df[feature_time].tolist()
+        else:
+            timestamps = [None] * len(entity_ids)
+        feature_value_type = gca_featurestore_online_service.FeatureValue
+        payload_type = gca_featurestore_online_service.WriteFeatureValuesPayload
+
+        metadata_pbs = [
+            feature_value_type.Metadata.pb(
+                feature_value_type.Metadata(generate_time=timestamp)
+            )
+            if cls._is_timestamp(timestamp)
+            else None
+            for timestamp in timestamps
+        ]
+        payload_pbs = [
+            payload_type.pb()(entity_id=entity_id) for entity_id in entity_ids
+        ]
+
+        for feature_id in df.columns:
+            if feature_id == feature_time:
+                continue
+            column = df[feature_id]
+            field = cls._get_feature_value_field(column)
+            for payload_pb, value, metadata_pb in zip(
+                payload_pbs, column.tolist(), metadata_pbs
+            ):
+                feature_value_pb = payload_pb.feature_values[feature_id]
+                if field:
+                    setattr(feature_value_pb, field, value)
+                else:
+                    feature_value_pb.CopyFrom(
+                        feature_value_type.pb(
+                            cls._convert_value_to_gapic_feature_value(
+                                feature_id=feature_id, value=value
+                            )
+                        )
+                    )
+                if metadata_pb is not None:
+                    feature_value_pb.metadata.CopyFrom(metadata_pb)
+
+        return [payload_type.wrap(payload_pb) for payload_pb in payload_pbs]
+
+    @staticmethod
+    def _get_feature_value_field(
+        column: "pd.Series",  # noqa: F821 - skip check for undefined name 'pd'
+    ) -> Optional[str]:
+        """Helper method that infers the FeatureValue field of all the values
+        of a DataFrame column.
+
+        Args:
+            column (pd.Series):
+                Required. The DataFrame column.
+
+        Returns:
+            Optional[str] - The name of the FeatureValue field to set every value
+            of the column to, or None if the values have to be converted one by
+            one.
+        """
+        from pandas.api import types as pd_types
+
+        if pd_types.is_extension_array_dtype(column.dtype):
+            return None
+        if column.dtype.kind == "O":
+            return _FEATURE_VALUE_FIELD_BY_INFERRED_TYPE.get(
+                pd_types.infer_dtype(column, skipna=False)
+            )
+        return _FEATURE_VALUE_FIELD_BY_DTYPE_KIND.get(column.dtype.kind)
+
     @staticmethod
     def _apply_feature_timestamp(
         cls,
@@ -1889,19 +2727,19 @@ class _EntityType(base.VertexAiResourceNounWithFutureManager):
                 bytes_value=value
             )
         elif isinstance(value, List):
-            if all([isinstance(item, bool) for item in value]):
+            if all(isinstance(item, bool) for item in value):
                 feature_value = gca_featurestore_online_service.FeatureValue(
                     bool_array_value=gca_types.BoolArray(values=value)
                 )
-            elif all([isinstance(item, str) for item in value]):
+            elif all(isinstance(item, str) for item in value):
                 feature_value = gca_featurestore_online_service.FeatureValue(
                     string_array_value=gca_types.StringArray(values=value)
                 )
-            elif all([isinstance(item, int) for item in value]):
+            elif all(isinstance(item, int) for item in value):
                 feature_value = gca_featurestore_online_service.FeatureValue(
                     int64_array_value=gca_types.Int64Array(values=value)
                 )
-            elif all([isinstance(item, float) for item in value]):
+            elif all(isinstance(item, float) for item in value):
                 feature_value = gca_featurestore_online_service.FeatureValue(
                     double_array_value=gca_types.DoubleArray(values=value)
                 )
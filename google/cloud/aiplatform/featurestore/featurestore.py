@@ -15,6 +15,7 @@
 # limitations under the License.
 #
 
+from concurrent import futures
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 import uuid
 
@@ -41,6 +42,9 @@ from google.cloud import bigquery
 
 _LOGGER = base.Logger(__name__)
 
+# Maximum number of BigQuery Storage read streams read at the same time.
+_DEFAULT_BQ_STORAGE_READ_MAX_WORKERS = 8
+
 
 class Featurestore(base.VertexAiResourceNounWithFutureManager):
     """Managed featurestore resource for Vertex AI."""
@@ -1119,6 +1123,8 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
         request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
         serve_request_timeout: Optional[float] = None,
         bq_dataset_id: Optional[str] = None,
+        max_stream_count: int = 0,
+        max_read_workers: Optional[int] = None,
     ) -> "pd.DataFrame":  # noqa: F821 - skip check for undefined name 'pd'
         """Batch serves feature values to pandas DataFrame
 
@@ -1213,32 +1219,156 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                 Optional. Excludes Feature values with feature generation timestamp before this timestamp. If not set, retrieve
                 oldest values kept in Feature Store. Timestamp, if present, must not have higher than millisecond precision.
 
+            max_stream_count (int):
+                Optional. The maximum number of BigQuery Storage streams the served
+                feature values are read from. If 0, the default, the BigQuery
+                Storage API chooses the number of streams.
+
+            max_read_workers (int):
+                Optional. The maximum number of streams read at the same time.
+                Defaults to 8.
+
         Returns:
             pd.DataFrame: The pandas DataFrame containing feature values from batch serving.
 
         """
         try:
-            from google.cloud import bigquery_storage
+            import pandas as pd
         except ImportError:
             raise ImportError(
-                f"Google-Cloud-Bigquery-Storage is not installed. Please install google-cloud-bigquery-storage to use "
+                f"Pandas is not installed. Please install pandas to use "
                 f"{self.batch_serve_to_df.__name__}"
             )
 
+        table = self._batch_serve_to_arrow(
+            method_name=self.batch_serve_to_df.__name__,
+            serving_feature_ids=serving_feature_ids,
+            read_instances_df=read_instances_df,
+            pass_through_fields=pass_through_fields,
+            feature_destination_fields=feature_destination_fields,
+            start_time=start_time,
+            request_metadata=request_metadata,
+            serve_request_timeout=serve_request_timeout,
+            bq_dataset_id=bq_dataset_id,
+            max_stream_count=max_stream_count,
+            max_read_workers=max_read_workers,
+        )
+
+        return table.to_pandas() if table.num_columns else pd.DataFrame()
+
+    def batch_serve_to_arrow(
+        self,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]] = None,
+        feature_destination_fields: Optional[Dict[str, str]] = None,
+        start_time: Optional[timestamp_pb2.Timestamp] = None,
+        request_metadata: Optional[Sequence[Tuple[str, str]]] = (),
+        serve_request_timeout: Optional[float] = None,
+        bq_dataset_id: Optional[str] = None,
+        max_stream_count: int = 0,
+        max_read_workers: Optional[int] = None,
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Batch serves feature values to a pyarrow Table.
+
+        The served feature values are read from BigQuery Storage as Arrow record
+        batches, which are assembled into the Table without conversion to pandas.
+
+        Note:
+            Calling this method will automatically create and delete a temporary
+            bigquery dataset in the same GCP project, which will be used
+            as the intermediary storage for batch serve feature values
+            from featurestore to the Table.
+
+        Args:
+            serving_feature_ids (Dict[str, List[str]]):
+                Required. A user defined dictionary to define the entity_types and their features for batch serve/read.
+                See `Featurestore.batch_serve_to_df` for details.
+            read_instances_df (pd.DataFrame):
+                Required. Read_instances_df is a pandas DataFrame containing the read instances.
+                See `Featurestore.batch_serve_to_df` for details.
+            pass_through_fields (List[str]):
+                Optional. When not empty, the specified fields in the
+                read_instances source will be joined as-is in the output,
+                in addition to those fields from the Featurestore Entity.
+            feature_destination_fields (Dict[str, str]):
+                Optional. A user defined dictionary to map a feature's fully qualified resource name to
+                its destination field name. If the destination field name is not defined,
+                the feature ID will be used as its destination field name.
+            start_time (timestamp_pb2.Timestamp):
+                Optional. Excludes Feature values with feature generation timestamp before this timestamp. If not set, retrieve
+                oldest values kept in Feature Store. Timestamp, if present, must not have higher than millisecond precision.
+            request_metadata (Sequence[Tuple[str, str]]):
+                Optional. Strings which should be sent along with the request as metadata.
+            serve_request_timeout (float):
+                Optional. The timeout for the serve request in seconds.
+            bq_dataset_id (str):
+                Optional. The full dataset ID for the BigQuery dataset to use
+                for temporarily staging data. If specified, caller must have
+                `bigquery.tables.create` permissions for Dataset.
+            max_stream_count (int):
+                Optional. The maximum number of BigQuery Storage streams the served
+                feature values are read from. If 0, the default, the BigQuery
+                Storage API chooses the number of streams.
+            max_read_workers (int):
+                Optional. The maximum number of streams read at the same time.
+                Defaults to 8.
+
+        Returns:
+            pyarrow.Table: The Table containing feature values from batch serving.
+        """
+        return self._batch_serve_to_arrow(
+            method_name=self.batch_serve_to_arrow.__name__,
+            serving_feature_ids=serving_feature_ids,
+            read_instances_df=read_instances_df,
+            pass_through_fields=pass_through_fields,
+            feature_destination_fields=feature_destination_fields,
+            start_time=start_time,
+            request_metadata=request_metadata,
+            serve_request_timeout=serve_request_timeout,
+            bq_dataset_id=bq_dataset_id,
+            max_stream_count=max_stream_count,
+            max_read_workers=max_read_workers,
+        )
+
+    def _batch_serve_to_arrow(
+        self,
+        method_name: str,
+        serving_feature_ids: Dict[str, List[str]],
+        read_instances_df: "pd.DataFrame",  # noqa: F821 - skip check for undefined name 'pd'
+        pass_through_fields: Optional[List[str]],
+        feature_destination_fields: Optional[Dict[str, str]],
+        start_time: Optional[timestamp_pb2.Timestamp],
+        request_metadata: Optional[Sequence[Tuple[str, str]]],
+        serve_request_timeout: Optional[float],
+        bq_dataset_id: Optional[str],
+        max_stream_count: int,
+        max_read_workers: Optional[int],
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Batch serves feature values to a temporary BigQuery table and reads it as a pyarrow Table.
+
+        Args:
+            method_name (str):
+                Required. The name of the public method, used in error messages.
+            See `Featurestore.batch_serve_to_arrow` for the other arguments.
+
+        Returns:
+            pyarrow.Table: The Table containing feature values from batch serving.
+        """
         try:
-            import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
+            from google.cloud import bigquery_storage
         except ImportError:
             raise ImportError(
-                f"Pyarrow is not installed. Please install pyarrow to use "
-                f"{self.batch_serve_to_df.__name__}"
+                f"Google-Cloud-Bigquery-Storage is not installed. Please install google-cloud-bigquery-storage to use "
+                f"{method_name}"
             )
 
         try:
-            import pandas as pd
+            import pyarrow  # noqa: F401 - skip check for 'pyarrow' which is required when using 'google.cloud.bigquery'
         except ImportError:
             raise ImportError(
-                f"Pandas is not installed. Please install pandas to use "
-                f"{self.batch_serve_to_df.__name__}"
+                f"Pyarrow is not installed. Please install pyarrow to use "
+                f"{method_name}"
             )
 
         bigquery_client = bigquery.Client(
@@ -1311,13 +1441,14 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                     ),
                     data_format=bigquery_storage.types.DataFormat.ARROW,
                 ),
+                max_stream_count=max_stream_count,
             )
 
-            frames = []
-            for stream in read_session_proto.streams:
-                reader = bigquery_storage_read_client.read_rows(stream.name)
-                for message in reader.rows().pages:
-                    frames.append(message.to_dataframe())
+            table = self._read_bq_storage_streams(
+                bigquery_storage_read_client=bigquery_storage_read_client,
+                read_session=read_session_proto,
+                max_read_workers=max_read_workers,
+            )
 
         finally:
             # clean up: if user didn't specify dataset, delete ephemeral dataset
@@ -1332,7 +1463,56 @@ class Featurestore(base.VertexAiResourceNounWithFutureManager):
                 bigquery_client.delete_table(temp_bq_batch_serve_table_id)
                 bigquery_client.delete_table(temp_bq_read_instances_table_id)
 
-        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(frames)
+        return table
+
+    @staticmethod
+    def _read_bq_storage_streams(
+        bigquery_storage_read_client: "bigquery_storage.BigQueryReadClient",  # noqa: F821
+        read_session: "bigquery_storage.types.ReadSession",  # noqa: F821
+        max_read_workers: Optional[int] = None,
+    ) -> "pyarrow.Table":  # noqa: F821 - skip check for undefined name 'pyarrow'
+        """Reads the streams of a BigQuery Storage read session concurrently.
+
+        Args:
+            bigquery_storage_read_client (bigquery_storage.BigQueryReadClient):
+                Required. The client reading the streams.
+            read_session (bigquery_storage.types.ReadSession):
+                Required. The read session with data format ARROW.
+            max_read_workers (int):
+                Optional. The maximum number of streams read at the same time.
+
+        Returns:
+            pyarrow.Table: The rows of all streams, in stream order.
+        """
+        import pyarrow
+
+        def _read_stream(stream_name: str) -> List["pyarrow.RecordBatch"]:
+            reader = bigquery_storage_read_client.read_rows(stream_name)
+            return [page.to_arrow() for page in reader.rows(read_session).pages]
+
+        streams = read_session.streams
+        record_batches = []
+        if streams:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(
+                    len(streams),
+                    max_read_workers or _DEFAULT_BQ_STORAGE_READ_MAX_WORKERS,
+                )
+            ) as executor:
+                for stream_record_batches in executor.map(
+                    _read_stream, [stream.name for stream in streams]
+                ):
+                    record_batches.extend(stream_record_batches)
+
+        if record_batches:
+            return pyarrow.Table.from_batches(record_batches)
+
+        serialized_schema = read_session.arrow_schema.serialized_schema
+        if serialized_schema:
+            return pyarrow.ipc.read_schema(
+                pyarrow.py_buffer(serialized_schema)
+            ).empty_table()
+        return pyarrow.table({})
 
     def _get_ephemeral_bq_full_dataset_id(
         self, featurestore_id: str, project_number: str
@@ -16,10 +16,13 @@
 #
 
 
+import collections
 from concurrent import futures
+import functools
 import logging
 import pkg_resources  # Note this is used after copybara replacement
 import os
+import threading
 from typing import List, Optional, Type, Union
 
 from google.api_core import client_options
@@ -41,6 +44,18 @@ from google.cloud.aiplatform.compat.types import (
     encryption_spec_v1beta1 as gca_encryption_spec_v1beta1,
 )
 
+# Maximum number of clients kept by _Config.create_client. Least recently used
+# clients are evicted first.
+_CLIENT_CACHE_MAX_SIZE = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _get_gapic_version() -> str:
+    """Returns the installed version of google-cloud-aiplatform."""
+    return pkg_resources.get_distribution(
+        "google-cloud-aiplatform",
+    ).version
+
 
 class _Config:
     """Stores common parameters and options for API calls."""
@@ -93,6 +108,8 @@ class _Config:
         self._credentials = None
         self._encryption_spec_key_name = None
         self._network = None
+        self._client_cache = collections.OrderedDict()
+        self._client_cache_lock = threading.Lock()
 
     def init(
         self,
@@ -375,10 +392,16 @@ class _Config:
         api_base_path_override: Optional[str] = None,
         api_path_override: Optional[str] = None,
         appended_user_agent: Optional[List[str]] = None,
+        wrapped_client_idle_timeout: Optional[float] = None,
     ) -> utils.VertexAiServiceClientWithOverride:
         """Instantiates a given VertexAiServiceClient with optional
         overrides.
 
+        Clients are cached per client class, credentials, API endpoint and user
+        agent, so that resources created with the same configuration share their
+        clients and gRPC channels. The least recently used clients are evicted
+        from the cache once it holds more than 64 clients.
+
         Args:
             client_class (utils.VertexAiServiceClientWithOverride):
                 Required. A Vertex AI Service Client with optional overrides.
@@ -391,12 +414,15 @@ class _Config:
             appended_user_agent (List[str]):
                 Optional. User agent appended in the client info. If more than one, it will be
                 separated by spaces.
+            wrapped_client_idle_timeout (float):
+                Optional. For temporary clients, seconds of inactivity after which
+                the underlying client is released and recreated on the next call.
+                Defaults to the idle timeout of the client class, 60 seconds.
+
         Returns:
             client: Instantiated Vertex AI Service client with optional overrides
         """
-        gapic_version = pkg_resources.get_distribution(
-            "google-cloud-aiplatform",
-        ).version
+        gapic_version = _get_gapic_version()
 
         user_agent = f"{constants.USER_AGENT_PRODUCT}/{gapic_version}"
         if appended_user_agent:
@@ -418,7 +444,49 @@ class _Config:
             "client_info": client_info,
         }
 
-        return client_class(**kwargs)
+        if wrapped_client_idle_timeout is not None:
+            kwargs["wrapped_client_idle_timeout"] = wrapped_client_idle_timeout
+
+        if not client_class._is_cacheable:
+            return client_class(**kwargs)
+
+        cache_key = (
+            client_class,
+            kwargs["credentials"],
+            kwargs["client_options"].api_endpoint,
+            user_agent,
+            wrapped_client_idle_timeout,
+        )
+        with self._client_cache_lock:
+            client = self._client_cache.get(cache_key)
+            if client is not None:
+                self._client_cache.move_to_end(cache_key)
+                return client
+
+        client = client_class(**kwargs)
+
+        with self._client_cache_lock:
+            # Another thread may have created the client in the meantime.
+            client = self._client_cache.setdefault(cache_key, client)
+            self._client_cache.move_to_end(cache_key)
+            # Evicted clients are not closed, they may still be used by resources.
+            while len(self._client_cache) > _CLIENT_CACHE_MAX_SIZE:
+                self._client_cache.popitem(last=False)
+
+        return client
+
+    def close_clients(self):
+        """Closes the clients created by create_client and clears the client cache.
+
+        Resources holding a closed client can no longer make API calls, so this
+        should only be called once the resources are no longer used.
+        """
+        with self._client_cache_lock:
+            clients = list(self._client_cache.values())
+            self._client_cache.clear()
+
+        for client in clients:
+            client.close()
 
 
 # global config to store init parameters: ie, aiplatform.init(project=..., location=...)
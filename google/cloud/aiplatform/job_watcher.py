@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import collections
+from concurrent import futures
+import threading
+import time
+from typing import Dict, List, Optional
+
+from google.rpc import code_pb2
+
+from google.cloud.aiplatform import base
+from google.cloud.aiplatform import initializer
+
+_LOGGER = base.Logger(__name__)
+
+# Poll intervals of a job, in seconds. The interval of a job is multiplied
+# every time its state did not change, and reset when it changed.
+_DEFAULT_MIN_POLL_INTERVAL = 5
+_DEFAULT_MAX_POLL_INTERVAL = 60 * 5
+_DEFAULT_POLL_INTERVAL_MULTIPLIER = 2
+
+# Page size of the list requests refreshing the states of several jobs.
+_LIST_PAGE_SIZE = 100
+
+
+class _WatchedJob:
+    """A job watched by a JobWatcher and its polling schedule."""
+
+    def __init__(self, job: base.VertexAiStatefulResource, poll_interval: float):
+        self.job = job
+        self.future = futures.Future()
+        self.poll_interval = poll_interval
+        self.next_poll_time = time.monotonic()
+        self.state = None
+
+
+class JobWatcher:
+    """Watches the state of many jobs from a single background thread.
+
+    Jobs are polled with adaptive backoff: the poll interval of a job doubles
+    every time its state did not change, and is reset when it changed. Jobs of
+    the same type, project and location that are due at the same time are
+    refreshed together with one list request instead of one get request each.
+
+    Example usage:
+        watcher = aiplatform.JobWatcher()
+
+        jobs = [
+            aiplatform.CustomJob(...).submit() ...
+        ]
+        for future in concurrent.futures.as_completed(
+            [watcher.watch(job) for job in jobs]
+        ):
+            print(future.result().resource_name)
+
+        # Or, in a coroutine:
+        done_jobs = await asyncio.gather(*[watcher.watch_async(job) for job in jobs])
+    """
+
+    def __init__(
+        self,
+        min_poll_interval: float = _DEFAULT_MIN_POLL_INTERVAL,
+        max_poll_interval: float = _DEFAULT_MAX_POLL_INTERVAL,
+        poll_interval_multiplier: float = _DEFAULT_POLL_INTERVAL_MULTIPLIER,
+    ):
+        """Initializes the watcher. The watcher thread starts with the first job.
+
+        Args:
+            min_poll_interval (float):
+                Optional. The initial poll interval of a job in seconds.
+            max_poll_interval (float):
+                Optional. The maximum poll interval of a job in seconds.
+            poll_interval_multiplier (float):
+                Optional. The factor applied to the poll interval of a job whose
+                state did not change.
+        """
+        self._min_poll_interval = min_poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._poll_interval_multiplier = poll_interval_multiplier
+        self._watched_jobs: Dict[str, _WatchedJob] = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._shutdown = False
+
+    def watch(self, job: base.VertexAiStatefulResource) -> futures.Future:
+        """Watches a job until it completes.
+
+        Args:
+            job (base.VertexAiStatefulResource):
+                Required. A job, e.g. a CustomJob, BatchPredictionJob,
+                PipelineJob or training job. Its resource must have been created,
+                e.g. with `submit`.
+
+        Returns:
+            A future resolved with the job once it completed successfully. The
+            future raises a RuntimeError if the job failed or was cancelled.
+
+        Raises:
+            RuntimeError: If the job resource has not been created or the watcher
+                has been shut down.
+        """
+        job._assert_gca_resource_is_available()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("The JobWatcher has been shut down.")
+
+            watched_job = self._watched_jobs.get(job.resource_name)
+            if watched_job is None:
+                watched_job = _WatchedJob(job, self._min_poll_interval)
+                self._watched_jobs[job.resource_name] = watched_job
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+                self._condition.notify()
+            return watched_job.future
+
+    def watch_async(self, job: base.VertexAiStatefulResource) -> asyncio.Future:
+        """Watches a job until it completes, from a coroutine.
+
+        Args:
+            job (base.VertexAiStatefulResource):
+                Required. A job whose resource has been created.
+
+        Returns:
+            An asyncio future of the current event loop, resolved like the future
+            returned by `watch`.
+        """
+        return asyncio.wrap_future(self.watch(job))
+
+    def shutdown(self):
+        """Stops the watcher thread and cancels the futures of unfinished jobs."""
+        with self._condition:
+            self._shutdown = True
+            watched_jobs = list(self._watched_jobs.values())
+            self._watched_jobs.clear()
+            self._condition.notify()
+
+        for watched_job in watched_jobs:
+            watched_job.future.cancel()
+
+    def _run(self):
+        """Polls the jobs that are due until the watcher is shut down."""
+        while True:
+            with self._condition:
+                while not self._shutdown:
+                    now = time.monotonic()
+                    next_poll_time = min(
+                        (
+                            watched_job.next_poll_time
+                            for watched_job in self._watched_jobs.values()
+                        ),
+                        default=None,
+                    )
+                    if next_poll_time is not None and next_poll_time <= now:
+                        break
+                    self._condition.wait(
+                        None if next_poll_time is None else next_poll_time - now
+                    )
+                if self._shutdown:
+                    return
+                due_jobs = [
+                    watched_job
+                    for watched_job in self._watched_jobs.values()
+                    if watched_job.next_poll_time <= now
+                ]
+
+            try:
+                self._poll(due_jobs)
+            except Exception as exc:
+                # The thread must survive, or no watched job would ever complete.
+                _LOGGER.warning("Polling jobs failed, retrying later: %s" % exc)
+                self._reschedule(due_jobs)
+
+    def _reschedule(self, watched_jobs: List[_WatchedJob]):
+        """Schedules the next poll of jobs that were due but not polled."""
+        now = time.monotonic()
+        with self._condition:
+            for watched_job in watched_jobs:
+                if watched_job.next_poll_time <= now:
+                    watched_job.next_poll_time = now + watched_job.poll_interval
+
+    def _poll(self, watched_jobs: List[_WatchedJob]):
+        """Refreshes the states of jobs and resolves the futures of completed ones."""
+        groups = collections.defaultdict(list)
+        for watched_job in watched_jobs:
+            job = watched_job.job
+            groups[(type(job), job.project, job.location)].append(watched_job)
+
+        states = {}
+        for group in groups.values():
+            states.update(self._get_states(group))
+
+        now = time.monotonic()
+        for watched_job in watched_jobs:
+            if watched_job.future.cancelled():
+                with self._condition:
+                    self._watched_jobs.pop(watched_job.job.resource_name, None)
+                continue
+
+            job = watched_job.job
+            state = states.get(job.resource_name)
+            try:
+                if state is None:
+                    # Not returned by the list request, or a single job.
+                    job._sync_gca_resource()
+                    state = job._gca_resource.state
+                if state in job._valid_done_states:
+                    # List requests may not return every field of a resource.
+                    if job._gca_resource.state != state:
+                        job._sync_gca_resource()
+                    self._complete(watched_job)
+                    continue
+            except Exception as exc:
+                self._complete(watched_job, exc)
+                continue
+
+            if state == watched_job.state:
+                watched_job.poll_interval = min(
+                    watched_job.poll_interval * self._poll_interval_multiplier,
+                    self._max_poll_interval,
+                )
+            else:
+                _LOGGER.info(
+                    "%s %s current state:\n%s"
+                    % (job.__class__.__name__, job.resource_name, state)
+                )
+                watched_job.state = state
+                watched_job.poll_interval = self._min_poll_interval
+            watched_job.next_poll_time = now + watched_job.poll_interval
+
+    def _get_states(self, watched_jobs: List[_WatchedJob]) -> Dict[str, object]:
+        """Lists the states of jobs of the same type, project and location.
+
+        Jobs created since the oldest of the jobs are listed, until all the jobs
+        are found. Jobs that are not found are left out of the result.
+
+        Args:
+            watched_jobs (List[_WatchedJob]):
+                Required. The jobs whose state to get.
+
+        Returns:
+            The states of the found jobs by resource name.
+        """
+        if len(watched_jobs) < 2:
+            return {}
+
+        job = watched_jobs[0].job
+        names = {watched_job.job.resource_name for watched_job in watched_jobs}
+        oldest_create_time = min(
+            watched_job.job._gca_resource.create_time for watched_job in watched_jobs
+        )
+        list_request = {
+            "parent": initializer.global_config.common_location_path(
+                project=job.project, location=job.location
+            ),
+            "filter": f'create_time>="{oldest_create_time.rfc3339()}"',
+            "page_size": _LIST_PAGE_SIZE,
+        }
+
+        states = {}
+        try:
+            for gapic_resource in getattr(job.api_client, job._list_method)(
+                request=list_request
+            ):
+                if gapic_resource.name in names:
+                    states[gapic_resource.name] = gapic_resource.state
+                    if len(states) == len(names):
+                        break
+        except Exception as exc:
+            _LOGGER.warning(
+                "Listing %s failed, falling back to getting each job: %s"
+                % (job.__class__.__name__, exc)
+            )
+        return states
+
+    def _complete(self, watched_job: _WatchedJob, exc: Optional[Exception] = None):
+        """Stops watching a job and resolves its future."""
+        with self._condition:
+            self._watched_jobs.pop(watched_job.job.resource_name, None)
+
+        job = watched_job.job
+        if exc is None and job._gca_resource.error.code != code_pb2.OK:
+            exc = RuntimeError("Job failed with:\n%s" % job._gca_resource.error)
+
+        if not watched_job.future.set_running_or_notify_cancel():
+            return
+        if exc is not None:
+            watched_job.future.set_exception(exc)
+        else:
+            _LOGGER.log_action_completed_against_resource("run", "completed", job)
+            watched_job.future.set_result(job)
@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-from typing import Iterable, Optional, Union, Sequence, Dict, List
+from typing import Iterable, Optional, Union, Sequence, Dict, List, Tuple
 
 import abc
 import copy
@@ -114,6 +114,8 @@ class _Job(base.VertexAiStatefulResource):
     # Required by the done() method
     _valid_done_states = _JOB_COMPLETE_STATES
 
+    _list_order_by_locally = True
+
     def __init__(
         self,
         job_name: str,
@@ -599,6 +601,105 @@ class BatchPredictionJob(_Job):
             (jobs.BatchPredictionJob):
                 Instantiated representation of the created batch prediction job.
         """
+        model_name, gapic_batch_prediction_job = cls._build_gca_batch_prediction_job(
+            job_display_name=job_display_name,
+            model_name=model_name,
+            instances_format=instances_format,
+            predictions_format=predictions_format,
+            gcs_source=gcs_source,
+            bigquery_source=bigquery_source,
+            gcs_destination_prefix=gcs_destination_prefix,
+            bigquery_destination_prefix=bigquery_destination_prefix,
+            model_parameters=model_parameters,
+            machine_type=machine_type,
+            accelerator_type=accelerator_type,
+            accelerator_count=accelerator_count,
+            starting_replica_count=starting_replica_count,
+            max_replica_count=max_replica_count,
+            generate_explanation=generate_explanation,
+            explanation_metadata=explanation_metadata,
+            explanation_parameters=explanation_parameters,
+            labels=labels,
+            project=project,
+            location=location,
+            encryption_spec_key_name=encryption_spec_key_name,
+            batch_size=batch_size,
+            model_monitoring_objective_config=model_monitoring_objective_config,
+            model_monitoring_alert_config=model_monitoring_alert_config,
+            analysis_instance_schema_uri=analysis_instance_schema_uri,
+            service_account=service_account,
+        )
+
+        empty_batch_prediction_job = cls._empty_constructor(
+            project=project,
+            location=location,
+            credentials=credentials,
+        )
+        if model_monitoring_objective_config:
+            empty_batch_prediction_job.api_client = (
+                empty_batch_prediction_job.api_client.select_version("v1beta1")
+            )
+
+        # TODO(b/242108750): remove temporary logic once model monitoring for batch prediction is GA
+        return cls._create(
+            empty_batch_prediction_job=empty_batch_prediction_job,
+            model_or_model_name=model_name,
+            gca_batch_prediction_job=gapic_batch_prediction_job,
+            generate_explanation=generate_explanation,
+            sync=sync,
+            create_request_timeout=create_request_timeout,
+        )
+
+    @classmethod
+    def _build_gca_batch_prediction_job(
+        cls,
+        job_display_name: str,
+        model_name: Union[str, "aiplatform.Model"],
+        instances_format: str = "jsonl",
+        predictions_format: str = "jsonl",
+        gcs_source: Optional[Union[str, Sequence[str]]] = None,
+        bigquery_source: Optional[str] = None,
+        gcs_destination_prefix: Optional[str] = None,
+        bigquery_destination_prefix: Optional[str] = None,
+        model_parameters: Optional[Dict] = None,
+        machine_type: Optional[str] = None,
+        accelerator_type: Optional[str] = None,
+        accelerator_count: Optional[int] = None,
+        starting_replica_count: Optional[int] = None,
+        max_replica_count: Optional[int] = None,
+        generate_explanation: Optional[bool] = False,
+        explanation_metadata: Optional["aiplatform.explain.ExplanationMetadata"] = None,
+        explanation_parameters: Optional[
+            "aiplatform.explain.ExplanationParameters"
+        ] = None,
+        labels: Optional[Dict[str, str]] = None,
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        encryption_spec_key_name: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        model_monitoring_objective_config: Optional[
+            "aiplatform.model_monitoring.ObjectiveConfig"
+        ] = None,
+        model_monitoring_alert_config: Optional[
+            "aiplatform.model_monitoring.AlertConfig"
+        ] = None,
+        analysis_instance_schema_uri: Optional[str] = None,
+        service_account: Optional[str] = None,
+    ) -> Tuple[Union[str, "aiplatform.Model"], gca_bp_job_compat.BatchPredictionJob]:
+        """Validates the arguments of `create` and builds the batch prediction job proto.
+
+        See `BatchPredictionJob.create` for the arguments.
+
+        Returns:
+            The fully-qualified model resource name, or the given Model, and the
+            batch prediction job proto without model.
+
+        Raises:
+            ValueError:
+                If no or multiple source or destinations are provided. Also, if
+                provided instances_format or predictions_format are not supported
+                by Vertex AI.
+        """
         # TODO(b/242108750): remove temporary logic once model monitoring for batch prediction is GA
         if model_monitoring_objective_config:
             from google.cloud.aiplatform.compat.types import (
@@ -764,16 +865,6 @@ class BatchPredictionJob(_Job):
         if service_account:
             gapic_batch_prediction_job.service_account = service_account
 
-        empty_batch_prediction_job = cls._empty_constructor(
-            project=project,
-            location=location,
-            credentials=credentials,
-        )
-        if model_monitoring_objective_config:
-            empty_batch_prediction_job.api_client = (
-                empty_batch_prediction_job.api_client.select_version("v1beta1")
-            )
-
         # TODO(b/242108750): remove temporary logic once model monitoring for batch prediction is GA
         if model_monitoring_objective_config:
             model_monitoring_objective_config._config_for_bp = True
@@ -790,15 +881,7 @@ class BatchPredictionJob(_Job):
             )
             gapic_batch_prediction_job.model_monitoring_config = gapic_mm_config
 
-        # TODO(b/242108750): remove temporary logic once model monitoring for batch prediction is GA
-        return cls._create(
-            empty_batch_prediction_job=empty_batch_prediction_job,
-            model_or_model_name=model_name,
-            gca_batch_prediction_job=gapic_batch_prediction_job,
-            generate_explanation=generate_explanation,
-            sync=sync,
-            create_request_timeout=create_request_timeout,
-        )
+        return model_name, gapic_batch_prediction_job
 
     @classmethod
     @base.optional_sync(return_input_arg="empty_batch_prediction_job")
@@ -15,8 +15,22 @@
 # limitations under the License.
 #
 
+import asyncio
+import collections
+from concurrent import futures
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence, Tuple
+import itertools
+import threading
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from google.auth import credentials as auth_credentials
 from google.cloud.aiplatform import base
@@ -39,6 +53,29 @@ import grpc
 
 _LOGGER = base.Logger(__name__)
 
+_MATCH_GRPC_PORT = 10000
+_MATCH_CHANNEL_POOL_SIZE = 4
+# Each channel of a pool gets its own connection, kept open by keepalive pings.
+_MATCH_CHANNEL_OPTIONS = [
+    ("grpc.use_local_subchannel_pool", 1),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+# Match channels are shared by all index endpoint objects of the process, so that
+# re-creating a MatchingEngineIndexEndpoint does not open new connections.
+_match_channel_pools: Dict[str, "_MatchChannelPool"] = {}
+_match_channel_pools_lock = threading.Lock()
+
+# Bulk queries are chunked so that requests and responses stay below the default
+# 4 MiB gRPC message size limit, with some headroom.
+_BULK_QUERY_MAX_MESSAGE_BYTES = 3 * 1024 * 1024
+# Estimated serialized size of a neighbor in a response, ID included.
+_BULK_QUERY_NEIGHBOR_BYTES = 64
+_BULK_QUERY_DEFAULT_MAX_CONCURRENCY = 4
+
 
 @dataclass
 class MatchNeighbor:
@@ -74,6 +111,41 @@ class Namespace:
     deny_tokens: list = field(default_factory=list)
 
 
+class _MatchChannelPool:
+    """Long-lived gRPC channels to a match server, used in round-robin order."""
+
+    def __init__(
+        self,
+        address: str,
+        size: int,
+        channel_factory: Callable[..., grpc.Channel],
+    ):
+        """Opens the channels of the pool.
+
+        Args:
+            address (str):
+                Required. The host and port of the match server.
+            size (int):
+                Required. The number of channels of the pool.
+            channel_factory (Callable[..., grpc.Channel]):
+                Required. Creates a channel from an address and channel options,
+                e.g. grpc.insecure_channel or grpc.aio.insecure_channel.
+        """
+        self.channels = [
+            channel_factory(address, options=_MATCH_CHANNEL_OPTIONS)
+            for _ in range(size)
+        ]
+        self._stubs = [
+            match_service_pb2_grpc.MatchServiceStub(channel)
+            for channel in self.channels
+        ]
+        self._counter = itertools.count()
+
+    def get_stub(self) -> match_service_pb2_grpc.MatchServiceStub:
+        """Returns the stub of the next channel of the pool."""
+        return self._stubs[next(self._counter) % len(self._stubs)]
+
+
 class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
     """Matching Engine index endpoint resource for Vertex AI."""
 
@@ -86,6 +158,12 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
     _parse_resource_name_method = "parse_index_endpoint_path"
     _format_resource_name_method = "index_endpoint_path"
 
+    _public_match_client: Optional[utils.MatchClientWithOverride] = None
+    _match_grpc_addresses: Optional[Dict[str, str]] = None
+    _match_async_channel_pools: Optional[
+        Dict[str, Tuple[asyncio.AbstractEventLoop, _MatchChannelPool]]
+    ] = None
+
     def __init__(
         self,
         index_endpoint_name: str,
@@ -365,6 +443,86 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
             api_path_override=self.public_endpoint_domain_name,
         )
 
+    def _sync_gca_resource(self):
+        """Sync GAPIC service representation of client class resource."""
+        super()._sync_gca_resource()
+        # Deployed indexes may have been added, removed or moved.
+        self._match_grpc_addresses = None
+
+    def _get_match_grpc_address(self, deployed_index_id: str) -> str:
+        """Returns the host and port of the match server of a deployed index.
+
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex.
+
+        Returns:
+            The address of the match server of the deployed index.
+
+        Raises:
+            RuntimeError: If there is no deployed index with the ID.
+        """
+        if self._match_grpc_addresses is None:
+            self._match_grpc_addresses = {}
+
+        address = self._match_grpc_addresses.get(deployed_index_id)
+        if address is None:
+            deployed_indexes = [
+                deployed_index
+                for deployed_index in self.deployed_indexes
+                if deployed_index.id == deployed_index_id
+            ]
+
+            if not deployed_indexes:
+                raise RuntimeError(
+                    f"No deployed index with id '{deployed_index_id}' found"
+                )
+
+            # Retrieve server ip from deployed index
+            server_ip = deployed_indexes[0].private_endpoints.match_grpc_address
+            address = f"{server_ip}:{_MATCH_GRPC_PORT}"
+            self._match_grpc_addresses[deployed_index_id] = address
+        return address
+
+    def _get_match_stub(
+        self, deployed_index_id: str
+    ) -> match_service_pb2_grpc.MatchServiceStub:
+        """Returns a stub on a pooled channel to the match server of a deployed index."""
+        address = self._get_match_grpc_address(deployed_index_id)
+        with _match_channel_pools_lock:
+            pool = _match_channel_pools.get(address)
+            if pool is None:
+                pool = _MatchChannelPool(
+                    address=address,
+                    size=_MATCH_CHANNEL_POOL_SIZE,
+                    channel_factory=grpc.insecure_channel,
+                )
+                _match_channel_pools[address] = pool
+        return pool.get_stub()
+
+    def _get_match_async_stub(
+        self, deployed_index_id: str
+    ) -> match_service_pb2_grpc.MatchServiceStub:
+        """Returns a stub on a pooled grpc.aio channel to the match server of a deployed index.
+
+        grpc.aio channels are bound to the event loop they are created on, so the
+        pool is re-created when called from another event loop.
+        """
+        address = self._get_match_grpc_address(deployed_index_id)
+        if self._match_async_channel_pools is None:
+            self._match_async_channel_pools = {}
+
+        loop = asyncio.get_running_loop()
+        pool_loop, pool = self._match_async_channel_pools.get(address, (None, None))
+        if pool is None or pool_loop is not loop:
+            pool = _MatchChannelPool(
+                address=address,
+                size=_MATCH_CHANNEL_POOL_SIZE,
+                channel_factory=grpc.aio.insecure_channel,
+            )
+            self._match_async_channel_pools[address] = (loop, pool)
+        return pool.get_stub()
+
     @property
     def public_endpoint_domain_name(self) -> Optional[str]:
         """Public endpoint DNS name."""
@@ -988,7 +1146,39 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                 "Please make sure index has been deployed to public endpoint, and follow the example usage to call this method."
             )
 
-        # Create the FindNeighbors request
+        find_neighbors_request = self._build_find_neighbors_request(
+            deployed_index_id=deployed_index_id,
+            queries=queries,
+            num_neighbors=num_neighbors,
+            restricts=self._build_find_neighbors_restricts(filter),
+        )
+
+        response = self._public_match_client.find_neighbors(find_neighbors_request)
+
+        return self._parse_find_neighbors_response(response)
+
+    @staticmethod
+    def _build_find_neighbors_restricts(
+        filter: Optional[List[Namespace]],
+    ) -> List[gca_index_v1beta1.IndexDatapoint.Restriction]:
+        """Builds the datapoint restrictions of a filter once for all queries."""
+        restricts = []
+        for namespace in filter or []:
+            restrict = gca_index_v1beta1.IndexDatapoint.Restriction()
+            restrict.namespace = namespace.name
+            restrict.allow_list.extend(namespace.allow_tokens)
+            restrict.deny_list.extend(namespace.deny_tokens)
+            restricts.append(restrict)
+        return restricts
+
+    def _build_find_neighbors_request(
+        self,
+        deployed_index_id: str,
+        queries: Sequence[Sequence[float]],
+        num_neighbors: int,
+        restricts: List[gca_index_v1beta1.IndexDatapoint.Restriction],
+    ) -> gca_match_service_v1beta1.FindNeighborsRequest:
+        """Builds the FindNeighborsRequest of queries on a deployed index."""
         find_neighbors_request = gca_match_service_v1beta1.FindNeighborsRequest()
         find_neighbors_request.index_endpoint = self.resource_name
         find_neighbors_request.deployed_index_id = deployed_index_id
@@ -998,19 +1188,19 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
                 gca_match_service_v1beta1.FindNeighborsRequest.Query()
             )
             find_neighbors_query.neighbor_count = num_neighbors
-            datapoint = gca_index_v1beta1.IndexDatapoint(feature_vector=query)
-            for namespace in filter:
-                restrict = gca_index_v1beta1.IndexDatapoint.Restriction()
-                restrict.namespace = namespace.name
-                restrict.allow_list.extend(namespace.allow_tokens)
-                restrict.deny_list.extend(namespace.deny_tokens)
-                datapoint.restricts.append(restrict)
+            datapoint = gca_index_v1beta1.IndexDatapoint(
+                feature_vector=self._query_to_list(query)
+            )
+            datapoint.restricts.extend(restricts)
             find_neighbors_query.datapoint = datapoint
             find_neighbors_request.queries.append(find_neighbors_query)
+        return find_neighbors_request
 
-        response = self._public_match_client.find_neighbors(find_neighbors_request)
-
-        # Wrap the results in MatchNeighbor objects and return
+    @staticmethod
+    def _parse_find_neighbors_response(
+        response: gca_match_service_v1beta1.FindNeighborsResponse,
+    ) -> List[List[MatchNeighbor]]:
+        """Wraps the results of a FindNeighborsResponse in MatchNeighbor objects."""
         return [
             [
                 MatchNeighbor(
@@ -1021,6 +1211,104 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
             for embedding_neighbors in response.nearest_neighbors
         ]
 
+    def bulk_find_neighbors(
+        self,
+        *,
+        deployed_index_id: str,
+        queries: Union[Sequence[Sequence[float]], "np.ndarray"],  # noqa: F821
+        num_neighbors: int = 10,
+        filter: Optional[List[Namespace]] = None,
+        max_queries_per_request: Optional[int] = None,
+        max_concurrency: int = _BULK_QUERY_DEFAULT_MAX_CONCURRENCY,
+        as_numpy: bool = False,
+    ) -> Union[
+        Iterator[List[MatchNeighbor]], Tuple["np.ndarray", "np.ndarray"]  # noqa: F821
+    ]:
+        """Retrieves nearest neighbors for a large number of queries on the specified deployed index which is deployed to public endpoint.
+
+        The queries are split into requests that fit in a gRPC message, and up to
+        max_concurrency requests are sent at the same time.
+
+        ```
+        Example usage:
+            ids, distances = my_index_endpoint.bulk_find_neighbors(
+                deployed_index_id="public_test1", queries=embeddings, as_numpy=True
+            )
+        ```
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            queries (Union[Sequence[Sequence[float]], np.ndarray]):
+                Required. The queries, e.g. a 2-D numpy array with one embedding
+                per row.
+            num_neighbors (int):
+                Required. The number of nearest neighbors to be retrieved from database for
+                each query.
+            filter (List[Namespace]):
+                Optional. A list of Namespaces for filtering the matching results,
+                applied to every query. See `MatchingEngineIndexEndpoint.find_neighbors`
+                for details.
+            max_queries_per_request (int):
+                Optional. The maximum number of queries of one request. By default
+                requests are only limited by the gRPC message size.
+            max_concurrency (int):
+                Optional. The maximum number of requests in flight at the same time.
+            as_numpy (bool):
+                Optional. If True, all results are collected into two arrays of
+                shape (number of queries, num_neighbors): the neighbor IDs and
+                their distances. Missing neighbors have an empty ID and a NaN
+                distance.
+
+        Returns:
+            An iterator over the nearest neighbors of each query, in order, or the
+            (ids, distances) arrays if as_numpy is True.
+
+        Raises:
+            ValueError: If the index is not deployed to a public endpoint, or a
+                limit is not positive.
+        """
+        if not self._public_match_client:
+            raise ValueError(
+                "Please make sure index has been deployed to public endpoint, and follow the example usage to call this method."
+            )
+
+        restricts = self._build_find_neighbors_restricts(filter)
+
+        def _find_neighbors(
+            chunk: Sequence[Sequence[float]],
+        ) -> List[List[MatchNeighbor]]:
+            response = self._public_match_client.find_neighbors(
+                self._build_find_neighbors_request(
+                    deployed_index_id=deployed_index_id,
+                    queries=chunk,
+                    num_neighbors=num_neighbors,
+                    restricts=restricts,
+                )
+            )
+            return self._parse_find_neighbors_response(response)
+
+        query_bytes = (
+            gca_match_service_v1beta1.FindNeighborsRequest.Query.pb(
+                self._build_find_neighbors_request(
+                    deployed_index_id=deployed_index_id,
+                    queries=queries[:1],
+                    num_neighbors=num_neighbors,
+                    restricts=restricts,
+                ).queries[0]
+            ).ByteSize()
+            if len(queries)
+            else 0
+        )
+        return self._bulk_query(
+            query_fn=_find_neighbors,
+            queries=queries,
+            query_bytes=query_bytes,
+            num_neighbors=num_neighbors,
+            max_queries_per_request=max_queries_per_request,
+            max_concurrency=max_concurrency,
+            as_numpy=as_numpy,
+        )
+
     def read_index_datapoints(
         self,
         *,
@@ -1076,6 +1364,9 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
     ) -> List[List[MatchNeighbor]]:
         """Retrieves nearest neighbors for the given embedding queries on the specified deployed index.
 
+        The request is sent on a pool of long-lived gRPC channels to the match
+        server, which is shared by all index endpoints of the process.
+
         Args:
             deployed_index_id (str):
                 Required. The ID of the DeployedIndex to match the queries against.
@@ -1094,51 +1385,125 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
             List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
         """
 
-        # Find the deployed index by id
-        deployed_indexes = [
-            deployed_index
-            for deployed_index in self.deployed_indexes
-            if deployed_index.id == deployed_index_id
-        ]
+        stub = self._get_match_stub(deployed_index_id)
+        batch_request = self._build_batch_match_request(
+            deployed_index_id=deployed_index_id,
+            queries=queries,
+            num_neighbors=num_neighbors,
+            filter=filter,
+        )
+
+        # Perform the request
+        response = stub.BatchMatch(batch_request)
 
-        if not deployed_indexes:
-            raise RuntimeError(f"No deployed index with id '{deployed_index_id}' found")
+        return self._parse_batch_match_response(response)
 
-        # Retrieve server ip from deployed index
-        server_ip = deployed_indexes[0].private_endpoints.match_grpc_address
+    async def match_async(
+        self,
+        deployed_index_id: str,
+        queries: List[List[float]],
+        num_neighbors: int = 1,
+        filter: Optional[List[Namespace]] = [],
+    ) -> List[List[MatchNeighbor]]:
+        """Asynchronously retrieves nearest neighbors for the given embedding queries on the specified deployed index.
 
-        # Set up channel and stub
-        channel = grpc.insecure_channel("{}:10000".format(server_ip))
-        stub = match_service_pb2_grpc.MatchServiceStub(channel)
+        The request is sent on pooled grpc.aio channels without blocking the event
+        loop. The channels are bound to the event loop they are first used on.
 
-        # Create the batch match request
-        batch_request = match_service_pb2.BatchMatchRequest()
-        batch_request_for_index = (
-            match_service_pb2.BatchMatchRequest.BatchMatchRequestPerIndex()
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            queries (List[List[float]]):
+                Required. A list of queries. Each query is a list of floats, representing a single embedding.
+            num_neighbors (int):
+                Required. The number of nearest neighbors to be retrieved from database for
+                each query.
+            filter (List[Namespace]):
+                Optional. A list of Namespaces for filtering the matching results.
+                See `MatchingEngineIndexEndpoint.match` for details.
+
+        Returns:
+            List[List[MatchNeighbor]] - A list of nearest neighbors for each query.
+        """
+        stub = self._get_match_async_stub(deployed_index_id)
+        batch_request = self._build_batch_match_request(
+            deployed_index_id=deployed_index_id,
+            queries=queries,
+            num_neighbors=num_neighbors,
+            filter=filter,
         )
-        batch_request_for_index.deployed_index_id = deployed_index_id
-        requests = []
-        for query in queries:
-            request = match_service_pb2.MatchRequest(
-                num_neighbors=num_neighbors,
+
+        response = await stub.BatchMatch(batch_request)
+
+        return self._parse_batch_match_response(response)
+
+    @staticmethod
+    def _build_match_request_template(
+        deployed_index_id: str,
+        num_neighbors: int,
+        filter: Optional[List[Namespace]],
+    ) -> match_service_pb2.MatchRequest:
+        """Builds a MatchRequest without query holding the fields shared by all queries."""
+        template = match_service_pb2.MatchRequest(
+            num_neighbors=num_neighbors,
+            deployed_index_id=deployed_index_id,
+        )
+        for namespace in filter or []:
+            restrict = template.restricts.add()
+            restrict.name = namespace.name
+            restrict.allow_tokens.extend(namespace.allow_tokens)
+            restrict.deny_tokens.extend(namespace.deny_tokens)
+        return template
+
+    @classmethod
+    def _build_batch_match_request(
+        cls,
+        deployed_index_id: str,
+        queries: Sequence[Sequence[float]],
+        num_neighbors: int,
+        filter: Optional[List[Namespace]] = None,
+        template: Optional[match_service_pb2.MatchRequest] = None,
+    ) -> match_service_pb2.BatchMatchRequest:
+        """Builds the BatchMatchRequest of match queries on a deployed index.
+
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            queries (Sequence[Sequence[float]]):
+                Required. The query embeddings.
+            num_neighbors (int):
+                Required. The number of nearest neighbors of each query.
+            filter (List[Namespace]):
+                Optional. The Namespaces filtering the matching results.
+            template (match_service_pb2.MatchRequest):
+                Optional. The request template built by
+                `_build_match_request_template`. Built from the other arguments if
+                not set.
+
+        Returns:
+            The BatchMatchRequest.
+        """
+        if template is None:
+            template = cls._build_match_request_template(
                 deployed_index_id=deployed_index_id,
-                float_val=query,
+                num_neighbors=num_neighbors,
+                filter=filter,
             )
-            for namespace in filter:
-                restrict = match_service_pb2.Namespace()
-                restrict.name = namespace.name
-                restrict.allow_tokens.extend(namespace.allow_tokens)
-                restrict.deny_tokens.extend(namespace.deny_tokens)
-                request.restricts.append(restrict)
-            requests.append(request)
-
-        batch_request_for_index.requests.extend(requests)
-        batch_request.requests.append(batch_request_for_index)
 
-        # Perform the request
-        response = stub.BatchMatch(batch_request)
+        batch_request = match_service_pb2.BatchMatchRequest()
+        batch_request_for_index = batch_request.requests.add()
+        batch_request_for_index.deployed_index_id = deployed_index_id
+        for query in queries:
+            request = batch_request_for_index.requests.add()
+            request.CopyFrom(template)
+            request.float_val.extend(cls._query_to_list(query))
+        return batch_request
 
-        # Wrap the results in MatchNeighbor objects and return
+    @staticmethod
+    def _parse_batch_match_response(
+        response: match_service_pb2.BatchMatchResponse,
+    ) -> List[List[MatchNeighbor]]:
+        """Wraps the results of a BatchMatchResponse in MatchNeighbor objects."""
         return [
             [
                 MatchNeighbor(id=neighbor.id, distance=neighbor.distance)
@@ -1146,3 +1511,199 @@ class MatchingEngineIndexEndpoint(base.VertexAiResourceNounWithFutureManager):
             ]
             for embedding_neighbors in response.responses[0].responses
         ]
+
+    def bulk_match(
+        self,
+        deployed_index_id: str,
+        queries: Union[Sequence[Sequence[float]], "np.ndarray"],  # noqa: F821
+        num_neighbors: int = 1,
+        filter: Optional[List[Namespace]] = None,
+        max_queries_per_request: Optional[int] = None,
+        max_concurrency: int = _BULK_QUERY_DEFAULT_MAX_CONCURRENCY,
+        as_numpy: bool = False,
+    ) -> Union[
+        Iterator[List[MatchNeighbor]], Tuple["np.ndarray", "np.ndarray"]  # noqa: F821
+    ]:
+        """Retrieves nearest neighbors for a large number of queries on the specified deployed index.
+
+        The queries are split into BatchMatchRequests that fit in a gRPC message.
+        Up to max_concurrency requests are sent at the same time over the pooled
+        match channels. The requests of all queries share the restricts of the
+        filter, which are built once.
+
+        Example usage:
+            for neighbors in my_index_endpoint.bulk_match(
+                deployed_index_id="my_deployed_index", queries=embeddings
+            ):
+                ...
+
+        Args:
+            deployed_index_id (str):
+                Required. The ID of the DeployedIndex to match the queries against.
+            queries (Union[Sequence[Sequence[float]], np.ndarray]):
+                Required. The queries, e.g. a 2-D numpy array with one embedding
+                per row.
+            num_neighbors (int):
+                Required. The number of nearest neighbors to be retrieved from database for
+                each query.
+            filter (List[Namespace]):
+                Optional. A list of Namespaces for filtering the matching results,
+                applied to every query. See `MatchingEngineIndexEndpoint.match` for
+                details.
+            max_queries_per_request (int):
+                Optional. The maximum number of queries of one request. By default
+                requests are only limited by the gRPC message size.
+            max_concurrency (int):
+                Optional. The maximum number of requests in flight at the same time.
+            as_numpy (bool):
+                Optional. If True, all results are collected into two arrays of
+                shape (number of queries, num_neighbors): the neighbor IDs and
+                their distances. Missing neighbors have an empty ID and a NaN
+                distance.
+
+        Returns:
+            An iterator over the nearest neighbors of each query, in order, or the
+            (ids, distances) arrays if as_numpy is True.
+
+        Raises:
+            RuntimeError: If there is no deployed index with the ID.
+            ValueError: If a limit is not positive.
+        """
+        # Resolves the address early so that an unknown index fails on the call.
+        self._get_match_grpc_address(deployed_index_id)
+        template = self._build_match_request_template(
+            deployed_index_id=deployed_index_id,
+            num_neighbors=num_neighbors,
+            filter=filter,
+        )
+
+        def _match(chunk: Sequence[Sequence[float]]) -> List[List[MatchNeighbor]]:
+            batch_request = self._build_batch_match_request(
+                deployed_index_id=deployed_index_id,
+                queries=chunk,
+                num_neighbors=num_neighbors,
+                template=template,
+            )
+            response = self._get_match_stub(deployed_index_id).BatchMatch(batch_request)
+            return self._parse_batch_match_response(response)
+
+        # float_val is a packed repeated float field.
+        query_bytes = (
+            template.ByteSize() + 4 * len(queries[0]) + 8 if len(queries) else 0
+        )
+        return self._bulk_query(
+            query_fn=_match,
+            queries=queries,
+            query_bytes=query_bytes,
+            num_neighbors=num_neighbors,
+            max_queries_per_request=max_queries_per_request,
+            max_concurrency=max_concurrency,
+            as_numpy=as_numpy,
+        )
+
+    @staticmethod
+    def _query_to_list(query: Sequence[float]) -> List[float]:
+        """Converts a query, e.g. a row of a numpy array, to a list of floats."""
+        return query.tolist() if hasattr(query, "tolist") else query
+
+    @classmethod
+    def _bulk_query(
+        cls,
+        query_fn: Callable[[Sequence[Sequence[float]]], List[List[MatchNeighbor]]],
+        queries: Union[Sequence[Sequence[float]], "np.ndarray"],  # noqa: F821
+        query_bytes: int,
+        num_neighbors: int,
+        max_queries_per_request: Optional[int],
+        max_concurrency: int,
+        as_numpy: bool,
+    ) -> Union[
+        Iterator[List[MatchNeighbor]], Tuple["np.ndarray", "np.ndarray"]  # noqa: F821
+    ]:
+        """Runs query_fn on chunks of the queries with bounded concurrency.
+
+        Args:
+            query_fn (Callable[[Sequence[Sequence[float]]], List[List[MatchNeighbor]]]):
+                Required. Sends one request for a chunk of queries and returns the
+                neighbors of each query of the chunk.
+            queries (Union[Sequence[Sequence[float]], np.ndarray]):
+                Required. The queries.
+            query_bytes (int):
+                Required. The serialized size of one query in a request.
+            num_neighbors (int):
+                Required. The number of nearest neighbors of each query.
+            max_queries_per_request (int):
+                Optional. The maximum number of queries of one chunk.
+            max_concurrency (int):
+                Required. The maximum number of chunks queried at the same time.
+            as_numpy (bool):
+                Required. Whether to collect the results into numpy arrays.
+
+        Returns:
+            An iterator over the nearest neighbors of each query, in order, or the
+            (ids, distances) arrays if as_numpy is True.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        if max_queries_per_request is not None and max_queries_per_request < 1:
+            raise ValueError(
+                "max_queries_per_request must be a positive integer, "
+                f"got {max_queries_per_request}."
+            )
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be a positive integer, got {max_concurrency}."
+            )
+
+        bytes_per_query = max(query_bytes, num_neighbors * _BULK_QUERY_NEIGHBOR_BYTES)
+        chunk_size = max(1, _BULK_QUERY_MAX_MESSAGE_BYTES // max(bytes_per_query, 1))
+        if max_queries_per_request is not None:
+            chunk_size = min(chunk_size, max_queries_per_request)
+
+        results = cls._iter_bulk_query_results(
+            query_fn=query_fn,
+            queries=queries,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+        )
+        if not as_numpy:
+            return results
+
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "NumPy is not installed. Please install numpy to use as_numpy=True."
+            )
+
+        ids = np.full((len(queries), num_neighbors), "", dtype=object)
+        distances = np.full((len(queries), num_neighbors), np.nan, dtype=np.float64)
+        for row, neighbors in enumerate(results):
+            ids[row, : len(neighbors)] = [neighbor.id for neighbor in neighbors]
+            distances[row, : len(neighbors)] = [
+                neighbor.distance for neighbor in neighbors
+            ]
+        return ids, distances
+
+    @staticmethod
+    def _iter_bulk_query_results(
+        query_fn: Callable[[Sequence[Sequence[float]]], List[List[MatchNeighbor]]],
+        queries: Union[Sequence[Sequence[float]], "np.ndarray"],  # noqa: F821
+        chunk_size: int,
+        max_concurrency: int,
+    ) -> Iterator[List[MatchNeighbor]]:
+        """Yields the results of chunks of queries in order while later chunks are in flight."""
+        with futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            in_flight: collections.deque = collections.deque()
+            try:
+                for start in range(0, len(queries), chunk_size):
+                    in_flight.append(
+                        executor.submit(query_fn, queries[start : start + chunk_size])
+                    )
+                    if len(in_flight) >= max_concurrency:
+                        yield from in_flight.popleft().result()
+                while in_flight:
+                    yield from in_flight.popleft().result()
+            finally:
+                for future in in_flight:
+                    future.cancel()
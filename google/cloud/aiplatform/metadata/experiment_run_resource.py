@@ -15,10 +15,12 @@
 # limitations under the License.
 """Vertex Experiment Run class."""
 
+import atexit
 from collections import abc
 import concurrent.futures
 import functools
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from google.api_core import exceptions
 from google.auth import credentials as auth_credentials
@@ -26,8 +28,12 @@ from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import pipeline_jobs
 from google.cloud.aiplatform import jobs
+from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.compat.types import artifact as gca_artifact
 from google.cloud.aiplatform.compat.types import execution as gca_execution
+from google.cloud.aiplatform.compat.types import (
+    tensorboard_data as gca_tensorboard_data,
+)
 from google.cloud.aiplatform.compat.types import (
     tensorboard_time_series as gca_tensorboard_time_series,
 )
@@ -52,6 +58,9 @@ from google.protobuf import timestamp_pb2
 
 _LOGGER = base.Logger(__name__)
 
+# The maximum number of data points in one WriteTensorboardRunData request.
+_MAX_WRITE_TENSORBOARD_RUN_DATA_POINTS = 5000
+
 
 def _format_experiment_run_resource_id(experiment_name: str, run_name: str) -> str:
     """Formats the the experiment run resource id.
@@ -83,6 +92,211 @@ def _v1_not_supported(method: Callable) -> Callable:
     return wrapper
 
 
+class _TimeSeriesMetricsBuffer:
+    """Buffers the time series metrics of a TensorboardRun and writes them in batches.
+
+    Logged data points are kept in memory and written by a background thread
+    once `max_buffered_points` points are buffered or every `flush_interval`
+    seconds, whichever comes first. Missing TensorboardTimeSeries are created
+    with one BatchCreateTensorboardTimeSeries request per flush.
+
+    An error raised by a background flush is re-raised by the next call to
+    `add` or `flush`. The points of a failed flush are kept and written again
+    by the next flush; rewriting a step overwrites its value, so points that
+    were already written are not duplicated.
+
+    The buffer is flushed on `close`, which is also registered to run at
+    interpreter exit.
+    """
+
+    def __init__(
+        self,
+        tensorboard_run: tensorboard_resource.TensorboardRun,
+        max_buffered_points: int,
+        flush_interval: float,
+    ):
+        """Initializes the buffer and starts its background flush thread.
+
+        Args:
+            tensorboard_run (tensorboard_resource.TensorboardRun):
+                Required. The TensorboardRun to write the data points to.
+            max_buffered_points (int):
+                Required. Number of buffered data points that triggers a flush.
+            flush_interval (float):
+                Required. Maximum number of seconds between two flushes.
+        """
+        self._tensorboard_run = tensorboard_run
+        self._max_buffered_points = max_buffered_points
+        self._flush_interval = flush_interval
+
+        # Guards _points and _error.
+        self._lock = threading.Lock()
+        # Serializes flushes so the points are written in the order they were logged.
+        self._flush_lock = threading.Lock()
+        self._points: List[Tuple[str, float, int, timestamp_pb2.Timestamp]] = []
+        self._error: Optional[Exception] = None
+
+        self._flush_requested = threading.Event()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._flush_periodically,
+            name="ExperimentRunTimeSeriesMetricsFlush",
+            daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def add(
+        self,
+        metrics: Dict[str, float],
+        step: int,
+        wall_time: Optional[timestamp_pb2.Timestamp] = None,
+    ):
+        """Buffers one data point per metric.
+
+        Args:
+            metrics (Dict[str, float]):
+                Required. Dictionary of where keys are metric names and values are metric values.
+            step (int):
+                Required. Step index of these data points within the run.
+            wall_time (timestamp_pb2.Timestamp):
+                Optional. Wall clock timestamp of these data points. Defaults
+                to the time they are buffered.
+        Raises:
+            RuntimeError: If the buffer is closed.
+        """
+        self._raise_background_error()
+
+        if not wall_time:
+            wall_time = utils.get_timestamp_proto()
+
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError("The time series metrics buffer is closed.")
+            self._points.extend(
+                (display_name, value, step, wall_time)
+                for display_name, value in metrics.items()
+            )
+            is_full = len(self._points) >= self._max_buffered_points
+
+        if is_full:
+            self._flush_requested.set()
+
+    def flush(self):
+        """Writes all buffered data points."""
+        self._raise_background_error()
+        self._flush()
+
+    def close(self):
+        """Stops the background flush thread and writes all buffered data points."""
+        atexit.unregister(self.close)
+        if self._closed.is_set():
+            return
+
+        with self._lock:
+            self._closed.set()
+        self._flush_requested.set()
+        self._thread.join()
+
+        # Points of a failed background flush were kept, so a successful
+        # final flush supersedes the error.
+        self._flush()
+        with self._lock:
+            self._error = None
+
+    def _raise_background_error(self):
+        """Re-raises the error of the last failed background flush, if any."""
+        with self._lock:
+            error, self._error = self._error, None
+        if error:
+            raise error
+
+    def _flush_periodically(self):
+        """Flushes the buffer until it is closed."""
+        while not self._closed.is_set():
+            self._flush_requested.wait(timeout=self._flush_interval)
+            self._flush_requested.clear()
+            if self._closed.is_set():
+                return
+            try:
+                self._flush()
+            except Exception as e:
+                _LOGGER.warning(f"Failed to write time series metrics: {e}")
+                with self._lock:
+                    self._error = e
+
+    def _flush(self):
+        """Writes the buffered data points, keeping them buffered on failure."""
+        with self._flush_lock:
+            with self._lock:
+                points, self._points = self._points, []
+            if not points:
+                return
+            try:
+                self._write(points)
+            except Exception:
+                with self._lock:
+                    self._points[:0] = points
+                raise
+
+    def _write(self, points: List[Tuple[str, float, int, timestamp_pb2.Timestamp]]):
+        """Creates the missing time series and writes the data points.
+
+        Args:
+            points (List[Tuple[str, float, int, timestamp_pb2.Timestamp]]):
+                Required. The (display name, value, step, wall time) of the data points.
+        """
+        tensorboard_run = self._tensorboard_run
+
+        def _get_missing_display_names() -> List[str]:
+            return [
+                display_name
+                for display_name in dict.fromkeys(point[0] for point in points)
+                if display_name
+                not in tensorboard_run._time_series_display_name_to_id_mapping
+            ]
+
+        if _get_missing_display_names():
+            tensorboard_run._sync_time_series_display_name_to_id_mapping()
+            missing_display_names = _get_missing_display_names()
+            if missing_display_names:
+                tensorboard_run.batch_create_tensorboard_time_series(
+                    display_names=missing_display_names
+                )
+
+        for i in range(0, len(points), _MAX_WRITE_TENSORBOARD_RUN_DATA_POINTS):
+            time_series_id_to_values: Dict[
+                str, List[gca_tensorboard_data.TimeSeriesDataPoint]
+            ] = {}
+            for display_name, value, step, wall_time in points[
+                i : i + _MAX_WRITE_TENSORBOARD_RUN_DATA_POINTS
+            ]:
+                time_series_id = (
+                    tensorboard_run._time_series_display_name_to_id_mapping[
+                        display_name
+                    ]
+                )
+                time_series_id_to_values.setdefault(time_series_id, []).append(
+                    gca_tensorboard_data.TimeSeriesDataPoint(
+                        scalar=gca_tensorboard_data.Scalar(value=value),
+                        wall_time=wall_time,
+                        step=step,
+                    )
+                )
+
+            tensorboard_run.api_client.write_tensorboard_run_data(
+                tensorboard_run=tensorboard_run.resource_name,
+                time_series_data=[
+                    gca_tensorboard_data.TimeSeriesData(
+                        tensorboard_time_series_id=time_series_id,
+                        value_type=gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR,
+                        values=values,
+                    )
+                    for time_series_id, values in time_series_id_to_values.items()
+                ],
+            )
+
+
 class ExperimentRun(
     experiment_resources._ExperimentLoggable,
     experiment_loggable_schemas=(
@@ -97,6 +311,9 @@ class ExperimentRun(
 ):
     """A Vertex AI Experiment run."""
 
+    # Set by enable_time_series_metrics_buffering.
+    _time_series_metrics_buffer: Optional[_TimeSeriesMetricsBuffer] = None
+
     def __init__(
         self,
         run_name: str,
@@ -913,6 +1130,82 @@ class ExperimentRun(
         data = self._backing_tensorboard_run.resource.read_time_series_data()
         return max(ts.values[-1].step if ts.values else 0 for ts in data.values())
 
+    def _ensure_backing_tensorboard_run(self, method_name: str):
+        """Assigns the experiment backing tensorboard to this run if it has none.
+
+        Args:
+            method_name (str): Name of the method requiring the backing tensorboard.
+        Raises:
+            RuntimeError: If current experiment run doesn't have a backing Tensorboard resource.
+        """
+        if not self._backing_tensorboard_run:
+            self._assign_to_experiment_backing_tensorboard()
+            if not self._backing_tensorboard_run:
+                raise RuntimeError(
+                    f"Please set this experiment run with backing tensorboard resource to use {method_name}."
+                )
+
+    @_v1_not_supported
+    def enable_time_series_metrics_buffering(
+        self,
+        max_buffered_points: int = 1000,
+        flush_interval: float = 10.0,
+    ):
+        """Buffers time series metrics in memory and writes them in background batches.
+
+        Once enabled, `log_time_series_metrics` only buffers the data points.
+        They are written by a background thread, with one request per batch,
+        when `max_buffered_points` points are buffered or every
+        `flush_interval` seconds. Missing time series are created in batches
+        as well. The buffer is flushed when the run ends, on
+        `flush_time_series_metrics` and at interpreter exit.
+
+        ```
+        with aiplatform.start_run('my-run') as run:
+            run.enable_time_series_metrics_buffering()
+            for i in range(10000):
+                run.log_time_series_metrics({'loss': loss})
+        ```
+
+        Args:
+            max_buffered_points (int):
+                Optional. Number of buffered data points that triggers a flush.
+            flush_interval (float):
+                Optional. Maximum number of seconds between two flushes.
+        Raises:
+            ValueError: If max_buffered_points or flush_interval is not positive.
+            RuntimeError: If current experiment run doesn't have a backing Tensorboard resource.
+        """
+        if max_buffered_points < 1:
+            raise ValueError(
+                f"max_buffered_points must be positive, got {max_buffered_points}."
+            )
+        if flush_interval <= 0:
+            raise ValueError(f"flush_interval must be positive, got {flush_interval}.")
+
+        self._ensure_backing_tensorboard_run(
+            method_name="enable_time_series_metrics_buffering"
+        )
+        self.disable_time_series_metrics_buffering()
+
+        self._time_series_metrics_buffer = _TimeSeriesMetricsBuffer(
+            tensorboard_run=self._backing_tensorboard_run.resource,
+            max_buffered_points=max_buffered_points,
+            flush_interval=flush_interval,
+        )
+
+    def flush_time_series_metrics(self):
+        """Writes the time series metrics buffered by this run, if any."""
+        if self._time_series_metrics_buffer:
+            self._time_series_metrics_buffer.flush()
+
+    def disable_time_series_metrics_buffering(self):
+        """Flushes the buffered time series metrics and stops buffering new ones."""
+        time_series_metrics_buffer = self._time_series_metrics_buffer
+        if time_series_metrics_buffer:
+            self._time_series_metrics_buffer = None
+            time_series_metrics_buffer.close()
+
     @_v1_not_supported
     def log_time_series_metrics(
         self,
@@ -943,20 +1236,22 @@ class ExperimentRun(
             RuntimeError: If current experiment run doesn't have a backing Tensorboard resource.
         """
 
-        if not self._backing_tensorboard_run:
-            self._assign_to_experiment_backing_tensorboard()
-            if not self._backing_tensorboard_run:
-                raise RuntimeError(
-                    "Please set this experiment run with backing tensorboard resource to use log_time_series_metrics."
-                )
+        self._ensure_backing_tensorboard_run(method_name="log_time_series_metrics")
 
-        self._soft_create_time_series(metric_keys=set(metrics.keys()))
+        if not self._time_series_metrics_buffer:
+            self._soft_create_time_series(metric_keys=set(metrics.keys()))
 
         if not step:
             step = self._largest_step or self._get_latest_time_series_step()
             step += 1
             self._largest_step = step
 
+        if self._time_series_metrics_buffer:
+            self._time_series_metrics_buffer.add(
+                metrics=metrics, step=step, wall_time=wall_time
+            )
+            return
+
         self._backing_tensorboard_run.resource.write_tensorboard_scalar_data(
             time_series_data=metrics, step=step, wall_time=wall_time
         )
@@ -1345,11 +1640,16 @@ class ExperimentRun(
     ):
         """Ends this experiment run and sets state to COMPLETE.
 
+        Buffered time series metrics are flushed first.
+
         Args:
             state (aiplatform.gapic.Execution.State):
                 Optional. Override the state at the end of run. Defaults to COMPLETE.
         """
-        self.update_state(state)
+        try:
+            self.disable_time_series_metrics_buffering()
+        finally:
+            self.update_state(state)
 
     def delete(self, *, delete_backing_tensorboard_run: bool = False):
         """Deletes this experiment run.
@@ -20,7 +20,7 @@ import collections
 import re
 import threading
 from copy import deepcopy
-from typing import Dict, Optional, Union, Any, List
+from typing import Dict, Iterator, Optional, Union, Any, List
 
 import proto
 from google.api_core import exceptions
@@ -377,6 +377,72 @@ class _Resource(base.VertexAiResourceNounWithFutureManager, abc.ABC):
             order_by=order_by,
         )
 
+    @classmethod
+    def iter_list(
+        cls,
+        filter: Optional[str] = None,  # pylint: disable=redefined-builtin
+        metadata_store_id: str = "default",
+        project: Optional[str] = None,
+        location: Optional[str] = None,
+        credentials: Optional[auth_credentials.Credentials] = None,
+        order_by: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator["_Resource"]:
+        """Lazily list resources that match the list filter in target metadataStore.
+
+        Resources are yielded page by page as soon as they are received, while
+        the next page is requested in the background. Breaking out of the
+        iteration stops the listing.
+
+        Args:
+            filter (str):
+                Optional. A query to filter available resources for
+                matching results.
+            metadata_store_id (str):
+                The <metadata_store_id> portion of the resource name with
+                the format:
+                projects/123/locations/us-central1/metadataStores/<metadata_store_id>/<resource_noun>/<resource_id>
+                If not provided, the MetadataStore's ID will be set to "default".
+            project (str):
+                Project used to create this resource. Overrides project set in
+                aiplatform.init.
+            location (str):
+                Location used to create this resource. Overrides location set in
+                aiplatform.init.
+            credentials (auth_credentials.Credentials):
+                Custom credentials used to create this resource. Overrides
+                credentials set in aiplatform.init.
+            order_by (str):
+                Optional. How the list of messages is ordered. See `list` for
+                details.
+            page_size (int):
+                Optional. The number of resources requested per page.
+            max_results (int):
+                Optional. The maximum number of resources to yield.
+
+        Returns:
+            resources (Iterator[_Resource]):
+                an iterator of managed Metadata resources.
+        """
+        parent = (
+            initializer.global_config.common_location_path(
+                project=project, location=location
+            )
+            + f"/metadataStores/{metadata_store_id}"
+        )
+
+        return super().iter_list(
+            filter=filter,
+            project=project,
+            location=location,
+            credentials=credentials,
+            parent=parent,
+            order_by=order_by,
+            page_size=page_size,
+            max_results=max_results,
+        )
+
     @classmethod
     def _create(
         cls,
@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+from concurrent import futures
+import functools
 import json
 import pathlib
 import re
@@ -22,8 +25,10 @@ import tempfile
 import requests
 from typing import (
     Any,
+    Callable,
     Dict,
     List,
+    Mapping,
     NamedTuple,
     Optional,
     Sequence,
@@ -34,8 +39,8 @@ from typing import (
 
 from google.api_core import operation
 from google.api_core import exceptions as api_exceptions
+from google.api_core import retry as api_retry
 from google.auth import credentials as auth_credentials
-from google.auth.transport import requests as google_auth_requests
 import proto
 
 from google.cloud import aiplatform
@@ -47,6 +52,7 @@ from google.cloud.aiplatform import jobs
 from google.cloud.aiplatform import models
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import gcs_utils
+from google.cloud.aiplatform.utils import http_utils
 from google.cloud.aiplatform.utils import _explanation_utils
 from google.cloud.aiplatform import model_evaluation
 from google.cloud.aiplatform.compat.services import endpoint_service_client
@@ -68,7 +74,7 @@ from google.cloud.aiplatform.constants import (
 
 from google.cloud.aiplatform_v1.types import model as model_v1
 
-from google.protobuf import field_mask_pb2, timestamp_pb2
+from google.protobuf import field_mask_pb2, struct_pb2, timestamp_pb2
 from google.protobuf import json_format
 
 if TYPE_CHECKING:
@@ -80,6 +86,12 @@ _SUCCESSFUL_HTTP_RESPONSE = 300
 _RAW_PREDICT_DEPLOYED_MODEL_ID_KEY = "X-Vertex-AI-Deployed-Model-Id"
 _RAW_PREDICT_MODEL_RESOURCE_KEY = "X-Vertex-AI-Model"
 _RAW_PREDICT_MODEL_VERSION_ID_KEY = "X-Vertex-AI-Model-Version-Id"
+# Prediction request bodies are limited to 1.5 MB.
+_BULK_PREDICT_MAX_REQUEST_BYTES = 1572864
+_BULK_PREDICT_DEFAULT_MAX_CONCURRENCY = 8
+_PREDICTIONS_FORMAT_JSON = "json"
+_PREDICTIONS_FORMAT_NUMPY = "numpy"
+_PREDICTIONS_FORMATS = (_PREDICTIONS_FORMAT_JSON, _PREDICTIONS_FORMAT_NUMPY)
 
 _LOGGER = base.Logger(__name__)
 
@@ -94,6 +106,22 @@ _SUPPORTED_MODEL_FILE_NAMES = [
 ]
 
 
+class _PrivateEndpointTooManyRequests(api_exceptions.TooManyRequests, RuntimeError):
+    """A throttled PrivateEndpoint request, still catchable as a RuntimeError."""
+
+    def __str__(self):
+        return self.message
+
+
+class _PrivateEndpointServiceUnavailable(
+    api_exceptions.ServiceUnavailable, RuntimeError
+):
+    """An unavailable PrivateEndpoint, still catchable as a RuntimeError."""
+
+    def __str__(self):
+        return self.message
+
+
 class VersionInfo(NamedTuple):
     """VersionInfo class envelopes returned Model version information.
 
@@ -136,6 +164,8 @@ class Prediction(NamedTuple):
             call. The schema of any single prediction may be specified via
             Endpoint's DeployedModels' [Model's][google.cloud.aiplatform.v1beta1.DeployedModel.model]
             [PredictSchemata's][google.cloud.aiplatform.v1beta1.Model.predict_schemata]
+            A numpy.ndarray if the predictions were requested with
+            return_format="numpy".
         deployed_model_id:
             ID of the Endpoint's DeployedModel that served this prediction.
         model_version_id:
@@ -165,6 +195,18 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
     _format_resource_name_method = "endpoint_path"
     _preview_class = "google.cloud.aiplatform.aiplatform.preview.models.Endpoint"
 
+    _list_order_by_locally = True
+
+    _http_transport_config = http_utils.HttpTransportConfig()
+    _async_http_client = None
+    _prediction_async_client = None
+
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: proto.Message) -> bool:
+        """Returns whether a listed GAPIC endpoint is a public Endpoint."""
+        # `network` is empty for public Endpoints
+        return not bool(gapic_resource.network)
+
     @property
     def preview(self):
         """Return an Endpoint instance with preview features enabled."""
@@ -1498,12 +1540,162 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
 
         return self
 
+    def configure_http_transport(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """Configures the HTTP connection pools used by raw predictions.
+
+        The settings apply to the session of `raw_predict` and to the async client
+        of `predict_async(use_raw_predict=True)`. Existing connections are closed.
+
+        Example usage:
+            my_endpoint.configure_http_transport(max_connections=500)
+
+        Args:
+            max_connections (int):
+                Optional. The maximum number of connections kept open to the
+                endpoint. Requests beyond it wait for a free connection. Defaults
+                to 100.
+            max_keepalive_connections (int):
+                Optional. The maximum number of idle connections the async client
+                keeps alive. Defaults to 20.
+            keepalive_expiry (float):
+                Optional. The time in seconds the async client keeps idle connections
+                alive. Defaults to 5.0.
+            http2 (bool):
+                Optional. Whether the async client uses HTTP/2 when the server and the
+                installed ``h2`` package support it. Defaults to True.
+        """
+        settings = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+            "http2": http2,
+        }
+        self._http_transport_config = http_utils.HttpTransportConfig(
+            **{name: value for name, value in settings.items() if value is not None}
+        )
+        if self.authorized_session:
+            self.authorized_session.close()
+        self.authorized_session = None
+        # The async client is bound to the event loop it was used on, so it is
+        # only dropped here and closed by the garbage collector.
+        self._async_http_client = None
+
+    def _get_raw_predict_request_url(self) -> str:
+        """Gets the rawPredict URL of this Endpoint."""
+        if not self.raw_predict_request_url:
+            self.raw_predict_request_url = f"https://{self.location}-{constants.base.API_BASE_PATH}/v1/projects/{self.project}/locations/{self.location}/endpoints/{self.name}:rawPredict"
+        return self.raw_predict_request_url
+
+    @staticmethod
+    def _get_raw_predict_prediction(
+        json_response: Dict[str, Any],
+        headers: Mapping[str, str],
+        return_format: str = _PREDICTIONS_FORMAT_JSON,
+    ) -> Prediction:
+        """Constructs a Prediction from the JSON body and headers of a rawPredict response."""
+        predictions = json_response["predictions"]
+        if return_format == _PREDICTIONS_FORMAT_NUMPY:
+            np = Endpoint._import_numpy()
+            try:
+                predictions = np.array(predictions, dtype=np.float64)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    'return_format="numpy" requires numeric predictions of equal shape.'
+                ) from exc
+
+        return Prediction(
+            predictions=predictions,
+            deployed_model_id=headers[_RAW_PREDICT_DEPLOYED_MODEL_ID_KEY],
+            model_resource_name=headers[_RAW_PREDICT_MODEL_RESOURCE_KEY],
+            model_version_id=headers.get(_RAW_PREDICT_MODEL_VERSION_ID_KEY, None),
+        )
+
+    @staticmethod
+    def _import_numpy() -> "numpy":  # type: ignore # noqa: F821
+        """Imports numpy for predictions requested with return_format="numpy"."""
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                'NumPy is not installed. Please install numpy to use return_format="numpy".'
+            )
+        return numpy
+
+    @staticmethod
+    def _validate_return_format(return_format: str) -> None:
+        """Raises a ValueError if the predictions format is not supported."""
+        if return_format not in _PREDICTIONS_FORMATS:
+            raise ValueError(
+                f"Unsupported return_format {return_format!r}, "
+                f"must be one of {_PREDICTIONS_FORMATS}."
+            )
+
+    @staticmethod
+    def _get_predictions(
+        predictions: Sequence[struct_pb2.Value],
+        return_format: str = _PREDICTIONS_FORMAT_JSON,
+    ) -> Union[List[Any], "numpy.ndarray"]:  # type: ignore # noqa: F821
+        """Converts the protobuf predictions of a prediction response.
+
+        Args:
+            predictions (Sequence[struct_pb2.Value]):
+                Required. The predictions of the response.
+            return_format (str):
+                Optional. "json" to convert every prediction to its JSON
+                representation, "numpy" to decode numeric predictions straight into
+                one numpy array.
+
+        Returns:
+            The list of predictions, or an array with one row per prediction.
+
+        Raises:
+            ValueError: If the predictions are not numeric or of unequal shape
+                and return_format is "numpy".
+        """
+        if return_format == _PREDICTIONS_FORMAT_JSON:
+            return [json_format.MessageToDict(item) for item in predictions]
+
+        np = Endpoint._import_numpy()
+
+        def _to_numpy(value: struct_pb2.Value) -> Any:
+            kind = value.WhichOneof("kind")
+            if kind == "number_value":
+                return value.number_value
+            if kind == "list_value":
+                values = value.list_value.values
+                # Vectors of numbers, e.g. embeddings, skip the per-element recursion.
+                if all(item.WhichOneof("kind") == "number_value" for item in values):
+                    return np.fromiter(
+                        (item.number_value for item in values),
+                        dtype=np.float64,
+                        count=len(values),
+                    )
+                return [_to_numpy(item) for item in values]
+            raise ValueError(
+                f'return_format="numpy" requires numeric predictions, got a {kind}.'
+            )
+
+        rows = [_to_numpy(prediction) for prediction in predictions]
+        try:
+            return np.array(rows, dtype=np.float64)
+        except ValueError as exc:
+            raise ValueError(
+                'return_format="numpy" requires numeric predictions of equal shape.'
+            ) from exc
+
     def predict(
         self,
         instances: List,
         parameters: Optional[Dict] = None,
         timeout: Optional[float] = None,
         use_raw_predict: Optional[bool] = False,
+        return_format: str = _PREDICTIONS_FORMAT_JSON,
     ) -> Prediction:
         """Make a prediction against this Endpoint.
 
@@ -1531,29 +1723,32 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             use_raw_predict (bool):
                 Optional. Default value is False. If set to True, the underlying prediction call will be made
                 against Endpoint.raw_predict().
+            return_format (str):
+                Optional. The format of the returned predictions. "json", the
+                default, returns a list with the JSON representation of each
+                prediction. "numpy" decodes numeric predictions, e.g. scores or
+                embedding vectors, straight into a numpy.ndarray with one row per
+                instance, skipping the conversion to Python objects.
 
         Returns:
             prediction (aiplatform.Prediction):
                 Prediction with returned predictions and Model ID.
+
+        Raises:
+            ValueError: If return_format is not supported, or is "numpy" and the
+                predictions are not numeric or of unequal shape.
         """
+        self._validate_return_format(return_format)
         self.wait()
         if use_raw_predict:
             raw_predict_response = self.raw_predict(
                 body=json.dumps({"instances": instances, "parameters": parameters}),
                 headers={"Content-Type": "application/json"},
             )
-            json_response = raw_predict_response.json()
-            return Prediction(
-                predictions=json_response["predictions"],
-                deployed_model_id=raw_predict_response.headers[
-                    _RAW_PREDICT_DEPLOYED_MODEL_ID_KEY
-                ],
-                model_resource_name=raw_predict_response.headers[
-                    _RAW_PREDICT_MODEL_RESOURCE_KEY
-                ],
-                model_version_id=raw_predict_response.headers.get(
-                    _RAW_PREDICT_MODEL_VERSION_ID_KEY, None
-                ),
+            return self._get_raw_predict_prediction(
+                raw_predict_response.json(),
+                raw_predict_response.headers,
+                return_format=return_format,
             )
         else:
             prediction_response = self._prediction_client.predict(
@@ -1564,10 +1759,9 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
             )
 
             return Prediction(
-                predictions=[
-                    json_format.MessageToDict(item)
-                    for item in prediction_response.predictions.pb
-                ],
+                predictions=self._get_predictions(
+                    prediction_response.predictions.pb, return_format=return_format
+                ),
                 deployed_model_id=prediction_response.deployed_model_id,
                 model_version_id=prediction_response.model_version_id,
                 model_resource_name=prediction_response.model,
@@ -1598,13 +1792,372 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         """
         if not self.authorized_session:
             self.credentials._scopes = constants.base.DEFAULT_AUTHED_SCOPES
-            self.authorized_session = google_auth_requests.AuthorizedSession(
-                self.credentials
+            self.authorized_session = http_utils.create_authorized_session(
+                self.credentials, self._http_transport_config
             )
-            self.raw_predict_request_url = f"https://{self.location}-{constants.base.API_BASE_PATH}/v1/projects/{self.project}/locations/{self.location}/endpoints/{self.name}:rawPredict"
 
         return self.authorized_session.post(
-            url=self.raw_predict_request_url, data=body, headers=headers
+            url=self._get_raw_predict_request_url(), data=body, headers=headers
+        )
+
+    async def _wait_async(self) -> None:
+        """Waits for a pending creation of this Endpoint without blocking the event loop.
+
+        Only a pending creation is waited on in the default executor. Otherwise
+        the wait returns immediately, on the event loop thread.
+        """
+        if self._latest_future is None:
+            self.wait()
+        else:
+            await asyncio.get_running_loop().run_in_executor(None, self.wait)
+
+    async def predict_async(
+        self,
+        instances: List,
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        use_raw_predict: Optional[bool] = False,
+        return_format: str = _PREDICTIONS_FORMAT_JSON,
+    ) -> Prediction:
+        """Make an asynchronous prediction against this Endpoint.
+
+        The request is sent without blocking the event loop, so that many predictions
+        can be in flight from one thread. Predictions are sent through the gRPC async
+        prediction client, or through a pooled async HTTP client if use_raw_predict
+        is set. Both clients are bound to the event loop they are first used on.
+
+        Example usage:
+            predictions = await asyncio.gather(
+                *[my_endpoint.predict_async(instances=[instance]) for instance in instances]
+            )
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. See `Endpoint.predict` for details.
+            parameters (Dict):
+                The parameters that govern the prediction. See `Endpoint.predict`
+                for details.
+            timeout (float): Optional. The timeout for this request in seconds.
+            use_raw_predict (bool):
+                Optional. Default value is False. If set to True, the underlying prediction call will be made
+                against the rawPredict API with the async HTTP client. Requires the
+                `httpx` package.
+            return_format (str):
+                Optional. The format of the returned predictions, "json" or
+                "numpy". See `Endpoint.predict` for details.
+
+        Returns:
+            prediction (aiplatform.Prediction):
+                Prediction with returned predictions and Model ID.
+
+        Raises:
+            ValueError: If return_format is not supported, or is "numpy" and the
+                predictions are not numeric or of unequal shape.
+        """
+        self._validate_return_format(return_format)
+        await self._wait_async()
+        if use_raw_predict:
+            raw_predict_response = await self._raw_predict_async(
+                body=json.dumps({"instances": instances, "parameters": parameters}),
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+            raw_predict_response.raise_for_status()
+            return self._get_raw_predict_prediction(
+                raw_predict_response.json(),
+                raw_predict_response.headers,
+                return_format=return_format,
+            )
+
+        if not self._prediction_async_client:
+            self._prediction_async_client = initializer.global_config.create_client(
+                client_class=utils.PredictionAsyncClientWithOverride,
+                credentials=self.credentials,
+                location_override=self.location,
+                prediction_client=True,
+            )
+        prediction_response = await self._prediction_async_client.predict(
+            endpoint=self._gca_resource.name,
+            instances=instances,
+            parameters=parameters,
+            timeout=timeout,
+        )
+
+        return Prediction(
+            predictions=self._get_predictions(
+                prediction_response.predictions.pb, return_format=return_format
+            ),
+            deployed_model_id=prediction_response.deployed_model_id,
+            model_version_id=prediction_response.model_version_id,
+            model_resource_name=prediction_response.model,
+        )
+
+    async def _raw_predict_async(
+        self,
+        body: Union[bytes, str],
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> "httpx.Response":  # type: ignore # noqa: F821
+        """Sends a rawPredict request with the pooled async HTTP client.
+
+        Args:
+            body (Union[bytes, str]):
+                Required. The body of the prediction request.
+            headers (Dict[str, str]):
+                Required. The header of the request as a dictionary.
+            timeout (float):
+                Optional. The timeout for this request in seconds.
+
+        Returns:
+            The HTTP response of the rawPredict request.
+        """
+        if not self._async_http_client:
+            self.credentials._scopes = constants.base.DEFAULT_AUTHED_SCOPES
+            self._async_http_client = http_utils.create_async_client(
+                self._http_transport_config
+            )
+        headers = await http_utils.get_authorization_headers(self.credentials, headers)
+        return await self._async_http_client.post(
+            self._get_raw_predict_request_url(),
+            content=body,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    def bulk_predict(
+        self,
+        instances: List,
+        parameters: Optional[Dict] = None,
+        max_instances_per_request: Optional[int] = None,
+        max_request_bytes: int = _BULK_PREDICT_MAX_REQUEST_BYTES,
+        max_concurrency: int = _BULK_PREDICT_DEFAULT_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
+        use_raw_predict: Optional[bool] = False,
+        retry: Optional[api_retry.Retry] = None,
+    ) -> Prediction:
+        """Make a prediction on a large list of instances against this Endpoint.
+
+        The instances are split into requests of at most max_instances_per_request
+        instances and max_request_bytes bytes of JSON. Up to max_concurrency requests
+        are sent at the same time. Requests rejected with HTTP 429 or 503 are retried
+        with exponential backoff. The predictions are returned in the order of the
+        instances.
+
+        Example usage:
+            prediction = my_endpoint.bulk_predict(
+                instances=rows, max_instances_per_request=100, max_concurrency=16
+            )
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. See `Endpoint.predict` for details.
+            parameters (Dict):
+                The parameters that govern the prediction. They are sent with
+                every request. See `Endpoint.predict` for details.
+            max_instances_per_request (int):
+                Optional. The maximum number of instances sent in one request. By
+                default requests are only limited by max_request_bytes.
+            max_request_bytes (int):
+                Optional. The maximum size in bytes of the JSON body of one request.
+                An instance larger than the limit is sent in a request of its own.
+                Defaults to 1.5 MB.
+            max_concurrency (int):
+                Optional. The maximum number of requests in flight at the same time.
+            timeout (float): Optional. The timeout for each request in seconds.
+            use_raw_predict (bool):
+                Optional. Default value is False. If set to True, the requests are
+                made against the rawPredict API.
+            retry (google.api_core.retry.Retry):
+                Optional. The retry policy of each request. By default requests
+                failing with HTTP 429 or 503 are retried with exponential backoff.
+
+        Returns:
+            prediction (aiplatform.Prediction):
+                Prediction with the predictions of all instances. The model IDs are
+                those of the first request.
+
+        Raises:
+            ValueError: If instances is empty or a limit is not positive.
+        """
+        self.wait()
+        return self._bulk_predict(
+            predict_fn=functools.partial(
+                self._predict_shard, timeout=timeout, use_raw_predict=use_raw_predict
+            ),
+            instances=instances,
+            parameters=parameters,
+            max_instances_per_request=max_instances_per_request,
+            max_request_bytes=max_request_bytes,
+            max_concurrency=max_concurrency,
+            retry=retry,
+        )
+
+    def _predict_shard(
+        self,
+        instances: List,
+        parameters: Optional[Dict],
+        timeout: Optional[float],
+        use_raw_predict: bool,
+    ) -> Prediction:
+        """Makes the prediction request of one shard of a bulk prediction.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: If a rawPredict request
+                failed.
+        """
+        if not use_raw_predict:
+            return self.predict(
+                instances=instances, parameters=parameters, timeout=timeout
+            )
+
+        raw_predict_response = self.raw_predict(
+            body=json.dumps({"instances": instances, "parameters": parameters}),
+            headers={"Content-Type": "application/json"},
+        )
+        if raw_predict_response.status_code >= _SUCCESSFUL_HTTP_RESPONSE:
+            raise api_exceptions.from_http_response(raw_predict_response)
+        return self._get_raw_predict_prediction(
+            raw_predict_response.json(), raw_predict_response.headers
+        )
+
+    def _bulk_predict(
+        self,
+        predict_fn: Callable[[List, Optional[Dict]], Prediction],
+        instances: List,
+        parameters: Optional[Dict],
+        max_instances_per_request: Optional[int],
+        max_request_bytes: int,
+        max_concurrency: int,
+        retry: Optional[api_retry.Retry],
+    ) -> Prediction:
+        """Shards the instances and runs predict_fn on the shards concurrently.
+
+        Args:
+            predict_fn (Callable[[List, Optional[Dict]], Prediction]):
+                Required. The function predicting one shard of instances with the
+                parameters.
+            instances (List):
+                Required. The instances to predict.
+            parameters (Dict):
+                Optional. The parameters sent with every shard.
+            max_instances_per_request (int):
+                Optional. The maximum number of instances of a shard.
+            max_request_bytes (int):
+                Required. The maximum JSON size in bytes of the request of a shard.
+            max_concurrency (int):
+                Required. The maximum number of shards predicted at the same time.
+            retry (google.api_core.retry.Retry):
+                Optional. The retry policy of each shard.
+
+        Returns:
+            The Prediction of all instances, in order.
+
+        Raises:
+            ValueError: If instances is empty or a limit is not positive.
+        """
+        if not instances:
+            raise ValueError("At least one instance is required.")
+        if max_instances_per_request is not None and max_instances_per_request < 1:
+            raise ValueError(
+                "max_instances_per_request must be a positive integer, "
+                f"got {max_instances_per_request}."
+            )
+        if max_request_bytes < 1:
+            raise ValueError(
+                f"max_request_bytes must be a positive integer, got {max_request_bytes}."
+            )
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be a positive integer, got {max_concurrency}."
+            )
+
+        shards = self._shard_instances(
+            instances=instances,
+            parameters=parameters,
+            max_instances_per_request=max_instances_per_request,
+            max_request_bytes=max_request_bytes,
+        )
+        retry = retry or api_retry.Retry(predicate=self._is_retryable_prediction_error)
+        retrying_predict_fn = retry(predict_fn)
+
+        with futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(shards))
+        ) as executor:
+            shard_futures = [
+                executor.submit(retrying_predict_fn, shard, parameters)
+                for shard in shards
+            ]
+            try:
+                shard_predictions = [future.result() for future in shard_futures]
+            except Exception:
+                for future in shard_futures:
+                    future.cancel()
+                raise
+
+        return Prediction(
+            predictions=[
+                prediction
+                for shard_prediction in shard_predictions
+                for prediction in shard_prediction.predictions
+            ],
+            deployed_model_id=shard_predictions[0].deployed_model_id,
+            model_version_id=shard_predictions[0].model_version_id,
+            model_resource_name=shard_predictions[0].model_resource_name,
+        )
+
+    @staticmethod
+    def _shard_instances(
+        instances: List,
+        parameters: Optional[Dict],
+        max_instances_per_request: Optional[int],
+        max_request_bytes: int,
+    ) -> List[List]:
+        """Splits the instances into shards fitting in one prediction request.
+
+        The size of a request is estimated as the size of its JSON body.
+
+        Args:
+            instances (List):
+                Required. The instances to split.
+            parameters (Dict):
+                Optional. The parameters sent with every request.
+            max_instances_per_request (int):
+                Optional. The maximum number of instances of a shard.
+            max_request_bytes (int):
+                Required. The maximum JSON size in bytes of the request of a shard.
+
+        Returns:
+            The shards of instances, in order.
+        """
+        envelope_bytes = len(
+            json.dumps({"instances": [], "parameters": parameters}).encode("utf-8")
+        )
+        shards = []
+        shard = []
+        shard_bytes = envelope_bytes
+        for instance in instances:
+            instance_bytes = len(json.dumps(instance).encode("utf-8"))
+            # Instances after the first one of a shard are preceded by ", ".
+            if shard and (
+                shard_bytes + instance_bytes + 2 > max_request_bytes
+                or len(shard) == max_instances_per_request
+            ):
+                shards.append(shard)
+                shard = []
+                shard_bytes = envelope_bytes
+            shard_bytes += instance_bytes + (2 if shard else 0)
+            shard.append(instance)
+        shards.append(shard)
+        return shards
+
+    @staticmethod
+    def _is_retryable_prediction_error(exception: Exception) -> bool:
+        """Returns whether a failed prediction request should be retried."""
+        return isinstance(
+            exception,
+            (api_exceptions.TooManyRequests, api_exceptions.ServiceUnavailable),
         )
 
     def explain(
@@ -1708,9 +2261,7 @@ class Endpoint(base.VertexAiResourceNounWithFutureManager, base.PreviewMixin):
         """
 
         return cls._list_with_local_order(
-            cls_filter=lambda ep: not bool(
-                ep.network
-            ),  # `network` is empty for public Endpoints
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
@@ -1788,6 +2339,12 @@ class PrivateEndpoint(Endpoint):
     Read more [about private endpoints in the documentation.](https://cloud.google.com/vertex-ai/docs/predictions/using-private-endpoints)
     """
 
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: proto.Message) -> bool:
+        """Returns whether a listed GAPIC endpoint is a PrivateEndpoint."""
+        # Only PrivateEndpoints have a network set
+        return bool(gapic_resource.network)
+
     def __init__(
         self,
         endpoint_name: str,
@@ -1828,7 +2385,7 @@ class PrivateEndpoint(Endpoint):
             ImportError: If there is an issue importing the `urllib3` package.
         """
         try:
-            import urllib3
+            import urllib3  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Cannot import the urllib3 HTTP client. Please install google-cloud-aiplatform[private_endpoints]."
@@ -1846,7 +2403,7 @@ class PrivateEndpoint(Endpoint):
                 "Please ensure the Endpoint being retrieved is a PrivateEndpoint."
             )
 
-        self._http_client = urllib3.PoolManager()
+        self._http_client = http_utils.create_pool_manager(self._http_transport_config)
 
     @property
     def predict_http_uri(self) -> Optional[str]:
@@ -2016,7 +2573,7 @@ class PrivateEndpoint(Endpoint):
             ImportError: If there is an issue importing the `urllib3` package.
         """
         try:
-            import urllib3
+            import urllib3  # noqa: F401
         except ImportError:
             raise ImportError(
                 "Cannot import the urllib3 HTTP client. Please install google-cloud-aiplatform[private_endpoints]."
@@ -2029,10 +2586,73 @@ class PrivateEndpoint(Endpoint):
             credentials=credentials,
         )
 
-        endpoint._http_client = urllib3.PoolManager()
+        endpoint._http_client = http_utils.create_pool_manager(
+            endpoint._http_transport_config
+        )
 
         return endpoint
 
+    def configure_http_transport(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+    ) -> None:
+        """Configures the HTTP connection pools used by predictions.
+
+        The settings apply to `predict`, `raw_predict`, `health_check` and
+        `predict_async`. Existing connections are closed.
+
+        Example usage:
+            my_private_endpoint.configure_http_transport(max_connections=500)
+
+        Args:
+            max_connections (int):
+                Optional. The maximum number of connections kept open to the
+                endpoint. Requests beyond it wait for a free connection. Defaults
+                to 100.
+            max_keepalive_connections (int):
+                Optional. The maximum number of idle connections the async client
+                keeps alive. Defaults to 20.
+            keepalive_expiry (float):
+                Optional. The time in seconds the async client keeps idle connections
+                alive. Defaults to 5.0.
+            http2 (bool):
+                Optional. Whether the async client uses HTTP/2 when the server and the
+                installed ``h2`` package support it. Defaults to True.
+        """
+        super().configure_http_transport(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+        )
+        self._http_client.clear()
+        self._http_client = http_utils.create_pool_manager(self._http_transport_config)
+
+    @staticmethod
+    def _get_http_error(status: int, response_text: str) -> RuntimeError:
+        """Returns the error raised for a failed PrivateEndpoint HTTP request.
+
+        Args:
+            status (int):
+                Required. The HTTP status code of the response.
+            response_text (str):
+                Required. The body of the response.
+
+        Returns:
+            A RuntimeError. For the retryable statuses, 429 and 503, it is also
+            the matching `google.api_core.exceptions` type so bulk_predict can
+            retry it.
+        """
+        message = f"{status} - Failed to make request, see response: {response_text}"
+        if status == 429:
+            return _PrivateEndpointTooManyRequests(message)
+        if status == 503:
+            return _PrivateEndpointServiceUnavailable(message)
+        return RuntimeError(message)
+
     def _http_request(
         self,
         method: str,
@@ -2078,9 +2698,8 @@ class PrivateEndpoint(Endpoint):
             if response.status < _SUCCESSFUL_HTTP_RESPONSE:
                 return response
             else:
-                raise RuntimeError(
-                    f"{response.status} - Failed to make request, see response: "
-                    + response.data.decode("utf-8")
+                raise self._get_http_error(
+                    response.status, response.data.decode("utf-8")
                 )
 
         except urllib3.exceptions.MaxRetryError as exc:
@@ -2152,6 +2771,147 @@ class PrivateEndpoint(Endpoint):
             deployed_model_id=self._gca_resource.deployed_models[0].id,
         )
 
+    async def predict_async(
+        self,
+        instances: List,
+        parameters: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Prediction:
+        """Make an asynchronous prediction against this PrivateEndpoint.
+
+        The request is sent with a pooled async HTTP client without blocking the
+        event loop, so that many predictions can be in flight from one thread. The
+        client is bound to the event loop it is first used on. Requires the `httpx`
+        package. This method must be called within the network the PrivateEndpoint
+        is peered to.
+
+        Example usage:
+            response = await my_private_endpoint.predict_async(instances=[...])
+            my_predictions = response.predictions
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. Instance types mut be JSON serializable.
+                See `PrivateEndpoint.predict` for details.
+            parameters (Dict):
+                The parameters that govern the prediction. See
+                `PrivateEndpoint.predict` for details.
+            timeout (float): Optional. The timeout for this request in seconds.
+
+        Returns:
+            prediction (aiplatform.Prediction):
+                Prediction object with returned predictions and Model ID.
+
+        Raises:
+            RuntimeError: If a model has not been deployed a request cannot be made,
+                or if the request failed.
+        """
+        await self._wait_async()
+        if self._skipped_getter_call():
+            # Fetching the resource blocks, so it runs off the event loop.
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._sync_gca_resource_if_skipped
+            )
+
+        if not self._gca_resource.deployed_models:
+            raise RuntimeError(
+                "Cannot make a predict request because a model has not been deployed on this Private"
+                "Endpoint. Please ensure a model has been deployed."
+            )
+
+        if not self._async_http_client:
+            self._async_http_client = http_utils.create_async_client(
+                self._http_transport_config
+            )
+
+        try:
+            response = await self._async_http_client.post(
+                self.predict_http_uri,
+                content=json.dumps({"instances": instances, "parameters": parameters}),
+                headers={"Content-Type": "application/json"},
+                timeout=timeout,
+            )
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to make a POST request to this URI, make sure: "
+                " this call is being made inside the network this PrivateEndpoint is peered to "
+                f"({self._gca_resource.network}), calling health_check() returns True, "
+                f"and that {self.predict_http_uri} is a valid URL."
+            ) from exc
+
+        if response.status_code >= _SUCCESSFUL_HTTP_RESPONSE:
+            raise self._get_http_error(response.status_code, response.text)
+
+        return Prediction(
+            predictions=response.json().get("predictions"),
+            deployed_model_id=self._gca_resource.deployed_models[0].id,
+        )
+
+    def bulk_predict(
+        self,
+        instances: List,
+        parameters: Optional[Dict] = None,
+        max_instances_per_request: Optional[int] = None,
+        max_request_bytes: int = _BULK_PREDICT_MAX_REQUEST_BYTES,
+        max_concurrency: int = _BULK_PREDICT_DEFAULT_MAX_CONCURRENCY,
+        retry: Optional[api_retry.Retry] = None,
+    ) -> Prediction:
+        """Make a prediction on a large list of instances against this PrivateEndpoint.
+
+        The instances are split into requests of at most max_instances_per_request
+        instances and max_request_bytes bytes of JSON. Up to max_concurrency requests
+        are sent at the same time. Requests rejected with HTTP 429 or 503 are retried
+        with exponential backoff. The predictions are returned in the order of the
+        instances. This method must be called within the network the PrivateEndpoint
+        is peered to.
+
+        Example usage:
+            prediction = my_private_endpoint.bulk_predict(
+                instances=rows, max_instances_per_request=100, max_concurrency=16
+            )
+
+        Args:
+            instances (List):
+                Required. The instances that are the input to the
+                prediction call. See `PrivateEndpoint.predict` for details.
+            parameters (Dict):
+                The parameters that govern the prediction. See
+                `PrivateEndpoint.predict` for details.
+            max_instances_per_request (int):
+                Optional. The maximum number of instances sent in one request. By
+                default requests are only limited by max_request_bytes.
+            max_request_bytes (int):
+                Optional. The maximum size in bytes of the JSON body of one request.
+                An instance larger than the limit is sent in a request of its own.
+                Defaults to 1.5 MB.
+            max_concurrency (int):
+                Optional. The maximum number of requests in flight at the same time.
+                The connection pool of the PrivateEndpoint should be at least as
+                large, see `PrivateEndpoint.configure_http_transport`.
+            retry (google.api_core.retry.Retry):
+                Optional. The retry policy of each request. By default requests
+                failing with HTTP 429 or 503 are retried with exponential backoff.
+
+        Returns:
+            prediction (aiplatform.Prediction):
+                Prediction object with the predictions of all instances.
+
+        Raises:
+            ValueError: If instances is empty or a limit is not positive.
+            RuntimeError: If a model has not been deployed a request cannot be made.
+        """
+        self.wait()
+        return self._bulk_predict(
+            predict_fn=self.predict,
+            instances=instances,
+            parameters=parameters,
+            max_instances_per_request=max_instances_per_request,
+            max_request_bytes=max_request_bytes,
+            max_concurrency=max_concurrency,
+            retry=retry,
+        )
+
     def raw_predict(
         self, body: bytes, headers: Dict[str, str]
     ) -> requests.models.Response:
@@ -2266,9 +3026,7 @@ class PrivateEndpoint(Endpoint):
         """
 
         return cls._list_with_local_order(
-            cls_filter=lambda ep: bool(
-                ep.network
-            ),  # Only PrivateEndpoints have a network set
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
@@ -107,6 +107,8 @@ class PipelineJob(
     # Required by the done() method
     _valid_done_states = _PIPELINE_COMPLETE_STATES
 
+    _list_order_by_locally = True
+
     def __init__(
         self,
         # TODO(b/223262536): Make the display_name parameter optional in the next major release
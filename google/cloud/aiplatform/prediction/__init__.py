@@ -28,11 +28,15 @@ from google.cloud.aiplatform.prediction.local_model import (
 )
 from google.cloud.aiplatform.prediction.predictor import Predictor
 from google.cloud.aiplatform.prediction.serializer import (
+    ArrowSerializer,
     DefaultSerializer,
+    MsgpackSerializer,
+    NumpySerializer,
     Serializer,
 )
 
 __all__ = (
+    "ArrowSerializer",
     "DEFAULT_HEALTH_ROUTE",
     "DEFAULT_HTTP_PORT",
     "DEFAULT_PREDICT_ROUTE",
@@ -40,6 +44,8 @@ __all__ = (
     "Handler",
     "LocalEndpoint",
     "LocalModel",
+    "MsgpackSerializer",
+    "NumpySerializer",
     "PredictionHandler",
     "Predictor",
     "Serializer",
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, List, Optional, Set
+
+_INSTANCES_KEY = "instances"
+_PARAMETERS_KEY = "parameters"
+_PREDICTIONS_KEY = "predictions"
+
+
+class _PendingRequest:
+    """A prediction input waiting in the batching queue."""
+
+    def __init__(self, instances: List[Any], parameters: Any, future: asyncio.Future):
+        self.instances = instances
+        self.parameters = parameters
+        self.parameters_key = json.dumps(parameters, sort_keys=True, default=str)
+        self.future = future
+
+
+class PredictionBatcher:
+    """Coalesces concurrent prediction inputs into a single prediction call.
+
+    Inputs of the form ``{"instances": [...], "parameters": {...}}`` are queued for
+    at most ``max_wait_ms`` milliseconds. The instances of all queued inputs sharing
+    the same parameters are concatenated, up to ``max_batch_size`` instances, and
+    passed to ``predict_fn`` in one call. Inputs already queued join the batch without
+    waiting, so a ``max_wait_ms`` of 0 still batches inputs that arrive together. The
+    ``"predictions"`` list of the result is then split back into one result per input,
+    in order.
+
+    Inputs that cannot be batched, e.g. inputs with keys other than ``"instances"``
+    and ``"parameters"``, are passed to ``predict_fn`` directly.
+    """
+
+    def __init__(
+        self,
+        predict_fn: Callable[[Any], Awaitable[Any]],
+        max_batch_size: int,
+        max_wait_ms: float,
+    ):
+        """Initializes a PredictionBatcher instance.
+
+        Args:
+            predict_fn (Callable[[Any], Awaitable[Any]]):
+                Required. The coroutine function performing the prediction on a
+                prediction input, e.g. preprocess, predict and postprocess.
+            max_batch_size (int):
+                Required. The maximum number of instances in one batch.
+            max_wait_ms (float):
+                Required. The maximum time in milliseconds an input waits for other
+                inputs before its batch is sent.
+
+        Raises:
+            ValueError: If max_batch_size is less than 1 or max_wait_ms is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError(
+                f"max_batch_size must be a positive integer, got {max_batch_size}."
+            )
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {max_wait_ms}.")
+
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_wait_secs = max_wait_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _is_batchable(prediction_input: Any) -> bool:
+        """Returns whether the prediction input can be merged with other inputs."""
+        return (
+            isinstance(prediction_input, dict)
+            and isinstance(prediction_input.get(_INSTANCES_KEY), list)
+            and set(prediction_input).issubset({_INSTANCES_KEY, _PARAMETERS_KEY})
+        )
+
+    def _ensure_worker(self) -> None:
+        """Starts the batching worker on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, prediction_input: Any) -> Any:
+        """Submits a prediction input and waits for its prediction results.
+
+        Args:
+            prediction_input (Any):
+                Required. The deserialized prediction input.
+
+        Returns:
+            The prediction results for the given input.
+        """
+        if not self._is_batchable(prediction_input):
+            return await self._predict_fn(prediction_input)
+
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put(
+            _PendingRequest(
+                instances=prediction_input[_INSTANCES_KEY],
+                parameters=prediction_input.get(_PARAMETERS_KEY),
+                future=future,
+            )
+        )
+        return await future
+
+    async def close(self) -> None:
+        """Stops the batching worker. Inputs still queued are cancelled."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+        self._worker = None
+
+    async def _run(self) -> None:
+        """Collects queued inputs into batches and runs them until cancelled."""
+        carried_over = None
+        while True:
+            first = carried_over or await self._queue.get()
+            carried_over = None
+            batch = [first]
+            batch_size = len(first.instances)
+            deadline = self._loop.time() + self._max_wait_secs
+
+            while batch_size < self._max_batch_size:
+                # Inputs already queued join the batch even once the deadline
+                # has passed, so that a zero wait still batches them.
+                if not self._queue.empty():
+                    pending = self._queue.get_nowait()
+                else:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        pending = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                if (
+                    pending.parameters_key != first.parameters_key
+                    or batch_size + len(pending.instances) > self._max_batch_size
+                ):
+                    carried_over = pending
+                    break
+                batch.append(pending)
+                batch_size += len(pending.instances)
+
+            # Batches run concurrently so that an executor-backed predict_fn can
+            # process several batches at the same time.
+            batch_task = self._loop.create_task(self._run_batch(batch))
+            self._batch_tasks.add(batch_task)
+            batch_task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[_PendingRequest]) -> None:
+        """Runs one prediction for the batch and resolves the pending futures."""
+        batch_input = {
+            _INSTANCES_KEY: [
+                instance for pending in batch for instance in pending.instances
+            ]
+        }
+        if batch[0].parameters is not None:
+            batch_input[_PARAMETERS_KEY] = batch[0].parameters
+
+        try:
+            results = await self._predict_fn(batch_input)
+            split_results = self._split_results(
+                results, [len(pending.instances) for pending in batch]
+            )
+        except Exception as exception:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exception)
+            return
+
+        for pending, result in zip(batch, split_results):
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+    @staticmethod
+    def _split_results(results: Any, sizes: List[int]) -> List[Any]:
+        """Splits the prediction results of a batch into per-input results.
+
+        Args:
+            results (Any):
+                Required. The prediction results of the batch. Must be a dict with a
+                "predictions" list with one entry per batched instance.
+            sizes (List[int]):
+                Required. The number of instances of each batched input.
+
+        Returns:
+            A list of prediction results, one per batched input.
+
+        Raises:
+            ValueError: If the results cannot be split by instance.
+        """
+        predictions = (
+            results.get(_PREDICTIONS_KEY) if isinstance(results, dict) else None
+        )
+        if predictions is None or len(predictions) != sum(sizes):
+            raise ValueError(
+                "Batched prediction results must be a dict with a "
+                f'"{_PREDICTIONS_KEY}" list containing one prediction per instance.'
+            )
+
+        split_results = []
+        offset = 0
+        for size in sizes:
+            result = dict(results)
+            result[_PREDICTIONS_KEY] = predictions[offset : offset + size]
+            split_results.append(result)
+            offset += size
+        return split_results
@@ -16,8 +16,10 @@
 #
 
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent import futures
 import logging
-from typing import Optional, Type
+from typing import Any, Optional, Type
 import traceback
 
 try:
@@ -31,10 +33,38 @@ except ImportError:
     )
 
 from google.cloud.aiplatform.prediction import handler_utils
+from google.cloud.aiplatform.prediction.batcher import PredictionBatcher
 from google.cloud.aiplatform.prediction.predictor import Predictor
+from google.cloud.aiplatform.prediction import serializer
 from google.cloud.aiplatform.prediction.serializer import DefaultSerializer
 
 
+_THREAD_EXECUTOR = "thread"
+_PROCESS_EXECUTOR = "process"
+
+# The predictor loaded in a worker process of the process executor.
+_process_predictor: Optional[Predictor] = None
+
+
+def _run_predictor(predictor: Predictor, prediction_input: Any) -> Any:
+    """Runs preprocess, predict and postprocess of the predictor on the input."""
+    return predictor.postprocess(
+        predictor.predict(predictor.preprocess(prediction_input))
+    )
+
+
+def _init_process_predictor(predictor: Type[Predictor], artifacts_uri: str) -> None:
+    """Loads the predictor once in a worker process of the process executor."""
+    global _process_predictor
+    _process_predictor = predictor()
+    _process_predictor.load(artifacts_uri)
+
+
+def _run_process_predictor(prediction_input: Any) -> Any:
+    """Runs the predictor loaded in the current worker process on the input."""
+    return _run_predictor(_process_predictor, prediction_input)
+
+
 class Handler(ABC):
     """Interface for Handler class to handle prediction requests."""
 
@@ -68,6 +98,10 @@ class Handler(ABC):
         """
         pass
 
+    async def close(self) -> None:
+        """Releases the resources of the handler when the model server shuts down."""
+        pass
+
 
 class PredictionHandler(Handler):
     """Default prediction handler for the prediction requests sent to the application."""
@@ -76,6 +110,11 @@ class PredictionHandler(Handler):
         self,
         artifacts_uri: str,
         predictor: Optional[Type[Predictor]] = None,
+        max_batch_size: Optional[int] = None,
+        max_batch_wait_ms: float = 0,
+        executor: Optional[str] = None,
+        executor_workers: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
     ):
         """Initializes a Handler instance.
 
@@ -85,21 +124,137 @@ class PredictionHandler(Handler):
             predictor (Type[Predictor]):
                 Optional. The Predictor class this handler uses to initiate predictor
                 instance if given.
+            max_batch_size (int):
+                Optional. If set to a value greater than 1, concurrent requests of the
+                form {"instances": [...], "parameters": {...}} are merged into one
+                prediction call of at most this many instances. The predictor's
+                postprocess must then return a dict with a "predictions" list holding
+                one prediction per instance.
+            max_batch_wait_ms (float):
+                Optional. The maximum time in milliseconds a request waits for other
+                requests to be batched with. With 0, only the requests already
+                queued are batched. Only used if max_batch_size is set.
+            executor (str):
+                Optional. Where the predictor is invoked. By default the predictor runs
+                on the event loop of the model server. If set to "thread", it runs in a
+                thread pool. If set to "process", the predictor is loaded in and runs
+                in a pool of worker processes, which suits predictors holding the GIL.
+                Either way the event loop stays free to serve health checks.
+            executor_workers (int):
+                Optional. The number of threads or processes of the executor. Defaults
+                to the default of the corresponding concurrent.futures executor.
+            max_queue_size (int):
+                Optional. The maximum number of requests being processed at the same
+                time. Requests exceeding it are rejected with status code 503.
 
         Raises:
-            ValueError: If predictor is None.
+            ValueError: If predictor is None or executor is not supported.
         """
         if predictor is None:
             raise ValueError(
                 "PredictionHandler must have a predictor class passed to the init function."
             )
 
-        self._predictor = predictor()
-        self._predictor.load(artifacts_uri)
+        if executor == _PROCESS_EXECUTOR:
+            # The predictor is only loaded in the worker processes.
+            self._predictor = None
+            self._executor = futures.ProcessPoolExecutor(
+                max_workers=executor_workers,
+                initializer=_init_process_predictor,
+                initargs=(predictor, artifacts_uri),
+            )
+        elif executor == _THREAD_EXECUTOR or executor is None:
+            self._predictor = predictor()
+            self._predictor.load(artifacts_uri)
+            self._executor = (
+                futures.ThreadPoolExecutor(max_workers=executor_workers)
+                if executor
+                else None
+            )
+        else:
+            raise ValueError(
+                f'Unsupported executor: {executor}. Supported executors are "'
+                f'{_THREAD_EXECUTOR}" and "{_PROCESS_EXECUTOR}".'
+            )
+
+        self._max_queue_size = max_queue_size
+        self._num_requests_in_flight = 0
+
+        self._batcher = None
+        if max_batch_size is not None and max_batch_size > 1:
+            self._batcher = PredictionBatcher(
+                self._predict,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_batch_wait_ms,
+            )
+
+    async def close(self) -> None:
+        """Stops the batching worker and shuts down the predictor executor.
+
+        Running predictor calls are not waited for.
+        """
+        if self._batcher is not None:
+            await self._batcher.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    async def _predict(self, prediction_input: Any) -> Any:
+        """Runs preprocess, predict and postprocess on the prediction input.
+
+        Args:
+            prediction_input (Any):
+                Required. The deserialized prediction input.
+
+        Returns:
+            The postprocessed prediction results.
+        """
+        if self._executor is None:
+            return _run_predictor(self._predictor, prediction_input)
+
+        loop = asyncio.get_running_loop()
+        if self._predictor is None:
+            return await loop.run_in_executor(
+                self._executor, _run_process_predictor, prediction_input
+            )
+        return await loop.run_in_executor(
+            self._executor, _run_predictor, self._predictor, prediction_input
+        )
 
     async def handle(self, request: Request) -> Response:
         """Handles a prediction request.
 
+        Args:
+            request (Request):
+                Required. The prediction request sent to the application.
+
+        Returns:
+            The response of the prediction request.
+
+        Raises:
+            HTTPException: If any exception is thrown from predictor object, or with
+                status code 503 if max_queue_size requests are already in flight.
+        """
+        if (
+            self._max_queue_size is not None
+            and self._num_requests_in_flight >= self._max_queue_size
+        ):
+            raise HTTPException(
+                status_code=503,
+                detail=(
+                    "The model server is overloaded: "
+                    f"{self._num_requests_in_flight} requests are in flight."
+                ),
+            )
+
+        self._num_requests_in_flight += 1
+        try:
+            return await self._handle(request)
+        finally:
+            self._num_requests_in_flight -= 1
+
+    async def _handle(self, request: Request) -> Response:
+        """Deserializes the request, runs the prediction and serializes the response.
+
         Args:
             request (Request):
                 Required. The prediction request sent to the application.
@@ -112,12 +267,15 @@ class PredictionHandler(Handler):
         """
         request_body = await request.body()
         content_type = handler_utils.get_content_type_from_headers(request.headers)
-        prediction_input = DefaultSerializer.deserialize(request_body, content_type)
+        prediction_input = serializer.get_serializer_for_content_type(
+            content_type
+        ).deserialize(request_body, content_type)
 
         try:
-            prediction_results = self._predictor.postprocess(
-                self._predictor.predict(self._predictor.preprocess(prediction_input))
-            )
+            if self._batcher is not None:
+                prediction_results = await self._batcher.submit(prediction_input)
+            else:
+                prediction_results = await self._predict(prediction_input)
         except HTTPException:
             raise
         except Exception as exception:
@@ -134,5 +292,8 @@ class PredictionHandler(Handler):
             raise HTTPException(status_code=500, detail=error_message)
 
         accept = handler_utils.get_accept_from_headers(request.headers)
-        data = DefaultSerializer.serialize(prediction_results, accept)
+        response_serializer = serializer.get_serializer_for_accept(accept)
+        data = response_serializer.serialize(prediction_results, accept)
+        if response_serializer is not DefaultSerializer:
+            return Response(content=data, media_type=response_serializer.MEDIA_TYPE)
         return Response(content=data, media_type=accept)
@@ -224,6 +224,47 @@ class LocalModel:
         If you hit the error showing "model server container out of memory" when you deploy models
         to endpoints, you should decrease the number of workers.
 
+        With the default ``PredictionHandler``, concurrent requests can be merged into one
+        prediction call, which increases throughput of models benefiting from vectorized inputs.
+        You can enable batching with the following environment variables:
+
+        .. code-block:: python
+
+            VERTEX_CPR_MAX_BATCH_SIZE:
+                The maximum number of instances merged into one prediction call. Batching is
+                enabled if it is greater than 1.
+            VERTEX_CPR_MAX_BATCH_WAIT_MS:
+                The maximum time in milliseconds a request waits for other requests to be
+                batched with. The default is 0.
+
+        By default the predictor runs on the event loop of the model server, so a slow prediction
+        delays health checks and other requests of the same worker. You can move predictions to an
+        executor with the following environment variables:
+
+        .. code-block:: python
+
+            VERTEX_CPR_PREDICT_EXECUTOR:
+                Either "thread" to run the predictor in a thread pool, or "process" to load and run
+                the predictor in a pool of worker processes.
+            VERTEX_CPR_PREDICT_EXECUTOR_WORKERS:
+                The number of threads or processes of the executor.
+            VERTEX_CPR_MAX_QUEUE_SIZE:
+                The maximum number of requests in flight per model server worker. Requests
+                exceeding it are rejected with status code 503.
+
+        Predictors loading model artifacts with ``prediction_utils.download_model_artifacts``,
+        including the built-in ``SklearnPredictor`` and ``XgboostPredictor``, download the files
+        concurrently. The downloads can be tuned with the following environment variables:
+
+        .. code-block:: python
+
+            VERTEX_CPR_DOWNLOAD_WORKERS:
+                The number of concurrent downloads. The default is 8.
+            VERTEX_CPR_MODEL_CACHE_DIR:
+                A local directory, e.g. a volume shared by the replicas on a node, caching the
+                downloaded files by content hash. Files already in the cache are not downloaded
+                again.
+
         Args:
             src_dir (str):
                 Required. The path to the local directory including all needed files such as
@@ -20,6 +20,7 @@ import logging
 import multiprocessing
 import os
 import traceback
+from typing import Any, Dict
 
 try:
     from fastapi import FastAPI
@@ -78,7 +79,9 @@ class CprModelServer:
             )
 
         self.handler = handler_class(
-            os.environ.get("AIP_STORAGE_URI"), predictor=predictor_class
+            os.environ.get("AIP_STORAGE_URI"),
+            predictor=predictor_class,
+            **get_handler_kwargs_from_env(),
         )
 
         if "AIP_HTTP_PORT" not in os.environ:
@@ -108,6 +111,7 @@ class CprModelServer:
             endpoint=self.predict,
             methods=["POST"],
         )
+        self.app.add_event_handler("shutdown", self._close_handler)
 
     async def __call__(self, scope, receive, send):
         await self.app(scope, receive, send)
@@ -120,6 +124,13 @@ class CprModelServer:
             level=logging.INFO,
         )
 
+    async def _close_handler(self):
+        """Releases the resources of the handler, e.g. its predictor executor."""
+        # Handlers not derived from Handler may not define close.
+        close = getattr(self.handler, "close", None)
+        if close is not None:
+            await close()
+
     def health(self):
         """Executes a health check."""
         return {}
@@ -162,6 +173,53 @@ class CprModelServer:
             raise HTTPException(status_code=500, detail=error_message)
 
 
+def get_handler_kwargs_from_env() -> Dict[str, Any]:
+    """Gets the optional handler arguments configured in the environment variables.
+
+    Only the arguments whose environment variables are set are returned, so that
+    handlers not supporting them are still initialized with the default arguments.
+    The following environment variables enable request batching in the default
+    ``PredictionHandler``:
+        VERTEX_CPR_MAX_BATCH_SIZE:
+            The maximum number of instances merged into one prediction call. Batching
+            is enabled if it is greater than 1.
+        VERTEX_CPR_MAX_BATCH_WAIT_MS:
+            The maximum time in milliseconds a request waits for other requests to be
+            batched with. The default is 0, which only batches the requests already
+            queued.
+    The following environment variables move the predictor calls of the default
+    ``PredictionHandler`` off the event loop:
+        VERTEX_CPR_PREDICT_EXECUTOR:
+            Either "thread" to run the predictor in a thread pool, or "process" to run
+            it in a pool of worker processes.
+        VERTEX_CPR_PREDICT_EXECUTOR_WORKERS:
+            The number of threads or processes of the executor.
+        VERTEX_CPR_MAX_QUEUE_SIZE:
+            The maximum number of requests in flight per model server worker. Requests
+            exceeding it are rejected with status code 503.
+
+    Returns:
+        The keyword arguments to initialize the handler with.
+    """
+    handler_kwargs = {}
+    max_batch_size_str = os.getenv("VERTEX_CPR_MAX_BATCH_SIZE")
+    if max_batch_size_str:
+        handler_kwargs["max_batch_size"] = int(max_batch_size_str)
+        handler_kwargs["max_batch_wait_ms"] = float(
+            os.getenv("VERTEX_CPR_MAX_BATCH_WAIT_MS", "0")
+        )
+    executor = os.getenv("VERTEX_CPR_PREDICT_EXECUTOR")
+    if executor:
+        handler_kwargs["executor"] = executor
+        executor_workers_str = os.getenv("VERTEX_CPR_PREDICT_EXECUTOR_WORKERS")
+        if executor_workers_str:
+            handler_kwargs["executor_workers"] = int(executor_workers_str)
+    max_queue_size_str = os.getenv("VERTEX_CPR_MAX_QUEUE_SIZE")
+    if max_queue_size_str:
+        handler_kwargs["max_queue_size"] = int(max_queue_size_str)
+    return handler_kwargs
+
+
 def set_number_of_workers_from_env() -> None:
     """Sets the number of model server workers used by Uvicorn in the environment variable.
 
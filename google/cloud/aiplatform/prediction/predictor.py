@@ -34,8 +34,16 @@ class Predictor(ABC):
 
         predictor.postprocess(predictor.predict(predictor.preprocess(prediction_input)))
 
+    Attributes:
+        keep_prediction_arrays (bool):
+            Whether the default predictors keep the predictions as a numpy array
+            in ``postprocess`` instead of converting them to a list. Set it to True
+            in a subclass served with a binary serializer, such as
+            ``NumpySerializer``, to skip the conversion.
     """
 
+    keep_prediction_arrays = False
+
     def __init__(self):
         return
 
@@ -16,8 +16,9 @@
 #
 
 from abc import ABC, abstractmethod
+import io
 import json
-from typing import Any, Optional
+from typing import Any, Optional, Type
 
 try:
     from fastapi import HTTPException
@@ -32,6 +33,40 @@ from google.cloud.aiplatform.prediction import handler_utils
 
 
 APPLICATION_JSON = "application/json"
+APPLICATION_MSGPACK = "application/x-msgpack"
+APPLICATION_ARROW_STREAM = "application/vnd.apache.arrow.stream"
+APPLICATION_NPY = "application/x-npy"
+
+_INSTANCES_KEY = "instances"
+_PREDICTIONS_KEY = "predictions"
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """Converts NumPy arrays and scalars to Python objects for json.dumps.
+
+    Raises:
+        TypeError: If the value is not JSON serializable.
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _is_accepted(media_type: str, accept: Optional[str]) -> bool:
+    """Returns whether the media type is acceptable given the accept header."""
+    accept_dict = handler_utils.parse_accept_header(accept)
+    return (
+        media_type in accept_dict or prediction_constants.ANY_ACCEPT_TYPE in accept_dict
+    )
+
+
+def _get_predictions_array(prediction: Any) -> Any:
+    """Gets the predictions of the prediction results as a NumPy array."""
+    import numpy as np
+
+    if isinstance(prediction, dict):
+        prediction = prediction.get(_PREDICTIONS_KEY)
+    return np.asarray(prediction)
 
 
 class Serializer(ABC):
@@ -123,7 +158,7 @@ class DefaultSerializer(Serializer):
             or prediction_constants.ANY_ACCEPT_TYPE in accept_dict
         ):
             try:
-                return json.dumps(prediction)
+                return json.dumps(prediction, default=_to_json_compatible)
             except TypeError:
                 raise HTTPException(
                     status_code=400,
@@ -142,3 +177,329 @@ class DefaultSerializer(Serializer):
                     f'Currently supported accept in DefaultSerializer: "{APPLICATION_JSON}".'
                 ),
             )
+
+
+class NumpySerializer(Serializer):
+    """Serializer for the NumPy ``.npy`` format.
+
+    The request body is a single ``.npy`` array holding the instances. The response
+    body is a single ``.npy`` array holding the predictions.
+    """
+
+    MEDIA_TYPE = APPLICATION_NPY
+
+    @staticmethod
+    def deserialize(data: Any, content_type: Optional[str]) -> Any:
+        """Deserializes the request data into {"instances": np.ndarray}.
+
+        Args:
+            data (Any):
+                Required. The request data sent to the application.
+            content_type (str):
+                Optional. The specified content type of the request.
+
+        Raises:
+            HTTPException: If the request data is not a valid ``.npy`` array.
+        """
+        import numpy as np
+
+        try:
+            return {_INSTANCES_KEY: np.load(io.BytesIO(data), allow_pickle=False)}
+        except ValueError as exception:
+            raise HTTPException(
+                status_code=400,
+                detail=f"NumPy deserialization failed for the request data: {exception}.",
+            )
+
+    @staticmethod
+    def serialize(prediction: Any, accept: Optional[str]) -> Any:
+        """Serializes the predictions into a ``.npy`` array.
+
+        Args:
+            prediction (Any):
+                Required. The generated prediction, either a dict with a "predictions"
+                entry or the predictions themselves.
+            accept (str):
+                Optional. The specified content type of the response.
+
+        Raises:
+            HTTPException: If the predictions cannot be stored as a ``.npy`` array
+                or the specified accept is not supported.
+        """
+        import numpy as np
+
+        if not _is_accepted(APPLICATION_NPY, accept):
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Unsupported accept of the response: {accept}.\n"
+                    f'Currently supported accept in NumpySerializer: "{APPLICATION_NPY}".'
+                ),
+            )
+        buffer = io.BytesIO()
+        try:
+            np.save(buffer, _get_predictions_array(prediction), allow_pickle=False)
+        except ValueError as exception:
+            raise HTTPException(
+                status_code=400,
+                detail=f"NumPy serialization failed for the prediction result: {exception}.",
+            )
+        return buffer.getvalue()
+
+
+class ArrowSerializer(Serializer):
+    """Serializer for the Apache Arrow IPC stream format.
+
+    The columns of the request table are stacked into a 2-D instances array. The
+    predictions are returned as a table with a "predictions" column, or with one
+    "predictions_<i>" column per output if the predictions are 2-D.
+    """
+
+    MEDIA_TYPE = APPLICATION_ARROW_STREAM
+
+    @staticmethod
+    def deserialize(data: Any, content_type: Optional[str]) -> Any:
+        """Deserializes the request data into {"instances": np.ndarray}.
+
+        Args:
+            data (Any):
+                Required. The request data sent to the application.
+            content_type (str):
+                Optional. The specified content type of the request.
+
+        Raises:
+            HTTPException: If the request data is not a valid Arrow stream.
+        """
+        import numpy as np
+
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError(
+                "Pyarrow is not installed and is required to deserialize "
+                f'"{APPLICATION_ARROW_STREAM}" requests.'
+            )
+
+        try:
+            table = pyarrow.ipc.open_stream(data).read_all()
+        except pyarrow.ArrowInvalid as exception:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Arrow deserialization failed for the request data: {exception}.",
+            )
+        return {
+            _INSTANCES_KEY: np.column_stack(
+                [column.to_numpy() for column in table.columns]
+            )
+        }
+
+    @staticmethod
+    def serialize(prediction: Any, accept: Optional[str]) -> Any:
+        """Serializes the predictions into an Arrow stream.
+
+        Args:
+            prediction (Any):
+                Required. The generated prediction, either a dict with a "predictions"
+                entry or the predictions themselves.
+            accept (str):
+                Optional. The specified content type of the response.
+
+        Raises:
+            HTTPException: If the predictions are not 1-D or 2-D or the specified
+                accept is not supported.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError(
+                "Pyarrow is not installed and is required to serialize "
+                f'"{APPLICATION_ARROW_STREAM}" responses.'
+            )
+
+        if not _is_accepted(APPLICATION_ARROW_STREAM, accept):
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Unsupported accept of the response: {accept}.\n"
+                    "Currently supported accept in ArrowSerializer: "
+                    f'"{APPLICATION_ARROW_STREAM}".'
+                ),
+            )
+        predictions = _get_predictions_array(prediction)
+        if predictions.ndim == 1:
+            table = pyarrow.table({_PREDICTIONS_KEY: predictions})
+        elif predictions.ndim == 2:
+            table = pyarrow.table(
+                {
+                    f"{_PREDICTIONS_KEY}_{i}": predictions[:, i]
+                    for i in range(predictions.shape[1])
+                }
+            )
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    "Arrow serialization requires 1-D or 2-D predictions, got "
+                    f"{predictions.ndim} dimensions."
+                ),
+            )
+
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+
+def _encode_msgpack_ndarray(value: Any) -> Any:
+    """Encodes NumPy arrays and scalars as msgpack maps or Python scalars."""
+    import numpy as np
+
+    if isinstance(value, np.ndarray):
+        value = np.ascontiguousarray(value)
+        return {
+            "nd": True,
+            "type": value.dtype.str,
+            "shape": list(value.shape),
+            "data": value.tobytes(),
+        }
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not msgpack serializable"
+    )
+
+
+def _decode_msgpack_ndarray(value: dict) -> Any:
+    """Decodes msgpack maps written by _encode_msgpack_ndarray into NumPy arrays."""
+    if value.get("nd") is True and "data" in value:
+        import numpy as np
+
+        return np.frombuffer(value["data"], dtype=np.dtype(value["type"])).reshape(
+            value["shape"]
+        )
+    return value
+
+
+class MsgpackSerializer(Serializer):
+    """Serializer for the msgpack format.
+
+    The request body is a msgpack map such as {"instances": ...}. NumPy arrays are
+    encoded as maps of the form {"nd": True, "type": <dtype str>, "shape": [...],
+    "data": <raw bytes>}, which are decoded without creating a Python object per
+    element.
+    """
+
+    MEDIA_TYPE = APPLICATION_MSGPACK
+
+    @staticmethod
+    def deserialize(data: Any, content_type: Optional[str]) -> Any:
+        """Deserializes the msgpack request data.
+
+        Args:
+            data (Any):
+                Required. The request data sent to the application.
+            content_type (str):
+                Optional. The specified content type of the request.
+
+        Raises:
+            HTTPException: If the request data is not valid msgpack.
+        """
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                "Msgpack is not installed and is required to deserialize "
+                f'"{APPLICATION_MSGPACK}" requests.'
+            )
+
+        try:
+            return msgpack.unpackb(data, raw=False, object_hook=_decode_msgpack_ndarray)
+        except (ValueError, msgpack.UnpackException) as exception:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Msgpack deserialization failed for the request data: {exception}.",
+            )
+
+    @staticmethod
+    def serialize(prediction: Any, accept: Optional[str]) -> Any:
+        """Serializes the prediction results into msgpack.
+
+        Args:
+            prediction (Any):
+                Required. The generated prediction to be sent back to clients.
+            accept (str):
+                Optional. The specified content type of the response.
+
+        Raises:
+            HTTPException: If msgpack serialization failed or the specified accept is
+                not supported.
+        """
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError(
+                "Msgpack is not installed and is required to serialize "
+                f'"{APPLICATION_MSGPACK}" responses.'
+            )
+
+        if not _is_accepted(APPLICATION_MSGPACK, accept):
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Unsupported accept of the response: {accept}.\n"
+                    "Currently supported accept in MsgpackSerializer: "
+                    f'"{APPLICATION_MSGPACK}".'
+                ),
+            )
+        try:
+            return msgpack.packb(prediction, default=_encode_msgpack_ndarray)
+        except TypeError as exception:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Msgpack serialization failed for the prediction result: {exception}.",
+            )
+
+
+_BINARY_SERIALIZERS = {
+    serializer.MEDIA_TYPE: serializer
+    for serializer in (NumpySerializer, ArrowSerializer, MsgpackSerializer)
+}
+
+
+def get_serializer_for_content_type(content_type: Optional[str]) -> Type[Serializer]:
+    """Gets the serializer deserializing requests of the given content type.
+
+    Args:
+        content_type (str):
+            Optional. The content type of the request.
+
+    Returns:
+        The serializer for the content type. Defaults to DefaultSerializer.
+    """
+    return _BINARY_SERIALIZERS.get(content_type, DefaultSerializer)
+
+
+def get_serializer_for_accept(accept: Optional[str]) -> Type[Serializer]:
+    """Gets the serializer of the most preferred supported media type in accept.
+
+    Args:
+        accept (str):
+            Optional. The accept header of the request.
+
+    Returns:
+        The serializer for the most preferred media type. Defaults to
+        DefaultSerializer, which is also used if JSON is preferred equally.
+    """
+    best_serializer = DefaultSerializer
+    best_quality = None
+    for media_type, quality in handler_utils.parse_accept_header(accept).items():
+        if media_type in (APPLICATION_JSON, prediction_constants.ANY_ACCEPT_TYPE):
+            serializer = DefaultSerializer
+        elif media_type in _BINARY_SERIALIZERS:
+            serializer = _BINARY_SERIALIZERS[media_type]
+        else:
+            continue
+        if best_quality is None or quality > best_quality:
+            best_serializer = serializer
+            best_quality = quality
+    return best_serializer
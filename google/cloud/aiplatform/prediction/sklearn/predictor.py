@@ -58,6 +58,9 @@ class SklearnPredictor(Predictor):
 
     def preprocess(self, prediction_input: dict) -> np.ndarray:
         """Converts the request body to a numpy array before prediction.
+
+        Instances already deserialized into a numpy array, e.g. by NumpySerializer,
+        are used without copying.
         Args:
             prediction_input (dict):
                 Required. The prediction input that needs to be preprocessed.
@@ -81,10 +84,14 @@ class SklearnPredictor(Predictor):
 
     def postprocess(self, prediction_results: np.ndarray) -> dict:
         """Converts numpy array to a dict.
+
+        The array is converted to a list unless keep_prediction_arrays is set.
         Args:
             prediction_results (np.ndarray):
                 Required. The prediction results.
         Returns:
             The postprocessed prediction results.
         """
+        if self.keep_prediction_arrays:
+            return {"predictions": prediction_results}
         return {"predictions": prediction_results.tolist()}
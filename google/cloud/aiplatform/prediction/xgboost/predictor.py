@@ -96,10 +96,14 @@ class XgboostPredictor(Predictor):
 
     def postprocess(self, prediction_results: np.ndarray) -> dict:
         """Converts numpy array to a dict.
+
+        The array is converted to a list unless keep_prediction_arrays is set.
         Args:
             prediction_results (np.ndarray):
                 Required. The prediction results.
         Returns:
             The postprocessed prediction results.
         """
+        if self.keep_prediction_arrays:
+            return {"predictions": prediction_results}
         return {"predictions": prediction_results.tolist()}
@@ -58,6 +58,8 @@ _SCHEDULE_ERROR_STATES = schedule_constants._SCHEDULE_ERROR_STATES
 class PipelineJobSchedule(
     _Schedule,
 ):
+    _list_order_by_locally = True
+
     def __init__(
         self,
         pipeline_job: PipelineJob,
@@ -45,6 +45,9 @@ from google.cloud.aiplatform.compat.types import (
 
 _LOGGER = base.Logger(__name__)
 
+# The maximum number of time series in one BatchCreateTensorboardTimeSeries request.
+_CREATE_TIME_SERIES_BATCH_SIZE = 1000
+
 
 class _TensorboardServiceResource(base.VertexAiResourceNounWithFutureManager):
     client_class = utils.TensorboardClientWithOverride
@@ -987,6 +990,83 @@ class TensorboardRun(_TensorboardServiceResource):
 
         return tb_time_series
 
+    def batch_create_tensorboard_time_series(
+        self,
+        display_names: Sequence[str],
+        value_type: Union[
+            gca_tensorboard_time_series.TensorboardTimeSeries.ValueType, str
+        ] = "SCALAR",
+        plugin_name: str = "scalars",
+    ) -> List[gca_tensorboard_time_series.TensorboardTimeSeries]:
+        """Creates several tensorboard time series in this run at once.
+
+        The time series are created with one BatchCreateTensorboardTimeSeries
+        request per `_CREATE_TIME_SERIES_BATCH_SIZE` display names instead of
+        one request per time series.
+
+        Example Usage:
+
+            tb_time_series = tensorboard_run.batch_create_tensorboard_time_series(
+                display_names=['loss', 'accuracy'],
+            )
+
+        Args:
+            display_names (Sequence[str]):
+                Required. User provided names of the TensorboardTimeSeries to create.
+                Each value should be unique among all TensorboardTimeSeries resources
+                belonging to this TensorboardRun.
+            value_type (Union[gca_tensorboard_time_series.TensorboardTimeSeries.ValueType, str]):
+                Optional. Type of TensorboardTimeSeries value. One of 'SCALAR', 'TENSOR', 'BLOB_SEQUENCE'.
+            plugin_name (str):
+                Optional. Name of the plugin the time series pertain to. Such as Scalar, Tensor, Blob.
+        Returns:
+            List[gca_tensorboard_time_series.TensorboardTimeSeries]: The created
+                TensorboardTimeSeries.
+        """
+        if isinstance(value_type, str):
+            value_type = getattr(
+                gca_tensorboard_time_series.TensorboardTimeSeries.ValueType, value_type
+            )
+
+        resource_name_parts = self._parse_resource_name(self.resource_name)
+        resource_name_parts.pop("run")
+        tensorboard_experiment_name = TensorboardExperiment._format_resource_name(
+            **resource_name_parts
+        )
+
+        display_names = list(display_names)
+        created_time_series = []
+        for i in range(0, len(display_names), _CREATE_TIME_SERIES_BATCH_SIZE):
+            requests = [
+                gca_tensorboard_service.CreateTensorboardTimeSeriesRequest(
+                    parent=self.resource_name,
+                    tensorboard_time_series=gca_tensorboard_time_series.TensorboardTimeSeries(
+                        display_name=display_name,
+                        value_type=value_type,
+                        plugin_name=plugin_name,
+                    ),
+                )
+                for display_name in display_names[
+                    i : i + _CREATE_TIME_SERIES_BATCH_SIZE
+                ]
+            ]
+
+            _LOGGER.info(
+                f"Creating {len(requests)} TensorboardTimeSeries in {self.resource_name}"
+            )
+
+            time_series = self.api_client.batch_create_tensorboard_time_series(
+                parent=tensorboard_experiment_name,
+                requests=requests,
+            ).tensorboard_time_series
+
+            self._time_series_display_name_to_id_mapping.update(
+                {ts.display_name: ts.name.split("/")[-1] for ts in time_series}
+            )
+            created_time_series.extend(time_series)
+
+        return created_time_series
+
     def read_time_series_data(self) -> Dict[str, gca_tensorboard_data.TimeSeriesData]:
         """Read the time series data of this run.
 
@@ -17,13 +17,28 @@
 """Uploads a TensorBoard logdir to TensorBoard.gcp."""
 
 import abc
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent import futures
 import functools
 import logging
 import os
+import queue
 import re
+import tempfile
+import threading
 import time
-from typing import ContextManager, Dict, FrozenSet, Generator, Iterable, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
 import uuid
 
 from google.api_core import exceptions
@@ -46,6 +61,7 @@ import tensorflow as tf
 from google.protobuf import timestamp_pb2 as timestamp
 from google.protobuf import message
 from tensorboard.backend import process_graph
+from tensorboard.backend.event_processing import directory_watcher
 from tensorboard.backend.event_processing.plugin_event_accumulator import (
     directory_loader,
 )
@@ -55,6 +71,7 @@ from tensorboard.backend.event_processing.plugin_event_accumulator import (
 from tensorboard.backend.event_processing.plugin_event_accumulator import (
     io_wrapper,
 )
+from tensorboard.compat.proto import event_pb2
 from tensorboard.compat.proto import graph_pb2
 from tensorboard.compat.proto import summary_pb2
 from tensorboard.compat.proto import types_pb2
@@ -75,6 +92,10 @@ TensorboardServiceClient = tensorboard_service_client.TensorboardServiceClient
 # be expensive for network file systems.
 _MIN_LOGDIR_POLL_INTERVAL_SECS = 1
 
+# Maximum length of a logdir polling cycle in seconds when the polling interval
+# adapts to the write activity in the logdir.
+_MAX_LOGDIR_POLL_INTERVAL_SECS = 30
+
 # Maximum length of a base-128 varint as used to encode a 64-bit value
 # (without the "msb of last byte is bit 63" optimization, to be
 # compatible with protobuf and golang varints).
@@ -105,6 +126,27 @@ _DEFAULT_MAX_TENSOR_POINT_SIZE = 16 * (2**10)  # 16KiB
 
 _DEFAULT_MAX_BLOB_SIZE = 10 * (2**30)  # 10GiB
 
+# Default maximum number of blobs uploaded to GCS concurrently.
+_DEFAULT_MAX_BLOB_UPLOAD_WORKERS = 8
+
+# Blobs larger than this are sent with a chunked, resumable upload so that a
+# transient failure only resends the current chunk instead of the whole blob.
+_BLOB_CHUNKED_UPLOAD_THRESHOLD = 64 * (2**20)  # 64MiB
+
+# Chunk size of the resumable blob uploads. Must be a multiple of 256KiB.
+_BLOB_UPLOAD_CHUNK_SIZE = 16 * (2**20)  # 16MiB
+
+# Number of events handed over at once from a run reader thread to the sender
+# when the event files of several runs are read concurrently.
+_RUN_READER_BATCH_SIZE = 100
+
+# Maximum number of event batches buffered per run reader thread.
+_RUN_READER_QUEUE_SIZE_PER_WORKER = 4
+
+# Maximum size of the events kept in memory by a single-pass one-shot upload.
+# Past it, the events are spilled to a temporary file.
+_DEFAULT_MAX_BUFFERED_EVENT_BYTES = 64 * (2**20)  # 64MiB
+
 logger = tb_logging.get_logger()
 logger.setLevel(logging.WARNING)
 
@@ -141,6 +183,13 @@ class TensorBoardUploader(object):
         one_shot: bool = False,
         event_file_inactive_secs: Optional[int] = None,
         run_name_prefix=None,
+        max_blob_upload_workers: int = _DEFAULT_MAX_BLOB_UPLOAD_WORKERS,
+        max_run_reader_workers: int = 1,
+        max_in_flight_write_requests: int = 1,
+        single_pass: bool = False,
+        max_buffered_event_bytes: int = _DEFAULT_MAX_BUFFERED_EVENT_BYTES,
+        incremental_logdir_sync: bool = False,
+        logdir_sync_cursor_path: Optional[str] = None,
     ):
         """Constructs a TensorBoardUploader.
 
@@ -180,7 +229,57 @@ class TensorBoardUploader(object):
             considered inactive.
           run_name_prefix: If present, all runs created by this invocation will have
             their name prefixed by this value.
+          max_blob_upload_workers: Maximum number of blobs (e.g. images, audio,
+            graphs) uploaded to GCS concurrently. Set to 1 to upload blobs one
+            at a time.
+          max_run_reader_workers: Maximum number of runs whose event files are
+            read concurrently in an upload cycle. The events are sent while
+            the event files are still being read. Set to 1 to read and send
+            the runs one after the other.
+          max_in_flight_write_requests: Maximum number of write requests sent
+            concurrently. Each request stays within the size limits of
+            `upload_limits` and is still started at the rate allowed by the
+            rate limiters. Set to 1 to wait for each request to complete
+            before building the next one.
+          single_pass: In one-shot mode with a new experiment, read the event
+            files only once. The events read to find the runs and time series
+            to create are buffered, and spilled to a local temporary file past
+            `max_buffered_event_bytes`, then uploaded from the buffer. The
+            temporary file needs about as much local disk space as the events
+            of the log dir beyond that size. If False (default), the event
+            files are read again to be uploaded and no disk space is used.
+          max_buffered_event_bytes: Maximum total size in bytes of the events
+            kept in memory by a single-pass upload. Defaults to 64MiB.
+          incremental_logdir_sync: When continuously uploading a log dir in
+            Cloud Storage or on a local file system, list its event files at
+            each cycle and only read the runs with new or modified event files,
+            instead of walking the log dir and reading every run. Unless
+            `logdir_poll_rate_limiter` is set, the polling interval also grows
+            while no data is written to the log dir, up to 30 seconds.
+          logdir_sync_cursor_path: Path of a local file persisting the versions
+            of the event files uploaded with `incremental_logdir_sync`. When
+            the uploader restarts with the same file, only the runs changed
+            since the last upload cycle are read again.
+
+        Raises:
+          ValueError: If max_blob_upload_workers, max_run_reader_workers or
+            max_in_flight_write_requests is less than 1, or if
+            max_buffered_event_bytes is negative.
         """
+        for arg_name, arg_value in (
+            ("max_blob_upload_workers", max_blob_upload_workers),
+            ("max_run_reader_workers", max_run_reader_workers),
+            ("max_in_flight_write_requests", max_in_flight_write_requests),
+        ):
+            if arg_value < 1:
+                raise ValueError(
+                    "%s must be at least 1, got %d." % (arg_name, arg_value)
+                )
+        if max_buffered_event_bytes < 0:
+            raise ValueError(
+                "max_buffered_event_bytes must not be negative, got %d."
+                % max_buffered_event_bytes
+            )
         self._experiment_name = experiment_name
         self._experiment_display_name = experiment_display_name
         self._tensorboard_resource_name = tensorboard_resource_name
@@ -190,6 +289,12 @@ class TensorBoardUploader(object):
         self._logdir = logdir
         self._allowed_plugins = frozenset(allowed_plugins)
         self._run_name_prefix = run_name_prefix
+        self._max_blob_upload_workers = max_blob_upload_workers
+        self._max_run_reader_workers = max_run_reader_workers
+        self._max_in_flight_write_requests = max_in_flight_write_requests
+        self._single_pass = single_pass
+        self._max_buffered_event_bytes = max_buffered_event_bytes
+        self._single_pass_time_saved_secs = None
         self._is_brand_new_experiment = False
         self._continue_uploading = True
 
@@ -219,10 +324,27 @@ class TensorBoardUploader(object):
         self._one_shot = one_shot
         self._dispatcher = None
         self._additional_senders: Dict[str, uploader_utils.RequestSender] = {}
-        if logdir_poll_rate_limiter is None:
-            self._logdir_poll_rate_limiter = util.RateLimiter(
-                _MIN_LOGDIR_POLL_INTERVAL_SECS
+        self._logdir_change_detector = None
+        if incremental_logdir_sync and not one_shot:
+            self._logdir_change_detector = uploader_utils.get_logdir_change_detector(
+                logdir, cursor_path=logdir_sync_cursor_path
             )
+            if self._logdir_change_detector is None:
+                logger.warning(
+                    "Incremental logdir sync is not supported for %s, the whole "
+                    "logdir is read at each upload cycle.",
+                    logdir,
+                )
+        self._run_to_directory_loader: Dict[str, directory_loader.DirectoryLoader] = {}
+        if logdir_poll_rate_limiter is None:
+            if self._logdir_change_detector is None:
+                self._logdir_poll_rate_limiter = util.RateLimiter(
+                    _MIN_LOGDIR_POLL_INTERVAL_SECS
+                )
+            else:
+                self._logdir_poll_rate_limiter = _AdaptivePollRateLimiter(
+                    _MIN_LOGDIR_POLL_INTERVAL_SECS, _MAX_LOGDIR_POLL_INTERVAL_SECS
+                )
         else:
             self._logdir_poll_rate_limiter = logdir_poll_rate_limiter
 
@@ -259,6 +381,7 @@ class TensorBoardUploader(object):
             path_filter=io_wrapper.IsTensorFlowEventsFile,
             active_filter=active_filter,
         )
+        self._directory_loader_factory = directory_loader_factory
         self._logdir_loader = logdir_loader.LogdirLoader(
             self._logdir, directory_loader_factory
         )
@@ -269,6 +392,14 @@ class TensorBoardUploader(object):
 
         self._create_additional_senders()
 
+    @property
+    def single_pass_time_saved_secs(self) -> Optional[float]:
+        """The estimated seconds saved by reading the logdir once.
+
+        None unless a single-pass one-shot upload has completed.
+        """
+        return self._single_pass_time_saved_secs
+
     def _create_or_get_experiment(self) -> tensorboard_experiment.TensorboardExperiment:
         """Create an experiment or get an experiment.
 
@@ -320,6 +451,8 @@ class TensorBoardUploader(object):
             blob_storage_folder=self._blob_storage_folder,
             one_platform_resource_manager=self._one_platform_resource_manager,
             tracker=self._tracker,
+            max_blob_upload_workers=self._max_blob_upload_workers,
+            max_in_flight_write_requests=self._max_in_flight_write_requests,
         )
 
         # Update partials with experiment name
@@ -331,6 +464,7 @@ class TensorBoardUploader(object):
         self._dispatcher = _Dispatcher(
             request_sender=self._request_sender,
             additional_senders=self._additional_senders,
+            max_run_reader_workers=self._max_run_reader_workers,
         )
 
     def _should_profile(self) -> bool:
@@ -381,21 +515,24 @@ class TensorBoardUploader(object):
         if self._dispatcher is None:
             raise RuntimeError("Must call create_experiment() before start_uploading()")
 
-        if self._one_shot:
-            if self._is_brand_new_experiment:
-                self._pre_create_runs_and_time_series()
-            else:
-                logger.warning(
-                    "Please consider uploading to a new experiment instead of "
-                    "an existing one, as the former allows for better upload "
-                    "performance."
-                )
-
-        while self._continue_uploading:
-            self._logdir_poll_rate_limiter.tick()
-            self._upload_once()
+        if self._one_shot and self._is_brand_new_experiment and self._single_pass:
+            self._upload_single_pass()
+        else:
             if self._one_shot:
-                break
+                if self._is_brand_new_experiment:
+                    self._pre_create_runs_and_time_series()
+                else:
+                    logger.warning(
+                        "Please consider uploading to a new experiment instead of "
+                        "an existing one, as the former allows for better upload "
+                        "performance."
+                    )
+
+            while self._continue_uploading:
+                self._logdir_poll_rate_limiter.tick()
+                self._upload_once()
+                if self._one_shot:
+                    break
         if self._one_shot and not self._tracker.has_data():
             logger.warning(
                 "One-shot mode was used on a logdir (%s) without any uploadable data"
@@ -405,10 +542,57 @@ class TensorBoardUploader(object):
     def _end_uploading(self):
         self._continue_uploading = False
 
-    def _pre_create_runs_and_time_series(self):
+    def _upload_single_pass(self):
+        """Uploads the log dir once, reading its event files a single time.
+
+        The events read to create the runs and time series are buffered and
+        then uploaded from the buffer.
+        """
+        with _LogdirEventBuffer(self._max_buffered_event_bytes) as event_buffer:
+            self._pre_create_runs_and_time_series(event_buffer)
+            if not self._continue_uploading:
+                return
+            self._logdir_poll_rate_limiter.tick()
+            self._upload_once(event_buffer.get_run_events())
+            self._report_single_pass_time_saved(event_buffer)
+
+    def _report_single_pass_time_saved(self, event_buffer: "_LogdirEventBuffer"):
+        """Reports the time saved by not reading the event files twice.
+
+        The time saved is the time spent reading the event files, which a
+        second pass would have spent again, minus the time spent reading back
+        the spilled events.
+
+        Args:
+          event_buffer: The buffer used by the single-pass upload.
+        """
+        self._single_pass_time_saved_secs = max(
+            event_buffer.read_secs - event_buffer.replay_secs, 0.0
+        )
+        logger.info(
+            "Single-pass upload read %d events in %.3f seconds, %d of them spilled "
+            "to disk and read back in %.3f seconds",
+            event_buffer.num_events,
+            event_buffer.read_secs,
+            event_buffer.num_spilled_events,
+            event_buffer.replay_secs,
+        )
+        if self._verbosity:
+            _LOGGER.info(
+                "Reading the logdir once saved an estimated %.1f seconds."
+                % self._single_pass_time_saved_secs
+            )
+
+    def _pre_create_runs_and_time_series(
+        self, event_buffer: Optional["_LogdirEventBuffer"] = None
+    ):
         """Iterates though the log dir to collect TensorboardRuns and
         TensorboardTimeSeries that need to be created, and creates them in batch
         to speed up uploading later on.
+
+        Args:
+          event_buffer: If set, the events read are added to this buffer so
+            that they can be uploaded without reading the log dir again.
         """
         self._logdir_loader_pre_create.synchronize_runs()
         run_to_events = self._logdir_loader_pre_create.get_run_events()
@@ -421,6 +605,8 @@ class TensorBoardUploader(object):
         run_tag_name_to_time_series_proto = {}
         for (run_name, events) in run_to_events.items():
             run_names.append(run_name)
+            if event_buffer is not None:
+                events = event_buffer.add_run(run_name, events)
             for event in events:
                 _filter_graph_defs(event)
                 for value in event.summary.value:
@@ -456,20 +642,35 @@ class TensorBoardUploader(object):
             run_tag_name_to_time_series_proto
         )
 
-    def _upload_once(self):
-        """Runs one upload cycle, sending zero or more RPCs."""
+    def _upload_once(
+        self,
+        run_to_events: Optional[
+            Dict[str, Generator[tf.compat.v1.Event, None, None]]
+        ] = None,
+    ):
+        """Runs one upload cycle, sending zero or more RPCs.
+
+        Args:
+          run_to_events: Mapping from run name, including the run name prefix,
+            to the events to upload. If not set, the new events of the log dir
+            are read.
+        """
         logger.info("Starting an upload cycle")
 
-        sync_start_time = time.time()
-        self._logdir_loader.synchronize_runs()
-        sync_duration_secs = time.time() - sync_start_time
-        logger.info("Logdir sync took %.3f seconds", sync_duration_secs)
+        if run_to_events is None:
+            if self._logdir_change_detector is None:
+                sync_start_time = time.time()
+                self._logdir_loader.synchronize_runs()
+                sync_duration_secs = time.time() - sync_start_time
+                logger.info("Logdir sync took %.3f seconds", sync_duration_secs)
 
-        run_to_events = self._logdir_loader.get_run_events()
-        if self._run_name_prefix:
-            run_to_events = {
-                self._run_name_prefix + k: v for k, v in run_to_events.items()
-            }
+                run_to_events = self._logdir_loader.get_run_events()
+            else:
+                run_to_events = self._get_changed_run_events()
+            if self._run_name_prefix:
+                run_to_events = {
+                    self._run_name_prefix + k: v for k, v in run_to_events.items()
+                }
 
         # Add a profile event to trigger send_request in _additional_senders
         if self._should_profile():
@@ -478,6 +679,219 @@ class TensorBoardUploader(object):
         with self._tracker.send_tracker():
             self._dispatcher.dispatch_requests(run_to_events)
 
+        if self._logdir_change_detector is not None:
+            self._logdir_change_detector.save_cursor()
+
+    def _get_changed_run_events(
+        self,
+    ) -> Dict[str, Generator[tf.compat.v1.Event, None, None]]:
+        """Returns the new events of the runs whose event files have changed.
+
+        Returns:
+          Mapping from run name to a generator of the new events of the run,
+          for the runs with new or modified event files.
+        """
+        sync_start_time = time.time()
+        changed_runs = self._logdir_change_detector.get_changed_runs()
+        sync_duration_secs = time.time() - sync_start_time
+        logger.info(
+            "Logdir sync took %.3f seconds, found %d changed runs",
+            sync_duration_secs,
+            len(changed_runs),
+        )
+
+        runs = self._logdir_change_detector.runs
+        for run_name in set(self._run_to_directory_loader) - runs:
+            del self._run_to_directory_loader[run_name]
+
+        run_to_events = {}
+        for run_name in sorted(changed_runs):
+            loader = self._run_to_directory_loader.get(run_name)
+            if loader is None:
+                loader = self._directory_loader_factory(
+                    self._logdir
+                    if run_name == os.curdir
+                    else os.path.join(self._logdir, run_name)
+                )
+                self._run_to_directory_loader[run_name] = loader
+            run_to_events[run_name] = _load_run_events(loader)
+
+        if isinstance(self._logdir_poll_rate_limiter, _AdaptivePollRateLimiter):
+            self._logdir_poll_rate_limiter.record_activity(bool(changed_runs))
+        return run_to_events
+
+
+class _AdaptivePollRateLimiter(object):
+    """Rate limiter of the logdir polling adapting to the write activity.
+
+    The interval between ticks doubles after each cycle without changes in the
+    logdir, up to a maximum, and goes back to the minimum once changes are
+    found.
+    """
+
+    def __init__(self, min_interval_secs: float, max_interval_secs: float):
+        """Constructs an _AdaptivePollRateLimiter.
+
+        Args:
+          min_interval_secs: Interval between ticks while the logdir changes.
+          max_interval_secs: Maximum interval between ticks.
+        """
+        self._min_interval_secs = min_interval_secs
+        self._max_interval_secs = max_interval_secs
+        self._interval_secs = min_interval_secs
+        self._last_tick_time = None
+
+    @property
+    def interval_secs(self) -> float:
+        """The current interval between ticks."""
+        return self._interval_secs
+
+    def tick(self):
+        """Blocks until the current interval has elapsed since the last tick."""
+        if self._last_tick_time is not None:
+            wait_secs = self._last_tick_time + self._interval_secs - time.monotonic()
+            if wait_secs > 0:
+                time.sleep(wait_secs)
+        self._last_tick_time = time.monotonic()
+
+    def record_activity(self, has_changes: bool):
+        """Adapts the interval to the result of the last poll.
+
+        Args:
+          has_changes: Whether the last poll found changes in the logdir.
+        """
+        if has_changes:
+            self._interval_secs = self._min_interval_secs
+        else:
+            self._interval_secs = min(self._interval_secs * 2, self._max_interval_secs)
+
+
+def _load_run_events(
+    loader: directory_loader.DirectoryLoader,
+) -> Generator[tf.compat.v1.Event, None, None]:
+    """Yields the new events of a run, stopping if its directory is deleted."""
+    try:
+        yield from loader.Load()
+    except directory_watcher.DirectoryDeletedError:
+        return
+
+
+class _LogdirEventBuffer(object):
+    """Buffers the events of the runs of a log dir so that they are read once.
+
+    Events are kept in memory up to a maximum size. Past it, they are appended
+    to a temporary file and read back when the events of their run are
+    iterated. The events of each run are iterated in the order they were
+    added.
+
+    Events are added from a single thread. The events of different runs can
+    then be iterated concurrently.
+
+    Use as a context manager to remove the temporary file.
+    """
+
+    def __init__(self, max_memory_bytes: int):
+        """Constructs a _LogdirEventBuffer.
+
+        Args:
+          max_memory_bytes: Maximum total size of the events kept in memory.
+        """
+        self._max_memory_bytes = max_memory_bytes
+        self._memory_bytes = 0
+        self._run_to_events: Dict[str, List[tf.compat.v1.Event]] = {}
+        # Offset and length of the spilled events of each run.
+        self._run_to_spilled_events: Dict[str, List[Tuple[int, int]]] = {}
+        self._spill_file = None
+        self._spill_file_lock = threading.Lock()
+        self.num_events = 0
+        self.num_spilled_events = 0
+        self.read_secs = 0.0
+        self.replay_secs = 0.0
+
+    def __enter__(self) -> "_LogdirEventBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Drops the buffered events and removes the temporary file."""
+        self._run_to_events.clear()
+        self._run_to_spilled_events.clear()
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def add_run(
+        self, run_name: str, events: Iterable[tf.compat.v1.Event]
+    ) -> Generator[tf.compat.v1.Event, None, None]:
+        """Adds the events of a run while they are read.
+
+        Args:
+          run_name: Name of the run.
+          events: The events of the run.
+
+        Yields:
+          The events, once added to the buffer.
+        """
+        memory_events = self._run_to_events.setdefault(run_name, [])
+        spilled_events = self._run_to_spilled_events.setdefault(run_name, [])
+        events = iter(events)
+        while True:
+            read_start_time = time.monotonic()
+            event = next(events, None)
+            self.read_secs += time.monotonic() - read_start_time
+            if event is None:
+                return
+            self.num_events += 1
+            event_bytes = event.ByteSize()
+            # Once the memory is full, all the following events are spilled so
+            # the spilled events of a run always follow its in-memory events.
+            if (
+                self._spill_file is None
+                and self._memory_bytes + event_bytes <= self._max_memory_bytes
+            ):
+                self._memory_bytes += event_bytes
+                memory_events.append(event)
+            else:
+                spilled_events.append(self._spill(event))
+            yield event
+
+    def _spill(self, event: tf.compat.v1.Event) -> Tuple[int, int]:
+        """Appends an event to the temporary file.
+
+        Returns:
+          The offset and length of the serialized event in the file.
+        """
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile()
+        self.num_spilled_events += 1
+        serialized_event = event.SerializeToString()
+        offset = self._spill_file.seek(0, os.SEEK_END)
+        self._spill_file.write(serialized_event)
+        return offset, len(serialized_event)
+
+    def _replay_run(self, run_name: str) -> Generator[tf.compat.v1.Event, None, None]:
+        """Yields the buffered events of a run and releases them."""
+        yield from self._run_to_events.pop(run_name, [])
+        for offset, length in self._run_to_spilled_events.pop(run_name, []):
+            with self._spill_file_lock:
+                replay_start_time = time.monotonic()
+                self._spill_file.seek(offset)
+                event = event_pb2.Event.FromString(self._spill_file.read(length))
+                self.replay_secs += time.monotonic() - replay_start_time
+            yield event
+
+    def get_run_events(self) -> Dict[str, Generator[tf.compat.v1.Event, None, None]]:
+        """Returns the buffered events of each run.
+
+        Returns:
+          Mapping from run name to a generator yielding its buffered events.
+        """
+        return {
+            run_name: self._replay_run(run_name) for run_name in self._run_to_events
+        }
+
 
 class PermissionDeniedError(RuntimeError):
     pass
@@ -525,6 +939,8 @@ class _BatchedRequestSender(object):
         blob_storage_folder: str,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
         tracker: upload_tracker.UploadTracker,
+        max_blob_upload_workers: int = _DEFAULT_MAX_BLOB_UPLOAD_WORKERS,
+        max_in_flight_write_requests: int = 1,
     ):
         """Constructs _BatchedRequestSender for the given experiment resource.
 
@@ -544,6 +960,10 @@ class _BatchedRequestSender(object):
           one_platform_resource_manager: An instance of the One Platform
             resource management class.
           tracker: Upload tracker to track information about uploads.
+          max_blob_upload_workers: Maximum number of blobs uploaded to GCS
+            concurrently.
+          max_in_flight_write_requests: Maximum number of write requests, of
+            all the data types, sent concurrently.
         """
         self._experiment_resource_name = experiment_resource_name
         self._api = api
@@ -551,6 +971,11 @@ class _BatchedRequestSender(object):
         self._allowed_plugins = frozenset(allowed_plugins)
         self._tracker = tracker
         self._one_platform_resource_manager = one_platform_resource_manager
+        self._request_pipeline = (
+            _RequestPipeline(max_in_flight_write_requests)
+            if max_in_flight_write_requests > 1
+            else None
+        )
         self._scalar_request_sender = _ScalarBatchedRequestSender(
             experiment_resource_id=experiment_resource_name,
             api=api,
@@ -558,6 +983,7 @@ class _BatchedRequestSender(object):
             max_request_size=upload_limits.max_scalar_request_size,
             tracker=self._tracker,
             one_platform_resource_manager=self._one_platform_resource_manager,
+            request_pipeline=self._request_pipeline,
         )
         self._tensor_request_sender = _TensorBatchedRequestSender(
             experiment_resource_id=experiment_resource_name,
@@ -567,6 +993,7 @@ class _BatchedRequestSender(object):
             max_tensor_point_size=upload_limits.max_tensor_point_size,
             tracker=self._tracker,
             one_platform_resource_manager=self._one_platform_resource_manager,
+            request_pipeline=self._request_pipeline,
         )
         self._blob_request_sender = _BlobRequestSender(
             experiment_resource_id=experiment_resource_name,
@@ -578,6 +1005,8 @@ class _BatchedRequestSender(object):
             blob_storage_folder=blob_storage_folder,
             tracker=self._tracker,
             one_platform_resource_manager=self._one_platform_resource_manager,
+            max_blob_upload_workers=max_blob_upload_workers,
+            request_pipeline=self._request_pipeline,
         )
 
     def send_request(
@@ -615,10 +1044,16 @@ class _BatchedRequestSender(object):
             self._blob_request_sender.add_event(run_name, event, value, metadata)
 
     def flush(self):
-        """Flushes any events that have been stored."""
+        """Flushes any events that have been stored.
+
+        Returns once all the write requests, including the ones still in
+        flight, have completed.
+        """
         self._scalar_request_sender.flush()
         self._tensor_request_sender.flush()
         self._blob_request_sender.flush()
+        if self._request_pipeline:
+            self._request_pipeline.wait()
 
     def get_metadata_and_validate(
         self, run_name: str, value: tf.compat.v1.Summary.Value
@@ -674,6 +1109,7 @@ class _Dispatcher(object):
         self,
         request_sender: _BatchedRequestSender,
         additional_senders: Optional[Dict[str, uploader_utils.RequestSender]] = None,
+        max_run_reader_workers: int = 1,
     ):
         """Construct a _Dispatcher object for the TensorboardUploader.
 
@@ -681,8 +1117,11 @@ class _Dispatcher(object):
             request_sender: A `_BatchedRequestSender` for handling events.
             additional_senders: A dictionary mapping a plugin name to additional
               Senders.
+            max_run_reader_workers: Maximum number of runs whose events are
+              read concurrently.
         """
         self._request_sender = request_sender
+        self._max_run_reader_workers = max_run_reader_workers
 
         if not additional_senders:
             additional_senders = {}
@@ -725,19 +1164,105 @@ class _Dispatcher(object):
         and drop any values with an unknown (i.e., absent or unrecognized)
         `data_class`.
 
+        When more than one run reader worker is allowed, the events of several
+        runs are read concurrently and the events of each run are sent in
+        order, interleaved with the events of the other runs.
+
         Args:
           run_to_events: Mapping from run name to generator of `tf.compat.v1.Event`
             values, as returned by `LogdirLoader.get_run_events`.
         """
-        for (run_name, events) in run_to_events.items():
-            self._dispatch_additional_senders(run_name)
-            if events is not None:
+        if self._max_run_reader_workers > 1 and len(run_to_events) > 1:
+            for run_name in run_to_events:
+                self._dispatch_additional_senders(run_name)
+            for run_name, events in self._read_runs_concurrently(run_to_events):
                 for event in events:
-                    _filter_graph_defs(event)
                     for value in event.summary.value:
                         self._request_sender.send_request(run_name, event, value)
+        else:
+            for (run_name, events) in run_to_events.items():
+                self._dispatch_additional_senders(run_name)
+                if events is not None:
+                    for event in events:
+                        _filter_graph_defs(event)
+                        for value in event.summary.value:
+                            self._request_sender.send_request(run_name, event, value)
         self._request_sender.flush()
 
+    def _read_runs_concurrently(
+        self, run_to_events: Dict[str, Generator[tf.compat.v1.Event, None, None]]
+    ) -> Generator[Tuple[str, List[tf.compat.v1.Event]], None, None]:
+        """Reads the events of several runs on a thread pool.
+
+        Args:
+          run_to_events: Mapping from run name to generator of `tf.compat.v1.Event`
+            values, as returned by `LogdirLoader.get_run_events`.
+
+        Yields:
+          Tuples of a run name and a batch of its events, with the graph defs
+          already filtered. The batches of a run are yielded in order.
+
+        Raises:
+          Exception: Any exception raised while reading the events of a run.
+        """
+        run_to_events = {
+            run_name: events
+            for run_name, events in run_to_events.items()
+            if events is not None
+        }
+        if not run_to_events:
+            return
+
+        max_workers = min(self._max_run_reader_workers, len(run_to_events))
+        batches = queue.Queue(maxsize=max_workers * _RUN_READER_QUEUE_SIZE_PER_WORKER)
+        stopped = threading.Event()
+
+        def put(item):
+            # Give up when the consumer is gone, e.g. after a failed request.
+            while not stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def read_run(run_name, events):
+            try:
+                batch = []
+                for event in events:
+                    if stopped.is_set():
+                        return
+                    _filter_graph_defs(event)
+                    batch.append(event)
+                    if len(batch) == _RUN_READER_BATCH_SIZE:
+                        put((run_name, batch))
+                        batch = []
+                if batch:
+                    put((run_name, batch))
+            finally:
+                # The end of a run, successful or not.
+                put((run_name, None))
+
+        with futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tensorboard_run_reader"
+        ) as executor:
+            reader_futures = {
+                run_name: executor.submit(read_run, run_name, events)
+                for run_name, events in run_to_events.items()
+            }
+            try:
+                remaining_runs = len(reader_futures)
+                while remaining_runs:
+                    run_name, batch = batches.get()
+                    if batch is None:
+                        remaining_runs -= 1
+                        # Raises the exception of a failed reader.
+                        reader_futures[run_name].result()
+                    else:
+                        yield run_name, batch
+            finally:
+                stopped.set()
+
 
 class _BaseBatchedRequestSender(object):
     """Helper class for building requests that fit under a size limit.
@@ -758,6 +1283,7 @@ class _BaseBatchedRequestSender(object):
         max_request_size: int,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        request_pipeline: Optional["_RequestPipeline"] = None,
     ):
         """Constructor for _BaseBatchedRequestSender.
 
@@ -768,6 +1294,8 @@ class _BaseBatchedRequestSender(object):
           rpc_rate_limiter: until.RateLimiter to limit rate of this request sender
           max_request_size: max number of bytes to send
           tracker:
+          request_pipeline: If set, the write requests are sent through this
+            pipeline instead of waiting for each of them to complete.
         """
         self._experiment_resource_id = experiment_resource_id
         self._api = api
@@ -775,6 +1303,7 @@ class _BaseBatchedRequestSender(object):
         self._byte_budget_manager = _ByteBudgetManager(max_request_size)
         self._tracker = tracker
         self._one_platform_resource_manager = one_platform_resource_manager
+        self._request_pipeline = request_pipeline
 
         # cache: map from Tensorboard tag to TimeSeriesData
         # cleared whenever a new request is created
@@ -866,23 +1395,49 @@ class _BaseBatchedRequestSender(object):
 
         self._rpc_rate_limiter.tick()
 
-        with uploader_utils.request_logger(request):
-            with self._get_tracker():
-                try:
-                    self._api.write_tensorboard_experiment_data(
-                        tensorboard_experiment=request.tensorboard_experiment,
-                        write_run_data_requests=request.write_run_data_requests,
-                    )
-                except grpc.RpcError as e:
-                    if (
-                        hasattr(e, "code")
-                        and getattr(e, "code")() == grpc.StatusCode.NOT_FOUND
-                    ):
-                        raise ExperimentNotFoundError() from e
-                    logger.error("Upload call failed with error %s", e)
+        # The tracker is created with the counts of this request, and only
+        # entered once the request has been written.
+        tracker = self._get_tracker()
+        if self._request_pipeline:
+            self._request_pipeline.submit(
+                self._write_request,
+                request,
+                on_done=functools.partial(_track_written_request, tracker),
+            )
+        else:
+            _track_written_request(tracker, self._write_request(request))
 
         self._new_request()
 
+    def _write_request(
+        self, request: tensorboard_service.WriteTensorboardExperimentDataRequest
+    ) -> bool:
+        """Sends a write request.
+
+        This method is called concurrently when a request pipeline is used.
+
+        Returns:
+          Whether the request was written. Failed requests are logged.
+
+        Raises:
+          ExperimentNotFoundError: If the experiment has been deleted.
+        """
+        with uploader_utils.request_logger(request):
+            try:
+                self._api.write_tensorboard_experiment_data(
+                    tensorboard_experiment=request.tensorboard_experiment,
+                    write_run_data_requests=request.write_run_data_requests,
+                )
+            except grpc.RpcError as e:
+                if (
+                    hasattr(e, "code")
+                    and getattr(e, "code")() == grpc.StatusCode.NOT_FOUND
+                ):
+                    raise ExperimentNotFoundError() from e
+                logger.error("Upload call failed with error %s", e)
+                return False
+        return True
+
     def _create_time_series_data(
         self, run_name: str, tag_name: str, metadata: tf.compat.v1.SummaryMetadata
     ) -> tensorboard_data.TimeSeriesData:
@@ -1019,6 +1574,7 @@ class _ScalarBatchedRequestSender(_BaseBatchedRequestSender):
         max_request_size: int,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        request_pipeline: Optional["_RequestPipeline"] = None,
     ):
         """Constructor for _ScalarBatchedRequestSender.
 
@@ -1029,6 +1585,7 @@ class _ScalarBatchedRequestSender(_BaseBatchedRequestSender):
           rpc_rate_limiter: until.RateLimiter to limit rate of this request sender
           max_request_size: max number of bytes to send
           tracker:
+          request_pipeline: Optional pipeline to send the requests through.
         """
         super().__init__(
             experiment_resource_id,
@@ -1037,6 +1594,7 @@ class _ScalarBatchedRequestSender(_BaseBatchedRequestSender):
             max_request_size,
             tracker,
             one_platform_resource_manager,
+            request_pipeline,
         )
 
     def _get_tracker(self) -> ContextManager:
@@ -1083,6 +1641,7 @@ class _TensorBatchedRequestSender(_BaseBatchedRequestSender):
         max_tensor_point_size: int,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        request_pipeline: Optional["_RequestPipeline"] = None,
     ):
         """Constructor for _TensorBatchedRequestSender.
 
@@ -1093,6 +1652,7 @@ class _TensorBatchedRequestSender(_BaseBatchedRequestSender):
           rpc_rate_limiter: until.RateLimiter to limit rate of this request sender
           max_request_size: max number of bytes to send
           tracker:
+          request_pipeline: Optional pipeline to send the requests through.
         """
         super().__init__(
             experiment_resource_id,
@@ -1101,6 +1661,7 @@ class _TensorBatchedRequestSender(_BaseBatchedRequestSender):
             max_request_size,
             tracker,
             one_platform_resource_manager,
+            request_pipeline,
         )
         self._max_tensor_point_size = max_tensor_point_size
 
@@ -1170,6 +1731,76 @@ class _TensorBatchedRequestSender(_BaseBatchedRequestSender):
         return True
 
 
+def _track_written_request(tracker: ContextManager, written: bool):
+    """Records a write request in the upload stats if it was written.
+
+    Args:
+      tracker: The tracker of the request, from upload_tracker.UploadTracker.
+      written: Whether the request was written.
+    """
+    if written:
+        with tracker:
+            pass
+
+
+class _RequestPipeline(object):
+    """Sends write requests on a thread pool, with a bounded number in flight.
+
+    Requests are submitted from a single thread. Once the maximum number of
+    requests is in flight, submitting a request waits for the oldest one to
+    complete. The exception of a failed request is raised from `submit` or
+    `wait`. The completion callbacks of the requests run on the submitting
+    thread, in submission order.
+    """
+
+    def __init__(self, max_in_flight_requests: int):
+        """Constructs a _RequestPipeline.
+
+        Args:
+          max_in_flight_requests: Maximum number of requests sent concurrently.
+        """
+        self._max_in_flight_requests = max_in_flight_requests
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_in_flight_requests,
+            thread_name_prefix="tensorboard_write_request",
+        )
+        self._in_flight = deque()
+
+    def submit(
+        self,
+        send_request: Callable[..., Any],
+        *args,
+        on_done: Optional[Callable[[Any], None]] = None,
+        **kwargs,
+    ):
+        """Starts sending a request.
+
+        Args:
+          send_request: The function sending the request.
+          *args: Positional arguments of send_request.
+          on_done: Called with the result of send_request once it completed
+            successfully.
+          **kwargs: Keyword arguments of send_request.
+        """
+        while len(self._in_flight) >= self._max_in_flight_requests:
+            self._complete_oldest()
+        self._in_flight.append(
+            (self._executor.submit(send_request, *args, **kwargs), on_done)
+        )
+
+    def wait(self):
+        """Waits for all the requests in flight to complete."""
+        while self._in_flight:
+            self._complete_oldest()
+
+    def _complete_oldest(self):
+        """Waits for the oldest request in flight and runs its callback."""
+        future, on_done = self._in_flight.popleft()
+        result = future.result()
+        if on_done is not None:
+            on_done(result)
+
+
 class _ByteBudgetManager(object):
     """Helper class for managing the request byte budget for certain RPCs.
 
@@ -1268,6 +1899,10 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
     every blob is sent individually and immediately.  Nonetheless we retain
     the `add_event()`/`flush()` structure for symmetry.
 
+    The blobs of a blob sequence are uploaded concurrently on a bounded thread
+    pool shared by all runs. The ids in the resulting `TensorboardBlobSequence`
+    keep the order of the blobs in the sequence.
+
     This class is not threadsafe. Use external synchronization if calling its
     methods concurrently.
     """
@@ -1285,6 +1920,8 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
         blob_storage_folder: str,
         tracker: upload_tracker.UploadTracker,
         one_platform_resource_manager: uploader_utils.OnePlatformResourceManager,
+        max_blob_upload_workers: int = _DEFAULT_MAX_BLOB_UPLOAD_WORKERS,
+        request_pipeline: Optional["_RequestPipeline"] = None,
     ):
         super().__init__(
             experiment_resource_id,
@@ -1293,10 +1930,22 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
             max_blob_request_size,
             tracker,
             one_platform_resource_manager,
+            request_pipeline,
         )
         self._max_blob_size = max_blob_size
         self._bucket = blob_storage_bucket
         self._folder = blob_storage_folder
+        self._max_blob_upload_workers = max_blob_upload_workers
+        self._blob_upload_executor = None
+
+    def _get_blob_upload_executor(self) -> futures.ThreadPoolExecutor:
+        """Returns the thread pool used to upload blobs, creating it if needed."""
+        if self._blob_upload_executor is None:
+            self._blob_upload_executor = futures.ThreadPoolExecutor(
+                max_workers=self._max_blob_upload_workers,
+                thread_name_prefix="tensorboard_blob_upload",
+            )
+        return self._blob_upload_executor
 
     def _new_request(self):
         super()._new_request()
@@ -1344,10 +1993,25 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
             if self._folder
             else blob_path_prefix
         )
+        if self._max_blob_upload_workers > 1 and len(blobs) > 1:
+            executor = self._get_blob_upload_executor()
+            # Uploads are started eagerly, the results are collected in the
+            # order of the sequence so that the blob ids keep that order.
+            send_blob_futures = [
+                executor.submit(self._send_blob, blob, blob_path_prefix)
+                for blob in blobs
+            ]
+            get_blob_ids = [future.result for future in send_blob_futures]
+        else:
+            get_blob_ids = [
+                functools.partial(self._send_blob, blob, blob_path_prefix)
+                for blob in blobs
+            ]
+
         sent_blob_ids = []
-        for blob in blobs:
+        for blob, get_blob_id in zip(blobs, get_blob_ids):
             with self._tracker.blob_tracker(len(blob)) as blob_tracker:
-                blob_id = self._send_blob(blob, blob_path_prefix)
+                blob_id = get_blob_id()
                 if blob_id is not None:
                     sent_blob_ids.append(str(blob_id))
                     blob_tracker.mark_uploaded(blob_id is not None)
@@ -1369,7 +2033,10 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
     def _send_blob(self, blob, blob_path_prefix):
         """Sends a single blob to a GCS bucket in the consumer project.
 
-        The blob will not be sent if it is too large.
+        The blob will not be sent if it is too large. Large blobs are sent with
+        a chunked, resumable upload.
+
+        This method is called concurrently from the blob upload threads.
 
         Returns:
           The ID of blob successfully sent.
@@ -1386,7 +2053,11 @@ class _BlobRequestSender(_BaseBatchedRequestSender):
         blob_path = (
             "{}/{}".format(blob_path_prefix, blob_id) if blob_path_prefix else blob_id
         )
-        self._bucket.blob(blob_path).upload_from_string(blob)
+        if len(blob) > _BLOB_CHUNKED_UPLOAD_THRESHOLD:
+            gcs_blob = self._bucket.blob(blob_path, chunk_size=_BLOB_UPLOAD_CHUNK_SIZE)
+        else:
+            gcs_blob = self._bucket.blob(blob_path)
+        gcs_blob.upload_from_string(blob)
         return blob_id
 
 
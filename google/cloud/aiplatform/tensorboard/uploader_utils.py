@@ -20,9 +20,10 @@ import abc
 import contextlib
 import json
 import logging
+import os
 import re
 import time
-from typing import Callable, Dict, Generator, List, Optional, Tuple
+from typing import Callable, Dict, Generator, Iterable, List, Optional, Set, Tuple
 import uuid
 
 from absl import app
@@ -526,3 +527,196 @@ def get_blob_storage_bucket_and_folder(
         ),
         exitcode=0,
     )
+
+
+class LogdirChangeDetector(abc.ABC):
+    """Detects the runs of a log dir whose event files are new or have grown.
+
+    A run is named after the path of its directory relative to the log dir,
+    like the runs of `tensorboard.uploader.logdir_loader.LogdirLoader`.
+
+    The cursor of the detector, i.e. the version of each event file as of the
+    last listing, can be persisted to a local file with `save_cursor`, and is
+    reloaded from that file on construction. A restarted uploader then only
+    reads the runs that changed since the cursor was saved.
+    """
+
+    def __init__(self, logdir: str, cursor_path: Optional[str] = None):
+        """Constructor for LogdirChangeDetector.
+
+        Args:
+            logdir (str):
+                Required. Path of the log directory.
+            cursor_path (str):
+                Optional. Path of a local file persisting the cursor across
+                restarts. The cursor is not persisted if not set.
+        """
+        self._logdir = logdir
+        self._cursor_path = cursor_path
+        # Cursor of the last listing: a version of each event file, which
+        # changes when the file is rewritten or appended to.
+        self._event_file_versions: Dict[str, Tuple[int, int]] = self._load_cursor()
+
+    def _load_cursor(self) -> Dict[str, Tuple[int, int]]:
+        """Loads the cursor saved to the cursor file, if any."""
+        if not self._cursor_path or not os.path.exists(self._cursor_path):
+            return {}
+        try:
+            with open(self._cursor_path) as f:
+                cursor = json.load(f)
+            if cursor["logdir"] != self._logdir:
+                logger.warning(
+                    "Ignoring the logdir sync cursor %s of another logdir: %s",
+                    self._cursor_path,
+                    cursor["logdir"],
+                )
+                return {}
+            return {
+                path: tuple(version)
+                for path, version in cursor["event_file_versions"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Ignoring the invalid logdir sync cursor %s: %s", self._cursor_path, e
+            )
+            return {}
+
+    def save_cursor(self):
+        """Saves the cursor of the last listing to the cursor file, if set.
+
+        Call it once the events of the changed runs have been uploaded, so
+        that a restart does not skip events that were not uploaded.
+        """
+        if not self._cursor_path:
+            return
+        cursor = {
+            "logdir": self._logdir,
+            "event_file_versions": self._event_file_versions,
+        }
+        temp_path = self._cursor_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(cursor, f)
+        os.replace(temp_path, self._cursor_path)
+
+    @property
+    def runs(self) -> Set[str]:
+        """The runs with at least one event file, as of the last listing."""
+        return {self._get_run_name(path) for path in self._event_file_versions}
+
+    def get_changed_runs(self) -> Set[str]:
+        """Lists the event files of the log dir and compares them with the
+        previous listing.
+
+        Returns:
+            The runs with event files added or modified since the previous
+            call. All the runs with event files on the first call.
+        """
+        event_file_versions = dict(self._list_event_files())
+        changed_runs = {
+            self._get_run_name(path)
+            for path, version in event_file_versions.items()
+            if self._event_file_versions.get(path) != version
+        }
+        self._event_file_versions = event_file_versions
+        return changed_runs
+
+    def _get_run_name(self, path: str) -> str:
+        return os.path.relpath(os.path.dirname(path), self._logdir)
+
+    @abc.abstractmethod
+    def _list_event_files(self) -> Iterable[Tuple[str, Tuple[int, int]]]:
+        """Lists the event files of the log dir.
+
+        Returns:
+            Pairs of the path of an event file and its version.
+        """
+        pass
+
+
+class LocalLogdirChangeDetector(LogdirChangeDetector):
+    """Detects changes in a log dir on a local file system.
+
+    The version of an event file is its size and modification time.
+    """
+
+    def _list_event_files(self) -> Iterable[Tuple[str, Tuple[int, int]]]:
+        for dir_path, _, file_names in os.walk(self._logdir):
+            for file_name in file_names:
+                if "tfevents" not in file_name:
+                    continue
+                path = os.path.join(dir_path, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, (stat.st_size, stat.st_mtime_ns)
+
+
+class GcsLogdirChangeDetector(LogdirChangeDetector):
+    """Detects changes in a log dir in Cloud Storage.
+
+    The event files are found with a single, flat listing of the objects under
+    the log dir, fetching only their name, generation and size, instead of
+    listing each directory. The version of an event file is its generation
+    and size.
+
+    Cloud Storage cannot list the objects changed since a given time, so each
+    listing still covers every object under the log dir. What is incremental
+    is the reading: only the runs whose event files changed since the cursor
+    are read, including across restarts when the cursor is persisted.
+    """
+
+    def __init__(
+        self,
+        logdir: str,
+        bucket: storage.Bucket,
+        cursor_path: Optional[str] = None,
+    ):
+        """Constructor for GcsLogdirChangeDetector.
+
+        Args:
+            logdir (str):
+                Required. Path of the log directory, starting with gs://.
+            bucket (storage.Bucket):
+                Required. The bucket of the log directory.
+            cursor_path (str):
+                Optional. Path of a local file persisting the cursor across
+                restarts.
+        """
+        super().__init__(logdir.rstrip("/"), cursor_path=cursor_path)
+        self._bucket = bucket
+        self._gcs_prefix = "gs://{}/".format(bucket.name)
+        prefix = self._logdir[len(self._gcs_prefix) :]
+        self._prefix = prefix + "/" if prefix else ""
+
+    def _list_event_files(self) -> Iterable[Tuple[str, Tuple[int, int]]]:
+        for blob in self._bucket.list_blobs(
+            prefix=self._prefix,
+            fields="items(name,generation,size),nextPageToken",
+        ):
+            if "tfevents" in blob.name.rsplit("/", 1)[-1]:
+                yield self._gcs_prefix + blob.name, (blob.generation, blob.size)
+
+
+def get_logdir_change_detector(
+    logdir: str, cursor_path: Optional[str] = None
+) -> Optional[LogdirChangeDetector]:
+    """Returns a change detector for a log directory.
+
+    Args:
+        logdir (str):
+            Required. Path of the log directory.
+        cursor_path (str):
+            Optional. Path of a local file persisting the cursor of the
+            detector across restarts.
+
+    Returns:
+        A change detector for log dirs in Cloud Storage or on a local file
+        system, None for other file systems.
+    """
+    bucket = get_source_bucket(logdir)
+    if bucket:
+        return GcsLogdirChangeDetector(logdir, bucket, cursor_path=cursor_path)
+    if "://" not in logdir:
+        return LocalLogdirChangeDetector(logdir, cursor_path=cursor_path)
+    return None
@@ -93,6 +93,8 @@ class _TrainingJob(base.VertexAiStatefulResource):
     # Required by the done() method
     _valid_done_states = _PIPELINE_COMPLETE_STATES
 
+    _list_order_by_locally = True
+
     def __init__(
         self,
         display_name: Optional[str] = None,
@@ -1009,6 +1011,13 @@ class _TrainingJob(base.VertexAiStatefulResource):
             )
         return False
 
+    @classmethod
+    def _list_cls_filter(cls, gapic_resource: proto.Message) -> bool:
+        """Returns whether a listed training pipeline is of this training job type."""
+        return (
+            gapic_resource.training_task_definition in cls._supported_training_schemas
+        )
+
     @classmethod
     def list(
         cls,
@@ -1048,14 +1057,8 @@ class _TrainingJob(base.VertexAiStatefulResource):
         Returns:
             List[VertexAiResourceNoun] - A list of TrainingJob resource objects
         """
-
-        training_job_subclass_filter = (
-            lambda gapic_obj: gapic_obj.training_task_definition
-            in cls._supported_training_schemas
-        )
-
         return cls._list_with_local_order(
-            cls_filter=training_job_subclass_filter,
+            cls_filter=cls._list_cls_filter,
             filter=filter,
             order_by=order_by,
             project=project,
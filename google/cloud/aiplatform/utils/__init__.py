@@ -21,6 +21,8 @@ import datetime
 import pathlib
 import logging
 import re
+import threading
+import time
 from typing import Any, Callable, Dict, Optional, Type, TypeVar, Tuple
 import uuid
 
@@ -38,16 +40,22 @@ from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform.compat.services import (
     dataset_service_client_v1beta1,
     deployment_resource_pool_service_client_v1beta1,
+    endpoint_service_async_client_v1beta1,
     endpoint_service_client_v1beta1,
     featurestore_online_serving_service_client_v1beta1,
+    featurestore_service_async_client_v1beta1,
     featurestore_service_client_v1beta1,
     index_service_client_v1beta1,
     index_endpoint_service_client_v1beta1,
+    job_service_async_client_v1beta1,
     job_service_client_v1beta1,
     match_service_client_v1beta1,
     metadata_service_client_v1beta1,
+    model_service_async_client_v1beta1,
     model_service_client_v1beta1,
+    pipeline_service_async_client_v1beta1,
     pipeline_service_client_v1beta1,
+    prediction_service_async_client_v1beta1,
     prediction_service_client_v1beta1,
     schedule_service_client_v1beta1,
     tensorboard_service_client_v1beta1,
@@ -56,16 +64,22 @@ from google.cloud.aiplatform.compat.services import (
 )
 from google.cloud.aiplatform.compat.services import (
     dataset_service_client_v1,
+    endpoint_service_async_client_v1,
     endpoint_service_client_v1,
     featurestore_online_serving_service_client_v1,
+    featurestore_service_async_client_v1,
     featurestore_service_client_v1,
     index_service_client_v1,
     index_endpoint_service_client_v1,
+    job_service_async_client_v1,
     job_service_client_v1,
     metadata_service_client_v1,
     model_garden_service_client_v1,
+    model_service_async_client_v1,
     model_service_client_v1,
+    pipeline_service_async_client_v1,
     pipeline_service_client_v1,
+    prediction_service_async_client_v1,
     prediction_service_client_v1,
     tensorboard_service_client_v1,
     vizier_service_client_v1,
@@ -80,14 +94,20 @@ VertexAiServiceClient = TypeVar(
     # v1beta1
     dataset_service_client_v1beta1.DatasetServiceClient,
     deployment_resource_pool_service_client_v1beta1.DeploymentResourcePoolServiceClient,
+    endpoint_service_async_client_v1beta1.EndpointServiceAsyncClient,
     endpoint_service_client_v1beta1.EndpointServiceClient,
     featurestore_online_serving_service_client_v1beta1.FeaturestoreOnlineServingServiceClient,
+    featurestore_service_async_client_v1beta1.FeaturestoreServiceAsyncClient,
     featurestore_service_client_v1beta1.FeaturestoreServiceClient,
     index_service_client_v1beta1.IndexServiceClient,
     index_endpoint_service_client_v1beta1.IndexEndpointServiceClient,
+    model_service_async_client_v1beta1.ModelServiceAsyncClient,
     model_service_client_v1beta1.ModelServiceClient,
     prediction_service_client_v1beta1.PredictionServiceClient,
+    prediction_service_async_client_v1beta1.PredictionServiceAsyncClient,
+    pipeline_service_async_client_v1beta1.PipelineServiceAsyncClient,
     pipeline_service_client_v1beta1.PipelineServiceClient,
+    job_service_async_client_v1beta1.JobServiceAsyncClient,
     job_service_client_v1beta1.JobServiceClient,
     match_service_client_v1beta1.MatchServiceClient,
     metadata_service_client_v1beta1.MetadataServiceClient,
@@ -96,13 +116,19 @@ VertexAiServiceClient = TypeVar(
     vizier_service_client_v1beta1.VizierServiceClient,
     # v1
     dataset_service_client_v1.DatasetServiceClient,
+    endpoint_service_async_client_v1.EndpointServiceAsyncClient,
     endpoint_service_client_v1.EndpointServiceClient,
     featurestore_online_serving_service_client_v1.FeaturestoreOnlineServingServiceClient,
+    featurestore_service_async_client_v1.FeaturestoreServiceAsyncClient,
     featurestore_service_client_v1.FeaturestoreServiceClient,
     metadata_service_client_v1.MetadataServiceClient,
+    model_service_async_client_v1.ModelServiceAsyncClient,
     model_service_client_v1.ModelServiceClient,
     prediction_service_client_v1.PredictionServiceClient,
+    prediction_service_async_client_v1.PredictionServiceAsyncClient,
+    pipeline_service_async_client_v1.PipelineServiceAsyncClient,
     pipeline_service_client_v1.PipelineServiceClient,
+    job_service_async_client_v1.JobServiceAsyncClient,
     job_service_client_v1.JobServiceClient,
     tensorboard_service_client_v1.TensorboardServiceClient,
     vizier_service_client_v1.VizierServiceClient,
@@ -362,10 +388,38 @@ def extract_project_and_location_from_parent(
     return parent_resources.groupdict() if parent_resources else {}
 
 
+class _LazyClientDict(dict):
+    """Dict of clients by version, creating each client on first access."""
+
+    def __init__(self, client_factory: Callable[[str], Any]):
+        """Initializes the empty dict.
+
+        Args:
+            client_factory (Callable[[str], Any]):
+                Required. Creates the client of a version. Raises a KeyError for
+                unknown versions.
+        """
+        super().__init__()
+        self._client_factory = client_factory
+        self._lock = threading.Lock()
+
+    def __missing__(self, version: str) -> Any:
+        with self._lock:
+            if not super().__contains__(version):
+                super().__setitem__(version, self._client_factory(version))
+            return super().__getitem__(version)
+
+
 class ClientWithOverride:
     class WrappedClient:
         """Wrapper class for client that creates client at API invocation
-        time."""
+        time.
+
+        The client is created on the first API invocation and reused by the
+        following ones. If the wrapper has an idle timeout, a client left unused
+        for longer than the timeout is released and a new one is created on the
+        next API invocation.
+        """
 
         def __init__(
             self,
@@ -373,6 +427,7 @@ class ClientWithOverride:
             client_options: client_options.ClientOptions,
             client_info: gapic_v1.client_info.ClientInfo,
             credentials: Optional[auth_credentials.Credentials] = None,
+            idle_timeout: Optional[float] = None,
         ):
             """Stores parameters needed to instantiate client.
 
@@ -385,27 +440,66 @@ class ClientWithOverride:
                     Required. Client info to pass to client.
                 credentials (auth_credentials.credentials):
                     Optional. Client credentials to pass to client.
+                idle_timeout (float):
+                    Optional. Seconds after the last API invocation after which
+                    the client is released. By default the client is kept for
+                    the lifetime of the wrapper.
             """
 
             self._client_class = client_class
             self._credentials = credentials
             self._client_options = client_options
             self._client_info = client_info
+            self._idle_timeout = idle_timeout
+            self._client = None
+            self._last_used = 0.0
+            self._lock = threading.Lock()
+
+        def _get_client(self) -> VertexAiServiceClient:
+            """Returns the client, instantiating it if needed."""
+            with self._lock:
+                now = time.monotonic()
+                if (
+                    self._client is not None
+                    and self._idle_timeout is not None
+                    and now - self._last_used > self._idle_timeout
+                ):
+                    # The released client is not closed, operations and bound
+                    # methods obtained from it may still be in use. Its channel
+                    # is closed once it is garbage collected.
+                    self._client = None
+                if self._client is None:
+                    self._client = self._client_class(
+                        credentials=self._credentials,
+                        client_options=self._client_options,
+                        client_info=self._client_info,
+                    )
+                self._last_used = now
+                return self._client
 
         def __getattr__(self, name: str) -> Any:
             """Instantiates client and returns attribute of the client."""
-            temporary_client = self._client_class(
-                credentials=self._credentials,
-                client_options=self._client_options,
-                client_info=self._client_info,
-            )
-            return getattr(temporary_client, name)
+            return getattr(self._get_client(), name)
+
+        def close(self):
+            """Closes the transport of the client, if it was instantiated."""
+            with self._lock:
+                client, self._client = self._client, None
+            if client is not None:
+                client.transport.close()
 
     @property
     @abc.abstractmethod
     def _is_temporary(self) -> bool:
         pass
 
+    # Whether initializer.global_config.create_client may share the client.
+    _is_cacheable = True
+
+    # Seconds after which the unused client of a WrappedClient is released, so
+    # that temporary clients do not live for the lifetime of the process.
+    _wrapped_client_idle_timeout: Optional[float] = 60.0
+
     @property
     @classmethod
     @abc.abstractmethod
@@ -433,6 +527,7 @@ class ClientWithOverride:
         client_options: client_options.ClientOptions,
         client_info: gapic_v1.client_info.ClientInfo,
         credentials: Optional[auth_credentials.Credentials] = None,
+        wrapped_client_idle_timeout: Optional[float] = None,
     ):
         """Stores parameters needed to instantiate client.
 
@@ -443,23 +538,35 @@ class ClientWithOverride:
                 Required. Client info to pass to client.
             credentials (auth_credentials.credentials):
                 Optional. Client credentials to pass to client.
+            wrapped_client_idle_timeout (float):
+                Optional. For temporary clients, seconds after the last API
+                invocation after which the client is released and a new one
+                is created on the next invocation. Defaults to 60 seconds. Set
+                to math.inf to keep the client for the lifetime of the wrapper.
         """
 
-        self._clients = {
-            version: self.WrappedClient(
-                client_class=client_class,
+        client_classes = dict(self._version_map)
+        if wrapped_client_idle_timeout is None:
+            wrapped_client_idle_timeout = self._wrapped_client_idle_timeout
+
+        def _create_client(version: str) -> VertexAiServiceClient:
+            client_class = client_classes[version]
+            if self._is_temporary:
+                return self.WrappedClient(
+                    client_class=client_class,
+                    client_options=client_options,
+                    client_info=client_info,
+                    credentials=credentials,
+                    idle_timeout=wrapped_client_idle_timeout,
+                )
+            return client_class(
                 client_options=client_options,
                 client_info=client_info,
                 credentials=credentials,
             )
-            if self._is_temporary
-            else client_class(
-                client_options=client_options,
-                client_info=client_info,
-                credentials=credentials,
-            )
-            for version, client_class in self._version_map
-        }
+
+        # Clients of the other versions are only instantiated when selected.
+        self._clients = _LazyClientDict(_create_client)
 
     def __getattr__(self, name: str) -> Any:
         """Instantiates client and returns attribute of the client."""
@@ -468,6 +575,14 @@ class ClientWithOverride:
     def select_version(self, version: str) -> VertexAiServiceClient:
         return self._clients[version]
 
+    def close(self):
+        """Closes the transports of the instantiated clients."""
+        for client in list(self._clients.values()):
+            if self._is_temporary:
+                client.close()
+            else:
+                client.transport.close()
+
     @classmethod
     def get_gapic_client_class(
         cls, version: Optional[str] = None
@@ -612,6 +727,85 @@ class PredictionClientWithOverride(ClientWithOverride):
     )
 
 
+class _AsyncClientWithOverride(ClientWithOverride):
+    """Base class of the overrides of GAPIC async clients."""
+
+    _is_temporary = False
+    # grpc.aio channels are bound to the event loop they are created on.
+    _is_cacheable = False
+
+    async def close(self):
+        """Closes the transports of the instantiated clients."""
+        for client in list(self._clients.values()):
+            await client.transport.close()
+
+
+class EndpointAsyncClientWithOverride(_AsyncClientWithOverride):
+    _default_version = compat.DEFAULT_VERSION
+    _version_map = (
+        (compat.V1, endpoint_service_async_client_v1.EndpointServiceAsyncClient),
+        (
+            compat.V1BETA1,
+            endpoint_service_async_client_v1beta1.EndpointServiceAsyncClient,
+        ),
+    )
+
+
+class FeaturestoreAsyncClientWithOverride(_AsyncClientWithOverride):
+    _default_version = compat.DEFAULT_VERSION
+    _version_map = (
+        (
+            compat.V1,
+            featurestore_service_async_client_v1.FeaturestoreServiceAsyncClient,
+        ),
+        (
+            compat.V1BETA1,
+            featurestore_service_async_client_v1beta1.FeaturestoreServiceAsyncClient,
+        ),
+    )
+
+
+class JobAsyncClientWithOverride(_AsyncClientWithOverride):
+    _default_version = compat.DEFAULT_VERSION
+    _version_map = (
+        (compat.V1, job_service_async_client_v1.JobServiceAsyncClient),
+        (compat.V1BETA1, job_service_async_client_v1beta1.JobServiceAsyncClient),
+    )
+
+
+class ModelAsyncClientWithOverride(_AsyncClientWithOverride):
+    _default_version = compat.DEFAULT_VERSION
+    _version_map = (
+        (compat.V1, model_service_async_client_v1.ModelServiceAsyncClient),
+        (compat.V1BETA1, model_service_async_client_v1beta1.ModelServiceAsyncClient),
+    )
+
+
+class PipelineJobAsyncClientWithOverride(_AsyncClientWithOverride):
+    _default_version = compat.DEFAULT_VERSION
+    _version_map = (
+        (compat.V1, pipeline_service_async_client_v1.PipelineServiceAsyncClient),
+        (
+            compat.V1BETA1,
+            pipeline_service_async_client_v1beta1.PipelineServiceAsyncClient,
+        ),
+    )
+
+
+class PredictionAsyncClientWithOverride(_AsyncClientWithOverride):
+    _default_version = compat.DEFAULT_VERSION
+    _version_map = (
+        (
+            compat.V1,
+            prediction_service_async_client_v1.PredictionServiceAsyncClient,
+        ),
+        (
+            compat.V1BETA1,
+            prediction_service_async_client_v1beta1.PredictionServiceAsyncClient,
+        ),
+    )
+
+
 class MatchClientWithOverride(ClientWithOverride):
     _is_temporary = False
     _default_version = compat.V1BETA1
@@ -665,6 +859,12 @@ VertexAiServiceClientWithOverride = TypeVar(
     PipelineClientWithOverride,
     PipelineJobClientWithOverride,
     PredictionClientWithOverride,
+    PredictionAsyncClientWithOverride,
+    EndpointAsyncClientWithOverride,
+    FeaturestoreAsyncClientWithOverride,
+    JobAsyncClientWithOverride,
+    ModelAsyncClientWithOverride,
+    PipelineJobAsyncClientWithOverride,
     MetadataClientWithOverride,
     ScheduleClientWithOverride,
     TensorboardClientWithOverride,
@@ -15,12 +15,16 @@
 # limitations under the License.
 #
 
+import collections
 import re
-from typing import Dict, NamedTuple, Optional
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
 
 from google.cloud.aiplatform.compat.services import featurestore_service_client
 from google.cloud.aiplatform.compat.types import (
     feature as gca_feature,
+    featurestore_online_service as gca_featurestore_online_service,
     featurestore_service as gca_featurestore_service,
 )
 from google.cloud.aiplatform import utils
@@ -175,3 +179,114 @@ class _FeatureConfig(NamedTuple):
         )
 
         return create_feature_request
+
+
+class FeatureValueCache:
+    """Thread-safe, size-bounded cache of online feature values that expire
+    after a time to live.
+
+    Values are cached per (entity ID, feature ID) pair, as the
+    ReadFeatureValuesResponse.EntityView.Data read for the pair, which holds the
+    feature value along with its generate_time. When the cache is full, the
+    least recently used pair is evicted.
+
+    Attributes:
+        hits (int): The number of pairs served from the cache.
+        misses (int): The number of pairs not in the cache, or expired.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """Creates an empty cache.
+
+        Args:
+            max_size (int):
+                Required. The maximum number of cached (entity ID, feature ID)
+                pairs.
+            ttl (float):
+                Required. The number of seconds a cached value is served for.
+
+        Raises:
+            ValueError: If max_size or ttl is not positive.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive.")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_many(
+        self, keys: Iterable[Tuple[str, str]]
+    ) -> Dict[
+        Tuple[str, str],
+        gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data,
+    ]:
+        """Returns the unexpired cached values of the given pairs.
+
+        Args:
+            keys (Iterable[Tuple[str, str]]):
+                Required. The (entity ID, feature ID) pairs to look up.
+
+        Returns:
+            Dict[Tuple[str, str], EntityView.Data] - The cached value of every
+            pair found in the cache.
+        """
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    found[key] = entry[1]
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self._entries[key]
+                    self.misses += 1
+        return found
+
+    def put_many(
+        self,
+        values: Dict[
+            Tuple[str, str],
+            gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data,
+        ],
+    ) -> None:
+        """Caches the values of (entity ID, feature ID) pairs.
+
+        Args:
+            values (Dict[Tuple[str, str], EntityView.Data]):
+                Required. The values to cache, by (entity ID, feature ID) pair.
+        """
+        expire_time = time.monotonic() + self._ttl
+        with self._lock:
+            for key, value in values.items():
+                self._entries[key] = (expire_time, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[Tuple[str, str]]) -> None:
+        """Removes the given (entity ID, feature ID) pairs from the cache.
+
+        Args:
+            keys (Iterable[Tuple[str, str]]):
+                Required. The pairs to remove. Pairs not in the cache are ignored.
+        """
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all the values from the cache."""
+        with self._lock:
+            self._entries.clear()
@@ -94,39 +94,27 @@ def upload_to_gcs(
         destination_blob.upload_from_filename(filename=source_file_path)
 
 
-def stage_local_data_in_gcs(
-    data_path: str,
+def get_staging_gcs_dir(
     staging_gcs_dir: Optional[str] = None,
     project: Optional[str] = None,
     location: Optional[str] = None,
     credentials: Optional[auth_credentials.Credentials] = None,
 ) -> str:
-    """Stages a local data in GCS.
-
-    The file copied to GCS is the name of the local file prepended with an
-    "aiplatform-{timestamp}-" string.
+    """Gets the Google Cloud Storage directory to stage data in.
 
     Args:
-        data_path: Required. Path of the local data to copy to GCS.
         staging_gcs_dir:
             Optional. Google Cloud Storage bucket to be used for data staging.
+            If not provided, the staging bucket set in aiplatform.init is used,
+            or else a regional staging bucket is created if it does not exist.
         project: Optional. Google Cloud Project that contains the staging bucket.
         location: Optional. Google Cloud location to use for the staging bucket.
         credentials: The custom credentials to use when making API calls.
             If not provided, default credentials will be used.
 
     Returns:
-        Google Cloud Storage URI of the staged data.
-
-    Raises:
-        RuntimeError: When source_path does not exist.
-        GoogleCloudError: When the upload process fails.
+        Google Cloud Storage URI of the staging directory.
     """
-    data_path_obj = pathlib.Path(data_path)
-
-    if not data_path_obj.exists():
-        raise RuntimeError(f"Local data does not exist: data_path='{data_path}'")
-
     staging_gcs_dir = staging_gcs_dir or initializer.global_config.staging_bucket
     if not staging_gcs_dir:
         project = project or initializer.global_config.project
@@ -149,6 +137,48 @@ def stage_local_data_in_gcs(
                 location=location,
             )
         staging_gcs_dir = "gs://" + staging_bucket_name
+    return staging_gcs_dir
+
+
+def stage_local_data_in_gcs(
+    data_path: str,
+    staging_gcs_dir: Optional[str] = None,
+    project: Optional[str] = None,
+    location: Optional[str] = None,
+    credentials: Optional[auth_credentials.Credentials] = None,
+) -> str:
+    """Stages a local data in GCS.
+
+    The file copied to GCS is the name of the local file prepended with an
+    "aiplatform-{timestamp}-" string.
+
+    Args:
+        data_path: Required. Path of the local data to copy to GCS.
+        staging_gcs_dir:
+            Optional. Google Cloud Storage bucket to be used for data staging.
+        project: Optional. Google Cloud Project that contains the staging bucket.
+        location: Optional. Google Cloud location to use for the staging bucket.
+        credentials: The custom credentials to use when making API calls.
+            If not provided, default credentials will be used.
+
+    Returns:
+        Google Cloud Storage URI of the staged data.
+
+    Raises:
+        RuntimeError: When source_path does not exist.
+        GoogleCloudError: When the upload process fails.
+    """
+    data_path_obj = pathlib.Path(data_path)
+
+    if not data_path_obj.exists():
+        raise RuntimeError(f"Local data does not exist: data_path='{data_path}'")
+
+    staging_gcs_dir = get_staging_gcs_dir(
+        staging_gcs_dir=staging_gcs_dir,
+        project=project,
+        location=location,
+        credentials=credentials,
+    )
 
     timestamp = datetime.datetime.now().isoformat(sep="-", timespec="milliseconds")
     staging_gcs_subdir = (
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import importlib.util
+from typing import Dict, NamedTuple, Optional
+
+from google.auth import credentials as auth_credentials
+from google.auth.transport import requests as google_auth_requests
+
+
+class HttpTransportConfig(NamedTuple):
+    """Connection pool settings of the HTTP transports used for predictions.
+
+    Attributes:
+        max_connections:
+            The maximum number of connections kept per host. Requests beyond it wait
+            for a free connection.
+        max_keepalive_connections:
+            The maximum number of idle connections kept alive by async clients.
+        keepalive_expiry:
+            The time in seconds idle connections of async clients are kept alive.
+        http2:
+            Whether async clients negotiate HTTP/2 when the server and the installed
+            ``h2`` package support it.
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    http2: bool = True
+
+
+def create_authorized_session(
+    credentials: auth_credentials.Credentials,
+    config: HttpTransportConfig,
+) -> google_auth_requests.AuthorizedSession:
+    """Creates an authorized requests session with a connection pool of the given size.
+
+    Args:
+        credentials (auth_credentials.Credentials):
+            Required. The credentials authorizing the requests.
+        config (HttpTransportConfig):
+            Required. The connection pool settings.
+
+    Returns:
+        The authorized session.
+    """
+    import requests
+
+    session = google_auth_requests.AuthorizedSession(credentials)
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=config.max_connections,
+        pool_maxsize=config.max_connections,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_pool_manager(
+    config: HttpTransportConfig,
+) -> "urllib3.PoolManager":  # type: ignore # noqa: F821
+    """Creates a urllib3 pool manager with connection pools of the given size.
+
+    Args:
+        config (HttpTransportConfig):
+            Required. The connection pool settings.
+
+    Returns:
+        The pool manager.
+
+    Raises:
+        ImportError: If there is an issue importing the `urllib3` package.
+    """
+    try:
+        import urllib3
+    except ImportError:
+        raise ImportError(
+            "Cannot import the urllib3 HTTP client. Please install google-cloud-aiplatform[private_endpoints]."
+        )
+
+    return urllib3.PoolManager(maxsize=config.max_connections)
+
+
+def create_async_client(
+    config: HttpTransportConfig,
+) -> "httpx.AsyncClient":  # type: ignore # noqa: F821
+    """Creates an async HTTP client with a connection pool of the given size.
+
+    Args:
+        config (HttpTransportConfig):
+            Required. The connection pool settings.
+
+    Returns:
+        The async HTTP client.
+
+    Raises:
+        ImportError: If there is an issue importing the `httpx` package.
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "Cannot import the httpx HTTP client. Please install google-cloud-aiplatform[endpoint]."
+        )
+
+    return httpx.AsyncClient(
+        http2=config.http2 and importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        timeout=None,
+    )
+
+
+async def get_authorization_headers(
+    credentials: auth_credentials.Credentials,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, str]:
+    """Adds the authorization header of the credentials to the headers.
+
+    Expired credentials are refreshed in the default executor so that the refresh
+    does not block the event loop.
+
+    Args:
+        credentials (auth_credentials.Credentials):
+            Required. The credentials authorizing the request.
+        headers (Dict[str, str]):
+            Optional. The headers of the request.
+
+    Returns:
+        A copy of the headers including the authorization header.
+    """
+    headers = dict(headers or {})
+    if not credentials.valid:
+        await asyncio.get_running_loop().run_in_executor(
+            None, credentials.refresh, google_auth_requests.Request()
+        )
+    credentials.apply(headers)
+    return headers
@@ -15,13 +15,19 @@
 # limitations under the License.
 #
 
+import base64
+from concurrent import futures
 import distutils.dir_util
+import functools
+import hashlib
 import inspect
 import logging
 import os
 from pathlib import Path
 import re
-from typing import Any, Optional, Sequence, Tuple, Type
+import shutil
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Type
+import uuid
 
 from google.cloud import storage
 from google.cloud.aiplatform.constants import prediction
@@ -33,6 +39,15 @@ _logger = logging.getLogger(__name__)
 REGISTRY_REGEX = re.compile(r"^([\w\-]+\-docker\.pkg\.dev|([\w]+\.|)gcr\.io)")
 GCS_URI_PREFIX = "gs://"
 
+# Environment variables configuring download_model_artifacts.
+MODEL_CACHE_DIR_ENV = "VERTEX_CPR_MODEL_CACHE_DIR"
+DOWNLOAD_WORKERS_ENV = "VERTEX_CPR_DOWNLOAD_WORKERS"
+
+_DEFAULT_DOWNLOAD_WORKERS = 8
+# Files larger than this are downloaded as concurrent ranged reads of this size.
+_DEFAULT_DOWNLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+_PARTIAL_DOWNLOAD_SUFFIX = ".partial"
+
 
 def inspect_source_from_class(
     custom_class: Type[Any],
@@ -118,17 +133,35 @@ def get_prediction_aip_http_port(
     )
 
 
-def download_model_artifacts(artifact_uri: str) -> None:
+def download_model_artifacts(
+    artifact_uri: str,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    chunk_size: int = _DEFAULT_DOWNLOAD_CHUNK_SIZE,
+) -> None:
     """Prepares model artifacts in the current working directory.
 
     If artifact_uri is a GCS uri, the model artifacts will be downloaded to the current
-    working directory.
+    working directory. Files are downloaded concurrently, and files larger than
+    chunk_size are downloaded as concurrent ranged reads.
+    If a cache directory is given, downloaded files are stored in it keyed by their
+    content hash and linked into the current working directory, so that restarted
+    model servers sharing the directory skip files that are already present.
     If artifact_uri is a local directory, the model artifacts will be copied to the current
     working directory.
 
     Args:
         artifact_uri (str):
             Required. The artifact uri that includes model artifacts.
+        max_workers (int):
+            Optional. The number of concurrent downloads. Defaults to the environment
+            variable VERTEX_CPR_DOWNLOAD_WORKERS, or 8 if it is unset.
+        cache_dir (str):
+            Optional. The local directory caching downloaded files. Defaults to the
+            environment variable VERTEX_CPR_MODEL_CACHE_DIR. No cache is used if both
+            are unset.
+        chunk_size (int):
+            Optional. The size in bytes of the ranged reads of large files.
     """
     if artifact_uri.startswith(GCS_URI_PREFIX):
         matches = re.match(f"{GCS_URI_PREFIX}(.*?)/(.*)", artifact_uri)
@@ -136,6 +169,7 @@ def download_model_artifacts(artifact_uri: str) -> None:
 
         gcs_client = storage.Client()
         blobs = gcs_client.list_blobs(bucket_name, prefix=prefix)
+        downloads = []
         for blob in blobs:
             name_without_prefix = blob.name[len(prefix) :]
             name_without_prefix = (
@@ -147,7 +181,205 @@ def download_model_artifacts(artifact_uri: str) -> None:
             directory = "/".join(file_split[0:-1])
             Path(directory).mkdir(parents=True, exist_ok=True)
             if name_without_prefix and not name_without_prefix.endswith("/"):
-                blob.download_to_filename(name_without_prefix)
+                downloads.append((blob, name_without_prefix))
+
+        if max_workers is None:
+            max_workers = int(
+                os.getenv(DOWNLOAD_WORKERS_ENV, str(_DEFAULT_DOWNLOAD_WORKERS))
+            )
+        cache_dir = cache_dir or os.getenv(MODEL_CACHE_DIR_ENV)
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        _download_blobs(downloads, max_workers, cache_dir, chunk_size)
     else:
         # Copy files to the current working directory.
         distutils.dir_util.copy_tree(artifact_uri, ".")
+
+
+def _download_blobs(
+    downloads: List[Tuple[storage.Blob, str]],
+    max_workers: int,
+    cache_dir: Optional[str],
+    chunk_size: int,
+) -> None:
+    """Downloads blobs to local files concurrently.
+
+    Args:
+        downloads (List[Tuple[storage.Blob, str]]):
+            Required. The blobs and the local file paths to download them to.
+        max_workers (int):
+            Required. The number of concurrent downloads.
+        cache_dir (str):
+            Optional. The local directory caching downloaded files.
+        chunk_size (int):
+            Required. The size in bytes of the ranged reads of large files.
+    """
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # The download futures of each file, the partial file they write to, if
+        # any, and the callable completing the file once all of them are done.
+        pending_files: List[
+            Tuple[List[futures.Future], Optional[str], Optional[Callable]]
+        ] = []
+        for blob, destination in downloads:
+            target = destination
+            if cache_dir:
+                target = _get_cache_path(cache_dir, blob)
+                if os.path.exists(target):
+                    _logger.info(f"Using cached {blob.name} from {target}.")
+                    _link_or_copy(target, destination)
+                    continue
+
+            if target == destination and (blob.size or 0) <= chunk_size:
+                pending_files.append(
+                    (
+                        [executor.submit(blob.download_to_filename, destination)],
+                        None,
+                        None,
+                    )
+                )
+                continue
+
+            partial_path = f"{target}.{uuid.uuid4().hex}{_PARTIAL_DOWNLOAD_SUFFIX}"
+            pending_files.append(
+                (
+                    _submit_blob_download(executor, blob, partial_path, chunk_size),
+                    partial_path,
+                    functools.partial(
+                        _complete_blob_download, blob, partial_path, target, destination
+                    ),
+                )
+            )
+
+        completed_files = 0
+        try:
+            for download_futures, _, complete in pending_files:
+                for download_future in download_futures:
+                    download_future.result()
+                if complete is not None:
+                    complete()
+                completed_files += 1
+        except Exception:
+            # Cancels the downloads not started yet and waits for the running
+            # ones so that none of them writes to a partial file after it is
+            # removed.
+            for download_futures, _, _ in pending_files[completed_files:]:
+                for download_future in download_futures:
+                    download_future.cancel()
+            executor.shutdown(wait=True)
+            for _, partial_path, _ in pending_files[completed_files:]:
+                if partial_path and os.path.exists(partial_path):
+                    os.remove(partial_path)
+            raise
+
+
+def _submit_blob_download(
+    executor: futures.Executor,
+    blob: storage.Blob,
+    path: str,
+    chunk_size: int,
+) -> List[futures.Future]:
+    """Submits the download of a blob, in ranged chunks if it is large.
+
+    Args:
+        executor (futures.Executor):
+            Required. The executor running the downloads.
+        blob (storage.Blob):
+            Required. The blob to download.
+        path (str):
+            Required. The local file path to download the blob to.
+        chunk_size (int):
+            Required. The size in bytes of the ranged reads.
+
+    Returns:
+        The futures of the submitted downloads.
+    """
+    if not blob.size or blob.size <= chunk_size:
+        return [executor.submit(blob.download_to_filename, path)]
+
+    # Preallocates the file so that the chunks can be written in any order.
+    with open(path, "wb") as f:
+        f.truncate(blob.size)
+    return [
+        executor.submit(
+            _download_blob_range,
+            blob,
+            path,
+            start,
+            min(start + chunk_size, blob.size) - 1,
+        )
+        for start in range(0, blob.size, chunk_size)
+    ]
+
+
+def _download_blob_range(blob: storage.Blob, path: str, start: int, end: int) -> None:
+    """Downloads the bytes from start to end, inclusive, of the blob into the file."""
+    data = blob.download_as_bytes(
+        start=start,
+        end=end,
+        checksum=None,
+        if_generation_match=blob.generation,
+    )
+    with open(path, "r+b") as f:
+        f.seek(start)
+        f.write(data)
+
+
+def _complete_blob_download(
+    blob: storage.Blob, partial_path: str, target: str, destination: str
+) -> None:
+    """Verifies and moves a downloaded file into place.
+
+    Args:
+        blob (storage.Blob):
+            Required. The downloaded blob.
+        partial_path (str):
+            Required. The local file the blob was downloaded to.
+        target (str):
+            Required. The final path of the downloaded file, either the
+            destination or a file in the cache directory.
+        destination (str):
+            Required. The path in the current working directory.
+
+    Raises:
+        ValueError: If the CRC32C checksum of the downloaded file does not match
+            the blob's.
+    """
+    if blob.crc32c and _compute_crc32c(partial_path) != blob.crc32c:
+        raise ValueError(f"Checksum mismatch while downloading {blob.name}.")
+    os.replace(partial_path, target)
+    if target != destination:
+        _link_or_copy(target, destination)
+
+
+def _compute_crc32c(path: str) -> str:
+    """Computes the base64-encoded CRC32C checksum of a file, as reported by GCS."""
+    import google_crc32c
+
+    checksum = google_crc32c.Checksum()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            checksum.update(chunk)
+    return base64.b64encode(checksum.digest()).decode("utf-8")
+
+
+def _get_cache_path(cache_dir: str, blob: storage.Blob) -> str:
+    """Gets the content-addressed path of a blob in the cache directory.
+
+    The path is keyed by the MD5 hash of the blob. Composite objects without an MD5
+    hash are keyed by their CRC32C checksum, bucket, name and generation.
+    """
+    if blob.md5_hash:
+        key = f"md5:{blob.md5_hash}"
+    else:
+        key = f"crc32c:{blob.crc32c}:{blob.bucket.name}/{blob.name}#{blob.generation}"
+    return os.path.join(cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    """Hard links the source file to the destination, or copies it if linking fails."""
+    if os.path.lexists(destination):
+        os.remove(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
@@ -0,0 +1,73 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Micro-benchmark of converting a DataFrame to WriteFeatureValuesPayloads.
+
+Compares converting the DataFrame to a dict per row and each cell to a
+FeatureValue, as EntityType.write_feature_values used to do, with the column
+wise conversion of EntityType._generate_payloads_from_df. No RPC is made.
+
+Usage:
+    python scripts/benchmark_feature_values_conversion.py [--rows 10000] [--columns 50]
+"""
+
+import argparse
+import datetime
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from google.cloud.aiplatform.featurestore import _entity_type
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--columns", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    data = {}
+    for i in range(args.columns):
+        if i % 3 == 0:
+            data[f"double_{i}"] = rng.random(args.rows)
+        elif i % 3 == 1:
+            data[f"int_{i}"] = rng.integers(0, 1000, args.rows)
+        else:
+            data[f"string_{i}"] = rng.integers(0, 1000, args.rows).astype(str)
+    df = pd.DataFrame(data, index=[f"entity_{i}" for i in range(args.rows)])
+    df = df.astype({column: object for column in df.columns if "string" in column})
+    df["feature_timestamp"] = datetime.datetime.now(tz=datetime.timezone.utc)
+
+    entity_type_class = _entity_type._EntityType
+
+    def row_wise():
+        return entity_type_class._generate_payloads(
+            instances=df.to_dict(orient="index"), feature_time="feature_timestamp"
+        )
+
+    def column_wise():
+        return entity_type_class._generate_payloads_from_df(
+            df=df, feature_time="feature_timestamp"
+        )
+
+    for name, fn in (("row wise", row_wise), ("column wise", column_wise)):
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"{name:>12}: {seconds:8.2f} s for {args.rows}x{args.columns} values")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Micro-benchmark of the per-call overhead of ClientWithOverride.WrappedClient.
+
+Compares getting a GAPIC method from a client instantiated for every call, as
+WrappedClient used to do, with getting it from a WrappedClient, which reuses its
+client. No RPC is made.
+
+Usage:
+    python scripts/benchmark_wrapped_client.py [--calls 200]
+"""
+
+import argparse
+import timeit
+
+from google.api_core import client_options
+from google.api_core import gapic_v1
+from google.auth import credentials as auth_credentials
+
+from google.cloud.aiplatform import utils
+from google.cloud.aiplatform.compat.services import model_service_client
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    kwargs = {
+        "client_options": client_options.ClientOptions(
+            api_endpoint="us-central1-aiplatform.googleapis.com"
+        ),
+        "client_info": gapic_v1.client_info.ClientInfo(),
+        "credentials": auth_credentials.AnonymousCredentials(),
+    }
+    wrapped_client = utils.ClientWithOverride.WrappedClient(
+        client_class=model_service_client.ModelServiceClient, **kwargs
+    )
+
+    def new_client_per_call():
+        return model_service_client.ModelServiceClient(**kwargs).get_model
+
+    def wrapped_client_call():
+        return wrapped_client.get_model
+
+    for name, fn in (
+        ("new client per call", new_client_per_call),
+        ("WrappedClient", wrapped_client_call),
+    ):
+        seconds = min(timeit.repeat(fn, number=args.calls, repeat=3))
+        print(f"{name:>20}: {seconds / args.calls * 1e6:10.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -74,13 +74,18 @@ prediction_extra_require = [
     # TODO: remove the upper bound after a new version is released.
     #   See https://github.com/tiangolo/fastapi/pull/4488.
     "fastapi >= 0.71.0, <0.76.0",
+    "msgpack",
     "starlette >= 0.17.1",
     "uvicorn[standard] >= 0.16.0",
 ]
 
-endpoint_extra_require = ["requests >= 2.28.1"]
+endpoint_extra_require = ["requests >= 2.28.1", "httpx >= 0.23.0"]
 
-private_endpoints_extra_require = ["urllib3 >=1.21.1, <1.27", "requests >= 2.28.1"]
+private_endpoints_extra_require = [
+    "urllib3 >=1.21.1, <1.27",
+    "requests >= 2.28.1",
+    "httpx >= 0.23.0",
+]
 
 autologging_extra_require = ["mlflow>=1.27.0,<=2.1.1"]
 
@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from datetime import datetime, timedelta
+from importlib import reload
+from unittest import mock
+
+import pytest
+
+from google.cloud import aiplatform
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import models
+from google.cloud.aiplatform.aio import base as aio_base
+from google.cloud.aiplatform.compat.services import (
+    endpoint_service_async_client,
+    featurestore_service_async_client,
+    job_service_async_client,
+    prediction_service_async_client,
+)
+from google.cloud.aiplatform.compat.types import (
+    batch_prediction_job as gca_batch_prediction_job,
+    endpoint as gca_endpoint,
+    entity_type as gca_entity_type,
+    featurestore as gca_featurestore,
+    job_state as gca_job_state,
+    prediction_service as gca_prediction_service,
+)
+from google.rpc import code_pb2, status_pb2
+
+import constants as test_constants
+
+_TEST_PROJECT = test_constants.ProjectConstants._TEST_PROJECT
+_TEST_LOCATION = test_constants.ProjectConstants._TEST_LOCATION
+_TEST_PARENT = test_constants.ProjectConstants._TEST_PARENT
+
+_TEST_ENDPOINT_ID = "1028944691210842416"
+_TEST_ENDPOINT_NAME = f"{_TEST_PARENT}/endpoints/{_TEST_ENDPOINT_ID}"
+_TEST_ENDPOINT_DISPLAY_NAME = "test-endpoint"
+_TEST_MODEL_NAME = f"{_TEST_PARENT}/models/123"
+_TEST_BATCH_PREDICTION_JOB_NAME = f"{_TEST_PARENT}/batchPredictionJobs/456"
+_TEST_FEATURESTORE_ID = "featurestore_id"
+_TEST_FEATURESTORE_NAME = f"{_TEST_PARENT}/featurestores/{_TEST_FEATURESTORE_ID}"
+_TEST_ENTITY_TYPE_NAME = f"{_TEST_FEATURESTORE_NAME}/entityTypes/entity_type_id"
+
+_TEST_INSTANCES = [[1.0, 2.0, 3.0], [1.0, 3.0, 4.0]]
+_TEST_PREDICTION = [[1.0, 2.0, 3.0], [3.0, 3.0, 1.0]]
+_TEST_GCS_SOURCE = "gs://example-bucket/folder/instance.jsonl"
+_TEST_GCS_DESTINATION_PREFIX = "gs://example-bucket/folder/output"
+
+_TEST_ERROR = status_pb2.Status(code=code_pb2.INTERNAL, message="internal error")
+
+
+class _AsyncPager:
+    """Async iterable standing in for the pager of a GAPIC async list method."""
+
+    def __init__(self, items):
+        self._items = items
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for item in self._items:
+            yield item
+
+
+def _make_lro(result):
+    lro = mock.Mock()
+    lro.operation.name = "operations/1"
+    lro.result = mock.AsyncMock(return_value=result)
+    return lro
+
+
+@pytest.fixture
+def get_endpoint_async_mock():
+    with mock.patch.object(
+        endpoint_service_async_client.EndpointServiceAsyncClient,
+        "get_endpoint",
+        new_callable=mock.AsyncMock,
+    ) as get_endpoint_mock:
+        get_endpoint_mock.return_value = gca_endpoint.Endpoint(
+            name=_TEST_ENDPOINT_NAME,
+            display_name=_TEST_ENDPOINT_DISPLAY_NAME,
+            create_time=datetime(2023, 1, 1),
+        )
+        yield get_endpoint_mock
+
+
+@pytest.fixture
+def list_endpoints_async_mock():
+    with mock.patch.object(
+        endpoint_service_async_client.EndpointServiceAsyncClient,
+        "list_endpoints",
+        new_callable=mock.AsyncMock,
+    ) as list_endpoints_mock:
+        create_time = datetime(2023, 1, 1)
+        list_endpoints_mock.return_value = _AsyncPager(
+            [
+                gca_endpoint.Endpoint(
+                    name=f"{_TEST_PARENT}/endpoints/1",
+                    display_name="b",
+                    create_time=create_time,
+                ),
+                gca_endpoint.Endpoint(
+                    name=f"{_TEST_PARENT}/endpoints/2",
+                    display_name="private",
+                    create_time=create_time,
+                    network="projects/123/global/networks/my-vpc",
+                ),
+                gca_endpoint.Endpoint(
+                    name=f"{_TEST_PARENT}/endpoints/3",
+                    display_name="a",
+                    create_time=create_time + timedelta(minutes=5),
+                ),
+            ]
+        )
+        yield list_endpoints_mock
+
+
+@pytest.fixture
+def create_endpoint_async_mock():
+    with mock.patch.object(
+        endpoint_service_async_client.EndpointServiceAsyncClient,
+        "create_endpoint",
+        new_callable=mock.AsyncMock,
+    ) as create_endpoint_mock:
+        create_endpoint_mock.return_value = _make_lro(
+            gca_endpoint.Endpoint(
+                name=_TEST_ENDPOINT_NAME, display_name=_TEST_ENDPOINT_DISPLAY_NAME
+            )
+        )
+        yield create_endpoint_mock
+
+
+@pytest.fixture
+def predict_async_mock():
+    with mock.patch.object(
+        prediction_service_async_client.PredictionServiceAsyncClient,
+        "predict",
+        new_callable=mock.AsyncMock,
+    ) as predict_mock:
+        predict_mock.return_value = gca_prediction_service.PredictResponse(
+            deployed_model_id="789", model=_TEST_MODEL_NAME
+        )
+        predict_mock.return_value.predictions.extend(_TEST_PREDICTION)
+        yield predict_mock
+
+
+@pytest.fixture
+def create_batch_prediction_job_async_mock():
+    with mock.patch.object(
+        job_service_async_client.JobServiceAsyncClient,
+        "create_batch_prediction_job",
+        new_callable=mock.AsyncMock,
+    ) as create_batch_prediction_job_mock:
+        create_batch_prediction_job_mock.return_value = (
+            gca_batch_prediction_job.BatchPredictionJob(
+                name=_TEST_BATCH_PREDICTION_JOB_NAME,
+                state=gca_job_state.JobState.JOB_STATE_PENDING,
+            )
+        )
+        yield create_batch_prediction_job_mock
+
+
+@pytest.fixture
+def get_batch_prediction_job_async_mock():
+    with mock.patch.object(
+        job_service_async_client.JobServiceAsyncClient,
+        "get_batch_prediction_job",
+        new_callable=mock.AsyncMock,
+    ) as get_batch_prediction_job_mock:
+        yield get_batch_prediction_job_mock
+
+
+@pytest.fixture
+def sleep_mock():
+    with mock.patch.object(
+        aio_base.asyncio, "sleep", new_callable=mock.AsyncMock
+    ) as sleep_mock:
+        yield sleep_mock
+
+
+def _set_batch_prediction_job_states(get_batch_prediction_job_mock, states, error=None):
+    get_batch_prediction_job_mock.side_effect = [
+        gca_batch_prediction_job.BatchPredictionJob(
+            name=_TEST_BATCH_PREDICTION_JOB_NAME, state=state, error=error
+        )
+        for state in states
+    ]
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+class TestAio:
+    def setup_method(self):
+        reload(initializer)
+        reload(aiplatform)
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+
+    def teardown_method(self):
+        initializer.global_pool.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_endpoint_get(self, get_endpoint_async_mock):
+        endpoint = await aiplatform.aio.Endpoint.get(_TEST_ENDPOINT_ID)
+
+        get_endpoint_async_mock.assert_awaited_once_with(name=_TEST_ENDPOINT_NAME)
+        assert isinstance(endpoint, aiplatform.aio.Endpoint)
+        assert endpoint.resource_name == _TEST_ENDPOINT_NAME
+        assert endpoint.display_name == _TEST_ENDPOINT_DISPLAY_NAME
+        assert endpoint.project == _TEST_PROJECT
+        assert endpoint.location == _TEST_LOCATION
+
+    @pytest.mark.asyncio
+    async def test_endpoint_list_filters_and_orders_locally(
+        self, list_endpoints_async_mock
+    ):
+        endpoints = await aiplatform.aio.Endpoint.list(order_by="display_name")
+
+        list_endpoints_async_mock.assert_awaited_once_with(
+            request={"parent": _TEST_PARENT}
+        )
+        assert [endpoint.display_name for endpoint in endpoints] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_endpoint_create(self, create_endpoint_async_mock):
+        endpoint = await aiplatform.aio.Endpoint.create(
+            display_name=_TEST_ENDPOINT_DISPLAY_NAME
+        )
+
+        create_endpoint_async_mock.assert_awaited_once_with(
+            parent=_TEST_PARENT,
+            endpoint=gca_endpoint.Endpoint(display_name=_TEST_ENDPOINT_DISPLAY_NAME),
+            endpoint_id=None,
+            metadata=(),
+            timeout=None,
+        )
+        assert endpoint.resource_name == _TEST_ENDPOINT_NAME
+
+    @pytest.mark.asyncio
+    async def test_endpoint_predict(self, get_endpoint_async_mock, predict_async_mock):
+        endpoint = await aiplatform.aio.Endpoint.get(_TEST_ENDPOINT_NAME)
+
+        prediction = await endpoint.predict(
+            instances=_TEST_INSTANCES, parameters={"param": 3.0}, timeout=10.0
+        )
+
+        assert prediction == models.Prediction(
+            predictions=_TEST_PREDICTION,
+            deployed_model_id="789",
+            model_version_id="",
+            model_resource_name=_TEST_MODEL_NAME,
+        )
+        predict_async_mock.assert_awaited_once_with(
+            endpoint=_TEST_ENDPOINT_NAME,
+            instances=_TEST_INSTANCES,
+            parameters={"param": 3.0},
+            timeout=10.0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_endpoint_to_sync(self, get_endpoint_async_mock):
+        endpoint = await aiplatform.aio.Endpoint.get(_TEST_ENDPOINT_ID)
+
+        sync_endpoint = endpoint.to_sync()
+
+        assert isinstance(sync_endpoint, aiplatform.Endpoint)
+        assert sync_endpoint.resource_name == _TEST_ENDPOINT_NAME
+
+    @pytest.mark.asyncio
+    async def test_batch_prediction_job_create_and_wait(
+        self,
+        create_batch_prediction_job_async_mock,
+        get_batch_prediction_job_async_mock,
+        sleep_mock,
+    ):
+        _set_batch_prediction_job_states(
+            get_batch_prediction_job_async_mock,
+            [
+                gca_job_state.JobState.JOB_STATE_RUNNING,
+                gca_job_state.JobState.JOB_STATE_RUNNING,
+                gca_job_state.JobState.JOB_STATE_SUCCEEDED,
+            ],
+        )
+
+        job = await aiplatform.aio.BatchPredictionJob.create(
+            job_display_name="test-job",
+            model_name="123",
+            gcs_source=_TEST_GCS_SOURCE,
+            gcs_destination_prefix=_TEST_GCS_DESTINATION_PREFIX,
+        )
+        assert not job.done()
+
+        await job.wait()
+
+        gapic_batch_prediction_job = create_batch_prediction_job_async_mock.call_args[
+            1
+        ]["batch_prediction_job"]
+        assert gapic_batch_prediction_job.model == _TEST_MODEL_NAME
+        assert gapic_batch_prediction_job.input_config.gcs_source.uris == [
+            _TEST_GCS_SOURCE
+        ]
+        assert job.state == gca_job_state.JobState.JOB_STATE_SUCCEEDED
+        assert job.done()
+        assert get_batch_prediction_job_async_mock.await_count == 3
+        assert [call.args[0] for call in sleep_mock.await_args_list] == [
+            aio_base._WAIT_MIN_POLL_INTERVAL,
+            aio_base._WAIT_MIN_POLL_INTERVAL * aio_base._WAIT_POLL_INTERVAL_MULTIPLIER,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_prediction_job_create_validates_arguments(self):
+        with pytest.raises(ValueError):
+            await aiplatform.aio.BatchPredictionJob.create(
+                job_display_name="test-job",
+                model_name="123",
+                gcs_destination_prefix=_TEST_GCS_DESTINATION_PREFIX,
+            )
+
+    @pytest.mark.asyncio
+    async def test_batch_prediction_job_wait_raises_on_failure(
+        self, get_batch_prediction_job_async_mock, sleep_mock
+    ):
+        _set_batch_prediction_job_states(
+            get_batch_prediction_job_async_mock,
+            [
+                gca_job_state.JobState.JOB_STATE_RUNNING,
+                gca_job_state.JobState.JOB_STATE_RUNNING,
+                gca_job_state.JobState.JOB_STATE_FAILED,
+            ],
+            error=_TEST_ERROR,
+        )
+        job = await aiplatform.aio.BatchPredictionJob.get(
+            _TEST_BATCH_PREDICTION_JOB_NAME
+        )
+
+        with pytest.raises(RuntimeError, match="internal error"):
+            await job.wait()
+
+    @pytest.mark.asyncio
+    async def test_featurestore_create_and_list_entity_types(self):
+        with mock.patch.object(
+            featurestore_service_async_client.FeaturestoreServiceAsyncClient,
+            "create_featurestore",
+            new_callable=mock.AsyncMock,
+        ) as create_featurestore_mock, mock.patch.object(
+            featurestore_service_async_client.FeaturestoreServiceAsyncClient,
+            "list_entity_types",
+            new_callable=mock.AsyncMock,
+        ) as list_entity_types_mock:
+            create_featurestore_mock.return_value = _make_lro(
+                gca_featurestore.Featurestore(name=_TEST_FEATURESTORE_NAME)
+            )
+            list_entity_types_mock.return_value = _AsyncPager(
+                [gca_entity_type.EntityType(name=_TEST_ENTITY_TYPE_NAME)]
+            )
+
+            featurestore = await aiplatform.aio.Featurestore.create(
+                featurestore_id=_TEST_FEATURESTORE_ID
+            )
+            entity_types = await aiplatform.aio.EntityType.list(
+                featurestore_name=_TEST_FEATURESTORE_ID
+            )
+
+        assert featurestore.resource_name == _TEST_FEATURESTORE_NAME
+        list_entity_types_mock.assert_awaited_once_with(
+            request={"parent": _TEST_FEATURESTORE_NAME}
+        )
+        assert [entity_type.resource_name for entity_type in entity_types] == [
+            _TEST_ENTITY_TYPE_NAME
+        ]
+        assert entity_types[0].featurestore_name == _TEST_FEATURESTORE_NAME
+
+    def test_async_clients_are_shared_per_event_loop(self):
+        async def _get_clients():
+            return [
+                aio_base._get_async_client(
+                    client_class=aiplatform.aio.Endpoint._client_class
+                )
+                for _ in range(2)
+            ]
+
+        first_loop_clients = asyncio.run(_get_clients())
+        second_loop_clients = asyncio.run(_get_clients())
+
+        assert first_loop_clients[0] is first_loop_clients[1]
+        assert second_loop_clients[0] is not first_loop_clients[0]
+        # The clients of the closed event loop have been released.
+        assert len(aio_base._async_clients) == 1
@@ -15,16 +15,23 @@
 # limitations under the License.
 #
 
+from concurrent import futures
 import copy
+import httpx
+import itertools
 import pytest
 import urllib3
 import json
+import numpy as np
+import threading
 
 from unittest import mock
 from importlib import reload
 from datetime import datetime, timedelta
 
+from google.api_core import exceptions as api_exceptions
 from google.api_core import operation as ga_operation
+from google.api_core import retry as api_retry
 from google.auth import credentials as auth_credentials
 
 from google.protobuf import field_mask_pb2
@@ -43,6 +50,7 @@ from google.cloud.aiplatform.compat.services import (
     endpoint_service_client,
     endpoint_service_client_v1beta1,
     prediction_service_client,
+    prediction_service_async_client,
     deployment_resource_pool_service_client_v1beta1,
 )
 
@@ -464,6 +472,40 @@ def predict_client_predict_mock():
         yield predict_mock
 
 
+@pytest.fixture
+def predict_async_client_predict_mock():
+    with mock.patch.object(
+        prediction_service_async_client.PredictionServiceAsyncClient,
+        "predict",
+        new_callable=mock.AsyncMock,
+    ) as predict_mock:
+        predict_mock.return_value = gca_prediction_service.PredictResponse(
+            deployed_model_id=_TEST_MODEL_ID,
+            model_version_id=_TEST_VERSION_ID,
+            model=_TEST_MODEL_NAME,
+        )
+        predict_mock.return_value.predictions.extend(_TEST_PREDICTION)
+        yield predict_mock
+
+
+@pytest.fixture
+def raw_predict_async_mock():
+    with mock.patch.object(
+        httpx.AsyncClient, "post", new_callable=mock.AsyncMock
+    ) as raw_predict_mock:
+        raw_predict_mock.return_value = httpx.Response(
+            status_code=200,
+            json={"predictions": _TEST_PREDICTION},
+            headers={
+                "X-Vertex-AI-Deployed-Model-Id": _TEST_MODEL_ID,
+                "X-Vertex-AI-Model": _TEST_MODEL_NAME,
+                "X-Vertex-AI-Model-Version-Id": _TEST_VERSION_ID,
+            },
+            request=httpx.Request("POST", "https://test"),
+        )
+        yield raw_predict_mock
+
+
 @pytest.fixture
 def predict_client_explain_mock():
     with mock.patch.object(
@@ -1841,6 +1883,276 @@ class TestEndpoint:
             timeout=None,
         )
 
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    async def test_predict_async(self, predict_async_client_predict_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = await test_endpoint.predict_async(
+            instances=_TEST_INSTANCES, parameters={"param": 3.0}, timeout=10.0
+        )
+
+        true_prediction = models.Prediction(
+            predictions=_TEST_PREDICTION,
+            deployed_model_id=_TEST_ID,
+            model_version_id=_TEST_VERSION_ID,
+            model_resource_name=_TEST_MODEL_NAME,
+        )
+
+        assert true_prediction == test_prediction
+        predict_async_client_predict_mock.assert_awaited_once_with(
+            endpoint=_TEST_ENDPOINT_NAME,
+            instances=_TEST_INSTANCES,
+            parameters={"param": 3.0},
+            timeout=10.0,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock", "predict_async_client_predict_mock")
+    @pytest.mark.parametrize("creation_pending", [True, False])
+    async def test_predict_async_waits_off_event_loop_only_if_pending(
+        self, creation_pending
+    ):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        if creation_pending:
+            test_endpoint._latest_future = futures.Future()
+        wait_threads = []
+
+        with mock.patch.object(
+            models.Endpoint,
+            "wait",
+            side_effect=lambda: wait_threads.append(threading.get_ident()),
+        ):
+            await test_endpoint.predict_async(instances=_TEST_INSTANCES)
+
+        assert len(wait_threads) == 1
+        assert (wait_threads[0] != threading.get_ident()) == creation_pending
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    async def test_predict_async_use_raw_predict(self, raw_predict_async_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_predictions = [
+            await test_endpoint.predict_async(
+                instances=_TEST_INSTANCES, use_raw_predict=True
+            )
+            for _ in range(2)
+        ]
+
+        true_prediction = models.Prediction(
+            predictions=_TEST_PREDICTION,
+            deployed_model_id=_TEST_MODEL_ID,
+            model_version_id=_TEST_VERSION_ID,
+            model_resource_name=_TEST_MODEL_NAME,
+        )
+
+        assert test_predictions == [true_prediction] * 2
+        assert raw_predict_async_mock.await_count == 2
+        url = raw_predict_async_mock.call_args[0][0]
+        assert url.endswith(f"/endpoints/{_TEST_ID}:rawPredict")
+        assert json.loads(raw_predict_async_mock.call_args[1]["content"]) == {
+            "instances": _TEST_INSTANCES,
+            "parameters": None,
+        }
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_configure_http_transport(self):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_endpoint.configure_http_transport(max_connections=7, http2=False)
+
+        session = models.http_utils.create_authorized_session(
+            test_endpoint.credentials, test_endpoint._http_transport_config
+        )
+
+        assert test_endpoint._http_transport_config.max_connections == 7
+        assert not test_endpoint._http_transport_config.http2
+        assert test_endpoint.authorized_session is None
+        assert session.get_adapter("https://")._pool_maxsize == 7
+        assert models.Endpoint._http_transport_config.max_connections == 100
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_configure_http_transport_defaults(self):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_endpoint.configure_http_transport()
+
+        assert test_endpoint._http_transport_config == (
+            models.http_utils.HttpTransportConfig(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=5.0,
+                http2=True,
+            )
+        )
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_numpy(self, predict_client_predict_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = test_endpoint.predict(
+            instances=_TEST_INSTANCES, return_format="numpy"
+        )
+
+        assert isinstance(test_prediction.predictions, np.ndarray)
+        assert test_prediction.predictions.dtype == np.float64
+        np.testing.assert_array_equal(
+            test_prediction.predictions, np.array(_TEST_PREDICTION)
+        )
+        assert test_prediction.deployed_model_id == _TEST_ID
+
+    @pytest.mark.parametrize(
+        "predictions,expected",
+        [
+            ([0.5, 1.5], np.array([0.5, 1.5])),
+            ([[[1.0], [2.0]], [[3.0], [4.0]]], np.array([[[1], [2]], [[3], [4]]])),
+        ],
+    )
+    def test_get_predictions_numpy(self, predictions, expected):
+        response = gca_prediction_service.PredictResponse()
+        response.predictions.extend(predictions)
+
+        test_predictions = models.Endpoint._get_predictions(
+            response.predictions.pb, return_format="numpy"
+        )
+
+        np.testing.assert_array_equal(test_predictions, expected)
+
+    @pytest.mark.parametrize(
+        "predictions,match",
+        [
+            ([{"score": 1.0}], "requires numeric predictions, got a struct_value"),
+            ([[1.0, 2.0], [1.0]], "requires numeric predictions of equal shape"),
+        ],
+    )
+    def test_get_predictions_numpy_raises(self, predictions, match):
+        response = gca_prediction_service.PredictResponse()
+        response.predictions.extend(predictions)
+
+        with pytest.raises(ValueError, match=match):
+            models.Endpoint._get_predictions(
+                response.predictions.pb, return_format="numpy"
+            )
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_predict_unsupported_return_format_raises(self):
+        test_endpoint = models.Endpoint(_TEST_ID)
+
+        with pytest.raises(ValueError, match="Unsupported return_format"):
+            test_endpoint.predict(instances=_TEST_INSTANCES, return_format="arrow")
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    async def test_predict_async_use_raw_predict_numpy(self, raw_predict_async_mock):
+        test_endpoint = models.Endpoint(_TEST_ID)
+        test_prediction = await test_endpoint.predict_async(
+            instances=_TEST_INSTANCES, use_raw_predict=True, return_format="numpy"
+        )
+
+        np.testing.assert_array_equal(
+            test_prediction.predictions, np.array(_TEST_PREDICTION)
+        )
+        assert test_prediction.deployed_model_id == _TEST_MODEL_ID
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_bulk_predict(self):
+        instances = [[float(i)] for i in range(10)]
+
+        with mock.patch.object(models.Endpoint, "predict") as predict_mock:
+            predict_mock.side_effect = lambda instances, parameters, timeout: (
+                models.Prediction(
+                    predictions=[instance[0] * 2 for instance in instances],
+                    deployed_model_id=_TEST_MODEL_ID,
+                )
+            )
+            test_endpoint = models.Endpoint(_TEST_ID)
+            test_prediction = test_endpoint.bulk_predict(
+                instances=instances,
+                parameters={"param": 3.0},
+                max_instances_per_request=3,
+                max_concurrency=2,
+                timeout=10.0,
+            )
+
+        assert test_prediction == models.Prediction(
+            predictions=[float(i) * 2 for i in range(10)],
+            deployed_model_id=_TEST_MODEL_ID,
+        )
+        assert predict_mock.call_count == 4
+        predict_mock.assert_any_call(
+            instances=[[9.0]], parameters={"param": 3.0}, timeout=10.0
+        )
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_bulk_predict_retries_throttled_requests(self):
+        with mock.patch.object(models.Endpoint, "predict") as predict_mock:
+            predict_mock.side_effect = [
+                api_exceptions.TooManyRequests("throttled"),
+                models.Prediction(
+                    predictions=_TEST_PREDICTION, deployed_model_id=_TEST_MODEL_ID
+                ),
+            ]
+            test_endpoint = models.Endpoint(_TEST_ID)
+            test_prediction = test_endpoint.bulk_predict(
+                instances=_TEST_INSTANCES,
+                retry=api_retry.Retry(
+                    predicate=models.Endpoint._is_retryable_prediction_error,
+                    initial=0.01,
+                ),
+            )
+
+        assert test_prediction.predictions == _TEST_PREDICTION
+        assert predict_mock.call_count == 2
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_bulk_predict_does_not_retry_other_errors(self):
+        with mock.patch.object(models.Endpoint, "predict") as predict_mock:
+            predict_mock.side_effect = api_exceptions.InvalidArgument("bad instance")
+            test_endpoint = models.Endpoint(_TEST_ID)
+
+            with pytest.raises(api_exceptions.InvalidArgument):
+                test_endpoint.bulk_predict(instances=_TEST_INSTANCES)
+
+        assert predict_mock.call_count == 1
+
+    def test_shard_instances(self):
+        instances = [[1.0, 2.0], "a" * 20, [3.0], [4.0]]
+
+        shards = models.Endpoint._shard_instances(
+            instances=instances,
+            parameters=None,
+            max_instances_per_request=None,
+            max_request_bytes=71,
+        )
+
+        assert shards == [[[1.0, 2.0], "a" * 20], [[3.0], [4.0]]]
+        for shard in shards:
+            body = json.dumps({"instances": shard, "parameters": None})
+            assert len(body) <= 71
+
+    def test_shard_instances_larger_than_limit(self):
+        shards = models.Endpoint._shard_instances(
+            instances=[[1.0, 2.0], [3.0]],
+            parameters=None,
+            max_instances_per_request=None,
+            max_request_bytes=40,
+        )
+
+        assert shards == [[[1.0, 2.0]], [[3.0]]]
+
+    def test_shard_instances_by_count(self):
+        shards = models.Endpoint._shard_instances(
+            instances=list(range(5)),
+            parameters={"param": 3.0},
+            max_instances_per_request=2,
+            max_request_bytes=models._BULK_PREDICT_MAX_REQUEST_BYTES,
+        )
+
+        assert shards == [[0, 1], [2, 3], [4]]
+
+    @pytest.mark.usefixtures("get_endpoint_mock")
+    def test_bulk_predict_without_instances_raises(self):
+        test_endpoint = models.Endpoint(_TEST_ID)
+
+        with pytest.raises(ValueError, match="At least one instance"):
+            test_endpoint.bulk_predict(instances=[])
+
     @pytest.mark.usefixtures("get_endpoint_mock")
     def test_explain(self, predict_client_explain_mock):
 
@@ -2024,6 +2336,58 @@ class TestEndpoint:
             ep_list[0].display_name < ep_list[1].display_name < ep_list[2].display_name
         )
 
+    def test_iter_list_endpoint_order_by_time_with_max_results(
+        self, list_endpoints_mock
+    ):
+        ep_iter = aiplatform.Endpoint.iter_list(
+            filter=_TEST_LIST_FILTER,
+            order_by=_TEST_LIST_ORDER_BY_CREATE_TIME,
+            page_size=2,
+            max_results=2,
+        )
+        ep_list = list(ep_iter)
+
+        list_endpoints_mock.assert_called_once_with(
+            request={
+                "parent": _TEST_PARENT,
+                "filter": _TEST_LIST_FILTER,
+                "page_size": 2,
+            }
+        )
+        assert [ep.display_name for ep in ep_list] == ["aab", "aaa"]
+        assert all(type(ep) == aiplatform.Endpoint for ep in ep_list)
+
+    def test_iter_list_endpoint_stops_early(self, list_endpoints_mock):
+        # An endless pager, the listing only ends by breaking out of it.
+        list_endpoints_mock.return_value = (
+            gca_endpoint.Endpoint(
+                name=_TEST_ENDPOINT_NAME,
+                display_name=str(i),
+                create_time=datetime.now(),
+            )
+            for i in itertools.count()
+        )
+
+        ep_list = []
+        for ep in aiplatform.Endpoint.iter_list(page_size=10):
+            ep_list.append(ep)
+            if len(ep_list) == 3:
+                break
+
+        assert [ep.display_name for ep in ep_list] == ["0", "1", "2"]
+
+    def test_iter_list_endpoint_raises_page_error(self, list_endpoints_mock):
+        def _pager():
+            yield _TEST_ENDPOINT_LIST[0]
+            raise api_exceptions.ServiceUnavailable("unavailable")
+
+        list_endpoints_mock.return_value = _pager()
+        ep_iter = aiplatform.Endpoint.iter_list()
+
+        assert next(ep_iter).display_name == "aac"
+        with pytest.raises(api_exceptions.ServiceUnavailable):
+            next(ep_iter)
+
     @pytest.mark.usefixtures("get_endpoint_with_models_mock")
     @pytest.mark.parametrize("sync", [True, False])
     def test_delete_endpoint_without_force(
@@ -2104,6 +2468,117 @@ class TestPrivateEndpoint(TestEndpoint):
             headers={"Content-Type": "application/json"},
         )
 
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    def test_bulk_predict_private_endpoint(self, predict_private_endpoint_mock):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+        test_prediction = test_endpoint.bulk_predict(
+            instances=_TEST_INSTANCES * 2, max_instances_per_request=2
+        )
+
+        true_prediction = models.Prediction(
+            predictions=_TEST_PREDICTION * 2, deployed_model_id=_TEST_ID
+        )
+
+        assert true_prediction == test_prediction
+        assert predict_private_endpoint_mock.call_count == 2
+
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    def test_bulk_predict_private_endpoint_retries_unavailable(
+        self, predict_private_endpoint_mock
+    ):
+        predict_private_endpoint_mock.side_effect = [
+            urllib3.response.HTTPResponse(status=503, body=b"unavailable"),
+            urllib3.response.HTTPResponse(
+                status=200, body=json.dumps({"predictions": _TEST_PREDICTION})
+            ),
+        ]
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+        test_prediction = test_endpoint.bulk_predict(
+            instances=_TEST_INSTANCES,
+            retry=api_retry.Retry(
+                predicate=models.Endpoint._is_retryable_prediction_error,
+                initial=0.01,
+            ),
+        )
+
+        assert test_prediction.predictions == _TEST_PREDICTION
+        assert predict_private_endpoint_mock.call_count == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    async def test_predict_async(self, raw_predict_async_mock):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+        test_prediction = await test_endpoint.predict_async(
+            instances=_TEST_INSTANCES, parameters={"param": 3.0}
+        )
+
+        true_prediction = models.Prediction(
+            predictions=_TEST_PREDICTION, deployed_model_id=_TEST_ID
+        )
+
+        assert true_prediction == test_prediction
+        raw_predict_async_mock.assert_awaited_once_with(
+            "",
+            content='{"instances": [[1.0, 2.0, 3.0], [1.0, 3.0, 4.0]], "parameters": {"param": 3.0}}',
+            headers={"Content-Type": "application/json"},
+            timeout=None,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    async def test_predict_async_error(self, raw_predict_async_mock):
+        raw_predict_async_mock.return_value = httpx.Response(
+            status_code=500, text="internal error"
+        )
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+
+        with pytest.raises(RuntimeError, match="500 - Failed to make request"):
+            await test_endpoint.predict_async(instances=_TEST_INSTANCES)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    async def test_predict_async_throttled(self, raw_predict_async_mock):
+        raw_predict_async_mock.return_value = httpx.Response(
+            status_code=429, text="quota exceeded"
+        )
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+
+        with pytest.raises(api_exceptions.TooManyRequests) as e:
+            await test_endpoint.predict_async(instances=_TEST_INSTANCES)
+
+        assert models.Endpoint._is_retryable_prediction_error(e.value)
+        assert isinstance(e.value, RuntimeError)
+        assert str(e.value).startswith("429 - Failed to make request")
+
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    def test_predict_private_endpoint_error_not_retryable(
+        self, predict_private_endpoint_mock
+    ):
+        predict_private_endpoint_mock.return_value = urllib3.response.HTTPResponse(
+            status=500, body=b"internal error"
+        )
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+
+        with pytest.raises(RuntimeError, match="500 - Failed to make request") as e:
+            test_endpoint.predict(instances=_TEST_INSTANCES)
+
+        assert not models.Endpoint._is_retryable_prediction_error(e.value)
+
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    def test_configure_http_transport(self):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+        test_endpoint.configure_http_transport(max_connections=7)
+
+        assert test_endpoint._http_client.connection_pool_kw["maxsize"] == 7
+
+    @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
+    def test_configure_http_transport_defaults(self):
+        test_endpoint = models.PrivateEndpoint(_TEST_ID)
+        test_endpoint.configure_http_transport()
+
+        assert test_endpoint._http_transport_config.max_connections == 100
+        assert test_endpoint._http_client.connection_pool_kw["maxsize"] == 100
+
     @pytest.mark.usefixtures("get_private_endpoint_with_model_mock")
     def test_health_check(self, health_check_private_endpoint_mock):
         test_endpoint = models.PrivateEndpoint(_TEST_ID)
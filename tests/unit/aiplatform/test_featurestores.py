@@ -19,12 +19,14 @@ import copy
 import pytest
 import datetime
 import pandas as pd
+import pyarrow as pa
 import uuid
 
 from unittest import mock
 from importlib import reload
 from unittest.mock import MagicMock, patch
 
+from google.api_core import exceptions
 from google.api_core import operation
 from google.protobuf import field_mask_pb2, timestamp_pb2
 
@@ -34,6 +36,7 @@ from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform import utils
 from google.cloud.aiplatform.utils import resource_manager_utils
 
+from google.cloud.aiplatform.featurestore import _entity_type
 from google.cloud.aiplatform.utils import featurestore_utils
 from google.cloud.aiplatform.compat.services import (
     featurestore_service_client,
@@ -75,6 +78,7 @@ from google.cloud.aiplatform.compat.types import (
 
 from google.cloud import bigquery
 from google.cloud import bigquery_storage
+from google.cloud import storage
 from google.cloud.bigquery_storage_v1.types import stream as gcbqs_stream
 
 from google.cloud import resourcemanager
@@ -384,6 +388,24 @@ def _get_entity_view_proto(entity_id, feature_value_types, feature_values):
     return entity_view_proto
 
 
+def _streaming_read_feature_values_side_effect(request, metadata, timeout):
+    """Returns the feature _TEST_FEATURE_ID of entity "entity_id_{i}" as i."""
+    return [
+        gca_featurestore_online_service.ReadFeatureValuesResponse(
+            header=_get_header_proto(feature_ids=[_TEST_FEATURE_ID])
+        )
+    ] + [
+        gca_featurestore_online_service.ReadFeatureValuesResponse(
+            entity_view=_get_entity_view_proto(
+                entity_id=entity_id,
+                feature_value_types=[_TEST_INT_TYPE],
+                feature_values=[int(entity_id.rsplit("_", 1)[1])],
+            )
+        )
+        for entity_id in request.entity_ids
+    ]
+
+
 def uuid_mock():
     return uuid.UUID(int=1)
 
@@ -2031,6 +2053,72 @@ class TestFeaturestore:
             timeout=None,
         )
 
+    @pytest.mark.usefixtures(
+        "get_featurestore_mock",
+        "bq_init_client_mock",
+        "bq_init_dataset_mock",
+        "bq_create_dataset_mock",
+        "bq_load_table_from_dataframe_mock",
+        "bq_delete_dataset_mock",
+        "bqs_init_client_mock",
+        "get_project_mock",
+        "batch_read_feature_values_mock",
+    )
+    @patch("uuid.uuid4", uuid_mock)
+    def test_batch_serve_to_arrow(self, bqs_client_mock):
+        aiplatform.init(project=_TEST_PROJECT_DIFF)
+        read_session_proto = gcbqs_stream.ReadSession(
+            streams=[gcbqs_stream.ReadStream(name=f"stream_{i}") for i in range(3)]
+        )
+        bqs_client_mock.create_read_session.return_value = read_session_proto
+
+        def _read_rows(stream_name):
+            page = MagicMock()
+            page.to_arrow.return_value = pa.RecordBatch.from_pydict(
+                {"stream": [stream_name, stream_name]}
+            )
+            reader = MagicMock()
+            reader.rows.return_value.pages = [page]
+            return reader
+
+        bqs_client_mock.read_rows.side_effect = _read_rows
+
+        my_featurestore = aiplatform.Featurestore(
+            featurestore_name=_TEST_FEATURESTORE_NAME
+        )
+        table = my_featurestore.batch_serve_to_arrow(
+            serving_feature_ids=_TEST_SERVING_FEATURE_IDS,
+            read_instances_df=pd.DataFrame(),
+            max_stream_count=3,
+            max_read_workers=2,
+        )
+
+        assert table.column("stream").to_pylist() == [
+            "stream_0",
+            "stream_0",
+            "stream_1",
+            "stream_1",
+            "stream_2",
+            "stream_2",
+        ]
+        assert bqs_client_mock.create_read_session.call_args[1]["max_stream_count"] == 3
+        assert bqs_client_mock.read_rows.call_count == 3
+
+    def test_read_bq_storage_streams_without_rows(self):
+        schema = pa.schema([("feature", pa.int64())])
+        read_session_proto = gcbqs_stream.ReadSession()
+        read_session_proto.arrow_schema.serialized_schema = (
+            schema.serialize().to_pybytes()
+        )
+
+        table = aiplatform.Featurestore._read_bq_storage_streams(
+            bigquery_storage_read_client=MagicMock(),
+            read_session=read_session_proto,
+        )
+
+        assert table.schema == schema
+        assert table.num_rows == 0
+
 
 @pytest.mark.usefixtures("google_auth_mock")
 class TestEntityType:
@@ -2462,6 +2550,82 @@ class TestEntityType:
                 gcs_source_type=_TEST_GCS_SOURCE_TYPE_INVALID,
             )
 
+    @pytest.mark.usefixtures("get_entity_type_mock", "get_feature_mock")
+    @pytest.mark.parametrize("staging_strategy", ["gcs", "auto"])
+    @patch("uuid.uuid4", uuid_mock)
+    def test_ingest_from_df_staged_in_gcs(
+        self, import_feature_values_mock, staging_strategy
+    ):
+        aiplatform.init(project=_TEST_PROJECT, staging_bucket="gs://my-bucket")
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        df_source = pd.DataFrame(
+            {
+                "entity_id": ["entity_1", "entity_2", "entity_3"],
+                _TEST_IMPORTING_FEATURE_SOURCE_FIELD: [1, 2, 3],
+                _TEST_FEATURE_TIME_FIELD: pd.to_datetime(["2022-01-01 11:59:59.5"] * 3),
+                "unused_column": [True, False, True],
+            }
+        )
+        uploaded_files = []
+
+        with patch.object(_entity_type, "_GCS_STAGING_FILE_DF_BYTES", 1), patch.object(
+            storage.Blob,
+            "upload_from_filename",
+            side_effect=lambda filename: uploaded_files.append(open(filename).read()),
+        ), patch.object(storage.Blob, "delete") as delete_blob_mock:
+            my_entity_type.ingest_from_df(
+                feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+                feature_time=_TEST_FEATURE_TIME_FIELD,
+                df_source=df_source,
+                feature_source_fields=_TEST_IMPORTING_FEATURE_SOURCE_FIELDS,
+                staging_strategy=staging_strategy,
+            )
+
+        expected_gcs_dir = f"gs://my-bucket/vertex_ai_auto_staging/{_TEST_ENTITY_TYPE_ID}-{uuid_mock()}"
+        import_feature_values_mock.assert_called_once_with(
+            request=gca_featurestore_service.ImportFeatureValuesRequest(
+                entity_type=_TEST_ENTITY_TYPE_NAME,
+                feature_specs=[
+                    gca_featurestore_service.ImportFeatureValuesRequest.FeatureSpec(
+                        id=_TEST_IMPORTING_FEATURE_ID,
+                        source_field=_TEST_IMPORTING_FEATURE_SOURCE_FIELD,
+                    ),
+                ],
+                csv_source=gca_io.CsvSource(
+                    gcs_source=gca_io.GcsSource(
+                        uris=[f"{expected_gcs_dir}/part-{i:05d}.csv" for i in range(3)]
+                    )
+                ),
+                feature_time_field=_TEST_FEATURE_TIME_FIELD,
+            ),
+            metadata=_TEST_REQUEST_METADATA,
+            timeout=None,
+        )
+        assert sorted(uploaded_files)[0] == (
+            f'"entity_id","{_TEST_IMPORTING_FEATURE_SOURCE_FIELD}",'
+            f'"{_TEST_FEATURE_TIME_FIELD}"\n'
+            '"entity_1",1,"2022-01-01T11:59:59.500000Z"\n'
+        )
+        assert delete_blob_mock.call_count == 3
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_ingest_from_df_staged_in_gcs_with_array_feature_raise_error(
+        self, get_feature_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        get_feature_mock.return_value = gca_feature.Feature(
+            name=_TEST_FEATURE_NAME, value_type=_TEST_STR_ARR_TYPE
+        )
+
+        with pytest.raises(ValueError):
+            my_entity_type.ingest_from_df(
+                feature_ids=_TEST_IMPORTING_FEATURE_IDS,
+                feature_time=_TEST_FEATURE_TIME_FIELD,
+                df_source=pd.DataFrame(),
+                staging_strategy="gcs",
+            )
+
     @pytest.mark.usefixtures(
         "get_entity_type_mock",
         "get_feature_mock",
@@ -2702,6 +2866,155 @@ class TestEntityType:
         assert result.entity_id[0] == _TEST_READ_ENTITY_ID
         assert result.get(_TEST_FEATURE_ID)[0] == _TEST_FEATURE_VALUE
 
+    @pytest.mark.usefixtures("get_entity_type_mock", "get_feature_mock")
+    def test_read_more_than_100_entities(self, streaming_read_feature_values_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        entity_ids = [f"entity_id_{i}" for i in range(250)]
+        streaming_read_feature_values_mock.side_effect = (
+            _streaming_read_feature_values_side_effect
+        )
+
+        result = my_entity_type.read(
+            entity_ids=entity_ids, feature_ids=_TEST_FEATURE_ID
+        )
+
+        assert sorted(
+            len(call.kwargs["request"].entity_ids)
+            for call in streaming_read_feature_values_mock.call_args_list
+        ) == [50, 100, 100]
+        assert result.entity_id.tolist() == entity_ids
+        assert result.get(_TEST_FEATURE_ID).tolist() == list(range(250))
+
+    @pytest.mark.usefixtures("get_entity_type_mock", "get_feature_mock")
+    def test_read_with_read_cache(
+        self, streaming_read_feature_values_mock, write_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(
+            entity_type_name=_TEST_ENTITY_TYPE_NAME
+        ).enable_read_cache(max_size=10, ttl=60)
+        streaming_read_feature_values_mock.side_effect = (
+            _streaming_read_feature_values_side_effect
+        )
+
+        def read(entity_ids):
+            return my_entity_type.read(
+                entity_ids=entity_ids, feature_ids=_TEST_FEATURE_ID
+            )
+
+        def read_entity_ids():
+            return [
+                list(call.kwargs["request"].entity_ids)
+                for call in streaming_read_feature_values_mock.call_args_list
+            ]
+
+        read(["entity_id_1", "entity_id_2"])
+        result = read(["entity_id_2", "entity_id_1", "entity_id_3"])
+
+        assert read_entity_ids() == [["entity_id_1", "entity_id_2"], ["entity_id_3"]]
+        assert result.entity_id.tolist() == [
+            "entity_id_2",
+            "entity_id_1",
+            "entity_id_3",
+        ]
+        assert result.get(_TEST_FEATURE_ID).tolist() == [2, 1, 3]
+        assert my_entity_type.read_cache.hits == 2
+        assert my_entity_type.read_cache.misses == 3
+
+        my_entity_type.write_feature_values(
+            instances={"entity_id_1": {_TEST_FEATURE_ID: 10}}
+        )
+        read(["entity_id_1", "entity_id_2"])
+
+        assert read_entity_ids()[-1] == ["entity_id_1"]
+
+        my_entity_type.disable_read_cache()
+        read(["entity_id_2"])
+
+        assert read_entity_ids()[-1] == ["entity_id_2"]
+
+    def test_feature_value_cache(self):
+        cache = featurestore_utils.FeatureValueCache(max_size=2, ttl=10)
+        data = gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data
+
+        with patch.object(
+            featurestore_utils.time, "monotonic", return_value=100
+        ) as monotonic_mock:
+            cache.put_many({("e1", "f"): data(), ("e2", "f"): data()})
+            assert cache.get_many([("e1", "f")]) == {("e1", "f"): data()}
+
+            # e2 is the least recently used pair.
+            cache.put_many({("e3", "f"): data()})
+            assert set(cache.get_many([("e1", "f"), ("e2", "f"), ("e3", "f")])) == {
+                ("e1", "f"),
+                ("e3", "f"),
+            }
+
+            cache.invalidate([("e1", "f")])
+            assert cache.get_many([("e1", "f")]) == {}
+
+            monotonic_mock.return_value = 110
+            assert cache.get_many([("e3", "f")]) == {}
+
+        assert len(cache) == 0
+        assert cache.hits == 3
+        assert cache.misses == 3
+
+    @pytest.mark.parametrize("max_size, ttl", [(0, 10), (10, 0)])
+    def test_feature_value_cache_raise_error(self, max_size, ttl):
+        with pytest.raises(ValueError):
+            featurestore_utils.FeatureValueCache(max_size=max_size, ttl=ttl)
+
+    @pytest.mark.usefixtures("get_entity_type_mock", "get_feature_mock")
+    @pytest.mark.parametrize("max_concurrent_requests", [1, 8])
+    def test_read_to_arrow(
+        self, streaming_read_feature_values_mock, max_concurrent_requests
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        entity_ids = [f"entity_id_{i}" for i in range(250)]
+        streaming_read_feature_values_mock.side_effect = (
+            _streaming_read_feature_values_side_effect
+        )
+
+        table = my_entity_type.read_to_arrow(
+            entity_ids=entity_ids,
+            feature_ids=_TEST_FEATURE_ID,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+
+        assert streaming_read_feature_values_mock.call_count == 3
+        assert table.column_names == ["entity_id", _TEST_FEATURE_ID]
+        assert table.column(_TEST_FEATURE_ID).type == pa.int64()
+        assert table.column("entity_id").to_pylist() == entity_ids
+        assert table.column(_TEST_FEATURE_ID).to_pylist() == list(range(250))
+
+    @pytest.mark.parametrize(
+        "feature_value_type, feature_values, expected_type",
+        [
+            (_TEST_INT_TYPE, [1, None, 3], pa.int64()),
+            (_TEST_DOUBLE_TYPE, [None, 1.5, 2.5], pa.float64()),
+            (_TEST_STR_TYPE, ["a", "b", None], pa.string()),
+            (_TEST_STR_ARR_TYPE, [["a", "b"], None, []], pa.list_(pa.string())),
+            (_TEST_INT_TYPE, [None, None, None], pa.null()),
+        ],
+    )
+    def test_decode_feature_values_to_arrow(
+        self, feature_value_type, feature_values, expected_type
+    ):
+        data_pbs = [
+            gca_featurestore_online_service.ReadFeatureValuesResponse.EntityView.Data.pb(
+                _get_data_proto(feature_value_type, feature_value)
+            )
+            for feature_value in feature_values
+        ]
+
+        array = aiplatform.EntityType._decode_feature_values_to_arrow(data_pbs)
+
+        assert array.type == expected_type
+        assert array.to_pylist() == feature_values
+
     @pytest.mark.usefixtures("get_entity_type_mock")
     @pytest.mark.parametrize(
         "instance, entity_id, expected_feature_values",
@@ -3117,6 +3430,133 @@ class TestEntityType:
             ],
         )
 
+    @pytest.mark.parametrize(
+        "feature_time",
+        [None, "feature_timestamp", _TEST_FEATURE_TIME_DATETIME_UTC],
+    )
+    def test_generate_payloads_from_df_matches_dict_conversion(self, feature_time):
+        df = pd.DataFrame(
+            data={
+                "double_feature": [1.5, 2.5],
+                "int_feature": [1, 2],
+                "bool_feature": [True, False],
+                "string_feature": ["a", "b"],
+                "bytes_feature": [b"a", b"b"],
+                "string_array_feature": [["a", "b"], ["c"]],
+                "mixed_feature": [1, "b"],
+            },
+            index=["entity_1", "entity_2"],
+        )
+        if feature_time == "feature_timestamp":
+            df[feature_time] = [_TEST_FEATURE_TIMESTAMP, None]
+
+        payloads = aiplatform.EntityType._generate_payloads_from_df(
+            df=df, feature_time=feature_time
+        )
+
+        assert payloads == aiplatform.EntityType._generate_payloads(
+            instances=df.to_dict(orient="index"), feature_time=feature_time
+        )
+        assert payloads[0].feature_values["mixed_feature"].int64_value == 1
+        assert payloads[1].feature_values["mixed_feature"].string_value == "b"
+
+    def test_generate_payloads_from_df_raise_error(self):
+        df = pd.DataFrame(
+            data={"test_feature_id": [[1, 2, "test_str"]]}, index=["entity_1"]
+        )
+
+        with pytest.raises(ValueError):
+            aiplatform.EntityType._generate_payloads_from_df(df=df)
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    @pytest.mark.parametrize("max_concurrent_requests", [1, 2])
+    def test_write_feature_values_in_chunks(
+        self, write_feature_values_mock, max_concurrent_requests
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        instances = pd.DataFrame(
+            data={"test_feature_1": [1.0, 2.0, 3.0, 4.0, 5.0]},
+            index=["e1", "e2", "e3", "e4", "e5"],
+        )
+
+        my_entity_type.write_feature_values(
+            instances=instances,
+            max_payloads_per_request=2,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+
+        written_entity_ids = sorted(
+            [payload.entity_id for payload in call.kwargs["payloads"]]
+            for call in write_feature_values_mock.call_args_list
+        )
+        assert written_entity_ids == [["e1", "e2"], ["e3", "e4"], ["e5"]]
+
+    def test_chunk_payloads_by_feature_value_count(self):
+        payloads = [
+            gca_featurestore_online_service.WriteFeatureValuesPayload(
+                entity_id=f"e{i}",
+                feature_values={
+                    f"f{j}": gca_featurestore_online_service.FeatureValue(int64_value=j)
+                    for j in range(3)
+                },
+            )
+            for i in range(4)
+        ]
+
+        with patch.object(_entity_type, "_MAX_FEATURE_VALUES_PER_WRITE_REQUEST", 7):
+            chunks = aiplatform.EntityType._chunk_payloads(payloads)
+
+        assert [len(chunk) for chunk in chunks] == [2, 2]
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_write_feature_values_retries_resource_exhausted(
+        self, write_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+        write_feature_values_mock.side_effect = [
+            exceptions.ResourceExhausted("Quota exceeded."),
+            gca_featurestore_online_service.WriteFeatureValuesResponse(),
+        ]
+
+        with patch("time.sleep") as sleep_mock:
+            my_entity_type.write_feature_values(
+                instances={"e1": {"test_feature_1": 1.0}}
+            )
+
+        assert write_feature_values_mock.call_count == 2
+        sleep_mock.assert_called_once()
+
+    @pytest.mark.usefixtures("get_entity_type_mock")
+    def test_write_feature_values_reports_failed_chunks(
+        self, write_feature_values_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+        my_entity_type = aiplatform.EntityType(entity_type_name=_TEST_ENTITY_TYPE_NAME)
+
+        def write_feature_values(entity_type, payloads):
+            if payloads[0].entity_id == "e2":
+                raise exceptions.InvalidArgument("Invalid feature value.")
+            return gca_featurestore_online_service.WriteFeatureValuesResponse()
+
+        write_feature_values_mock.side_effect = write_feature_values
+
+        with pytest.raises(_entity_type.FeatureValuesWriteError) as e:
+            my_entity_type.write_feature_values(
+                instances={
+                    "e1": {"test_feature_1": 1.0},
+                    "e2": {"test_feature_1": 2.0},
+                    "e3": {"test_feature_1": 3.0},
+                },
+                max_payloads_per_request=1,
+                max_concurrent_requests=2,
+            )
+
+        assert write_feature_values_mock.call_count == 3
+        assert [entity_ids for entity_ids, _ in e.value.errors] == [["e2"]]
+        assert isinstance(e.value.errors[0][1], exceptions.InvalidArgument)
+
     @pytest.mark.usefixtures("get_entity_type_mock")
     @pytest.mark.parametrize(
         "feature_id, test_value, expected_feature_value",
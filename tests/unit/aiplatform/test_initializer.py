@@ -259,6 +259,108 @@ class TestInit:
             assert " " + appended_user_agent[0] in user_agent
             assert " " + appended_user_agent[1] in user_agent
 
+    def test_create_client_reuses_cached_client(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        client = initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+
+        assert client is initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+        assert client is not initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride,
+            location_override=_TEST_LOCATION_2,
+        )
+        assert client is not initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride,
+            credentials=credentials.AnonymousCredentials(),
+        )
+        assert client is not initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride,
+            appended_user_agent=["fake_user_agent"],
+        )
+        assert client is not initializer.global_config.create_client(
+            client_class=utils.EndpointClientWithOverride
+        )
+
+    def test_create_client_temporary_client_idle_timeout(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        client = initializer.global_config.create_client(
+            client_class=utils.DatasetClientWithOverride
+        )
+        assert client.select_version("v1")._idle_timeout == 60
+
+        client = initializer.global_config.create_client(
+            client_class=utils.DatasetClientWithOverride,
+            wrapped_client_idle_timeout=10,
+        )
+        wrapped_client = client.select_version("v1")
+        assert wrapped_client._idle_timeout == 10
+        assert client is initializer.global_config.create_client(
+            client_class=utils.DatasetClientWithOverride,
+            wrapped_client_idle_timeout=10,
+        )
+
+        with mock.patch.object(utils.time, "monotonic", side_effect=[100, 105, 120]):
+            gapic_client = client.get_dataset.__self__
+            assert client.get_dataset.__self__ is gapic_client
+            assert client.get_dataset.__self__ is not gapic_client
+
+    def test_create_client_evicts_least_recently_used_client(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        with mock.patch.object(initializer, "_CLIENT_CACHE_MAX_SIZE", 2):
+            client = initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride
+            )
+            initializer.global_config.create_client(
+                client_class=utils.EndpointClientWithOverride
+            )
+            initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride
+            )
+            initializer.global_config.create_client(
+                client_class=utils.JobClientWithOverride
+            )
+
+            assert client is initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride
+            )
+            assert len(initializer.global_config._client_cache) == 2
+
+    def test_close_clients(self):
+        initializer.global_config.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        client = initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+
+        with mock.patch.object(client, "close") as close_mock:
+            initializer.global_config.close_clients()
+
+        close_mock.assert_called_once_with()
+        assert client is not initializer.global_config.create_client(
+            client_class=utils.ModelClientWithOverride
+        )
+
+    def test_get_gapic_version_is_resolved_once(self):
+        initializer._get_gapic_version.cache_clear()
+        with mock.patch.object(
+            initializer.pkg_resources, "get_distribution"
+        ) as get_distribution_mock:
+            get_distribution_mock.return_value.version = "1.2.3"
+            initializer.global_config.init(
+                project=_TEST_PROJECT, location=_TEST_LOCATION
+            )
+            initializer.global_config.create_client(
+                client_class=utils.ModelClientWithOverride
+            )
+            initializer.global_config.create_client(
+                client_class=utils.EndpointClientWithOverride
+            )
+
+        get_distribution_mock.assert_called_once_with("google-cloud-aiplatform")
+        initializer._get_gapic_version.cache_clear()
+
     @pytest.mark.parametrize(
         "init_location, location_override, expected_endpoint",
         [
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2023 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from concurrent import futures
+from datetime import datetime, timedelta
+from importlib import reload
+from unittest import mock
+
+import pytest
+
+from google.api_core import exceptions as api_exceptions
+from google.cloud import aiplatform
+from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform import jobs
+from google.cloud.aiplatform.compat.services import job_service_client
+from google.cloud.aiplatform.compat.types import (
+    batch_prediction_job as gca_batch_prediction_job_compat,
+    job_state as gca_job_state_compat,
+)
+from google.rpc import code_pb2, status_pb2
+
+import constants as test_constants
+
+_TEST_PROJECT = test_constants.ProjectConstants._TEST_PROJECT
+_TEST_LOCATION = test_constants.ProjectConstants._TEST_LOCATION
+_TEST_PARENT = test_constants.ProjectConstants._TEST_PARENT
+_TEST_JOB_NAME_1 = f"{_TEST_PARENT}/batchPredictionJobs/1"
+_TEST_JOB_NAME_2 = f"{_TEST_PARENT}/batchPredictionJobs/2"
+_TEST_JOB_NAME_OTHER = f"{_TEST_PARENT}/batchPredictionJobs/3"
+_TEST_CREATE_TIME_1 = datetime(2023, 1, 1, 12, 0, 0)
+_TEST_CREATE_TIME_2 = _TEST_CREATE_TIME_1 + timedelta(minutes=5)
+
+_TEST_JOB_STATE_RUNNING = gca_job_state_compat.JobState.JOB_STATE_RUNNING
+_TEST_JOB_STATE_SUCCESS = gca_job_state_compat.JobState.JOB_STATE_SUCCEEDED
+_TEST_JOB_STATE_FAILED = gca_job_state_compat.JobState.JOB_STATE_FAILED
+_TEST_ERROR = status_pb2.Status(code=code_pb2.INTERNAL, message="internal error")
+
+_TEST_RESULT_TIMEOUT = 10
+
+
+def _make_batch_prediction_job(name, state, error=None):
+    return gca_batch_prediction_job_compat.BatchPredictionJob(
+        name=name,
+        display_name=name.split("/")[-1],
+        state=state,
+        create_time=(
+            _TEST_CREATE_TIME_1 if name == _TEST_JOB_NAME_1 else _TEST_CREATE_TIME_2
+        ),
+        error=error,
+    )
+
+
+@pytest.fixture
+def get_batch_prediction_job_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "get_batch_prediction_job"
+    ) as get_batch_prediction_job_mock:
+        yield get_batch_prediction_job_mock
+
+
+@pytest.fixture
+def list_batch_prediction_jobs_mock():
+    with mock.patch.object(
+        job_service_client.JobServiceClient, "list_batch_prediction_jobs"
+    ) as list_batch_prediction_jobs_mock:
+        yield list_batch_prediction_jobs_mock
+
+
+def _set_job_states(get_batch_prediction_job_mock, job_states):
+    """Makes the get mock return the next state of a job on every call."""
+    job_states = {name: list(states) for name, states in job_states.items()}
+
+    def _get_batch_prediction_job(name, **kwargs):
+        states = job_states[name]
+        state = states.pop(0) if len(states) > 1 else states[0]
+        error = _TEST_ERROR if state == _TEST_JOB_STATE_FAILED else None
+        return _make_batch_prediction_job(name, state, error)
+
+    get_batch_prediction_job_mock.side_effect = _get_batch_prediction_job
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+class TestJobWatcher:
+    def setup_method(self):
+        reload(initializer)
+        reload(aiplatform)
+        aiplatform.init(project=_TEST_PROJECT, location=_TEST_LOCATION)
+        self.watcher = aiplatform.JobWatcher(min_poll_interval=0, max_poll_interval=0)
+
+    def teardown_method(self):
+        self.watcher.shutdown()
+        initializer.global_pool.shutdown(wait=True)
+
+    def test_watch_single_job(self, get_batch_prediction_job_mock):
+        _set_job_states(
+            get_batch_prediction_job_mock,
+            {
+                _TEST_JOB_NAME_1: [
+                    _TEST_JOB_STATE_RUNNING,
+                    _TEST_JOB_STATE_RUNNING,
+                    _TEST_JOB_STATE_SUCCESS,
+                ]
+            },
+        )
+        job = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+
+        future = self.watcher.watch(job)
+
+        assert future.result(timeout=_TEST_RESULT_TIMEOUT) is job
+        assert job._gca_resource.state == _TEST_JOB_STATE_SUCCESS
+        assert get_batch_prediction_job_mock.call_count == 3
+
+    def test_watch_same_job_twice_returns_same_future(
+        self, get_batch_prediction_job_mock
+    ):
+        _set_job_states(
+            get_batch_prediction_job_mock, {_TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING]}
+        )
+        job = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+        watcher = aiplatform.JobWatcher()
+
+        try:
+            assert watcher.watch(job) is watcher.watch(job)
+        finally:
+            watcher.shutdown()
+
+    def test_watch_failed_job_raises(self, get_batch_prediction_job_mock):
+        _set_job_states(
+            get_batch_prediction_job_mock,
+            {_TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_FAILED]},
+        )
+        job = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+
+        future = self.watcher.watch(job)
+
+        with pytest.raises(RuntimeError, match="internal error"):
+            future.result(timeout=_TEST_RESULT_TIMEOUT)
+
+    def test_watch_jobs_lists_states(
+        self, get_batch_prediction_job_mock, list_batch_prediction_jobs_mock
+    ):
+        _set_job_states(
+            get_batch_prediction_job_mock,
+            {
+                _TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+                _TEST_JOB_NAME_2: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+            },
+        )
+        job_1 = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+        job_2 = jobs.BatchPredictionJob(_TEST_JOB_NAME_2)
+        list_batch_prediction_jobs_mock.return_value = [
+            _make_batch_prediction_job(_TEST_JOB_NAME_OTHER, _TEST_JOB_STATE_RUNNING),
+            _make_batch_prediction_job(_TEST_JOB_NAME_2, _TEST_JOB_STATE_SUCCESS),
+            _make_batch_prediction_job(_TEST_JOB_NAME_1, _TEST_JOB_STATE_SUCCESS),
+        ]
+
+        # Pause the watcher so that both jobs are due at the same time.
+        with self.watcher._condition:
+            job_futures = [self.watcher.watch(job_1), self.watcher.watch(job_2)]
+
+        futures.wait(job_futures, timeout=_TEST_RESULT_TIMEOUT)
+        assert [future.result() for future in job_futures] == [job_1, job_2]
+        list_batch_prediction_jobs_mock.assert_called_once_with(
+            request={
+                "parent": _TEST_PARENT,
+                "filter": 'create_time>="2023-01-01T12:00:00.000000Z"',
+                "page_size": 100,
+            }
+        )
+        # One get per job on construction and one for the completed resource.
+        assert get_batch_prediction_job_mock.call_count == 4
+
+    def test_watch_jobs_falls_back_to_get_when_list_fails(
+        self, get_batch_prediction_job_mock, list_batch_prediction_jobs_mock
+    ):
+        _set_job_states(
+            get_batch_prediction_job_mock,
+            {
+                _TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+                _TEST_JOB_NAME_2: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+            },
+        )
+        job_1 = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+        job_2 = jobs.BatchPredictionJob(_TEST_JOB_NAME_2)
+        list_batch_prediction_jobs_mock.side_effect = api_exceptions.InvalidArgument(
+            "invalid filter"
+        )
+
+        with self.watcher._condition:
+            job_futures = [self.watcher.watch(job_1), self.watcher.watch(job_2)]
+
+        assert [
+            future.result(timeout=_TEST_RESULT_TIMEOUT) for future in job_futures
+        ] == [job_1, job_2]
+
+    def test_watch_jobs_falls_back_to_get_when_list_retries_exhausted(
+        self, get_batch_prediction_job_mock, list_batch_prediction_jobs_mock
+    ):
+        _set_job_states(
+            get_batch_prediction_job_mock,
+            {
+                _TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+                _TEST_JOB_NAME_2: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+            },
+        )
+        job_1 = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+        job_2 = jobs.BatchPredictionJob(_TEST_JOB_NAME_2)
+        list_batch_prediction_jobs_mock.side_effect = api_exceptions.RetryError(
+            "Deadline of 120.0s exceeded", cause=None
+        )
+
+        with self.watcher._condition:
+            job_futures = [self.watcher.watch(job_1), self.watcher.watch(job_2)]
+
+        assert [
+            future.result(timeout=_TEST_RESULT_TIMEOUT) for future in job_futures
+        ] == [job_1, job_2]
+
+    def test_watch_survives_poll_error(self, get_batch_prediction_job_mock):
+        _set_job_states(
+            get_batch_prediction_job_mock,
+            {
+                _TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+                _TEST_JOB_NAME_2: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS],
+            },
+        )
+        job_1 = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+        job_2 = jobs.BatchPredictionJob(_TEST_JOB_NAME_2)
+        poll = self.watcher._poll
+        poll_calls = []
+
+        def _poll(watched_jobs):
+            poll_calls.append(watched_jobs)
+            if len(poll_calls) == 1:
+                raise ValueError("unexpected")
+            poll(watched_jobs)
+
+        with mock.patch.object(self.watcher, "_poll", side_effect=_poll):
+            assert self.watcher.watch(job_1).result(timeout=_TEST_RESULT_TIMEOUT) is (
+                job_1
+            )
+
+        # The watcher thread is still alive and serves new jobs.
+        assert self.watcher.watch(job_2).result(timeout=_TEST_RESULT_TIMEOUT) is job_2
+
+    def test_watch_async(self, get_batch_prediction_job_mock):
+        _set_job_states(
+            get_batch_prediction_job_mock,
+            {_TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING, _TEST_JOB_STATE_SUCCESS]},
+        )
+        job = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+
+        async def _wait():
+            return await asyncio.wait_for(
+                self.watcher.watch_async(job), timeout=_TEST_RESULT_TIMEOUT
+            )
+
+        assert asyncio.run(_wait()) is job
+
+    def test_shutdown_cancels_futures(self, get_batch_prediction_job_mock):
+        _set_job_states(
+            get_batch_prediction_job_mock, {_TEST_JOB_NAME_1: [_TEST_JOB_STATE_RUNNING]}
+        )
+        job = jobs.BatchPredictionJob(_TEST_JOB_NAME_1)
+        watcher = aiplatform.JobWatcher()
+        future = watcher.watch(job)
+
+        watcher.shutdown()
+
+        assert future.cancelled()
+        with pytest.raises(RuntimeError, match="shut down"):
+            watcher.watch(job)
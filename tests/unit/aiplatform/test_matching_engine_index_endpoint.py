@@ -24,6 +24,9 @@ from google.api_core import operation
 from google.cloud import aiplatform
 from google.cloud.aiplatform import base
 from google.cloud.aiplatform import initializer
+from google.cloud.aiplatform.matching_engine import (
+    matching_engine_index_endpoint,
+)
 from google.cloud.aiplatform.matching_engine._protos import match_service_pb2
 from google.cloud.aiplatform.matching_engine.matching_engine_index_endpoint import (
     Namespace,
@@ -46,6 +49,7 @@ from google.protobuf import field_mask_pb2
 
 import grpc
 
+import numpy as np
 import pytest
 
 # project
@@ -452,6 +456,16 @@ def create_index_endpoint_mock():
         yield create_index_endpoint_mock
 
 
+@pytest.fixture
+def match_channel_pools_mock():
+    with patch.dict(
+        matching_engine_index_endpoint._match_channel_pools, clear=True
+    ), patch.object(
+        grpc, "insecure_channel", wraps=grpc.insecure_channel
+    ) as insecure_channel_mock:
+        yield insecure_channel_mock
+
+
 @pytest.fixture
 def index_endpoint_match_queries_mock():
     with patch.object(
@@ -892,6 +906,146 @@ class TestMatchingEngineIndexEndpoint:
 
         index_endpoint_match_queries_mock.assert_called_with(batch_request)
 
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_reuses_channels(
+        self, index_endpoint_match_queries_mock, match_channel_pools_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        for _ in range(2):
+            my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+                index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+            )
+            for _ in range(3):
+                my_index_endpoint.match(
+                    deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                    queries=_TEST_QUERIES,
+                    num_neighbors=_TEST_NUM_NEIGHBOURS,
+                )
+
+        assert index_endpoint_match_queries_mock.call_count == 6
+        assert (
+            match_channel_pools_mock.call_count
+            == matching_engine_index_endpoint._MATCH_CHANNEL_POOL_SIZE
+        )
+        match_channel_pools_mock.assert_called_with(
+            ":10000", options=matching_engine_index_endpoint._MATCH_CHANNEL_OPTIONS
+        )
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock", "match_channel_pools_mock")
+    def test_index_endpoint_bulk_match(self, index_endpoint_match_queries_mock):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        neighbors = my_index_endpoint.bulk_match(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=np.array(_TEST_QUERIES * 5, dtype=np.float32),
+            num_neighbors=_TEST_NUM_NEIGHBOURS,
+            filter=_TEST_FILTER,
+            max_queries_per_request=1,
+            max_concurrency=2,
+        )
+
+        assert (
+            list(neighbors)
+            == [[matching_engine_index_endpoint.MatchNeighbor(id="1", distance=0.1)]]
+            * 5
+        )
+        assert index_endpoint_match_queries_mock.call_count == 5
+        batch_request = index_endpoint_match_queries_mock.call_args[0][0]
+        request = batch_request.requests[0].requests[0]
+        assert request.deployed_index_id == _TEST_DEPLOYED_INDEX_ID
+        assert request.num_neighbors == _TEST_NUM_NEIGHBOURS
+        assert request.restricts[0] == match_service_pb2.Namespace(
+            name="class", allow_tokens=["token_1"], deny_tokens=["token_2"]
+        )
+        np.testing.assert_allclose(request.float_val, _TEST_QUERIES[0], rtol=1e-6)
+
+    def test_bulk_query_chunks_by_message_size(self):
+        chunks = []
+
+        def _query_fn(chunk):
+            chunks.append(len(chunk))
+            return [[] for _ in chunk]
+
+        results = (
+            matching_engine_index_endpoint.MatchingEngineIndexEndpoint._bulk_query(
+                query_fn=_query_fn,
+                queries=[[0.0]] * 10,
+                query_bytes=matching_engine_index_endpoint._BULK_QUERY_MAX_MESSAGE_BYTES
+                // 4,
+                num_neighbors=1,
+                max_queries_per_request=None,
+                max_concurrency=3,
+                as_numpy=False,
+            )
+        )
+
+        assert list(results) == [[]] * 10
+        assert sorted(chunks) == [2, 4, 4]
+
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    def test_index_endpoint_match_unknown_deployed_index_raises(self):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        with pytest.raises(RuntimeError, match="No deployed index with id 'unknown'"):
+            my_index_endpoint.match(deployed_index_id="unknown", queries=_TEST_QUERIES)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("get_index_endpoint_mock")
+    async def test_index_endpoint_match_async(self):
+        aiplatform.init(project=_TEST_PROJECT)
+        response = match_service_pb2.BatchMatchResponse(
+            responses=[
+                match_service_pb2.BatchMatchResponse.BatchMatchResponsePerIndex(
+                    deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                    responses=[
+                        match_service_pb2.MatchResponse(
+                            neighbor=[
+                                match_service_pb2.MatchResponse.Neighbor(
+                                    id="1", distance=0.1
+                                )
+                            ]
+                        )
+                    ],
+                )
+            ]
+        )
+
+        with patch.object(grpc.aio, "insecure_channel") as aio_channel_mock:
+            batch_match_mock = mock.AsyncMock(return_value=response)
+            aio_channel_mock.return_value.unary_unary.return_value = batch_match_mock
+
+            my_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+                index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+            )
+            for _ in range(2):
+                neighbors = await my_index_endpoint.match_async(
+                    deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+                    queries=_TEST_QUERIES,
+                    num_neighbors=_TEST_NUM_NEIGHBOURS,
+                    filter=_TEST_FILTER,
+                )
+
+        assert neighbors == [
+            [matching_engine_index_endpoint.MatchNeighbor(id="1", distance=0.1)]
+        ]
+        assert batch_match_mock.await_count == 2
+        assert (
+            aio_channel_mock.call_count
+            == matching_engine_index_endpoint._MATCH_CHANNEL_POOL_SIZE
+        )
+        batch_request = batch_match_mock.call_args[0][0]
+        assert batch_request.requests[0].deployed_index_id == _TEST_DEPLOYED_INDEX_ID
+        assert len(batch_request.requests[0].requests) == len(_TEST_QUERIES)
+
     @pytest.mark.usefixtures("get_index_public_endpoint_mock")
     def test_index_public_endpoint_match_queries(
         self, index_public_endpoint_match_queries_mock
@@ -933,6 +1087,38 @@ class TestMatchingEngineIndexEndpoint:
             find_neighbors_request
         )
 
+    @pytest.mark.usefixtures("get_index_public_endpoint_mock")
+    def test_index_public_endpoint_bulk_find_neighbors(
+        self, index_public_endpoint_match_queries_mock
+    ):
+        aiplatform.init(project=_TEST_PROJECT)
+
+        my_pubic_index_endpoint = aiplatform.MatchingEngineIndexEndpoint(
+            index_endpoint_name=_TEST_INDEX_ENDPOINT_ID
+        )
+
+        ids, distances = my_pubic_index_endpoint.bulk_find_neighbors(
+            deployed_index_id=_TEST_DEPLOYED_INDEX_ID,
+            queries=np.array(_TEST_QUERIES * 3),
+            num_neighbors=2,
+            filter=_TEST_FILTER,
+            max_queries_per_request=1,
+            as_numpy=True,
+        )
+
+        assert index_public_endpoint_match_queries_mock.call_count == 3
+        find_neighbors_request = index_public_endpoint_match_queries_mock.call_args[0][
+            0
+        ]
+        assert len(find_neighbors_request.queries) == 1
+        assert find_neighbors_request.queries[0].datapoint.restricts[0] == (
+            gca_index_v1beta1.IndexDatapoint.Restriction(
+                namespace="class", allow_list=["token_1"], deny_list=["token_2"]
+            )
+        )
+        np.testing.assert_array_equal(ids, np.array([["1", ""]] * 3, dtype=object))
+        np.testing.assert_allclose(distances, np.array([[0.1, np.nan]] * 3))
+
     @pytest.mark.usefixtures("get_index_public_endpoint_mock")
     def test_index_public_endpoint_read_index_datapoints(
         self, index_public_endpoint_read_index_datapoints_mock
@@ -17,6 +17,7 @@
 
 import os
 import copy
+import time
 from importlib import reload
 from unittest import mock
 from unittest.mock import patch, call
@@ -62,6 +63,9 @@ from google.cloud.aiplatform.compat.types import (
 from google.cloud.aiplatform.compat.types import (
     tensorboard_run as gca_tensorboard_run,
 )
+from google.cloud.aiplatform.compat.types import (
+    tensorboard_service as gca_tensorboard_service,
+)
 from google.cloud.aiplatform.compat.types import (
     tensorboard_time_series as gca_tensorboard_time_series,
 )
@@ -1074,6 +1078,37 @@ def list_tensorboard_time_series_mock_empty():
         yield list_tensorboard_time_series_mock
 
 
+@pytest.fixture
+def batch_create_tensorboard_time_series_mock():
+    def _batch_create_tensorboard_time_series(parent, requests):
+        return gca_tensorboard_service.BatchCreateTensorboardTimeSeriesResponse(
+            tensorboard_time_series=[
+                gca_tensorboard_time_series.TensorboardTimeSeries(
+                    name=f"{request.parent}/timeSeries/{request.tensorboard_time_series.display_name}-id",
+                    display_name=request.tensorboard_time_series.display_name,
+                    value_type=request.tensorboard_time_series.value_type,
+                )
+                for request in requests
+            ]
+        )
+
+    with patch.object(
+        TensorboardServiceClient,
+        "batch_create_tensorboard_time_series",
+    ) as batch_create_tensorboard_time_series_mock:
+        batch_create_tensorboard_time_series_mock.side_effect = (
+            _batch_create_tensorboard_time_series
+        )
+        yield batch_create_tensorboard_time_series_mock
+
+
+def _wait_for(condition, timeout=10):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "Timed out waiting for condition."
+        time.sleep(0.01)
+
+
 @pytest.fixture
 def create_tensorboard_run_artifact_mock():
     with patch.object(MetadataServiceClient, "create_artifact") as create_artifact_mock:
@@ -1729,6 +1764,197 @@ class TestExperiments:
             time_series_data=ts_data,
         )
 
+    @pytest.mark.usefixtures(
+        "get_metadata_store_mock",
+        "get_experiment_mock",
+        "create_experiment_run_context_mock",
+        "add_context_children_mock",
+        "get_tensorboard_mock",
+        "get_tensorboard_run_not_found_mock",
+        "get_tensorboard_experiment_not_found_mock",
+        "get_artifact_not_found_mock",
+        "get_tensorboard_time_series_not_found_mock",
+        "list_tensorboard_time_series_mock_empty",
+        "create_tensorboard_experiment_mock",
+        "create_tensorboard_run_mock",
+        "create_tensorboard_run_artifact_mock",
+        "add_context_artifacts_and_executions_mock",
+    )
+    def test_log_time_series_metrics_buffered_flushes_on_end_run(
+        self,
+        update_context_mock,
+        create_tensorboard_time_series_mock,
+        batch_create_tensorboard_time_series_mock,
+        write_tensorboard_run_data_mock,
+    ):
+        tb = aiplatform.Tensorboard(
+            test_constants.TensorboardConstants._TEST_TENSORBOARD_NAME
+        )
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            experiment=_TEST_EXPERIMENT,
+            experiment_tensorboard=tb,
+        )
+
+        run = aiplatform.start_run(_TEST_RUN)
+        run.enable_time_series_metrics_buffering(flush_interval=3600)
+
+        timestamp = utils.get_timestamp_proto()
+        for step in range(1, 4):
+            aiplatform.log_time_series_metrics(
+                {"loss": 1.0 / step, "accuracy": 0.1 * step},
+                step=step,
+                wall_time=timestamp,
+            )
+
+        write_tensorboard_run_data_mock.assert_not_called()
+
+        aiplatform.end_run()
+
+        create_tensorboard_time_series_mock.assert_not_called()
+        batch_create_tensorboard_time_series_mock.assert_called_once_with(
+            parent=test_constants.TensorboardConstants._TEST_TENSORBOARD_EXPERIMENT_NAME,
+            requests=[
+                gca_tensorboard_service.CreateTensorboardTimeSeriesRequest(
+                    parent=test_constants.TensorboardConstants._TEST_TENSORBOARD_RUN_NAME,
+                    tensorboard_time_series=gca_tensorboard_time_series.TensorboardTimeSeries(
+                        display_name=display_name,
+                        value_type="SCALAR",
+                        plugin_name="scalars",
+                    ),
+                )
+                for display_name in ("loss", "accuracy")
+            ],
+        )
+
+        ts_data = [
+            gca_tensorboard_data.TimeSeriesData(
+                tensorboard_time_series_id=f"{display_name}-id",
+                value_type=gca_tensorboard_time_series.TensorboardTimeSeries.ValueType.SCALAR,
+                values=[
+                    gca_tensorboard_data.TimeSeriesDataPoint(
+                        scalar=gca_tensorboard_data.Scalar(value=value(step)),
+                        wall_time=timestamp,
+                        step=step,
+                    )
+                    for step in range(1, 4)
+                ],
+            )
+            for display_name, value in (
+                ("loss", lambda step: 1.0 / step),
+                ("accuracy", lambda step: 0.1 * step),
+            )
+        ]
+        write_tensorboard_run_data_mock.assert_called_once_with(
+            tensorboard_run=test_constants.TensorboardConstants._TEST_TENSORBOARD_RUN_NAME,
+            time_series_data=ts_data,
+        )
+        assert run._time_series_metrics_buffer is None
+        update_context_mock.assert_called()
+
+    @pytest.mark.usefixtures(
+        "get_metadata_store_mock",
+        "get_experiment_mock",
+        "create_experiment_run_context_mock",
+        "add_context_children_mock",
+        "get_tensorboard_mock",
+        "get_tensorboard_run_not_found_mock",
+        "get_tensorboard_experiment_not_found_mock",
+        "get_artifact_not_found_mock",
+        "get_tensorboard_time_series_not_found_mock",
+        "list_tensorboard_time_series_mock_empty",
+        "create_tensorboard_experiment_mock",
+        "create_tensorboard_run_mock",
+        "create_tensorboard_run_artifact_mock",
+        "add_context_artifacts_and_executions_mock",
+        "batch_create_tensorboard_time_series_mock",
+        "update_context_mock",
+    )
+    def test_log_time_series_metrics_buffered_flushes_in_background_by_size(
+        self,
+        write_tensorboard_run_data_mock,
+    ):
+        tb = aiplatform.Tensorboard(
+            test_constants.TensorboardConstants._TEST_TENSORBOARD_NAME
+        )
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            experiment=_TEST_EXPERIMENT,
+            experiment_tensorboard=tb,
+        )
+
+        with aiplatform.start_run(_TEST_RUN) as run:
+            run.enable_time_series_metrics_buffering(
+                max_buffered_points=2, flush_interval=3600
+            )
+            run.log_time_series_metrics({"loss": 0.5}, step=1)
+            run.log_time_series_metrics({"loss": 0.25}, step=2)
+
+            _wait_for(lambda: write_tensorboard_run_data_mock.call_count == 1)
+            (written_data,) = write_tensorboard_run_data_mock.call_args.kwargs[
+                "time_series_data"
+            ]
+            assert [point.step for point in written_data.values] == [1, 2]
+
+        write_tensorboard_run_data_mock.assert_called_once()
+
+    @pytest.mark.usefixtures(
+        "get_metadata_store_mock",
+        "get_experiment_mock",
+        "create_experiment_run_context_mock",
+        "add_context_children_mock",
+        "get_tensorboard_mock",
+        "get_tensorboard_run_not_found_mock",
+        "get_tensorboard_experiment_not_found_mock",
+        "get_artifact_not_found_mock",
+        "get_tensorboard_time_series_not_found_mock",
+        "list_tensorboard_time_series_mock_empty",
+        "create_tensorboard_experiment_mock",
+        "create_tensorboard_run_mock",
+        "create_tensorboard_run_artifact_mock",
+        "add_context_artifacts_and_executions_mock",
+        "batch_create_tensorboard_time_series_mock",
+        "update_context_mock",
+    )
+    def test_log_time_series_metrics_buffered_background_error_keeps_points(
+        self,
+        write_tensorboard_run_data_mock,
+    ):
+        write_tensorboard_run_data_mock.side_effect = [
+            exceptions.ServiceUnavailable("unavailable"),
+            None,
+        ]
+        tb = aiplatform.Tensorboard(
+            test_constants.TensorboardConstants._TEST_TENSORBOARD_NAME
+        )
+        aiplatform.init(
+            project=_TEST_PROJECT,
+            location=_TEST_LOCATION,
+            experiment=_TEST_EXPERIMENT,
+            experiment_tensorboard=tb,
+        )
+
+        run = aiplatform.start_run(_TEST_RUN)
+        run.enable_time_series_metrics_buffering(
+            max_buffered_points=1, flush_interval=3600
+        )
+        run.log_time_series_metrics({"loss": 0.5}, step=1)
+
+        _wait_for(lambda: run._time_series_metrics_buffer._error is not None)
+        with pytest.raises(exceptions.ServiceUnavailable):
+            run.flush_time_series_metrics()
+
+        run.flush_time_series_metrics()
+
+        assert write_tensorboard_run_data_mock.call_count == 2
+        assert (
+            write_tensorboard_run_data_mock.call_args_list[0]
+            == write_tensorboard_run_data_mock.call_args_list[1]
+        )
+        aiplatform.end_run()
+
     @pytest.mark.usefixtures(
         "get_metadata_store_mock",
         "get_experiment_mock",
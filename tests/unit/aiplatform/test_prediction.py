@@ -17,9 +17,12 @@
 
 import asyncio
 import importlib
+import io
 import json
 import multiprocessing
+import numpy as np
 import os
+import pyarrow
 import pytest
 import requests
 import textwrap
@@ -56,6 +59,7 @@ from google.cloud.aiplatform.prediction import DEFAULT_PREDICT_ROUTE
 from google.cloud.aiplatform.prediction import LocalModel
 from google.cloud.aiplatform.prediction import LocalEndpoint
 from google.cloud.aiplatform.prediction import handler_utils
+from google.cloud.aiplatform.prediction.batcher import PredictionBatcher
 from google.cloud.aiplatform.prediction import local_endpoint
 from google.cloud.aiplatform.prediction import (
     model_server as model_server_module,
@@ -76,7 +80,13 @@ from google.cloud.aiplatform.prediction.local_model import (
     _DEFAULT_SDK_REQUIREMENTS,
 )
 from google.cloud.aiplatform.prediction.predictor import Predictor
+from google.cloud.aiplatform.prediction.sklearn import SklearnPredictor
+from google.cloud.aiplatform.prediction.xgboost import XgboostPredictor
+from google.cloud.aiplatform.prediction import serializer as serializer_module
+from google.cloud.aiplatform.prediction.serializer import ArrowSerializer
 from google.cloud.aiplatform.prediction.serializer import DefaultSerializer
+from google.cloud.aiplatform.prediction.serializer import MsgpackSerializer
+from google.cloud.aiplatform.prediction.serializer import NumpySerializer
 from google.cloud.aiplatform.utils import prediction_utils
 
 from google.cloud.aiplatform_v1.services.model_service import (
@@ -284,6 +294,14 @@ def get_test_predictor():
     return _TestPredictor
 
 
+class _TestSumPredictor(Predictor):
+    def load(self, artifacts_uri):
+        pass
+
+    def predict(self, instances):
+        return {"predictions": [[sum(instance)] for instance in instances["instances"]]}
+
+
 @pytest.fixture
 def populate_model_server_if_not_exists_mock():
     with mock.patch.object(
@@ -680,6 +698,22 @@ class TestPredictor:
 
         assert result == prediction_results
 
+    @pytest.mark.parametrize("predictor_class", [SklearnPredictor, XgboostPredictor])
+    def test_default_predictors_postprocess_returns_list(self, predictor_class):
+        prediction_results = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        result = predictor_class().postprocess(prediction_results)
+
+        assert result == {"predictions": [[1.0, 2.0], [3.0, 4.0]]}
+        assert json.dumps(result) == '{"predictions": [[1.0, 2.0], [3.0, 4.0]]}'
+
+        class ArrayPredictor(predictor_class):
+            keep_prediction_arrays = True
+
+        result = ArrayPredictor().postprocess(prediction_results)
+
+        assert result["predictions"] is prediction_results
+
 
 class TestDefaultSerializer:
     def test_deserialize_application_json(self):
@@ -774,6 +808,135 @@ class TestDefaultSerializer:
         assert expected_message in exception.value.detail
 
 
+class TestBinarySerializers:
+    def test_serialize_application_json_numpy(self):
+        prediction = {"predictions": np.array([[1, 2], [3, 4]])}
+
+        serialized_prediction = DefaultSerializer.serialize(
+            prediction, accept="application/json"
+        )
+
+        assert serialized_prediction == '{"predictions": [[1, 2], [3, 4]]}'
+
+    def test_numpy_serializer_round_trip(self):
+        instances = np.arange(6, dtype=np.float32).reshape(2, 3)
+        buffer = io.BytesIO()
+        np.save(buffer, instances)
+
+        deserialized_data = NumpySerializer.deserialize(
+            buffer.getvalue(), content_type="application/x-npy"
+        )
+        serialized_prediction = NumpySerializer.serialize(
+            {"predictions": deserialized_data["instances"]}, accept="application/x-npy"
+        )
+
+        np.testing.assert_array_equal(deserialized_data["instances"], instances)
+        np.testing.assert_array_equal(
+            np.load(io.BytesIO(serialized_prediction)), instances
+        )
+
+    def test_numpy_serializer_deserialize_invalid_data(self):
+        with pytest.raises(HTTPException) as exception:
+            NumpySerializer.deserialize(b"instances", content_type="application/x-npy")
+
+        assert exception.value.status_code == 400
+
+    def test_arrow_serializer_round_trip(self):
+        table = pyarrow.table({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        deserialized_data = ArrowSerializer.deserialize(
+            sink.getvalue().to_pybytes(),
+            content_type="application/vnd.apache.arrow.stream",
+        )
+        serialized_prediction = ArrowSerializer.serialize(
+            {"predictions": np.array([0.5, 0.25])},
+            accept="application/vnd.apache.arrow.stream",
+        )
+
+        np.testing.assert_array_equal(
+            deserialized_data["instances"], np.array([[1.0, 3.0], [2.0, 4.0]])
+        )
+        assert pyarrow.ipc.open_stream(
+            serialized_prediction
+        ).read_all().to_pydict() == {"predictions": [0.5, 0.25]}
+
+    def test_arrow_serializer_serialize_2d_predictions(self):
+        serialized_prediction = ArrowSerializer.serialize(
+            {"predictions": np.array([[1, 2], [3, 4]])},
+            accept="application/vnd.apache.arrow.stream",
+        )
+
+        assert pyarrow.ipc.open_stream(
+            serialized_prediction
+        ).read_all().to_pydict() == {"predictions_0": [1, 3], "predictions_1": [2, 4]}
+
+    def test_msgpack_serializer_round_trip(self):
+        import msgpack
+
+        instances = np.arange(4, dtype=np.int64).reshape(2, 2)
+        data = msgpack.packb(
+            {"instances": instances, "parameters": {"a": 1}},
+            default=serializer_module._encode_msgpack_ndarray,
+        )
+
+        deserialized_data = MsgpackSerializer.deserialize(
+            data, content_type="application/x-msgpack"
+        )
+        serialized_prediction = MsgpackSerializer.serialize(
+            {"predictions": deserialized_data["instances"]},
+            accept="application/x-msgpack",
+        )
+
+        np.testing.assert_array_equal(deserialized_data["instances"], instances)
+        assert deserialized_data["parameters"] == {"a": 1}
+        np.testing.assert_array_equal(
+            MsgpackSerializer.deserialize(serialized_prediction, None)["predictions"],
+            instances,
+        )
+
+    def test_binary_serializer_unsupported_accept_throws_exception(self):
+        with pytest.raises(HTTPException) as exception:
+            NumpySerializer.serialize({"predictions": [1]}, accept="application/json")
+
+        assert exception.value.status_code == 400
+
+    @pytest.mark.parametrize(
+        "content_type, expected_serializer",
+        [
+            ("application/json", DefaultSerializer),
+            ("application/x-npy", NumpySerializer),
+            ("application/vnd.apache.arrow.stream", ArrowSerializer),
+            ("application/x-msgpack", MsgpackSerializer),
+            ("unsupported_type", DefaultSerializer),
+            (None, DefaultSerializer),
+        ],
+    )
+    def test_get_serializer_for_content_type(self, content_type, expected_serializer):
+        assert (
+            serializer_module.get_serializer_for_content_type(content_type)
+            is expected_serializer
+        )
+
+    @pytest.mark.parametrize(
+        "accept, expected_serializer",
+        [
+            ("application/json", DefaultSerializer),
+            ("*/*", DefaultSerializer),
+            ("application/x-npy", NumpySerializer),
+            ("application/json;q=0.5, application/x-msgpack", MsgpackSerializer),
+            ("application/json, application/x-msgpack", DefaultSerializer),
+            ("text/html, application/vnd.apache.arrow.stream", ArrowSerializer),
+        ],
+    )
+    def test_get_serializer_for_accept(self, accept, expected_serializer):
+        assert (
+            serializer_module.get_serializer_for_accept(accept) is expected_serializer
+        )
+
+
 class TestPredictionHandler:
     def test_init(self, predictor_mock):
         handler = PredictionHandler(_TEST_GCS_ARTIFACTS_URI, predictor=predictor_mock)
@@ -941,6 +1104,275 @@ class TestPredictionHandler:
         )
 
 
+class TestPredictionBatcher:
+    @staticmethod
+    def _get_predict_fn(calls):
+        async def _predict_fn(prediction_input):
+            calls.append(prediction_input)
+            return {
+                "predictions": [
+                    sum(instance) for instance in prediction_input["instances"]
+                ]
+            }
+
+        return _predict_fn
+
+    @pytest.mark.asyncio
+    async def test_submit_merges_concurrent_inputs(self):
+        calls = []
+        batcher = PredictionBatcher(
+            self._get_predict_fn(calls), max_batch_size=10, max_wait_ms=50
+        )
+
+        results = await asyncio.gather(
+            batcher.submit({"instances": [[1, 2]]}),
+            batcher.submit({"instances": [[3, 4], [5, 6]]}),
+        )
+        await batcher.close()
+
+        assert results == [{"predictions": [3]}, {"predictions": [7, 11]}]
+        assert calls == [{"instances": [[1, 2], [3, 4], [5, 6]]}]
+
+    @pytest.mark.asyncio
+    async def test_submit_merges_queued_inputs_without_wait(self):
+        calls = []
+        batcher = PredictionBatcher(
+            self._get_predict_fn(calls), max_batch_size=10, max_wait_ms=0
+        )
+
+        results = await asyncio.gather(
+            *[batcher.submit({"instances": [[i]]}) for i in range(3)]
+        )
+        await batcher.close()
+
+        assert results == [{"predictions": [i]} for i in range(3)]
+        assert calls == [{"instances": [[0], [1], [2]]}]
+
+    @pytest.mark.asyncio
+    async def test_submit_respects_max_batch_size(self):
+        calls = []
+        batcher = PredictionBatcher(
+            self._get_predict_fn(calls), max_batch_size=2, max_wait_ms=50
+        )
+
+        results = await asyncio.gather(
+            *[batcher.submit({"instances": [[i]]}) for i in range(3)]
+        )
+        await batcher.close()
+
+        assert results == [{"predictions": [i]} for i in range(3)]
+        assert calls == [{"instances": [[0], [1]]}, {"instances": [[2]]}]
+
+    @pytest.mark.asyncio
+    async def test_submit_does_not_merge_different_parameters(self):
+        calls = []
+        batcher = PredictionBatcher(
+            self._get_predict_fn(calls), max_batch_size=10, max_wait_ms=50
+        )
+
+        await asyncio.gather(
+            batcher.submit({"instances": [[1]], "parameters": {"a": 1}}),
+            batcher.submit({"instances": [[2]], "parameters": {"a": 2}}),
+        )
+        await batcher.close()
+
+        assert calls == [
+            {"instances": [[1]], "parameters": {"a": 1}},
+            {"instances": [[2]], "parameters": {"a": 2}},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_submit_not_batchable_input(self):
+        calls = []
+        batcher = PredictionBatcher(
+            self._get_predict_fn(calls), max_batch_size=10, max_wait_ms=50
+        )
+
+        result = await batcher.submit({"instances": [[1]], "other": 1})
+
+        assert result == {"predictions": [1]}
+        assert calls == [{"instances": [[1]], "other": 1}]
+
+    @pytest.mark.asyncio
+    async def test_submit_predict_fn_raises_exception(self):
+        async def _predict_fn(prediction_input):
+            raise ValueError("Prediction failed.")
+
+        batcher = PredictionBatcher(_predict_fn, max_batch_size=10, max_wait_ms=50)
+
+        results = await asyncio.gather(
+            batcher.submit({"instances": [[1]]}),
+            batcher.submit({"instances": [[2]]}),
+            return_exceptions=True,
+        )
+        await batcher.close()
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_submit_results_cannot_be_split_raises_exception(self):
+        async def _predict_fn(prediction_input):
+            return {"predictions": [1]}
+
+        batcher = PredictionBatcher(_predict_fn, max_batch_size=10, max_wait_ms=50)
+
+        with pytest.raises(ValueError) as exception:
+            await asyncio.gather(
+                batcher.submit({"instances": [[1]]}),
+                batcher.submit({"instances": [[2]]}),
+            )
+        await batcher.close()
+
+        assert "one prediction per instance" in str(exception.value)
+
+    def test_init_invalid_max_batch_size_raises_exception(self):
+        with pytest.raises(ValueError):
+            PredictionBatcher(mock.AsyncMock(), max_batch_size=0, max_wait_ms=0)
+
+
+class TestPredictionHandlerBatching:
+    def test_init_without_batching(self, predictor_mock):
+        handler = PredictionHandler(_TEST_GCS_ARTIFACTS_URI, predictor=predictor_mock)
+
+        assert handler._batcher is None
+
+    @pytest.mark.asyncio
+    async def test_handle_with_batching(
+        self,
+        deserialize_mock,
+        get_content_type_from_headers_mock,
+        get_accept_from_headers_mock,
+        serialize_mock,
+    ):
+        postprocess_mock = mock.MagicMock(return_value={"predictions": [[1], [1]]})
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=get_test_predictor(),
+            max_batch_size=4,
+            max_batch_wait_ms=50,
+        )
+
+        with mock.patch.multiple(
+            handler._predictor,
+            preprocess=mock.MagicMock(side_effect=lambda x: x),
+            predict=mock.MagicMock(side_effect=lambda x: x),
+            postprocess=postprocess_mock,
+        ):
+            responses = await asyncio.gather(
+                handler.handle(get_test_request()),
+                handler.handle(get_test_request()),
+            )
+        await handler._batcher.close()
+
+        assert [response.status_code for response in responses] == [200, 200]
+        postprocess_mock.assert_called_once_with(
+            {"instances": [[1, 2, 3, 4], [1, 2, 3, 4]]}
+        )
+        serialize_mock.assert_has_calls(
+            [
+                mock.call(_TEST_PREDICTION_OUTPUT, _APPLICATION_JSON),
+                mock.call(_TEST_PREDICTION_OUTPUT, _APPLICATION_JSON),
+            ]
+        )
+
+
+class TestPredictionHandlerExecutor:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    async def test_handle_with_executor(
+        self,
+        executor,
+        deserialize_mock,
+        get_content_type_from_headers_mock,
+        get_accept_from_headers_mock,
+        serialize_mock,
+    ):
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=_TestSumPredictor,
+            executor=executor,
+            executor_workers=1,
+        )
+
+        response = await handler.handle(get_test_request())
+        handler._executor.shutdown()
+
+        assert response.status_code == 200
+        serialize_mock.assert_called_once_with(
+            {"predictions": [[10]]}, _APPLICATION_JSON
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    async def test_close_shuts_down_executor(self, executor):
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=_TestSumPredictor,
+            executor=executor,
+            executor_workers=1,
+        )
+
+        await handler.close()
+
+        with pytest.raises(RuntimeError):
+            handler._executor.submit(print)
+
+    def test_init_with_process_executor_does_not_load_predictor(self):
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=_TestSumPredictor,
+            executor="process",
+        )
+        handler._executor.shutdown()
+
+        assert handler._predictor is None
+
+    def test_init_unsupported_executor_raises_exception(self, predictor_mock):
+        with pytest.raises(ValueError) as exception:
+            PredictionHandler(
+                _TEST_GCS_ARTIFACTS_URI,
+                predictor=predictor_mock,
+                executor="unsupported",
+            )
+
+        assert "Unsupported executor: unsupported." in str(exception.value)
+
+    @pytest.mark.asyncio
+    async def test_handle_queue_full_raises_exception(
+        self, predictor_mock, deserialize_mock
+    ):
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=predictor_mock,
+            max_queue_size=1,
+        )
+        handler._num_requests_in_flight = 1
+
+        with pytest.raises(HTTPException) as exception:
+            await handler.handle(get_test_request())
+
+        assert exception.value.status_code == 503
+        assert not deserialize_mock.called
+
+    @pytest.mark.asyncio
+    async def test_handle_releases_queue_slot(
+        self,
+        deserialize_exception_mock,
+        get_content_type_from_headers_mock,
+        predictor_mock,
+    ):
+        handler = PredictionHandler(
+            _TEST_GCS_ARTIFACTS_URI,
+            predictor=predictor_mock,
+            max_queue_size=1,
+        )
+
+        with pytest.raises(HTTPException):
+            await handler.handle(get_test_request())
+
+        assert handler._num_requests_in_flight == 0
+
+
 class TestHandlerUtils:
     @pytest.mark.parametrize(
         "header_key, content_type_value, expected_content_type",
@@ -3192,6 +3624,17 @@ class TestModelServer:
 
         assert response.status_code == 200
 
+    def test_shutdown_closes_handler(
+        self, model_server_env_mock, importlib_import_module_mock_twice
+    ):
+        model_server = CprModelServer()
+        model_server.handler.close = mock.AsyncMock()
+
+        with TestClient(model_server.app):
+            model_server.handler.close.assert_not_awaited()
+
+        model_server.handler.close.assert_awaited_once_with()
+
     def test_predict(self, model_server_env_mock, importlib_import_module_mock_twice):
         model_server = CprModelServer()
         client = TestClient(model_server.app)
@@ -3267,6 +3710,44 @@ class TestModelServer:
         assert response.status_code == 500
         assert json.loads(response.content)["detail"] == expected_message
 
+    @mock.patch.dict(
+        os.environ,
+        {},
+        clear=True,
+    )
+    def test_get_handler_kwargs_from_env_default(self):
+        assert model_server_module.get_handler_kwargs_from_env() == {}
+
+    @mock.patch.dict(
+        os.environ,
+        {
+            "VERTEX_CPR_MAX_BATCH_SIZE": "64",
+            "VERTEX_CPR_MAX_BATCH_WAIT_MS": "5",
+        },
+        clear=True,
+    )
+    def test_get_handler_kwargs_from_env_batching(self):
+        assert model_server_module.get_handler_kwargs_from_env() == {
+            "max_batch_size": 64,
+            "max_batch_wait_ms": 5.0,
+        }
+
+    @mock.patch.dict(
+        os.environ,
+        {
+            "VERTEX_CPR_PREDICT_EXECUTOR": "process",
+            "VERTEX_CPR_PREDICT_EXECUTOR_WORKERS": "4",
+            "VERTEX_CPR_MAX_QUEUE_SIZE": "32",
+        },
+        clear=True,
+    )
+    def test_get_handler_kwargs_from_env_executor(self):
+        assert model_server_module.get_handler_kwargs_from_env() == {
+            "executor": "process",
+            "executor_workers": 4,
+            "max_queue_size": 32,
+        }
+
     @mock.patch.dict(
         os.environ,
         {
@@ -16,6 +16,7 @@
 #
 """Tests for uploader.py."""
 
+from concurrent import futures
 import datetime
 import functools
 import logging
@@ -69,6 +70,7 @@ from tensorboard.uploader import logdir_loader
 from tensorboard.uploader import upload_tracker
 from tensorboard.uploader import util
 from tensorboard.uploader.proto import server_info_pb2
+from tensorboard.util import tensor_util
 
 data_compat = uploader_lib.event_file_loader.data_compat
 dataclass_compat = uploader_lib.event_file_loader.dataclass_compat
@@ -208,6 +210,13 @@ def _create_uploader(
     one_shot=None,
     allowed_plugins=_SCALARS_HISTOGRAMS_AND_GRAPHS,
     run_name_prefix=None,
+    max_blob_upload_workers=uploader_lib._DEFAULT_MAX_BLOB_UPLOAD_WORKERS,
+    max_run_reader_workers=1,
+    max_in_flight_write_requests=1,
+    single_pass=False,
+    max_buffered_event_bytes=uploader_lib._DEFAULT_MAX_BUFFERED_EVENT_BYTES,
+    incremental_logdir_sync=False,
+    logdir_sync_cursor_path=None,
 ):
     if writer_client is _USE_DEFAULT:
         writer_client = _create_mock_client()
@@ -249,6 +258,13 @@ def _create_uploader(
         verbosity=verbosity,
         one_shot=one_shot,
         run_name_prefix=run_name_prefix,
+        max_blob_upload_workers=max_blob_upload_workers,
+        max_run_reader_workers=max_run_reader_workers,
+        max_in_flight_write_requests=max_in_flight_write_requests,
+        single_pass=single_pass,
+        max_buffered_event_bytes=max_buffered_event_bytes,
+        incremental_logdir_sync=incremental_logdir_sync,
+        logdir_sync_cursor_path=logdir_sync_cursor_path,
     )
 
 
@@ -257,6 +273,10 @@ def _create_dispatcher(
     api=None,
     allowed_plugins=_USE_DEFAULT,
     logdir=None,
+    max_scalar_request_size=128000,
+    max_run_reader_workers=1,
+    max_in_flight_write_requests=1,
+    tracker=None,
 ):
     if api is _USE_DEFAULT:
         api = _create_mock_client()
@@ -264,7 +284,7 @@ def _create_dispatcher(
         allowed_plugins = _SCALARS_HISTOGRAMS_AND_GRAPHS
 
     upload_limits = server_info_pb2.UploadLimits(
-        max_scalar_request_size=128000,
+        max_scalar_request_size=max_scalar_request_size,
         max_tensor_request_size=128000,
         max_tensor_point_size=52000,
         max_blob_request_size=128000,
@@ -289,7 +309,8 @@ def _create_dispatcher(
         blob_storage_bucket=None,
         blob_storage_folder=None,
         one_platform_resource_manager=one_platform_resource_manager,
-        tracker=upload_tracker.UploadTracker(verbosity=0),
+        tracker=tracker or upload_tracker.UploadTracker(verbosity=0),
+        max_in_flight_write_requests=max_in_flight_write_requests,
     )
 
     additional_senders = {}
@@ -309,6 +330,7 @@ def _create_dispatcher(
     return uploader_lib._Dispatcher(
         request_sender=request_sender,
         additional_senders=additional_senders,
+        max_run_reader_workers=max_run_reader_workers,
     )
 
 
@@ -706,6 +728,147 @@ class TensorboardUploaderTest(tf.test.TestCase):
         self.assertEqual(mock_tracker.tensors_tracker.call_count, 0)
         self.assertEqual(mock_tracker.blob_tracker.call_count, 0)
 
+    def test_start_uploading_one_shot_max_buffered_event_bytes(self):
+        uploader = _create_uploader(
+            logdir=self.get_temp_dir(),
+            one_shot=True,
+            single_pass=True,
+            max_buffered_event_bytes=1234,
+        )
+        uploader.create_experiment()
+
+        with mock.patch.object(
+            uploader_lib, "_LogdirEventBuffer", wraps=uploader_lib._LogdirEventBuffer
+        ) as mock_event_buffer, mock.patch.object(
+            uploader, "_pre_create_runs_and_time_series"
+        ), mock.patch.object(
+            uploader, "_upload_once"
+        ):
+            uploader.start_uploading()
+
+        mock_event_buffer.assert_called_once_with(1234)
+
+    def test_invalid_max_buffered_event_bytes(self):
+        with self.assertRaises(ValueError):
+            _create_uploader(max_buffered_event_bytes=-1)
+
+    def test_start_uploading_one_shot_single_pass(self):
+        uploader = _create_uploader(
+            logdir=self.get_temp_dir(), one_shot=True, single_pass=True
+        )
+        uploader.create_experiment()
+
+        with mock.patch.object(
+            uploader, "_pre_create_runs_and_time_series"
+        ) as mock_pre_create, mock.patch.object(
+            uploader, "_upload_once"
+        ) as mock_upload_once:
+            uploader.start_uploading()
+
+        # The events read to pre-create the runs are uploaded.
+        mock_pre_create.assert_called_once_with(mock.ANY)
+        self.assertIsInstance(
+            mock_pre_create.call_args[0][0], uploader_lib._LogdirEventBuffer
+        )
+        mock_upload_once.assert_called_once_with({})
+        self.assertIsNotNone(uploader.single_pass_time_saved_secs)
+
+    def test_start_uploading_one_shot_two_passes(self):
+        uploader = _create_uploader(logdir=self.get_temp_dir(), one_shot=True)
+        uploader.create_experiment()
+
+        with mock.patch.object(
+            uploader, "_pre_create_runs_and_time_series"
+        ) as mock_pre_create, mock.patch.object(
+            uploader, "_upload_once"
+        ) as mock_upload_once:
+            uploader.start_uploading()
+
+        mock_pre_create.assert_called_once_with()
+        mock_upload_once.assert_called_once_with()
+        self.assertIsNone(uploader.single_pass_time_saved_secs)
+
+    def test_upload_incremental_logdir_sync(self):
+        logdir = self.get_temp_dir()
+        mock_client = _create_mock_client()
+        uploader = _create_uploader(mock_client, logdir, incremental_logdir_sync=True)
+        uploader.create_experiment()
+        self.assertIsInstance(
+            uploader._logdir_change_detector, uploader_utils.LocalLogdirChangeDetector
+        )
+
+        writer_a = FileWriter(os.path.join(logdir, "a"))
+        writer_a.add_test_summary("foo", simple_value=1.0, step=1)
+        writer_a.flush()
+        writer_b = FileWriter(os.path.join(logdir, "b"))
+        writer_b.add_test_summary("foo", simple_value=1.0, step=1)
+        writer_b.flush()
+        with mock.patch.object(
+            uploader,
+            "_directory_loader_factory",
+            wraps=uploader._directory_loader_factory,
+        ) as mock_directory_loader_factory:
+            uploader._upload_once()
+            self.assertEqual(2, mock_directory_loader_factory.call_count)
+            self.assertEqual(
+                1, mock_client.write_tensorboard_experiment_data.call_count
+            )
+
+            # Nothing changed.
+            with mock.patch.object(
+                uploader_lib, "_load_run_events"
+            ) as mock_load_run_events:
+                uploader._upload_once()
+            mock_load_run_events.assert_not_called()
+            self.assertEqual(
+                1, mock_client.write_tensorboard_experiment_data.call_count
+            )
+
+            # Only run b changed, its existing loader reads the new events.
+            writer_b.add_test_summary("foo", simple_value=2.0, step=2)
+            writer_b.flush()
+            uploader._upload_once()
+            self.assertEqual(2, mock_directory_loader_factory.call_count)
+
+        self.assertEqual(2, mock_client.write_tensorboard_experiment_data.call_count)
+        call_args = mock_client.write_tensorboard_experiment_data.call_args
+        (run_request,) = call_args[1]["write_run_data_requests"]
+        self.assertEqual(
+            [point.scalar.value for point in run_request.time_series_data[0].values],
+            [2.0],
+        )
+
+    def test_upload_incremental_logdir_sync_resumes_from_cursor(self):
+        logdir = self.get_temp_dir()
+        cursor_path = os.path.join(self.get_temp_dir(), "cursor.json")
+        with FileWriter(os.path.join(logdir, "a")) as writer:
+            writer.add_test_summary("foo", simple_value=1.0, step=1)
+
+        mock_client = _create_mock_client()
+        uploader = _create_uploader(
+            mock_client,
+            logdir,
+            incremental_logdir_sync=True,
+            logdir_sync_cursor_path=cursor_path,
+        )
+        uploader.create_experiment()
+        uploader._upload_once()
+        self.assertEqual(1, mock_client.write_tensorboard_experiment_data.call_count)
+
+        # A restarted uploader does not read the unchanged run again.
+        restarted_uploader = _create_uploader(
+            mock_client,
+            logdir,
+            incremental_logdir_sync=True,
+            logdir_sync_cursor_path=cursor_path,
+        )
+        restarted_uploader.create_experiment()
+        with mock.patch.object(
+            uploader_lib, "_load_run_events"
+        ) as mock_load_run_events:
+            restarted_uploader._upload_once()
+        mock_load_run_events.assert_not_called()
+
     def test_upload_empty_logdir(self):
         logdir = self.get_temp_dir()
         mock_client = _create_mock_client()
@@ -1293,6 +1456,405 @@ class BatchedRequestSenderTest(tf.test.TestCase):
         )
 
 
+class PipelinedDispatchTest(tf.test.TestCase):
+    def _create_run_to_events(self, num_runs, num_steps):
+        return {
+            "run_%d"
+            % i: _apply_compat(
+                [
+                    event_pb2.Event(step=step, summary=scalar_v2_pb("loss", step))
+                    for step in range(num_steps)
+                ]
+            )
+            for i in range(num_runs)
+        }
+
+    def test_pipelined_dispatch(self):
+        mock_client = _create_mock_client()
+        lock = threading.Lock()
+        in_flight = [0]
+        max_in_flight = [0]
+        run_to_steps = {}
+
+        def write_tensorboard_experiment_data(
+            tensorboard_experiment, write_run_data_requests
+        ):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+                for run_request in write_run_data_requests:
+                    steps = [
+                        point.step
+                        for time_series_data in run_request.time_series_data
+                        for point in time_series_data.values
+                    ]
+                    self.assertEqual(steps, sorted(steps))
+                    run_to_steps.setdefault(run_request.tensorboard_run, []).extend(
+                        steps
+                    )
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+
+        mock_client.write_tensorboard_experiment_data.side_effect = (
+            write_tensorboard_experiment_data
+        )
+        dispatcher = _create_dispatcher(
+            experiment_resource_name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME,
+            api=mock_client,
+            max_scalar_request_size=1000,
+            max_run_reader_workers=4,
+            max_in_flight_write_requests=3,
+        )
+
+        dispatcher.dispatch_requests(self._create_run_to_events(8, 300))
+
+        self.assertLen(run_to_steps, 8)
+        for steps in run_to_steps.values():
+            self.assertEqual(sorted(steps), list(range(300)))
+        self.assertEqual(max_in_flight[0], 3)
+
+    def test_pipelined_dispatch_raises_write_error(self):
+        mock_client = _create_mock_client()
+        mock_client.write_tensorboard_experiment_data.side_effect = _grpc_error(
+            grpc.StatusCode.NOT_FOUND, "nope"
+        )
+        dispatcher = _create_dispatcher(
+            experiment_resource_name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME,
+            api=mock_client,
+            max_scalar_request_size=1000,
+            max_run_reader_workers=4,
+            max_in_flight_write_requests=3,
+        )
+
+        with self.assertRaises(uploader_lib.ExperimentNotFoundError):
+            dispatcher.dispatch_requests(self._create_run_to_events(8, 300))
+
+    def test_pipelined_dispatch_tracks_written_requests(self):
+        mock_client = _create_mock_client()
+        lock = threading.Lock()
+        num_calls = [0]
+        num_written = [0]
+
+        def write_tensorboard_experiment_data(
+            tensorboard_experiment, write_run_data_requests
+        ):
+            with lock:
+                num_calls[0] += 1
+                if num_calls[0] % 2 == 0:
+                    raise _grpc_error(grpc.StatusCode.UNAVAILABLE, "unavailable")
+                num_written[0] += 1
+
+        mock_client.write_tensorboard_experiment_data.side_effect = (
+            write_tensorboard_experiment_data
+        )
+        mock_tracker = mock.MagicMock()
+        scalars_tracker = mock_tracker.scalars_tracker.return_value
+
+        def enter_scalars_tracker():
+            # Requests are tracked once written, not when submitted.
+            self.assertLessEqual(scalars_tracker.__enter__.call_count, num_written[0])
+
+        scalars_tracker.__enter__.side_effect = enter_scalars_tracker
+        dispatcher = _create_dispatcher(
+            experiment_resource_name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME,
+            api=mock_client,
+            max_scalar_request_size=1000,
+            max_in_flight_write_requests=3,
+            tracker=mock_tracker,
+        )
+
+        dispatcher.dispatch_requests(self._create_run_to_events(1, 300))
+
+        self.assertGreater(num_calls[0], 2)
+        self.assertEqual(mock_tracker.scalars_tracker.call_count, num_calls[0])
+        self.assertEqual(scalars_tracker.__enter__.call_count, num_written[0])
+
+    def test_pipelined_dispatch_raises_read_error(self):
+        def failing_events():
+            yield event_pb2.Event(step=0, summary=scalar_v2_pb("loss", 0.0))
+            raise AbortUploadError
+
+        run_to_events = self._create_run_to_events(3, 10)
+        run_to_events["failing_run"] = _apply_compat(failing_events())
+        dispatcher = _create_dispatcher(
+            experiment_resource_name=_TEST_ONE_PLATFORM_EXPERIMENT_NAME,
+            api=_create_mock_client(),
+            max_run_reader_workers=2,
+        )
+
+        with self.assertRaises(AbortUploadError):
+            dispatcher.dispatch_requests(run_to_events)
+
+    def test_invalid_pipeline_arguments(self):
+        with self.assertRaises(ValueError):
+            _create_uploader(max_run_reader_workers=0)
+        with self.assertRaises(ValueError):
+            _create_uploader(max_in_flight_write_requests=0)
+
+
+class LogdirChangeDetectorTest(tf.test.TestCase):
+    def test_local_logdir_change_detector(self):
+        logdir = self.get_temp_dir()
+        detector = uploader_utils.LocalLogdirChangeDetector(logdir)
+        self.assertEqual(detector.get_changed_runs(), set())
+
+        with FileWriter(logdir) as writer:
+            writer.add_test_summary("foo")
+        for run_name in ("a", os.path.join("b", "c")):
+            with FileWriter(os.path.join(logdir, run_name)) as writer:
+                writer.add_test_summary("foo")
+        with open(os.path.join(logdir, "a", "not_events.txt"), "w") as f:
+            f.write("ignored")
+
+        self.assertEqual(
+            detector.get_changed_runs(), {".", "a", os.path.join("b", "c")}
+        )
+        self.assertEqual(detector.get_changed_runs(), set())
+
+        with FileWriter(os.path.join(logdir, "a")) as writer:
+            writer.add_test_summary("bar")
+        self.assertEqual(detector.get_changed_runs(), {"a"})
+        self.assertEqual(detector.runs, {".", "a", os.path.join("b", "c")})
+
+    def test_logdir_change_detector_persists_cursor(self):
+        logdir = self.get_temp_dir()
+        cursor_path = os.path.join(self.get_temp_dir(), "cursor.json")
+        for run_name in ("a", "b"):
+            with FileWriter(os.path.join(logdir, run_name)) as writer:
+                writer.add_test_summary("foo")
+
+        detector = uploader_utils.LocalLogdirChangeDetector(
+            logdir, cursor_path=cursor_path
+        )
+        self.assertEqual(detector.get_changed_runs(), {"a", "b"})
+        self.assertFalse(os.path.exists(cursor_path))
+        detector.save_cursor()
+
+        with FileWriter(os.path.join(logdir, "b")) as writer:
+            writer.add_test_summary("bar")
+
+        restarted_detector = uploader_utils.LocalLogdirChangeDetector(
+            logdir, cursor_path=cursor_path
+        )
+        self.assertEqual(restarted_detector.runs, {"a", "b"})
+        self.assertEqual(restarted_detector.get_changed_runs(), {"b"})
+
+        # A cursor of another logdir or an invalid cursor is ignored.
+        other_detector = uploader_utils.LocalLogdirChangeDetector(
+            os.path.join(logdir, "a"), cursor_path=cursor_path
+        )
+        self.assertEqual(other_detector.runs, set())
+        with open(cursor_path, "w") as f:
+            f.write("not json")
+        self.assertEqual(
+            uploader_utils.LocalLogdirChangeDetector(
+                logdir, cursor_path=cursor_path
+            ).runs,
+            set(),
+        )
+
+    def test_gcs_logdir_change_detector(self):
+        mock_bucket = mock.create_autospec(storage.Bucket, instance=True)
+        mock_bucket.name = "my-bucket"
+
+        def create_blob(name, generation, size=10):
+            blob = mock.Mock(generation=generation, size=size)
+            blob.name = name
+            return blob
+
+        mock_bucket.list_blobs.side_effect = [
+            [
+                create_blob("logs/a/events.out.tfevents.1", 1),
+                create_blob("logs/a/profile.pb", 1),
+                create_blob("logs/b/c/events.out.tfevents.2", 1),
+            ],
+            [
+                create_blob("logs/a/events.out.tfevents.1", 1),
+                create_blob("logs/b/c/events.out.tfevents.2", 2, size=20),
+                create_blob("logs/d/events.out.tfevents.3", 1),
+            ],
+        ]
+        detector = uploader_utils.GcsLogdirChangeDetector(
+            "gs://my-bucket/logs/", mock_bucket
+        )
+
+        self.assertEqual(detector.get_changed_runs(), {"a", "b/c"})
+        self.assertEqual(detector.get_changed_runs(), {"b/c", "d"})
+        self.assertEqual(detector.runs, {"a", "b/c", "d"})
+        self.assertEqual(mock_bucket.list_blobs.call_args[1]["prefix"], "logs/")
+
+    def test_get_logdir_change_detector(self):
+        self.assertIsInstance(
+            uploader_utils.get_logdir_change_detector(self.get_temp_dir()),
+            uploader_utils.LocalLogdirChangeDetector,
+        )
+        with mock.patch.object(storage, "Client"):
+            self.assertIsInstance(
+                uploader_utils.get_logdir_change_detector("gs://my-bucket/logs"),
+                uploader_utils.GcsLogdirChangeDetector,
+            )
+        self.assertIsNone(uploader_utils.get_logdir_change_detector("s3://b/logs"))
+
+    @mock.patch.object(time, "sleep")
+    def test_adaptive_poll_rate_limiter(self, mock_sleep):
+        limiter = uploader_lib._AdaptivePollRateLimiter(1, 8)
+        limiter.tick()
+        mock_sleep.assert_not_called()
+
+        intervals = []
+        for has_changes in (False, False, False, False, False, True):
+            limiter.record_activity(has_changes)
+            intervals.append(limiter.interval_secs)
+        self.assertEqual(intervals, [2, 4, 8, 8, 8, 1])
+
+        limiter.record_activity(False)
+        limiter.tick()
+        self.assertGreater(mock_sleep.call_args[0][0], 1)
+
+
+class LogdirEventBufferTest(tf.test.TestCase):
+    def _add_runs(self, event_buffer, run_to_events):
+        for run_name, events in run_to_events.items():
+            for _ in event_buffer.add_run(run_name, events):
+                pass
+
+    def test_buffers_events_in_memory(self):
+        run_to_events = {
+            "run_%d" % i: [_scalar_event("loss", step) for step in range(5)]
+            for i in range(3)
+        }
+
+        with uploader_lib._LogdirEventBuffer(max_memory_bytes=2**20) as event_buffer:
+            self._add_runs(event_buffer, run_to_events)
+
+            self.assertEqual(event_buffer.num_events, 15)
+            self.assertEqual(event_buffer.num_spilled_events, 0)
+            self.assertEqual(
+                {
+                    run_name: list(events)
+                    for run_name, events in event_buffer.get_run_events().items()
+                },
+                run_to_events,
+            )
+
+    def test_spills_events_past_max_memory_bytes(self):
+        run_to_events = {
+            "run_%d" % i: [_scalar_event("loss", step) for step in range(50)]
+            for i in range(4)
+        }
+        max_memory_bytes = run_to_events["run_0"][0].ByteSize() * 60
+
+        with uploader_lib._LogdirEventBuffer(max_memory_bytes) as event_buffer:
+            self._add_runs(event_buffer, run_to_events)
+            spill_file = event_buffer._spill_file
+
+            self.assertEqual(event_buffer.num_events, 200)
+            self.assertEqual(event_buffer.num_spilled_events, 140)
+            with futures.ThreadPoolExecutor(max_workers=4) as executor:
+                replayed_run_to_events = dict(
+                    zip(
+                        run_to_events,
+                        executor.map(list, event_buffer.get_run_events().values()),
+                    )
+                )
+            self.assertEqual(replayed_run_to_events, run_to_events)
+
+        self.assertTrue(spill_file.closed)
+
+
+class BlobRequestSenderTest(tf.test.TestCase):
+    def _create_blob_request_sender(self, mock_bucket, max_blob_upload_workers):
+        mock_resource_manager = mock.create_autospec(
+            uploader_utils.OnePlatformResourceManager
+        )
+        mock_resource_manager.get_time_series_resource_name.return_value = (
+            _TEST_ONE_PLATFORM_TIME_SERIES_NAME
+        )
+        return uploader_lib._BlobRequestSender(
+            experiment_resource_id=_TEST_ONE_PLATFORM_EXPERIMENT_NAME,
+            api=_create_mock_client(),
+            rpc_rate_limiter=util.RateLimiter(0),
+            max_blob_request_size=128000,
+            max_blob_size=12345,
+            blob_storage_bucket=mock_bucket,
+            blob_storage_folder=_TEST_BLOB_STORAGE_FOLDER,
+            tracker=mock.MagicMock(),
+            one_platform_resource_manager=mock_resource_manager,
+            max_blob_upload_workers=max_blob_upload_workers,
+        )
+
+    def _create_data_point(self, sender, blobs):
+        value = summary_pb2.Summary.Value(
+            tag="images", tensor=tensor_util.make_tensor_proto(blobs)
+        )
+        return sender._create_data_point(
+            _TEST_RUN_NAME,
+            event_pb2.Event(step=1, wall_time=123.5),
+            value,
+            value.metadata,
+        )
+
+    def test_concurrent_uploads_keep_blob_order(self):
+        blobs = [b"blob_%d" % i for i in range(10)]
+        uploaded_blobs = {}
+        mock_bucket = mock.create_autospec(storage.Bucket)
+
+        def create_blob(blob_path, chunk_size=None):
+            mock_blob = mock.create_autospec(storage.Blob)
+
+            def upload_from_string(data):
+                # Earlier blobs finish last.
+                time.sleep(0.001 * (len(blobs) - int(data.split(b"_")[1])))
+                uploaded_blobs[blob_path.split("/")[-1]] = data
+
+            mock_blob.upload_from_string.side_effect = upload_from_string
+            return mock_blob
+
+        mock_bucket.blob.side_effect = create_blob
+        sender = self._create_blob_request_sender(
+            mock_bucket, max_blob_upload_workers=4
+        )
+
+        point = self._create_data_point(sender, blobs)
+
+        self.assertEqual(
+            [uploaded_blobs[blob.id] for blob in point.blobs.values], blobs
+        )
+        self.assertEqual(sender._tracker.blob_tracker.call_count, len(blobs))
+
+    def test_serial_uploads_skip_too_large_blobs(self):
+        mock_bucket = mock.create_autospec(storage.Bucket)
+        sender = self._create_blob_request_sender(
+            mock_bucket, max_blob_upload_workers=1
+        )
+
+        point = self._create_data_point(sender, [b"small", b"x" * 20000])
+
+        self.assertLen(point.blobs.values, 1)
+        mock_bucket.blob.assert_called_once()
+        self.assertIsNone(sender._blob_upload_executor)
+
+    @mock.patch.object(uploader_lib, "_BLOB_CHUNKED_UPLOAD_THRESHOLD", 10)
+    def test_large_blobs_use_chunked_upload(self):
+        mock_bucket = mock.create_autospec(storage.Bucket)
+        sender = self._create_blob_request_sender(
+            mock_bucket, max_blob_upload_workers=1
+        )
+
+        self._create_data_point(sender, [b"small", b"x" * 100])
+
+        self.assertEqual(mock_bucket.blob.call_args_list[0][1], {})
+        self.assertEqual(
+            mock_bucket.blob.call_args_list[1][1],
+            {"chunk_size": uploader_lib._BLOB_UPLOAD_CHUNK_SIZE},
+        )
+
+    def test_invalid_max_blob_upload_workers(self):
+        with self.assertRaises(ValueError):
+            _create_uploader(max_blob_upload_workers=0)
+
+
 class ProfileRequestSenderTest(tf.test.TestCase):
     def _create_builder(self, mock_client, logdir):
         return _create_dispatcher(
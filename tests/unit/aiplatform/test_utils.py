@@ -23,6 +23,7 @@ import os
 import re
 import tempfile
 import textwrap
+import time
 from typing import Callable, Dict, Optional, Tuple
 from unittest import mock
 from unittest.mock import patch
@@ -70,8 +71,10 @@ def mock_storage_client():
 
     blob1 = mock.MagicMock()
     type(blob1).name = mock.PropertyMock(return_value=f"{GCS_PREFIX}/{FAKE_FILENAME}")
+    blob1.size = 1
     blob2 = mock.MagicMock()
     type(blob2).name = mock.PropertyMock(return_value=f"{GCS_PREFIX}/")
+    blob2.size = 0
 
     def get_blobs(bucket_name, prefix=""):
         return [blob1, blob2]
@@ -421,6 +424,48 @@ def test_wrapped_client():
     )
 
 
+@pytest.mark.usefixtures("google_auth_mock")
+def test_wrapped_client_reuses_client():
+    wrapped_client = utils.ClientWithOverride.WrappedClient(
+        client_class=model_service_client_default.ModelServiceClient,
+        client_options=client_options.ClientOptions(),
+        client_info=gapic_v1.client_info.ClientInfo(),
+    )
+
+    assert wrapped_client.get_model.__self__ is wrapped_client.list_models.__self__
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+def test_wrapped_client_releases_idle_client():
+    wrapped_client = utils.ClientWithOverride.WrappedClient(
+        client_class=model_service_client_default.ModelServiceClient,
+        client_options=client_options.ClientOptions(),
+        client_info=gapic_v1.client_info.ClientInfo(),
+        idle_timeout=60,
+    )
+
+    with mock.patch.object(utils.time, "monotonic", side_effect=[100, 130, 200]):
+        client = wrapped_client.get_model.__self__
+        assert wrapped_client.get_model.__self__ is client
+        assert wrapped_client.get_model.__self__ is not client
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+def test_wrapped_client_close():
+    wrapped_client = utils.ClientWithOverride.WrappedClient(
+        client_class=model_service_client_default.ModelServiceClient,
+        client_options=client_options.ClientOptions(),
+        client_info=gapic_v1.client_info.ClientInfo(),
+    )
+    client = wrapped_client.get_model.__self__
+
+    with mock.patch.object(client.transport, "close") as close_mock:
+        wrapped_client.close()
+
+    close_mock.assert_called_once_with()
+    assert wrapped_client.get_model.__self__ is not client
+
+
 @pytest.mark.usefixtures("google_auth_mock")
 def test_client_w_override_default_version():
 
@@ -439,6 +484,41 @@ def test_client_w_override_default_version():
     )
 
 
+@pytest.mark.usefixtures("google_auth_mock")
+def test_client_w_override_instantiates_versions_lazily():
+    test_client_info = gapic_v1.client_info.ClientInfo()
+    test_client_options = client_options.ClientOptions()
+
+    client_w_override = utils.PredictionClientWithOverride(
+        client_options=test_client_options,
+        client_info=test_client_info,
+    )
+    assert not client_w_override._clients
+
+    client_w_override.select_version(compat.V1)
+    assert list(client_w_override._clients) == [compat.V1]
+
+    with pytest.raises(KeyError):
+        client_w_override.select_version("v0")
+
+
+@pytest.mark.usefixtures("google_auth_mock")
+def test_client_w_override_close():
+    test_client_info = gapic_v1.client_info.ClientInfo()
+    test_client_options = client_options.ClientOptions()
+
+    client_w_override = utils.PredictionClientWithOverride(
+        client_options=test_client_options,
+        client_info=test_client_info,
+    )
+    client = client_w_override.select_version(compat.V1)
+
+    with mock.patch.object(client.transport, "close") as close_mock:
+        client_w_override.close()
+
+    close_mock.assert_called_once_with()
+
+
 @pytest.mark.usefixtures("google_auth_mock")
 def test_client_w_override_select_version():
 
@@ -959,6 +1039,147 @@ class TestPredictionUtils:
             .download_to_filename.called
         )
 
+    @staticmethod
+    def _get_blob_mock(name, data, md5_hash="fake-md5"):
+        blob = mock.MagicMock()
+        type(blob).name = mock.PropertyMock(return_value=name)
+        blob.size = len(data)
+        blob.md5_hash = md5_hash
+        blob.crc32c = None
+
+        def download_as_bytes(start, end, **kwargs):
+            return data[start : end + 1]
+
+        def download_to_filename(filename):
+            with open(filename, "wb") as f:
+                f.write(data)
+
+        blob.download_as_bytes.side_effect = download_as_bytes
+        blob.download_to_filename.side_effect = download_to_filename
+        return blob
+
+    def test_download_model_artifacts_chunked(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        data = b"0123456789"
+        blob = self._get_blob_mock(f"{GCS_PREFIX}/{FAKE_FILENAME}", data)
+
+        with patch.object(storage, "Client") as mock_storage_client:
+            mock_storage_client.return_value.list_blobs.return_value = [blob]
+            prediction_utils.download_model_artifacts(
+                f"gs://{GCS_BUCKET}/{GCS_PREFIX}", chunk_size=4
+            )
+
+        assert (tmp_path / FAKE_FILENAME).read_bytes() == data
+        assert blob.download_as_bytes.call_count == 3
+        assert not blob.download_to_filename.called
+        assert not list(tmp_path.glob("*.partial"))
+
+    def test_download_model_artifacts_checksum_mismatch(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        blob = self._get_blob_mock(f"{GCS_PREFIX}/{FAKE_FILENAME}", b"0123456789")
+        blob.crc32c = "invalid"
+
+        with patch.object(storage, "Client") as mock_storage_client:
+            mock_storage_client.return_value.list_blobs.return_value = [blob]
+            with pytest.raises(ValueError):
+                prediction_utils.download_model_artifacts(
+                    f"gs://{GCS_BUCKET}/{GCS_PREFIX}", chunk_size=4
+                )
+
+        assert not (tmp_path / FAKE_FILENAME).exists()
+        assert not list(tmp_path.glob("*.partial"))
+
+    def test_download_model_artifacts_chunk_error(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        blob = self._get_blob_mock(f"{GCS_PREFIX}/{FAKE_FILENAME}", b"0123456789")
+        blob.download_as_bytes.side_effect = [b"0123", RuntimeError("fake"), b"89"]
+
+        with patch.object(storage, "Client") as mock_storage_client:
+            mock_storage_client.return_value.list_blobs.return_value = [blob]
+            with pytest.raises(RuntimeError):
+                prediction_utils.download_model_artifacts(
+                    f"gs://{GCS_BUCKET}/{GCS_PREFIX}", chunk_size=4, max_workers=1
+                )
+
+        assert not (tmp_path / FAKE_FILENAME).exists()
+        assert not list(tmp_path.glob("*.partial"))
+
+    def test_download_model_artifacts_error_cancels_pending_chunks(
+        self, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        data = b"0123456789" * 4
+        blob = self._get_blob_mock(f"{GCS_PREFIX}/{FAKE_FILENAME}", data)
+
+        def download_as_bytes(start, end, **kwargs):
+            if start == 0:
+                raise RuntimeError("fake")
+            # Keeps the only worker busy until the pending chunks are cancelled.
+            time.sleep(0.1)
+            return data[start : end + 1]
+
+        blob.download_as_bytes.side_effect = download_as_bytes
+
+        with patch.object(storage, "Client") as mock_storage_client:
+            mock_storage_client.return_value.list_blobs.return_value = [blob]
+            with pytest.raises(RuntimeError):
+                prediction_utils.download_model_artifacts(
+                    f"gs://{GCS_BUCKET}/{GCS_PREFIX}", chunk_size=4, max_workers=1
+                )
+
+        assert blob.download_as_bytes.call_count == 2
+        assert not list(tmp_path.glob("*.partial"))
+
+    def test_download_model_artifacts_cache_download_error(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(prediction_utils.MODEL_CACHE_DIR_ENV, str(cache_dir))
+        blob = self._get_blob_mock(f"{GCS_PREFIX}/{FAKE_FILENAME}", b"model")
+
+        def download_to_filename(filename):
+            with open(filename, "wb") as f:
+                f.write(b"mod")
+            raise RuntimeError("fake")
+
+        blob.download_to_filename.side_effect = download_to_filename
+
+        with patch.object(storage, "Client") as mock_storage_client:
+            mock_storage_client.return_value.list_blobs.return_value = [blob]
+            with pytest.raises(RuntimeError):
+                prediction_utils.download_model_artifacts(
+                    f"gs://{GCS_BUCKET}/{GCS_PREFIX}"
+                )
+
+        assert not (tmp_path / FAKE_FILENAME).exists()
+        assert not list(cache_dir.iterdir())
+
+    def test_download_model_artifacts_cache(self, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        first_dir = tmp_path / "first"
+        second_dir = tmp_path / "second"
+        first_dir.mkdir()
+        second_dir.mkdir()
+        data = b"model"
+        first_blob = self._get_blob_mock(f"{GCS_PREFIX}/{FAKE_FILENAME}", data)
+        second_blob = self._get_blob_mock(f"{GCS_PREFIX}/{FAKE_FILENAME}", data)
+        monkeypatch.setenv(prediction_utils.MODEL_CACHE_DIR_ENV, str(cache_dir))
+
+        with patch.object(storage, "Client") as mock_storage_client:
+            mock_storage_client.return_value.list_blobs.side_effect = [
+                [first_blob],
+                [second_blob],
+            ]
+            monkeypatch.chdir(first_dir)
+            prediction_utils.download_model_artifacts(f"gs://{GCS_BUCKET}/{GCS_PREFIX}")
+            monkeypatch.chdir(second_dir)
+            prediction_utils.download_model_artifacts(f"gs://{GCS_BUCKET}/{GCS_PREFIX}")
+
+        assert first_blob.download_to_filename.called
+        assert not second_blob.download_to_filename.called
+        assert (first_dir / FAKE_FILENAME).read_bytes() == data
+        assert (second_dir / FAKE_FILENAME).read_bytes() == data
+        assert len(list(cache_dir.iterdir())) == 1
+
     def test_download_model_artifacts_not_gcs_uri(
         self, mock_storage_client, tmp_path, copy_tree_mock
     ):